@@ -18,24 +18,28 @@ AS_API_SOURCE = 'as_api.py'
 
 # preamble for autogenerated async API
 PREAMBLE = """# auto-generated. DO NOT EDIT
+import asyncio
 import csv
 import json
 import logging
 import mimetypes
 import os
-from collections.abc import AsyncGenerator
+from collections import deque
+from collections.abc import AsyncGenerator, Iterable
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
 from dateutil import tz
 from dateutil.parser import isoparse
 from enum import Enum
+from functools import partial
 from io import BufferedReader
-from typing import Union, Dict, Optional, Literal, List
+from typing import Any, BinaryIO, Callable, Union, Dict, Optional, Literal, List
 
 from aiohttp import FormData
 from pydantic import parse_obj_as
 
 from wxc_sdk.all_types import *
+from wxc_sdk.api_child import LazyApiChild
 from wxc_sdk.as_rest import AsRestSession
 from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str
 from wxc_sdk.base import SafeEnum as Enum
@@ -400,6 +404,13 @@ class ClassDef:
 VISITED_FOR_CLASS_SOURCES = set()
 
 
+def type_name(t: Union[type, str]) -> str:
+    """
+    Name of a type; attribute types can also be forward references (strings)
+    """
+    return t if isinstance(t, str) else t.__name__
+
+
 def class_sources(*, target: type) -> Generator[str, None, None]:
     """
     Dump source for one class. Descend into all dependencies before dumping the source for this class
@@ -452,11 +463,11 @@ def class_sources(*, target: type) -> Generator[str, None, None]:
         if is_dataclass(target_class):
             attributes = fields(target_class)
             attributes = sorted(attributes, key=lambda a: a.name)
-            logger(f'attributes {", ".join(f"{a.name}: {a.type.__name__}" for a in attributes)}')
+            logger(f'attributes {", ".join(f"{a.name}: {type_name(a.type)}" for a in attributes)}')
         else:
             attributes = []
 
-        depends_on_class_names = set(attribute.type.__name__ for attribute in attributes)
+        depends_on_class_names = set(type_name(attribute.type) for attribute in attributes)
         # check base classes
         bases = class_def.base_classes
         logger(f'base classes: {", ".join(sorted(bases)) or "None"}')
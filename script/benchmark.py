@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+"""
+Offline benchmarks for the sync and async SDK
+
+The benchmarks run against a local mock of the Webex API (see mock_webex.py) serving synthetic payloads. By default
+the mock server runs in a separate process so that only the CPU consumption of the SDK is measured.
+
+For each scenario these metrics are reported:
+
+* throughput: items per second
+* latency percentiles of the individual requests (p50, p90, p99)
+* CPU time per item (user + system time of the benchmark process)
+* peak memory allocated by Python (measured with tracemalloc in a separate run)
+
+Results can be saved as JSON and compared against a baseline to validate SDK upgrades:
+
+    .. code-block::
+
+        # on the current version
+        benchmark.py --save baseline.json
+        # after the upgrade: exit code 1 if any scenario regressed by more than 20%
+        benchmark.py --baseline baseline.json --tolerance 0.2
+"""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import re
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass, asdict
+from typing import Any, Optional
+
+from mock_webex import MockConfig, MockWebex, webex_id
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.cdr import CDR
+from wxc_sdk.metrics import RequestHooks
+from wxc_sdk.people import Person
+from wxc_sdk.rate_limit import RateLimiter
+
+
+class LatencyRecorder(RequestHooks):
+    """
+    Collects the latency of all requests
+    """
+
+    def __init__(self):
+        self.latencies: list[float] = []
+
+    def request_end(self, context: Any, method: str, template: str, status: Optional[int], elapsed: float,
+                    bytes_out: int, bytes_in: int, error: Optional[BaseException]):
+        self.latencies.append(elapsed)
+
+
+@dataclass
+class Result:
+    scenario: str
+    items: int
+    requests: int
+    #: wall clock time in seconds
+    seconds: float
+    #: items per second
+    throughput: float
+    #: request latency percentiles in ms
+    p50: float
+    p90: float
+    p99: float
+    #: CPU time per item in µs
+    cpu_per_item: float
+    #: peak memory in MB; None if not measured
+    peak_memory: Optional[float] = None
+
+
+@dataclass
+class Scenario:
+    name: str
+    #: sync scenario: called with a WebexSimpleApi instance; async scenario: called with an AsWebexSimpleApi
+    #: instance, returns a coroutine. Returns the number of items
+    run: Callable[..., Any]
+    is_async: bool = False
+
+
+def _cdr_feed(api) -> Any:
+    # same as DetailedCDRApi.get_cdr_history() w/o the fixed analytics URL
+    return api.session.follow_pagination(url=api.session.ep('cdr_feed'), model=CDR, params={'max': 500},
+                                         item_key='items')
+
+
+async def _as_count(gen) -> int:
+    count = 0
+    async for _ in gen:
+        count += 1
+    return count
+
+
+def scenarios(config: MockConfig) -> list[Scenario]:
+    person_ids = [webex_id('PEOPLE', i) for i in range(min(config.people, 500))]
+    return [
+        Scenario('people.list', lambda api: sum(1 for _ in api.people.list())),
+        Scenario('people.list(calling_data)', lambda api: sum(1 for _ in api.people.list(calling_data=True))),
+        Scenario('people.list(lazy)', lambda api: sum(1 for _ in api.session.follow_pagination(
+            url=api.session.ep('people'), model=Person, lazy=True, item_key='items'))),
+        Scenario('telephony.phone_numbers', lambda api: sum(1 for _ in api.telephony.phone_numbers())),
+        Scenario('cdr_feed', lambda api: sum(1 for _ in _cdr_feed(api))),
+        Scenario('people.details (map)', lambda api: sum(1 for _ in api.map(api.people.details, person_ids))),
+        Scenario('async people.list', lambda api: _as_count(api.people.list_gen()), is_async=True),
+        Scenario('async people.list(calling_data)', lambda api: _as_count(api.people.list_gen(calling_data=True)),
+                 is_async=True),
+        Scenario('async telephony.phone_numbers', lambda api: _as_count(api.telephony.phone_numbers_gen()),
+                 is_async=True),
+        Scenario('async cdr_feed', lambda api: _as_count(_cdr_feed(api)), is_async=True),
+        Scenario('async people.details (gather)',
+                 lambda api: _as_gather_count(api, person_ids), is_async=True),
+    ]
+
+
+async def _as_gather_count(api: AsWebexSimpleApi, person_ids: list[str]) -> int:
+    return len(await asyncio.gather(*[api.people.details(person_id) for person_id in person_ids]))
+
+
+def _run_once(scenario: Scenario, base: str, session_args: dict, measure_memory: bool) -> tuple[int, LatencyRecorder,
+                                                                                              float, float, float]:
+    """
+    run a scenario once
+
+    :return: number of items, latencies, wall time, cpu time, peak memory
+    """
+    recorder = LatencyRecorder()
+    session_args = dict(session_args, request_hooks=[recorder])
+    gc.collect()
+    if measure_memory:
+        tracemalloc.start()
+        tracemalloc.reset_peak()
+    start_cpu = time.process_time()
+    start = time.perf_counter()
+    if scenario.is_async:
+        async def run():
+            async with AsWebexSimpleApi(tokens='token', **session_args) as api:
+                api.session.BASE = base
+                return await scenario.run(api)
+
+        items = asyncio.run(run())
+    else:
+        with WebexSimpleApi(tokens='token', **session_args) as api:
+            api.session.BASE = base
+            items = scenario.run(api)
+    seconds = time.perf_counter() - start
+    cpu = time.process_time() - start_cpu
+    peak = 0.0
+    if measure_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return items, recorder, seconds, cpu, peak / 1024 / 1024
+
+
+def percentile(values: list[float], p: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+
+def run_scenario(scenario: Scenario, base: str, session_args: dict, runs: int = 3,
+                 measure_memory: bool = True) -> Result:
+    """
+    Run a scenario: one warm-up run, `runs` timed runs (the median run is reported), and optionally one run to
+    measure peak memory
+    """
+    _run_once(scenario, base, session_args, measure_memory=False)
+    measurements = sorted((_run_once(scenario, base, session_args, measure_memory=False) for _ in range(runs)),
+                          key=lambda m: m[2])
+    items, recorder, seconds, cpu, _ = measurements[len(measurements) // 2]
+    latencies = recorder.latencies
+    peak = _run_once(scenario, base, session_args, measure_memory=True)[4] if measure_memory else None
+    return Result(scenario=scenario.name, items=items, requests=len(latencies), seconds=seconds,
+                  throughput=items / seconds if seconds else 0.0,
+                  p50=percentile(latencies, 50) * 1000, p90=percentile(latencies, 90) * 1000,
+                  p99=percentile(latencies, 99) * 1000,
+                  cpu_per_item=cpu / items * 1000000 if items else 0.0,
+                  peak_memory=peak)
+
+
+def compare(results: list[Result], baseline: list[dict], tolerance: float) -> list[str]:
+    """
+    Compare results with a baseline
+
+    :return: list of regressions
+    """
+    baseline = {r['scenario']: r for r in baseline}
+    regressions = []
+    for result in results:
+        base = baseline.get(result.scenario)
+        if base is None:
+            continue
+        if result.throughput < base['throughput'] * (1 - tolerance):
+            regressions.append(f'{result.scenario}: throughput {result.throughput:.0f}/s, '
+                               f'baseline {base["throughput"]:.0f}/s')
+        if result.cpu_per_item > base['cpu_per_item'] * (1 + tolerance):
+            regressions.append(f'{result.scenario}: CPU per item {result.cpu_per_item:.1f} µs, '
+                               f'baseline {base["cpu_per_item"]:.1f} µs')
+        if result.peak_memory and base.get('peak_memory') and \
+                result.peak_memory > base['peak_memory'] * (1 + tolerance):
+            regressions.append(f'{result.scenario}: peak memory {result.peak_memory:.1f} MB, '
+                               f'baseline {base["peak_memory"]:.1f} MB')
+    return regressions
+
+
+def print_results(results: list[Result]):
+    print(f'{"scenario":34} {"items":>7} {"reqs":>5} {"items/s":>9} {"p50 ms":>7} {"p90 ms":>7} {"p99 ms":>7} '
+          f'{"CPU µs/item":>11} {"peak MB":>8}')
+    for r in results:
+        peak = '' if r.peak_memory is None else f'{r.peak_memory:8.1f}'
+        print(f'{r.scenario:34} {r.items:7} {r.requests:5} {r.throughput:9.0f} {r.p50:7.1f} {r.p90:7.1f} '
+              f'{r.p99:7.1f} {r.cpu_per_item:11.1f} {peak:>8}')
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='Offline benchmarks against a mock Webex API')
+    parser.add_argument('--scenarios', help='regular expression to select scenarios')
+    parser.add_argument('--list', action='store_true', help='list scenarios and exit')
+    parser.add_argument('--runs', type=int, default=3, help='number of timed runs per scenario')
+    parser.add_argument('--no-memory', action='store_true', help="don't measure peak memory")
+    parser.add_argument('--thread-server', action='store_true',
+                        help='run the mock server in a thread instead of a separate process')
+    parser.add_argument('--concurrent-requests', type=int, default=10)
+    parser.add_argument('--prefetch-pages', type=int, default=0)
+    parser.add_argument('--rate-limit', type=float, help='max request rate for a rate limiter')
+    parser.add_argument('--save', help='save results to this JSON file')
+    parser.add_argument('--baseline', help='compare results with this JSON file')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='tolerance for comparison with baseline')
+    for name, value in asdict(MockConfig()).items():
+        parser.add_argument(f'--{name.replace("_", "-")}', type=type(value), default=value,
+                            help=f'mock server: {name}')
+    args = parser.parse_args(argv)
+
+    config = MockConfig(**{name: getattr(args, name) for name in asdict(MockConfig())})
+    selected = [s for s in scenarios(config) if not args.scenarios or re.search(args.scenarios, s.name)]
+    if args.list:
+        print('\n'.join(s.name for s in selected))
+        return 0
+
+    # make sure that debug logging doesn't distort the results
+    logging.getLogger('wxc_sdk').setLevel(logging.WARNING)
+    session_args = dict(concurrent_requests=args.concurrent_requests, prefetch_pages=args.prefetch_pages)
+    if args.rate_limit:
+        session_args['rate_limiter'] = RateLimiter(max_rate=args.rate_limit)
+
+    server = MockWebex(config)
+    server.start() if args.thread_server else server.start_process()
+    try:
+        results = []
+        for scenario in selected:
+            results.append(run_scenario(scenario, server.base, session_args, runs=args.runs,
+                                        measure_memory=not args.no_memory))
+            r = results[-1]
+            print(f'{r.scenario}: {r.items} items, {r.throughput:.0f} items/s', file=sys.stderr)
+    finally:
+        server.stop()
+    print()
+    print_results(results)
+    if args.save:
+        with open(args.save, mode='w') as f:
+            json.dump([asdict(r) for r in results], f, indent=2)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print('\nRegressions:')
+            print('\n'.join(f'  {r}' for r in regressions))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
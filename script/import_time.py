@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""
+Benchmark: time needed to import the SDK and to create an API instance
+
+Each measurement runs in a fresh interpreter so that no modules are cached.
+"""
+import statistics
+import subprocess
+import sys
+
+RUNS = 10
+
+BENCHMARKS = {
+    'import wxc_sdk': 'import wxc_sdk',
+    'WebexSimpleApi()': 'from wxc_sdk import WebexSimpleApi; WebexSimpleApi(tokens="foo")',
+    'access api.people': 'from wxc_sdk import WebexSimpleApi; WebexSimpleApi(tokens="foo").people',
+    'all child APIs': 'from wxc_sdk import WebexSimpleApi; from dataclasses import fields; '
+                      'api = WebexSimpleApi(tokens="foo"); [getattr(api, f.name) for f in fields(api)]',
+    'import wxc_sdk.as_api': 'import wxc_sdk.as_api',
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(statement: str) -> list[float]:
+    """
+    Time a statement in fresh interpreters
+    """
+    return [float(subprocess.check_output([sys.executable, '-c', TIMER.format(statement=statement)]))
+            for _ in range(RUNS)]
+
+
+def main():
+    # warm up: make sure that byte code is compiled
+    subprocess.check_call([sys.executable, '-c', 'import wxc_sdk.as_api'])
+    print(f'{"":30} {"median [ms]":>12} {"min [ms]":>10}')
+    for name, statement in BENCHMARKS.items():
+        times = measure(statement)
+        print(f'{name:30} {statistics.median(times) * 1000:12.1f} {min(times) * 1000:10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -6,7 +6,7 @@ Create a reference of all methods available in the SDK
 import os
 
 from wxc_sdk import WebexSimpleApi
-from wxc_sdk.api_child import ApiChild
+from wxc_sdk.api_child import ApiChild, LazyApiChild
 import inspect
 
 RST_FILE = 'method_ref.rst'
@@ -111,8 +111,11 @@ def method_reference(name, obj):
             doc = doc.strip().split('\n')[0].split('.')[0].strip()
         yield f'{name}.{method}', f'{class_path}.{method}', f'{doc}'
 
+    # child APIs of WebexSimpleApi are created lazily
     child_apis = [name for name, value in obj.__dict__.items()
                   if isinstance(value, ApiChild)]
+    child_apis.extend(name for name, value in vars(obj.__class__).items()
+                      if isinstance(value, LazyApiChild) and name not in child_apis)
     child_apis.sort()
     for child_name in child_apis:
         yield from method_reference(f'{name}.{child_name}', getattr(obj, child_name))
@@ -0,0 +1,344 @@
+#!/usr/bin/env python
+"""
+Local stand-in for the Webex API serving synthetic payloads
+
+Used by the benchmarks in benchmark.py. Serves:
+
+* GET /v1/people: paginated list of people; callingData=true adds calling specific attributes
+* GET /v1/people/{id}: person details
+* GET /v1/telephony/config/numbers: paginated list of phone numbers
+* GET /v1/cdr_feed: paginated list of CDRs
+
+Pagination follows RFC5988 (Link header) with start and max parameters just like the Webex API. Latency and 429
+responses can be injected.
+
+The server can run in a background thread (:meth:`MockWebex.start`) or in a separate process
+(:meth:`MockWebex.start_process`) so that the CPU consumption of the server doesn't distort the measurements.
+
+Standalone:
+
+    .. code-block::
+
+        mock_webex.py --port 8080 --people 10000 --latency 50
+"""
+import argparse
+import asyncio
+import base64
+import multiprocessing
+import random
+import threading
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import Optional, get_args
+
+from aiohttp import web
+
+from wxc_sdk.json_codec import json_dumps
+
+__all__ = ['MockConfig', 'MockWebex', 'person', 'number', 'cdr']
+
+
+@dataclass
+class MockConfig:
+    #: number of people
+    people: int = 1000
+    #: number of phone numbers
+    numbers: int = 1000
+    #: number of CDRs
+    cdrs: int = 5000
+    #: maximum page size if no max parameter is given
+    page_size: int = 100
+    #: mean latency in ms added to each response
+    latency: float = 0.0
+    #: maximum jitter in ms added to the latency
+    jitter: float = 0.0
+    #: probability of a 429 response
+    p_429: float = 0.0
+    #: Retry-After for injected 429 responses
+    retry_after: int = 1
+    #: seed for random number generator
+    seed: int = 42
+
+
+def webex_id(kind: str, i: int) -> str:
+    """
+    Webex style base64 encoded id
+    """
+    return base64.b64encode(f'ciscospark://us/{kind}/{i:08d}-mock'.encode()).decode().rstrip('=')
+
+
+def person(i: int, calling_data: bool) -> dict:
+    """
+    Synthetic person
+    """
+    created = datetime(2022, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=i)
+    data = {'id': webex_id('PEOPLE', i),
+            'emails': [f'user{i:06d}@example.com'],
+            'phoneNumbers': [{'type': 'work', 'value': f'+1408555{i % 10000:04d}', 'primary': True}],
+            'displayName': f'User {i:06d}',
+            'nickName': f'User{i}',
+            'firstName': 'User',
+            'lastName': f'{i:06d}',
+            'avatar': f'https://avatar-prod-us-east-2.webexcontent.com/Avatar-{i:08d}~1600',
+            'orgId': webex_id('ORGANIZATION', 1),
+            'roles': [],
+            'licenses': [webex_id('LICENSE', 1), webex_id('LICENSE', 2)],
+            'created': created.isoformat(timespec='milliseconds').replace('+00:00', 'Z'),
+            'lastModified': created.isoformat(timespec='milliseconds').replace('+00:00', 'Z'),
+            'timezone': 'America/Los_Angeles',
+            'lastActivity': created.isoformat(timespec='milliseconds').replace('+00:00', 'Z'),
+            'sipAddresses': [{'type': 'cloud-calling', 'value': f'user{i:06d}@example.calls.webex.com',
+                              'primary': True}],
+            'status': 'active',
+            'invitePending': False,
+            'loginEnabled': True,
+            'type': 'person'}
+    if calling_data:
+        data['extension'] = f'{1000 + i}'
+        data['locationId'] = webex_id('LOCATION', i % 10)
+    return data
+
+
+def number(i: int) -> dict:
+    """
+    Synthetic phone number
+    """
+    data = {'phoneNumber': f'+1408555{i % 10000:04d}',
+            'extension': f'{1000 + i}',
+            'state': 'ACTIVE',
+            'phoneNumberType': 'PRIMARY',
+            'mainNumber': i % 100 == 0,
+            'tollFreeNumber': False,
+            'location': {'id': webex_id('LOCATION', i % 10), 'name': f'Location {i % 10}'}}
+    if i % 3:
+        data['owner'] = {'id': webex_id('PEOPLE', i), 'type': 'PEOPLE', 'firstName': 'User',
+                         'lastName': f'{i:06d}'}
+    return data
+
+
+def _cdr_columns() -> list[tuple[str, str, Optional[list[str]]]]:
+    """
+    column names (as in the CDR feed), kind, and enum values for all CDR fields
+    """
+    from wxc_sdk.cdr import CDR
+    from wxc_sdk.cdr.columnar import COLUMN_KINDS
+
+    columns = []
+    for name, field in CDR.__fields__.items():
+        values = None
+        enums = [t for t in (get_args(field.type_) or (field.type_,)) if isinstance(t, type) and issubclass(t, Enum)]
+        if enums:
+            values = [m.value for m in enums[0]]
+        columns.append((name.replace('_', ' ').capitalize(), COLUMN_KINDS[name], values))
+    return columns
+
+
+_CDR_COLUMNS = None
+
+
+def cdr(i: int) -> dict:
+    """
+    Synthetic CDR
+    """
+    global _CDR_COLUMNS
+    if _CDR_COLUMNS is None:
+        _CDR_COLUMNS = _cdr_columns()
+    start = datetime(2023, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=i)
+    data = {}
+    for column, kind, values in _CDR_COLUMNS:
+        if kind == 'timestamp':
+            data[column] = start.isoformat(timespec='milliseconds').replace('+00:00', 'Z')
+        elif kind == 'int':
+            data[column] = str(i % 600)
+        elif kind == 'bool':
+            data[column] = 'true' if i % 2 else 'false'
+        elif values:
+            data[column] = values[i % len(values)]
+        else:
+            data[column] = f'{column.replace(" ", "")}-{i}'
+    data['Correlation id'] = f'correlation-{i}'
+    data['Local call id'] = f'call-{i}'
+    return data
+
+
+class MockWebex:
+    """
+    Mock Webex API server
+    """
+
+    def __init__(self, config: MockConfig = None, port: int = 0):
+        self.config = config or MockConfig()
+        self.port = port
+        self._random = random.Random(self.config.seed)
+        self._runner: Optional[web.AppRunner] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._process: Optional[multiprocessing.Process] = None
+        #: number of requests served
+        self.requests = 0
+        # payloads are created on first use
+        self._people: dict[bool, list[dict]] = dict()
+        self._numbers: Optional[list[dict]] = None
+        self._cdrs: Optional[list[dict]] = None
+
+    @property
+    def base(self) -> str:
+        """
+        base URL to be used for the session: session.BASE = server.base
+        """
+        return f'http://127.0.0.1:{self.port}/v1'
+
+    def people(self, calling_data: bool) -> list[dict]:
+        people = self._people.get(calling_data)
+        if people is None:
+            people = [person(i, calling_data) for i in range(self.config.people)]
+            self._people[calling_data] = people
+        return people
+
+    def numbers(self) -> list[dict]:
+        if self._numbers is None:
+            self._numbers = [number(i) for i in range(self.config.numbers)]
+        return self._numbers
+
+    def cdrs(self) -> list[dict]:
+        if self._cdrs is None:
+            self._cdrs = [cdr(i) for i in range(self.config.cdrs)]
+        return self._cdrs
+
+    @web.middleware
+    async def _inject(self, request: web.Request, handler):
+        """
+        latency and 429 injection
+        """
+        self.requests += 1
+        config = self.config
+        if config.latency or config.jitter:
+            await asyncio.sleep((config.latency + self._random.random() * config.jitter) / 1000)
+        if config.p_429 and self._random.random() < config.p_429:
+            return web.json_response({'message': 'Too Many Requests'}, status=429,
+                                     headers={'Retry-After': str(config.retry_after)}, dumps=json_dumps)
+        return await handler(request)
+
+    def _page(self, request: web.Request, items: list[dict], item_key: str) -> web.Response:
+        """
+        one page of a list with Link header for the next page
+        """
+        start = int(request.query.get('start', 0))
+        page_size = int(request.query.get('max', self.config.page_size))
+        headers = {}
+        if start + page_size < len(items):
+            query = dict(request.query)
+            query.update(start=str(start + page_size), max=str(page_size))
+            next_url = request.url.with_query(query)
+            headers['Link'] = f'<{next_url}>; rel="next"'
+        return web.json_response({item_key: items[start:start + page_size]}, headers=headers, dumps=json_dumps)
+
+    async def _list_people(self, request: web.Request) -> web.Response:
+        return self._page(request, self.people(request.query.get('callingData') == 'true'), 'items')
+
+    async def _person_details(self, request: web.Request) -> web.Response:
+        person_id = request.match_info['person_id']
+        try:
+            i = int(base64.b64decode(f'{person_id}==').decode().split('/')[-1].split('-')[0])
+        except ValueError:
+            raise web.HTTPNotFound()
+        return web.json_response(person(i, request.query.get('callingData') == 'true'), dumps=json_dumps)
+
+    async def _list_numbers(self, request: web.Request) -> web.Response:
+        return self._page(request, self.numbers(), 'phoneNumbers')
+
+    async def _cdr_feed(self, request: web.Request) -> web.Response:
+        return self._page(request, self.cdrs(), 'items')
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._inject])
+        app.router.add_get('/v1/people', self._list_people)
+        app.router.add_get('/v1/people/{person_id}', self._person_details)
+        app.router.add_get('/v1/telephony/config/numbers', self._list_numbers)
+        app.router.add_get('/v1/cdr_feed', self._cdr_feed)
+        return app
+
+    async def _start(self):
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, '127.0.0.1', self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    def start(self) -> 'MockWebex':
+        """
+        Start the server in a background thread
+        """
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self._start())
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self._runner.cleanup())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True, name='mock_webex')
+        self._thread.start()
+        started.wait()
+        return self
+
+    def start_process(self) -> 'MockWebex':
+        """
+        Start the server in a separate process
+        """
+        queue = multiprocessing.Queue()
+        self._process = multiprocessing.Process(target=_serve, args=(asdict(self.config), self.port, queue),
+                                                daemon=True)
+        self._process.start()
+        self.port = queue.get(timeout=30)
+        return self
+
+    def stop(self):
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+
+def _serve(config: dict, port: int, queue: multiprocessing.Queue = None):
+    """
+    run the server in the current process
+    """
+
+    async def run():
+        server = MockWebex(MockConfig(**config), port=port)
+        await server._start()
+        if queue is None:
+            print(f'serving on {server.base}')
+        else:
+            queue.put(server.port)
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Mock Webex API server')
+    parser.add_argument('--port', type=int, default=8080)
+    for name, value in asdict(MockConfig()).items():
+        parser.add_argument(f'--{name.replace("_", "-")}', type=type(value), default=value)
+    args = parser.parse_args()
+    config = {name: getattr(args, name) for name in asdict(MockConfig())}
+    _serve(config, args.port)
+
+
+if __name__ == '__main__':
+    main()
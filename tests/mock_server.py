@@ -0,0 +1,150 @@
+"""
+Local HTTP server for offline unit tests
+
+A test case derived from :class:`MockServerTestCase` runs a :class:`MockHandler` subclass in a local HTTP server. The
+handler only defines its routes:
+
+    .. code-block:: python
+
+        class Handler(MockHandler):
+            routes = [('GET', r'/v1/items/(?P<item_id>\\w+)', 'get_item')]
+
+            def get_item(self, item_id: str):
+                self.reply(200, {'id': item_id})
+
+
+        class TestItems(MockServerTestCase):
+            handler = Handler
+
+            def test_get(self):
+                with WebexSimpleApi(tokens='token') as api:
+                    api.session.BASE = self.base
+                    ...
+"""
+import http.server
+import json
+import re
+import threading
+from typing import Any, ClassVar, Optional
+from unittest import TestCase
+from urllib.parse import urlsplit, parse_qs
+
+__all__ = ['MockHandler', 'MockServerTestCase']
+
+
+class MockHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Request handler dispatching requests based on a route table. Requests w/o matching route get a 404
+    """
+    #: routes: (HTTP method, regular expression for the URL path, name of the handler method). Handler methods are
+    #: called with the named groups of the match as keyword arguments
+    routes: ClassVar[list[tuple[str, str, str]]] = []
+
+    _body: Optional[bytes] = None
+
+    def _dispatch(self):
+        path = self.url.path
+        for method, pattern, name in self.routes:
+            if method != self.command:
+                continue
+            match = re.fullmatch(pattern, path)
+            if match:
+                getattr(self, name)(**match.groupdict())
+                return
+        self.reply(404, {'message': f'no route for {self.command} {path}'})
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionError:
+            # client gave up on the request; for example a cancelled task
+            pass
+
+    @property
+    def url(self):
+        return urlsplit(self.path)
+
+    @property
+    def query(self) -> dict[str, list[str]]:
+        return parse_qs(self.url.query)
+
+    def param(self, name: str, default: str = None) -> Optional[str]:
+        """
+        value of a URL parameter
+        """
+        return self.query.get(name, [default])[0]
+
+    def body(self) -> bytes:
+        """
+        request body
+        """
+        if self._body is None:
+            self._body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        return self._body
+
+    def json(self) -> Any:
+        """
+        request body parsed as JSON; None for empty bodies
+        """
+        body = self.body()
+        return json.loads(body) if body else None
+
+    def reply(self, status: int = 200, data: Any = None, *, body: bytes = None,
+              content_type: str = 'application/json', headers: dict = None):
+        """
+        send a response
+
+        :param status: HTTP status
+        :param data: JSON body
+        :param body: raw body; alternative to data
+        :param content_type: content type for raw bodies; no content type for empty bodies
+        :param headers: additional headers
+        """
+        if data is not None:
+            body = json.dumps(data).encode()
+            content_type = 'application/json'
+        body = body or b''
+        self.send_response(status)
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        if body:
+            self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class MockServer(http.server.ThreadingHTTPServer):
+    # tests open many connections at once
+    request_queue_size = 128
+
+
+class MockServerTestCase(TestCase):
+    """
+    Test case with a local HTTP server running :attr:`handler` in a background thread
+    """
+    handler: ClassVar[type[MockHandler]]
+    server: ClassVar[MockServer]
+    #: URL of the server: http://127.0.0.1:<port>
+    server_url: ClassVar[str]
+    #: base URL for the API: <server_url>/v1
+    base: ClassVar[str]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.server = MockServer(('127.0.0.1', 0), cls.handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.server_url = f'http://127.0.0.1:{cls.server.server_port}'
+        cls.base = f'{cls.server_url}/v1'
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
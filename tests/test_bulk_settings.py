@@ -0,0 +1,160 @@
+"""
+Test bulk read and apply of person settings
+"""
+import asyncio
+import threading
+import time
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.person_settings.common import settings_diff, settings_update
+from wxc_sdk.person_settings.dnd import DND
+from wxc_sdk.person_settings.forwarding import PersonForwardingSetting
+
+FORWARDING = {'callForwarding': {'always': {'enabled': True, 'destination': '1234', 'ringReminderEnabled': False},
+                                 'busy': {'enabled': False},
+                                 'noAnswer': {'enabled': False, 'numberOfRings': 3}},
+              'businessContinuity': {'enabled': False}}
+
+
+class Handler(MockHandler):
+    routes = [('GET', r'/v1/.*', 'get'),
+              ('PUT', r'/v1/.*', 'put')]
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    #: settings by path; updated by PUT requests
+    state = {}
+    puts = []
+
+    def put(self):
+        self.state[self.path] = self.json()
+        self.puts.append(self.path)
+        self.reply(204)
+
+    def get(self):
+        cls = self.__class__
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(0.02)
+        with cls.lock:
+            cls.in_flight -= 1
+        if '/unknown/' in self.path:
+            self.reply(404)
+            return
+        if self.path in self.state:
+            data = self.state[self.path]
+        elif self.path.endswith('/doNotDisturb'):
+            data = {'enabled': True, 'ringSplashEnabled': False}
+        else:
+            data = {'enabled': True}
+        self.reply(200, data)
+
+
+IDS = [f'p{i}' for i in range(10)] + ['unknown']
+
+
+class TestBulkSettings(MockServerTestCase):
+    handler = Handler
+
+    def setUp(self) -> None:
+        Handler.max_in_flight = 0
+        Handler.state.clear()
+        Handler.puts.clear()
+
+    def check_results(self, results):
+        self.assertEqual(len(IDS) * 2, len(results))
+        failed = [r for r in results if not r.ok]
+        self.assertEqual({('unknown', 'call_waiting'), ('unknown', 'dnd')}, {(r.id, r.feature) for r in failed})
+        dnd = [r for r in results if r.ok and r.feature == 'dnd']
+        self.assertTrue(all(r.settings == DND(enabled=True, ring_splash_enabled=False) for r in dnd))
+        self.assertLessEqual(Handler.max_in_flight, 4)
+
+    def test_001_sync(self):
+        with WebexSimpleApi(tokens='token') as api:
+            api.session.BASE = self.base
+            results = list(api.person_settings.read_bulk(ids=IDS, features=['dnd', 'call_waiting'], max_workers=4))
+        self.check_results(results)
+
+    def test_002_session_concurrency(self):
+        """
+        by default the concurrency of the session applies and jobs run in the thread pool of the session
+        """
+        with WebexSimpleApi(tokens='token', concurrent_requests=4) as api:
+            api.session.BASE = self.base
+            results = list(api.person_settings.read_bulk(ids=IDS, features=['dnd', 'call_waiting']))
+            self.assertIsNotNone(api.session._executor)
+        self.check_results(results)
+        self.assertGreater(Handler.max_in_flight, 1)
+
+    def test_003_unknown_feature(self):
+        with WebexSimpleApi(tokens='token') as api:
+            self.assertIn('forwarding', api.workspace_settings.bulk_features())
+            self.assertEqual(['permissions_out'], api.telephony.bulk_features())
+            with self.assertRaises(ValueError):
+                list(api.person_settings.read_bulk(ids=IDS, features=['foo']))
+
+    def test_004_async(self):
+        async def run():
+            async with AsWebexSimpleApi(tokens='token') as api:
+                api.session.BASE = self.base
+                return await api.person_settings.read_bulk(ids=IDS, features=['dnd', 'call_waiting'],
+                                                           max_workers=4)
+
+        self.check_results(asyncio.run(run()))
+
+    def test_005_diff(self):
+        """
+        field level diff and update of nested models
+        """
+        current = PersonForwardingSetting.parse_obj(FORWARDING)
+        desired = {'call_forwarding': {'always': {'enabled': False, 'destination': '1234'}}}
+        self.assertEqual({'call_forwarding.always.enabled': (True, False)}, settings_diff(current, desired))
+        updated = settings_update(current, desired)
+        self.assertFalse(updated.call_forwarding.always.enabled)
+        self.assertTrue(current.call_forwarding.always.enabled)
+        self.assertEqual(current.call_forwarding.busy, updated.call_forwarding.busy)
+        self.assertEqual({}, settings_diff(updated, desired))
+        # partial model: only fields set explicitly are compared
+        self.assertEqual({'enabled': (True, False)}, settings_diff(DND(enabled=True, ring_splash_enabled=True),
+                                                                   DND.construct(enabled=False)))
+        with self.assertRaises(ValueError):
+            settings_diff(current, {'foo': 1})
+
+    def test_006_apply(self):
+        """
+        only settings that differ are updated; dry run doesn't update anything
+        """
+        Handler.state['/v1/people/p1/features/callForwarding'] = FORWARDING
+        desired = {person_id: {'dnd': {'enabled': person_id != 'p0'},
+                               'call_waiting': True}
+                   for person_id in IDS}
+        desired['p1']['forwarding'] = {'call_forwarding': {'always': {'enabled': False}}}
+        with WebexSimpleApi(tokens='token') as api:
+            api.session.BASE = self.base
+            changes = list(api.person_settings.apply_bulk(desired=desired, dry_run=True, max_workers=4))
+            self.assertEqual([], Handler.puts)
+            self.assertEqual({('p0', 'dnd'), ('p1', 'forwarding')},
+                             {(c.id, c.feature) for c in changes if c.ok and c.changed})
+            self.assertFalse(any(c.applied for c in changes))
+            self.assertEqual({'unknown'}, {c.id for c in changes if not c.ok})
+
+            changes = list(api.person_settings.apply_bulk(desired=desired, max_workers=4))
+        self.assertEqual({('p0', 'dnd'), ('p1', 'forwarding')}, {(c.id, c.feature) for c in changes if c.applied})
+        self.assertEqual(['/v1/people/p0/features/doNotDisturb', '/v1/people/p1/features/callForwarding'],
+                         sorted(Handler.puts))
+        self.assertFalse(Handler.state['/v1/people/p1/features/callForwarding']['callForwarding']['always']['enabled'])
+
+    def test_007_apply_async(self):
+        desired = {person_id: {'dnd': {'enabled': person_id != 'p0'}} for person_id in IDS}
+
+        async def run():
+            async with AsWebexSimpleApi(tokens='token') as api:
+                api.session.BASE = self.base
+                return await api.person_settings.apply_bulk(desired=desired, max_workers=4)
+
+        changes = asyncio.run(run())
+        self.assertEqual(len(IDS), len(changes))
+        self.assertEqual(['/v1/people/p0/features/doNotDisturb'], Handler.puts)
@@ -0,0 +1,163 @@
+"""
+Test bulk upload of greetings and announcements
+"""
+import asyncio
+import email.parser
+import os
+import tempfile
+import threading
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.bulk_upload import MultipartFile, read_manifest, BulkUploader, AsBulkUploader, UploadStatus, \
+    UploadKind, UploadItem
+
+
+class Handler(MockHandler):
+    routes = [('POST', r'/v1/.*', 'upload')]
+    #: paths of requests seen so far; the first request for each path is throttled
+    seen = set()
+    #: uploads: (path, form fields)
+    uploads = []
+    lock = threading.Lock()
+
+    def upload(self):
+        body = self.body()
+        with self.lock:
+            first = self.path not in self.seen
+            self.seen.add(self.path)
+        if first:
+            self.reply(429, headers={'Retry-After': '0'})
+            return
+        message = email.parser.BytesParser().parsebytes(
+            f'Content-Type: {self.headers["Content-Type"]}\r\n\r\n'.encode() + body)
+        fields = {part.get_param('name', header='content-disposition'): part.get_payload(decode=True)
+                  for part in message.get_payload()}
+        with self.lock:
+            self.uploads.append((self.path, fields))
+            count = len(self.uploads)
+        if 'announcements' in self.path:
+            self.reply(200, {'id': f'announcement{count}'})
+        else:
+            self.reply(204)
+
+
+class TestBulkUpload(MockServerTestCase):
+    handler = Handler
+
+    def setUp(self) -> None:
+        Handler.seen.clear()
+        Handler.uploads.clear()
+        self.dir = tempfile.TemporaryDirectory()
+        self.audio = {}
+        for name, content in (('greeting.wav', b'RIFF' + bytes(range(256)) * 1000),
+                              ('welcome.wav', b'RIFF' + b'welcome' * 5000),
+                              ('welcome_copy.wav', b'RIFF' + b'welcome' * 5000),
+                              ('other.wav', b'RIFF' + b'other' * 10)):
+            with open(os.path.join(self.dir.name, name), mode='wb') as f:
+                f.write(content)
+            self.audio[name] = content
+        self.manifest = os.path.join(self.dir.name, 'manifest.csv')
+        with open(self.manifest, mode='w') as f:
+            f.write('kind,path,person_id,location_id,name\n')
+            for i in range(5):
+                f.write(f'busy_greeting,greeting.wav,person{i},,\n')
+            f.write('no_answer_greeting,greeting.wav,person0,,\n')
+            f.write('announcement,welcome.wav,,,Welcome\n')
+            f.write('announcement,welcome_copy.wav,,,Welcome again\n')
+            f.write('announcement,welcome.wav,,location1,\n')
+            f.write('announcement,other.wav,,,\n')
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def test_001_multipart_file(self):
+        path = os.path.join(self.dir.name, 'other.wav')
+        body = MultipartFile(path, fields={'name': 'Other'}, boundary='xyz')
+        content = body.read()
+        self.assertEqual(len(body), len(content))
+        self.assertTrue(content.startswith(b'--xyz\r\nContent-Disposition: form-data; name="name"\r\n\r\nOther\r\n'))
+        self.assertIn(b'filename="other.wav"\r\nContent-Type: audio/wav\r\n\r\n' + self.audio['other.wav'] +
+                      b'\r\n--xyz--\r\n', content)
+        # can be read again after close
+        body.close()
+        body.seek(0)
+        chunks = []
+        while chunk := body.read(7):
+            chunks.append(chunk)
+        self.assertEqual(content, b''.join(chunks))
+
+    def test_002_announcement_name(self):
+        """
+        announcement name is added to a request body w/o name; a different name is an error
+        """
+        path = os.path.join(self.dir.name, 'other.wav')
+        with WebexSimpleApi(tokens='token') as api:
+            api.session.BASE = self.base
+            repo = api.telephony.announcements_repo
+            with self.assertRaises(ValueError):
+                repo.upload_announcement(name='X', file=MultipartFile(path, fields={'name': 'Other'}))
+            announcement_id = repo.upload_announcement(name='X', file=MultipartFile(path))
+        self.assertTrue(announcement_id.startswith('announcement'))
+        self.assertEqual(b'X', Handler.uploads[-1][1]['name'])
+
+    def test_003_manifest(self):
+        items = read_manifest(self.manifest)
+        self.assertEqual(10, len(items))
+        self.assertEqual(UploadKind.busy_greeting, items[0].kind)
+        self.assertEqual(os.path.join(self.dir.name, 'greeting.wav'), items[0].path)
+        self.assertIsNone(items[0].location_id)
+        self.assertEqual('welcome', items[8].name)
+        with self.assertRaises(ValueError):
+            UploadItem(kind='busy_greeting', path='greeting.wav')
+
+    def check_results(self, results: list):
+        self.assertEqual(10, len(results))
+        by_status = {}
+        for result in results:
+            by_status.setdefault(result.status, []).append(result)
+        self.assertEqual(9, len(by_status[UploadStatus.uploaded]), [r.error for r in results if r.error])
+        # the copy of welcome.wav for the same repository is not uploaded
+        deduplicated = by_status[UploadStatus.deduplicated]
+        self.assertEqual(1, len(deduplicated))
+        welcome = next(r for r in results if r.item.name == 'Welcome')
+        self.assertEqual(welcome.announcement_id, deduplicated[0].announcement_id)
+        self.assertEqual(welcome.content_hash, deduplicated[0].content_hash)
+
+        # all uploads were throttled once and resent w/ complete content
+        self.assertEqual(9, len(Handler.uploads))
+        for path, fields in Handler.uploads:
+            if 'announcements' in path:
+                self.assertIn(fields['file'], (self.audio['welcome.wav'], self.audio['other.wav']))
+                self.assertIn('name', fields)
+            else:
+                self.assertEqual(self.audio['greeting.wav'], fields['file'])
+        paths = {path for path, _ in Handler.uploads}
+        self.assertIn('/v1/people/person3/features/voicemail/actions/uploadBusyGreeting/invoke', paths)
+        self.assertIn('/v1/people/person0/features/voicemail/actions/uploadNoAnswerGreeting/invoke', paths)
+        self.assertIn('/v1/telephony/config/locations/location1/announcements', paths)
+
+    def test_004_sync(self):
+        with WebexSimpleApi(tokens='token', concurrent_requests=4) as api:
+            api.session.BASE = self.base
+            results = list(BulkUploader(api).run(read_manifest(self.manifest)))
+        self.check_results(results)
+
+    def test_005_async(self):
+        async def run():
+            async with AsWebexSimpleApi(tokens='token', concurrent_requests=4) as api:
+                api.session.BASE = self.base
+                return [r async for r in AsBulkUploader(api).run(read_manifest(self.manifest))]
+
+        self.check_results(asyncio.run(run()))
+
+    def test_006_failure(self):
+        with WebexSimpleApi(tokens='token', concurrent_requests=4, retry_429=False) as api:
+            api.session.BASE = self.base
+            results = list(BulkUploader(api).run([UploadItem(kind='announcement',
+                                                             path=os.path.join(self.dir.name, 'welcome.wav')),
+                                                  UploadItem(kind='announcement',
+                                                             path=os.path.join(self.dir.name, 'welcome_copy.wav'))]))
+        self.assertEqual([UploadStatus.failed] * 2, [r.status for r in results])
+        self.assertIsNotNone(results[0].error)
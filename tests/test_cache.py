@@ -0,0 +1,88 @@
+"""
+Test response cache
+"""
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from wxc_sdk.cache import ResponseCache, MemoryCacheBackend, SQLiteCacheBackend, CachedResponse
+
+BASE = 'https://webexapis.com/v1'
+
+
+class TestResponseCache(TestCase):
+
+    def test_001_policies(self):
+        cache = ResponseCache(ttl=0, policies={r'/supportedDevices$': 60, r'/telephony/config': 10})
+        self.assertEqual(60, cache.ttl_for('/v1/telephony/config/supportedDevices'))
+        self.assertEqual(10, cache.ttl_for('/v1/telephony/config/callingProfiles'))
+        self.assertEqual(0, cache.ttl_for('/v1/people'))
+        self.assertIsNone(cache.key(url=f'{BASE}/people', params=None, access_token='t'))
+
+    def test_002_key(self):
+        cache = ResponseCache(ttl=60)
+        url = f'{BASE}/locations'
+        key = cache.key(url=url, params={'a': 1, 'b': 'x', 'c': None}, access_token='t1')
+        self.assertEqual(key, cache.key(url=url, params={'b': 'x', 'a': '1'}, access_token='t1'))
+        self.assertNotEqual(key, cache.key(url=url, params={'b': 'x', 'a': '1'}, access_token='t2'))
+        self.assertNotIn('t1', key)
+
+    def test_003_entries(self):
+        cache = ResponseCache(ttl=60)
+        url = f'{BASE}/locations'
+        key = cache.key(url=url, params=None, access_token='t')
+        entry = cache.put(key, url=url, response_url=url, data={'items': [1]},
+                          link=f'<{url}?start=1>; rel="next"', etag=None)
+        entry = cache.get(key)
+        self.assertFalse(entry.expired)
+        data = entry.data()
+        self.assertEqual({'items': [1]}, data)
+        # each call returns a new object
+        data['items'].append(2)
+        self.assertEqual({'items': [1]}, entry.data())
+        response = CachedResponse(entry)
+        self.assertEqual(f'{url}?start=1', response.links['next']['url'])
+
+    def check_invalidate(self, cache: ResponseCache):
+        urls = [f'{BASE}/locations', f'{BASE}/locations/l1', f'{BASE}/locations/l1/floors', f'{BASE}/locations/l2',
+                f'{BASE}/locationsX']
+        keys = [cache.key(url=url, params=None, access_token='t') for url in urls]
+        for key, url in zip(keys, urls):
+            cache.put(key, url=url, response_url=url, data='', link=None, etag=None)
+        cache.invalidate(f'{BASE}/locations/l1')
+        self.assertEqual([False, False, False, True, True], [cache.get(key) is not None for key in keys])
+
+    def test_004_invalidate_memory(self):
+        self.check_invalidate(ResponseCache(ttl=60))
+
+    def test_005_invalidate_sqlite(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = SQLiteCacheBackend(os.path.join(tmp, 'cache.db'))
+            try:
+                self.check_invalidate(ResponseCache(ttl=60, backend=backend))
+            finally:
+                backend.close()
+
+    def test_006_lru(self):
+        backend = MemoryCacheBackend(max_entries=2)
+        cache = ResponseCache(ttl=60, backend=backend)
+        for i in range(3):
+            url = f'{BASE}/locations/{i}'
+            cache.put(url, url=url, response_url=url, data='', link=None, etag=None)
+            if i == 1:
+                # access 0 -> 1 is least recently used
+                cache.get(f'{BASE}/locations/0')
+        self.assertEqual(2, len(backend))
+        self.assertIsNone(cache.get(f'{BASE}/locations/1'))
+
+    def test_007_expiry(self):
+        cache = ResponseCache(ttl=0.05)
+        url = f'{BASE}/locations'
+        key = cache.key(url=url, params=None, access_token='t')
+        cache.put(key, url=url, response_url=url, data='', link=None, etag='"x"')
+        time.sleep(0.1)
+        entry = cache.get(key)
+        self.assertTrue(entry.expired)
+        cache.refresh(key, entry)
+        self.assertFalse(cache.get(key).expired)
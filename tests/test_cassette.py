@@ -0,0 +1,177 @@
+"""
+Test record and replay of requests
+"""
+import asyncio
+import gzip
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk.as_rest import AsRestSession, AsRestError
+from wxc_sdk.cassette import Cassette, CassetteMiss
+from wxc_sdk.rest import RestSession, RestError
+from wxc_sdk.tokens import Tokens
+
+
+class Handler(MockHandler):
+    routes = [('GET', r'/v1/items', 'items'),
+              ('GET', r'/v1/binary', 'binary'),
+              ('GET', r'/v1/text', 'text'),
+              ('GET', r'/v1/.*', 'not_found'),
+              ('POST', r'/v1/.*', 'post')]
+    requests = 0
+
+    def items(self):
+        Handler.requests += 1
+        start = int(self.param('start', '0'))
+        headers = {}
+        if start < 4:
+            headers['Link'] = f'<http://{self.headers["Host"]}/v1/items?start={start + 2}&max=2>; rel="next"'
+        self.reply(200, {'items': [{'id': i} for i in range(start, start + 2)]}, headers=headers)
+
+    def binary(self):
+        Handler.requests += 1
+        self.reply(200, body=bytes(range(256)), content_type='application/octet-stream')
+
+    def text(self):
+        Handler.requests += 1
+        self.reply(200, body='text body'.encode(), content_type='text/plain; charset=utf-8')
+
+    def not_found(self):
+        Handler.requests += 1
+        self.reply(404, {'message': 'not found'})
+
+    def post(self):
+        Handler.requests += 1
+        self.body()
+        self.reply(200, {'access_token': 'secret', 'expires_in': 3600}, headers={'Set-Cookie': 'session=secret'})
+
+
+class TestCassette(MockServerTestCase):
+    handler = Handler
+
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.dir.name, name)
+
+    def sync_requests(self, session: RestSession) -> list:
+        result = [list(session.follow_pagination(url=f'{self.base}/items', params={'max': 2})),
+                  session.rest_get(url=f'{self.base}/binary'),
+                  session.rest_post(url=f'{self.base}/token', data={'client_secret': 'secret', 'code': 'secret'},
+                                    content_type='application/x-www-form-urlencoded'),
+                  session.rest_post(url=f'{self.base}/token', json={'refresh_token': 'secret'})]
+        with self.assertRaises(RestError) as error:
+            session.rest_get(url=f'{self.base}/missing')
+        result.append(error.exception.response.status_code)
+        return result
+
+    def test_001_sync(self):
+        path = self.path('sync.jsonl')
+        with Cassette(path, mode='record') as cassette:
+            with RestSession(tokens=Tokens(access_token='token'), concurrent_requests=5,
+                             cassette=cassette) as session:
+                recorded = self.sync_requests(session)
+        self.assertEqual(7, cassette.recorded)
+        with open(path) as f:
+            content = f.read()
+        for secret in ('"secret"', '=secret', 'Bearer'):
+            self.assertNotIn(secret, content)
+        self.assertIn('client_secret=***&code=***', content)
+
+        requests = Handler.requests
+        with Cassette(path, mode='replay') as cassette:
+            with RestSession(tokens=Tokens(access_token='other'), concurrent_requests=5,
+                             cassette=cassette) as session:
+                replayed = self.sync_requests(session)
+                with self.assertRaises(CassetteMiss):
+                    session.rest_get(url=f'{self.base}/binary')
+        self.assertEqual(requests, Handler.requests)
+        self.assertEqual(7, cassette.played)
+        self.assertEqual([{'id': i} for i in range(6)], replayed[0])
+        self.assertEqual(recorded[0], replayed[0])
+        self.assertEqual(recorded[1], replayed[1])
+        # tokens in responses are masked
+        self.assertEqual('***', replayed[2]['access_token'])
+        self.assertEqual(404, replayed[4])
+
+    def test_002_async(self):
+        path = self.path('async.jsonl.gz')
+
+        async def run(cassette: Cassette) -> list:
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=5,
+                                     cassette=cassette) as session:
+                result = [[item async for item in session.follow_pagination(url=f'{self.base}/items',
+                                                                            params={'max': 2})],
+                          await session.rest_post(url=f'{self.base}/token', json={'password': 'secret'}),
+                          await session.rest_get(url=f'{self.base}/text')]
+                try:
+                    await session.rest_get(url=f'{self.base}/missing')
+                except AsRestError as e:
+                    result.append(e.status)
+                return result
+
+        with Cassette(path) as cassette:
+            self.assertTrue(cassette.recording)
+            recorded = asyncio.run(run(cassette))
+        with gzip.open(path, mode='rt') as f:
+            content = f.read()
+        self.assertNotIn('"secret"', content)
+        self.assertIn('"password":"***"', content)
+
+        requests = Handler.requests
+        with Cassette(path, match_body=True) as cassette:
+            self.assertFalse(cassette.recording)
+            replayed = asyncio.run(run(cassette))
+        self.assertEqual(requests, Handler.requests)
+        self.assertEqual([{'id': i} for i in range(6)], replayed[0])
+        self.assertEqual({'access_token': '***', 'expires_in': 3600}, replayed[1])
+        self.assertEqual('text body', recorded[2])
+        self.assertEqual(recorded[2], replayed[2])
+        self.assertEqual(404, replayed[3])
+
+    def test_003_timing_and_repeat(self):
+        path = self.path('timing.jsonl')
+        with Cassette(path, mode='record') as cassette:
+            with RestSession(tokens=Tokens(access_token='token'), concurrent_requests=5,
+                             cassette=cassette) as session:
+                session.rest_get(url=f'{self.base}/binary')
+        # fake a slow response
+        with open(path) as f:
+            interaction = json.loads(f.read())
+        interaction['response']['elapsed_ms'] = 200
+        with open(path, mode='w') as f:
+            f.write(json.dumps(interaction))
+
+        with Cassette(path, mode='replay', timing=0.5, repeat=True) as cassette:
+            with RestSession(tokens=Tokens(access_token='token'), concurrent_requests=5,
+                             cassette=cassette) as session:
+                start = time.perf_counter()
+                for _ in range(2):
+                    session.rest_get(url=f'{self.base}/binary')
+                elapsed = time.perf_counter() - start
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertEqual(2, cassette.played)
+
+    def test_004_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            Cassette(self.path('x.jsonl'), mode='rewind')
+
+    def test_005_no_aiohttp_import(self):
+        """
+        cassette support doesn't make the synchronous SDK import aiohttp
+        """
+        code = ('import sys, tempfile, os, wxc_sdk; from wxc_sdk.cassette import Cassette; '
+                'path = os.path.join(tempfile.mkdtemp(), "c.jsonl"); '
+                'wxc_sdk.WebexSimpleApi(tokens="foo", cassette=Cassette(path, mode="record")); '
+                'print("aiohttp" in sys.modules)')
+        imported = subprocess.check_output([sys.executable, '-c', code], text=True).strip()
+        self.assertEqual('False', imported)
@@ -0,0 +1,76 @@
+"""
+Test columnar export of CDRs
+"""
+import csv
+import io
+from datetime import datetime, timezone
+from unittest import TestCase, skipUnless
+
+from wxc_sdk.cdr.columnar import CDRColumns, cdr_record_batches, cdr_to_numpy
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+CSV = """Start time,Duration,Answered,Call type,Calling line ID
+2022-07-01T12:00:00.000Z,17,true,SIP_NATIONAL,NA
+2022-07-01T12:01:00.000Z,,false,SIP_INBOUND,+4961007739764
+2022-07-01T12:02:00.000Z,3,true,SIP_NATIONAL,+4961007739765
+"""
+
+
+def rows() -> list[dict]:
+    return list(csv.DictReader(io.StringIO(CSV)))
+
+
+class TestCDRColumns(TestCase):
+
+    def test_001_to_dict(self):
+        columns = CDRColumns(columns=['start_time', 'duration', 'call_type', 'calling_line_id'])
+        columns.extend(rows())
+        self.assertEqual(3, len(columns))
+        data = columns.to_dict()
+        self.assertEqual([17, None, 3], data['duration'])
+        self.assertEqual(['SIP_NATIONAL', 'SIP_INBOUND', 'SIP_NATIONAL'], data['call_type'])
+        self.assertEqual([None, '+4961007739764', '+4961007739765'], data['calling_line_id'])
+        self.assertEqual(datetime(2022, 7, 1, 12, tzinfo=timezone.utc), data['start_time'][0])
+
+    def test_002_aliases(self):
+        """
+        keys can be aliases (camelCase), attribute names or CSV column names
+        """
+        columns = CDRColumns(columns=['start_time', 'duration', 'call_type'])
+        columns.extend([{'startTime': '2022-07-01T12:00:00.000Z', 'duration': '17', 'callType': 'SIP_NATIONAL'},
+                        {'start_time': '2022-07-01T12:01:00.000Z', 'call_type': 'SIP_INBOUND'},
+                        {'Start time': '2022-07-01T12:02:00.000Z', 'Duration': '3', 'Call type': 'SIP_NATIONAL'}])
+        data = columns.to_dict()
+        self.assertEqual([17, None, 3], data['duration'])
+        self.assertEqual(['SIP_NATIONAL', 'SIP_INBOUND', 'SIP_NATIONAL'], data['call_type'])
+        self.assertEqual(datetime(2022, 7, 1, 12, tzinfo=timezone.utc), data['start_time'][0])
+
+    def test_003_unknown_column(self):
+        with self.assertRaises(ValueError):
+            CDRColumns(columns=['foo'])
+
+    @skipUnless(pyarrow, 'pyarrow not installed')
+    def test_004_arrow(self):
+        batches = list(cdr_record_batches(rows(), batch_size=2))
+        self.assertEqual([2, 1], [batch.num_rows for batch in batches])
+        table = pyarrow.Table.from_batches(batches)
+        self.assertEqual(pyarrow.timestamp('ms', tz='UTC'), table.schema.field('start_time').type)
+        self.assertTrue(pyarrow.types.is_dictionary(table.schema.field('call_type').type))
+        self.assertEqual([17, None, 3], table.column('duration').to_pylist())
+
+    @skipUnless(numpy, 'numpy not installed')
+    def test_005_numpy(self):
+        array = cdr_to_numpy(rows(), columns=['start_time', 'duration', 'answered'])
+        self.assertEqual(3, len(array))
+        self.assertEqual(numpy.datetime64('2022-07-01T12:01:00', 'ms'), array['start_time'][1])
+        self.assertTrue(numpy.isnan(array['duration'][1]))
+        self.assertEqual([True, False, True], list(array['answered']))
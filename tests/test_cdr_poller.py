@@ -0,0 +1,89 @@
+"""
+Test incremental CDR poller
+"""
+import os
+import tempfile
+from datetime import timedelta
+from unittest import TestCase
+
+from wxc_sdk.cdr.poller import CDRPoller, CDRCheckpoint
+
+
+class FakeCDRApi:
+    """
+    Returns all CDRs with a report time in the requested window
+    """
+
+    def __init__(self):
+        self.cdrs = []
+        self.calls = []
+
+    def get_cdr_history(self, start_time, end_time, locations=None, raw=False):
+        self.calls.append((start_time, end_time))
+        return [cdr for cdr in self.cdrs
+                if start_time <= cdr['Report time'] <= end_time]
+
+
+def cdr(report_time, correlation_id: str, local_call_id: str) -> dict:
+    return {'Report time': report_time, 'Correlation ID': correlation_id, 'Local call ID': local_call_id}
+
+
+class TestCDRPoller(TestCase):
+
+    def setUp(self) -> None:
+        self.api = FakeCDRApi()
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, 'checkpoint.json')
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def poller(self) -> CDRPoller:
+        # noinspection PyTypeChecker
+        return CDRPoller(api=self.api, checkpoint_path=self.path, interval=timedelta(0), raw=True)
+
+    def add(self, poller: CDRPoller, ago: timedelta, correlation_id: str, local_call_id: str = 'l'):
+        """
+        add a CDR with a report time relative to the current watermark
+        """
+        self.api.cdrs.append(cdr(poller.checkpoint.watermark - ago, correlation_id, local_call_id))
+
+    def test_001_dedupe_overlap(self):
+        """
+        CDRs in the overlap are only returned once
+        """
+        poller = self.poller()
+        self.assertEqual([], poller.poll())
+        self.add(poller, timedelta(minutes=1), 'c1')
+        self.add(poller, timedelta(seconds=10), 'c2')
+        first = poller.poll()
+        self.assertEqual(['c1', 'c2'], [c['Correlation ID'] for c in first])
+        # c1 and c2 are returned again in the overlap of the next window, but shouldn't be yielded again
+        self.add(poller, timedelta(seconds=5), 'c3')
+        second = poller.poll()
+        self.assertEqual(['c3'], [c['Correlation ID'] for c in second])
+
+    def test_002_resume(self):
+        """
+        a new poller continues at the watermark of the checkpoint
+        """
+        poller = self.poller()
+        poller.poll()
+        checkpoint = CDRCheckpoint.parse_file(self.path)
+        self.assertEqual(poller.checkpoint, checkpoint)
+        poller = self.poller()
+        poller.poll()
+        start, _ = self.api.calls[-1]
+        self.assertEqual(checkpoint.watermark - poller.overlap, start)
+
+    def test_003_schedule(self):
+        """
+        poller waits for the interval between calls
+        """
+        poller = CDRPoller(api=self.api, interval=timedelta(minutes=5))
+        self.assertEqual(0, poller.next_call())
+        poller.poll()
+        self.assertGreater(poller.next_call(), 299)
+        poller.stop()
+        self.assertEqual([], poller.poll())
+        self.assertEqual(1, len(self.api.calls))
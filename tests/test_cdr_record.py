@@ -0,0 +1,74 @@
+"""
+Test compact CDR records
+"""
+import csv
+import io
+from unittest import TestCase
+
+from wxc_sdk.cdr import CDR, CDRRecord
+
+CSV = """\ufeffStart time,Answer time,Duration,Answered,Direction,Call type,Local SessionID,Calling line ID,New column
+2022-07-01T12:00:00.000Z,2022-07-01T12:00:01.000Z,17,true,ORIGINATING,SIP_NATIONAL,abc,NA,foo
+2022-07-01T12:01:00.000Z,,0,false,TERMINATING,SIP_INBOUND,def,+4961007739764,
+"""
+
+
+class TestCDRRecord(TestCase):
+
+    def test_001_from_csv(self):
+        """
+        records have the same attribute values as CDR instances
+        """
+        records = list(CDRRecord.from_csv(io.StringIO(CSV)))
+        rows = list(csv.DictReader(io.StringIO(CSV.lstrip('\ufeff'))))
+        # extra attributes are not allowed in unit tests
+        cdrs = [CDR.parse_obj({k: v for k, v in row.items() if k != 'New column'}) for row in rows]
+        self.assertEqual(2, len(records))
+        for record, cdr in zip(records, cdrs):
+            for name in CDR.__fields__:
+                self.assertEqual(getattr(cdr, name), getattr(record, name), name)
+        self.assertEqual({'new_column': 'foo'}, records[0].extra)
+        self.assertEqual(dict(), records[1].extra)
+        self.assertIsNone(records[0].calling_line_id)
+        self.assertEqual('abc', records[0].local_session_id)
+
+    def test_002_from_dicts(self):
+        """
+        from_dicts and from_csv create the same records
+        """
+        from_csv = list(CDRRecord.from_csv(io.StringIO(CSV)))
+        from_dicts = list(CDRRecord.from_dicts(csv.DictReader(io.StringIO(CSV.lstrip('\ufeff')))))
+        self.assertEqual(from_csv, from_dicts)
+
+    def test_003_enum_values_shared(self):
+        """
+        enum values are cached and shared by all records
+        """
+        records = list(CDRRecord.from_dicts([{'Call type': ''.join(['SIP_', 'NATIONAL'])} for _ in range(2)]))
+        self.assertIs(records[0].call_type, records[1].call_type)
+
+    def test_004_to_cdr(self):
+        records = list(CDRRecord.from_csv(io.StringIO(CSV)))
+        cdr = records[1].to_cdr()
+        self.assertIsInstance(cdr, CDR)
+        self.assertEqual(0, cdr.duration)
+        self.assertEqual('def', cdr.local_session_id)
+
+    def test_005_unknown_attribute(self):
+        record = CDRRecord.from_dict({'Duration': 1})
+        with self.assertRaises(AttributeError):
+            _ = record.foo
+
+    def test_006_aliases(self):
+        """
+        keys can be aliases (camelCase) or attribute names
+        """
+        from_csv = list(CDRRecord.from_csv(io.StringIO(CSV)))[0]
+        data = {'startTime': '2022-07-01T12:00:00.000Z', 'answerTime': '2022-07-01T12:00:01.000Z', 'duration': '17',
+                'answered': 'true', 'direction': 'ORIGINATING', 'callType': 'SIP_NATIONAL',
+                'local_session_id': 'abc'}
+        record = CDRRecord.from_dict(data)
+        self.assertEqual(from_csv.start_time, record.start_time)
+        self.assertEqual(from_csv.call_type, record.call_type)
+        self.assertEqual('abc', record.local_session_id)
+        self.assertEqual(dict(), record.extra)
@@ -0,0 +1,68 @@
+"""
+Test coalescing of identical concurrent GET requests
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.rest import RestSession
+from wxc_sdk.tokens import Tokens
+
+
+class Handler(MockHandler):
+    routes = [('GET', r'/test', 'get')]
+    requests = []
+
+    def get(self):
+        self.requests.append(self.path)
+        time.sleep(0.1)
+        self.reply(200, {'items': [1]})
+
+
+class TestCoalesce(MockServerTestCase):
+    handler = Handler
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.url = f'{cls.server_url}/test'
+
+    def setUp(self) -> None:
+        Handler.requests.clear()
+
+    def test_001_sync(self):
+        session = RestSession(tokens=Tokens(access_token='token'), concurrent_requests=20, coalesce_requests=True)
+
+        def get(i: int) -> dict:
+            data = session.rest_get(url=self.url, params={'a': 1})
+            data['items'].append(i)
+            return data
+
+        with session, ThreadPoolExecutor(max_workers=20) as pool:
+            results = list(pool.map(get, range(20)))
+        self.assertEqual(1, len(Handler.requests))
+        # each caller gets its own copy
+        self.assertTrue(all(len(data['items']) == 2 for data in results))
+
+    def test_002_sync_disabled(self):
+        with RestSession(tokens=Tokens(access_token='token'), concurrent_requests=5) as session:
+            with ThreadPoolExecutor(max_workers=5) as pool:
+                list(pool.map(lambda _: session.rest_get(url=self.url), range(5)))
+        self.assertEqual(5, len(Handler.requests))
+
+    def test_003_async(self):
+        async def run():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=20,
+                                     coalesce_requests=True) as session:
+                tasks = [asyncio.ensure_future(session.rest_get(url=self.url)) for _ in range(20)]
+                await asyncio.sleep(0.05)
+                # cancelling one caller doesn't affect the others
+                tasks[0].cancel()
+                return await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = asyncio.run(run())
+        self.assertEqual(1, len(Handler.requests))
+        self.assertIsInstance(results[0], asyncio.CancelledError)
+        self.assertTrue(all(data == {'items': [1]} for data in results[1:]))
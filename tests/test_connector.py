@@ -0,0 +1,71 @@
+"""
+Test connection pool settings and statistics of AsRestSession
+"""
+import asyncio
+
+from aiohttp import TCPConnector
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.as_rest import AsRestSession, ConnectorSettings
+from wxc_sdk.tokens import Tokens
+
+
+class Handler(MockHandler):
+    # keep-alive
+    protocol_version = 'HTTP/1.1'
+    routes = [('GET', r'/test', 'get')]
+
+    def get(self):
+        self.reply(200, {'path': self.path})
+
+
+class TestConnector(MockServerTestCase):
+    handler = Handler
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.url = f'{cls.server_url}/test'
+
+    def test_001_defaults(self):
+        """
+        connection limit is aligned with the number of concurrent requests; connections are reused
+        """
+
+        async def run():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=5) as session:
+                await asyncio.gather(*[session.rest_get(url=self.url) for _ in range(50)])
+                return session.pool_stats, session.pool_state
+
+        stats, state = asyncio.run(run())
+        self.assertEqual(10, state['limit'])
+        self.assertEqual(50, stats.requests)
+        self.assertLessEqual(stats.connections_created, 5)
+        self.assertEqual(50, stats.connections_created + stats.connections_reused)
+        self.assertGreater(stats.reuse_ratio, 0.8)
+        self.assertEqual(0, state['in_use'])
+
+    def test_002_settings(self):
+        async def run():
+            async with AsWebexSimpleApi(tokens='token', concurrent_requests=5,
+                                        connector=ConnectorSettings(limit=2, limit_per_host=1)) as api:
+                await asyncio.gather(*[api.session.rest_get(url=self.url) for _ in range(10)])
+                return api.session.pool_stats, api.session.pool_state
+
+        stats, state = asyncio.run(run())
+        self.assertEqual((2, 1), (state['limit'], state['limit_per_host']))
+        self.assertEqual(1, stats.connections_created)
+        self.assertGreater(stats.connections_queued, 0)
+
+    def test_003_custom_connector(self):
+        async def run():
+            connector = TCPConnector(limit=3)
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=5,
+                                     connector=connector) as session:
+                self.assertIs(connector, session.connector)
+                await session.rest_get(url=self.url)
+                return session.pool_stats
+
+        stats = asyncio.run(run())
+        self.assertEqual(1, stats.requests)
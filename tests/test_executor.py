@@ -0,0 +1,95 @@
+"""
+Test concurrent execution of calls with api.map() and api.gather()
+"""
+import asyncio
+import random
+import threading
+import time
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.rest import RestError
+
+
+class Handler(MockHandler):
+    routes = [('GET', r'/.*', 'get')]
+    lock = threading.Lock()
+    #: number of 429 responses to send
+    throttle = 0
+    #: (time, path, status) for each request
+    requests = []
+
+    def get(self):
+        cls = self.__class__
+        with cls.lock:
+            status = 200
+            if self.path.endswith('/fail'):
+                status = 404
+            elif cls.throttle:
+                cls.throttle -= 1
+                status = 429
+            cls.requests.append((time.monotonic(), self.path, status))
+        if status != 200:
+            self.reply(status, headers={'Retry-After': '1'})
+            return
+        time.sleep(random.random() * 0.02)
+        self.reply(200, {'path': self.path})
+
+
+class TestExecutor(MockServerTestCase):
+    handler = Handler
+
+    def setUp(self) -> None:
+        Handler.requests.clear()
+        Handler.throttle = 0
+
+    def get(self, api, i) -> str:
+        return api.session.rest_get(url=f'{self.server_url}/{i}')['path']
+
+    def test_001_ordered(self):
+        with WebexSimpleApi(tokens='token', concurrent_requests=5) as api:
+            results = list(api.map(lambda i: self.get(api, i), range(50)))
+        self.assertEqual([f'/{i}' for i in range(50)], results)
+
+    def test_002_unordered(self):
+        with WebexSimpleApi(tokens='token', concurrent_requests=5) as api:
+            results = list(api.map(lambda i, j: self.get(api, f'{i}/{j}'), range(50), range(50), ordered=False))
+        self.assertEqual(sorted(f'/{i}/{i}' for i in range(50)), sorted(results))
+
+    def test_003_gather(self):
+        with WebexSimpleApi(tokens='token', concurrent_requests=5) as api:
+            results = api.gather(lambda: self.get(api, 1), lambda: self.get(api, 'fail'), return_exceptions=True)
+            self.assertEqual('/1', results[0])
+            self.assertIsInstance(results[1], RestError)
+            with self.assertRaises(RestError):
+                api.gather(lambda: self.get(api, 1), lambda: self.get(api, 'fail'))
+
+    def test_004_429_backoff(self):
+        """
+        a 429 holds back all requests of the session
+        """
+        Handler.throttle = 1
+        with WebexSimpleApi(tokens='token', concurrent_requests=5) as api:
+            list(api.map(lambda i: self.get(api, i), range(20)))
+        throttled = next(t for t, _, status in Handler.requests if status == 429)
+        after = [t for t, _, status in Handler.requests if t > throttled + 0.05]
+        # all requests after the 429 were sent after the Retry-After period
+        self.assertTrue(after)
+        self.assertTrue(all(t >= throttled + 0.95 for t in after))
+
+    def test_005_async(self):
+        async def run():
+            async with AsWebexSimpleApi(tokens='token', concurrent_requests=5) as api:
+                async def get(i):
+                    return (await api.session.rest_get(url=f'{self.server_url}/{i}'))['path']
+
+                ordered = await api.map(get, range(30))
+                unordered = await api.map(get, range(30), ordered=False)
+                gathered = await api.gather(lambda: get(1), lambda: get(2))
+                return ordered, unordered, gathered
+
+        ordered, unordered, gathered = asyncio.run(run())
+        self.assertEqual([f'/{i}' for i in range(30)], ordered)
+        self.assertEqual(sorted(ordered), sorted(unordered))
+        self.assertEqual(['/1', '/2'], gathered)
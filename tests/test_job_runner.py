@@ -0,0 +1,210 @@
+"""
+Test job runner for device settings and manage numbers jobs
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import as_completed
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.common import DeviceCustomization, DeviceCustomizations
+from wxc_sdk.job_runner import JobRunner, AsJobRunner, PollPolicy, JobKind
+from wxc_sdk.telephony.jobs import NumberItem
+
+DEVICE_JOBS = '/v1/telephony/config/jobs/devices/callDeviceSettings'
+NUMBER_JOBS = '/v1/telephony/config/jobs/numbers/manageNumbers'
+
+#: run time of a job on the mock server
+JOB_DURATION = 0.1
+
+POLL = PollPolicy(initial=0.01, factor=2, maximum=0.04)
+
+
+class Handler(MockHandler):
+    routes = [('POST', DEVICE_JOBS, 'create_device_job'),
+              ('POST', NUMBER_JOBS, 'create_number_job'),
+              ('GET', r'/v1/.+/(?P<job_id>job\d+)/errors', 'job_errors'),
+              ('GET', r'/v1/.+/(?P<job_id>job\d+)', 'job_status')]
+    lock = threading.Lock()
+    #: jobs by id
+    jobs = {}
+    #: number of 409 responses
+    conflicts = 0
+    #: maximum number of concurrently running jobs per org
+    max_running = {}
+    requests = 0
+
+    @classmethod
+    def reset(cls):
+        cls.jobs.clear()
+        cls.max_running.clear()
+        cls.conflicts = 0
+        cls.requests = 0
+
+    @classmethod
+    def add_job(cls, org: str, kind: str, location: str = None) -> dict:
+        now = time.monotonic()
+        running = [job for job in cls.jobs.values() if job['org'] == org and job['kind'] == kind
+                   and job['done'] > now]
+        if running:
+            cls.conflicts += 1
+            return {}
+        job_id = f'job{len(cls.jobs)}'
+        errors = 2 if location in ('bad', 'anonymous') else 0
+        job = cls.jobs[job_id] = {'id': job_id, 'org': org, 'kind': kind, 'location': location, 'errors': errors,
+                                  'start': now, 'done': now + JOB_DURATION}
+        cls.max_running[org] = max(cls.max_running.get(org, 0), len(running) + 1)
+        return job
+
+    @staticmethod
+    def status(job: dict) -> dict:
+        now = time.monotonic()
+        status = 'COMPLETED' if now >= job['done'] else 'STARTED'
+        data = {'id': job['id'], 'latestExecutionStatus': status, 'trackingId': 't', 'sourceUserId': 'u',
+                'sourceCustomerId': job['org'], 'targetCustomerId': job['org'], 'instanceId': 1,
+                'jobExecutionStatus': []}
+        if job['kind'] == 'numbers':
+            # errors show up in the counts while the job is running
+            data.update(targetLocationId=job['location'],
+                        counts={'totalNumbers': 2, 'numbersFailed': job['errors'] if now > job['start'] else 0})
+        else:
+            data.update(locationCustomizationsEnabled=False, target='LOCATION', locationId=job['location'] or '',
+                        locationName=job['location'], percentageComplete='0')
+        return data
+
+    def create_job(self, kind: str, location: str = None):
+        org = self.param('orgId', 'own')
+        with self.lock:
+            Handler.requests += 1
+            job = self.add_job(org, kind, location)
+        if not job:
+            self.reply(409, {'message': 'job already running'})
+            return
+        self.reply(200, self.status(job))
+
+    def create_device_job(self):
+        self.create_job('devices', self.json().get('locationId'))
+
+    def create_number_job(self):
+        self.create_job('numbers', self.json()['targetLocationId'])
+
+    def job_errors(self, job_id: str):
+        with self.lock:
+            Handler.requests += 1
+            job = self.jobs[job_id]
+        items = [{'itemNumber': i, 'trackingId': f'error{i}',
+                  'error': {'key': '400', 'message': [{'description': 'failed', 'code': '1'}]}}
+                 for i in range(job['errors'])]
+        if job['kind'] == 'numbers':
+            for item in items:
+                item['item'] = f'+1555000{item["itemNumber"]}'
+                if job['location'] == 'anonymous':
+                    # item number and tracking id are optional
+                    item.pop('itemNumber')
+                    item.pop('trackingId')
+        self.reply(200, {'items': items})
+
+    def job_status(self, job_id: str):
+        with self.lock:
+            Handler.requests += 1
+            job = self.jobs[job_id]
+        self.reply(200, self.status(job))
+
+
+class TestJobRunner(MockServerTestCase):
+    handler = Handler
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.customization = DeviceCustomization(customizations=DeviceCustomizations(), custom_enabled=True)
+
+    def setUp(self) -> None:
+        Handler.reset()
+
+    def test_001_poll_policy(self):
+        delays = POLL.delays()
+        self.assertEqual([0.01, 0.02, 0.04, 0.04], [next(delays) for _ in range(4)])
+
+    def test_002_serialized_per_org(self):
+        with WebexSimpleApi(tokens='token', concurrent_requests=10) as api:
+            api.session.BASE = self.base
+            start = time.perf_counter()
+            with JobRunner(api, poll=POLL) as runner:
+                futures = [runner.change_device_settings(location_id=f'location{i}',
+                                                         customization=self.customization, org_id=org)
+                           for org in ('org1', 'org2') for i in range(3)]
+                results = [future.result() for future in as_completed(futures)]
+            elapsed = time.perf_counter() - start
+        self.assertEqual(6, len(results))
+        self.assertTrue(all(result.ok for result in results))
+        # jobs never overlapped and orgs ran in parallel
+        self.assertEqual(0, Handler.conflicts)
+        self.assertEqual({'org1': 1, 'org2': 1}, Handler.max_running)
+        self.assertLess(elapsed, 5 * JOB_DURATION)
+        self.assertEqual(['location0', 'location1', 'location2'],
+                         [future.result().job.location_id for future in futures[:3]])
+
+    def test_003_conflict_and_errors(self):
+        with WebexSimpleApi(tokens='token', concurrent_requests=10) as api:
+            api.session.BASE = self.base
+            # a job started outside the runner
+            api.telephony.jobs.device_settings.change(location_id='other', customization=self.customization,
+                                                      org_id='org1')
+            with JobRunner(api, poll=POLL, stream_errors=True) as runner:
+                future = runner.change_device_settings(location_id='bad', customization=self.customization,
+                                                       org_id='org1')
+                errors = list(future.errors())
+                result = future.result()
+        self.assertGreater(Handler.conflicts, 0)
+        self.assertEqual(2, len(errors))
+        self.assertEqual(errors, result.errors)
+        self.assertEqual('COMPLETED', result.job.latest_execution_status)
+        self.assertFalse(result.ok)
+
+    def test_004_errors_wo_item_number(self):
+        """
+        errors w/o item number and tracking id are not collapsed
+        """
+        with WebexSimpleApi(tokens='token', concurrent_requests=10) as api:
+            api.session.BASE = self.base
+            with JobRunner(api, poll=POLL) as runner:
+                result = runner.manage_numbers(operation='MOVE', target_location_id='anonymous',
+                                               number_list=[NumberItem(location_id='source',
+                                                                       numbers=['+15550000', '+15550001'])]).result()
+        self.assertEqual(['+15550000', '+15550001'], [error.item for error in result.errors])
+        self.assertIsNone(result.errors[0].item_number)
+
+    def test_005_timeout(self):
+        with WebexSimpleApi(tokens='token', concurrent_requests=10) as api:
+            api.session.BASE = self.base
+            with JobRunner(api, poll=PollPolicy(initial=0.01, timeout=0.02)) as runner:
+                future = runner.change_device_settings(location_id=None, customization=self.customization)
+                with self.assertRaises(TimeoutError):
+                    future.result()
+                self.assertEqual([], list(future.errors()))
+
+    def test_006_async(self):
+        async def run():
+            async with AsWebexSimpleApi(tokens='token', concurrent_requests=10) as api:
+                api.session.BASE = self.base
+                async with AsJobRunner(api, poll=POLL, stream_errors=True) as runner:
+                    futures = [runner.manage_numbers(operation='MOVE', target_location_id=location,
+                                                     number_list=[NumberItem(location_id='source',
+                                                                             numbers=['+15550000', '+15550001'])])
+                               for location in ('good', 'bad', 'good2')]
+                    futures.append(runner.change_device_settings(location_id='location', org_id='org1',
+                                                                 customization=self.customization))
+                    errors = [error async for error in futures[1].errors()]
+                    results = await asyncio.gather(*futures)
+                return errors, results
+
+        errors, results = asyncio.run(run())
+        self.assertEqual(2, len(errors))
+        self.assertEqual(['+15550000', '+15550001'], [error.item for error in errors])
+        self.assertEqual([JobKind.manage_numbers] * 3 + [JobKind.device_settings], [r.kind for r in results])
+        self.assertEqual([True, False, True, True], [r.ok for r in results])
+        self.assertEqual(0, Handler.conflicts)
+        self.assertEqual({'own': 1, 'org1': 1}, Handler.max_running)
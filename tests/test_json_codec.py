@@ -0,0 +1,124 @@
+"""
+Test pluggable JSON codec
+"""
+import asyncio
+import datetime
+import json
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.common.schedules import Event
+from wxc_sdk.json_codec import JsonCodec, StdJsonCodec, OrjsonCodec, json_codec, set_json_codec
+from wxc_sdk.people import Person
+from wxc_sdk.rest import RestSession
+from wxc_sdk.tokens import Tokens
+
+
+class CountingCodec(StdJsonCodec):
+    """
+    standard library codec counting calls
+    """
+
+    def __init__(self):
+        self.loads_calls = 0
+        self.dumps_calls = 0
+
+    def loads(self, s):
+        self.loads_calls += 1
+        return super().loads(s)
+
+    def dumps(self, obj, *, default=None, **kwargs):
+        self.dumps_calls += 1
+        return super().dumps(obj, default=default, **kwargs)
+
+
+class Handler(MockHandler):
+    routes = [('POST', r'/test', 'post')]
+    bodies = []
+
+    def post(self):
+        self.bodies.append((self.headers['Content-Type'], self.body()))
+        self.reply(200, {'echo': self.json(), 'name': 'Zoë'})
+
+
+class TestJsonCodec(MockServerTestCase):
+    handler = Handler
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.url = f'{cls.server_url}/test'
+
+    def setUp(self) -> None:
+        Handler.bodies.clear()
+        self.codec = CountingCodec()
+        self.previous = set_json_codec(self.codec)
+
+    def tearDown(self) -> None:
+        set_json_codec(self.previous)
+
+    def test_001_sync(self):
+        with RestSession(tokens=Tokens(access_token='token'), concurrent_requests=5) as session:
+            data = session.rest_post(url=self.url, json={'a': [1, 2]})
+        self.assertEqual({'echo': {'a': [1, 2]}, 'name': 'Zoë'}, data)
+        self.assertEqual(1, self.codec.dumps_calls)
+        self.assertEqual(1, self.codec.loads_calls)
+        ct, _ = Handler.bodies[0]
+        self.assertTrue(ct.startswith('application/json'))
+
+    def test_002_async(self):
+        async def run():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=5) as session:
+                return await session.rest_post(url=self.url, json={'a': [1, 2]})
+
+        data = asyncio.run(run())
+        self.assertEqual({'echo': {'a': [1, 2]}, 'name': 'Zoë'}, data)
+        self.assertEqual(1, self.codec.dumps_calls)
+        self.assertEqual(1, self.codec.loads_calls)
+        ct, _ = Handler.bodies[0]
+        self.assertTrue(ct.startswith('application/json'))
+
+    def test_003_model(self):
+        """
+        ApiModel.json() and parse_raw() use the codec
+        """
+        person = Person.parse_raw('{"id": "p1", "created": "2022-07-01T12:00:00.000Z"}')
+        self.assertEqual('p1', person.person_id)
+        json.loads(person.json())
+        self.assertEqual(1, self.codec.loads_calls)
+        self.assertEqual(1, self.codec.dumps_calls)
+
+    def test_004_codecs_equivalent(self):
+        """
+        all available codecs create the same JSON for models; custom json_encoders are honored
+        """
+        event = Event.day_start_end('event', datetime.date(2023, 1, 2), 9, 17)
+        codecs: list[JsonCodec] = [StdJsonCodec()]
+        for name in ('orjson', 'ujson'):
+            try:
+                set_json_codec(name)
+            except ImportError:
+                continue
+            codecs.append(json_codec())
+        results = []
+        for codec in codecs:
+            set_json_codec(codec)
+            results.append(json.loads(event.json()))
+            self.assertEqual('09:00', results[-1]['startTime'])
+        self.assertTrue(all(r == results[0] for r in results))
+
+    def test_005_orjson_fallback(self):
+        """
+        orjson codec falls back to the standard library for unsupported arguments and values
+        """
+        try:
+            codec = OrjsonCodec()
+        except ImportError:
+            self.skipTest('orjson not installed')
+        self.assertEqual(json.dumps({'a': 1}, indent=2), codec.dumps({'a': 1}, indent=2))
+        self.assertEqual(2 ** 70, codec.loads(codec.dumps(2 ** 70)))
+        self.assertEqual({'1': 'a'}, codec.loads(codec.dumps({1: 'a'})))
+
+    def test_006_unknown(self):
+        with self.assertRaises(ValueError):
+            set_json_codec('foo')
@@ -0,0 +1,65 @@
+"""
+Test lazy import and creation of child APIs
+"""
+import asyncio
+import subprocess
+import sys
+from dataclasses import fields
+from unittest import TestCase
+
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.api_child import ApiChild
+from wxc_sdk.as_api import AsWebexSimpleApi, AsApiChild
+
+
+class TestLazyApi(TestCase):
+
+    def test_001_import(self):
+        """
+        importing wxc_sdk doesn't import the child API modules
+        """
+        code = ('import sys, wxc_sdk; '
+                'print(",".join(m for m in ("wxc_sdk.telephony", "wxc_sdk.meetings", "wxc_sdk.people") '
+                'if m in sys.modules))')
+        imported = subprocess.check_output([sys.executable, '-c', code], text=True).strip()
+        self.assertEqual('', imported)
+
+    def test_002_child_apis(self):
+        """
+        child APIs are created on first access and then reused
+        """
+        api = WebexSimpleApi(tokens='foo')
+        self.assertNotIn('telephony', api.__dict__)
+        for field in fields(api):
+            if field.name == 'session':
+                continue
+            child = getattr(api, field.name)
+            self.assertIsInstance(child, ApiChild, field.name)
+            self.assertIs(api.session, child.session)
+            self.assertIs(child, getattr(api, field.name))
+
+    def test_003_compatibility(self):
+        """
+        child API classes can still be imported from wxc_sdk
+        """
+        from wxc_sdk import TelephonyApi
+        from wxc_sdk.telephony import TelephonyApi as Api
+        self.assertIs(Api, TelephonyApi)
+        with self.assertRaises(ImportError):
+            from wxc_sdk import FooApi  # noqa: F401
+
+    def test_004_async(self):
+        """
+        async child APIs are created on first access
+        """
+
+        async def test():
+            async with AsWebexSimpleApi(tokens='foo') as api:
+                self.assertNotIn('people', api.__dict__)
+                people = api.people
+                self.assertIsInstance(people, AsApiChild)
+                self.assertEqual('AsPeopleApi', people.__class__.__name__)
+                self.assertIs(people, api.people)
+                self.assertIs(api.session, people.session)
+
+        asyncio.run(test())
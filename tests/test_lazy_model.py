@@ -0,0 +1,89 @@
+"""
+Test lazy model proxies
+"""
+from datetime import datetime
+from unittest import TestCase
+
+from pydantic import ValidationError
+
+from wxc_sdk.base import LazyModel
+from wxc_sdk.cdr import CDR
+from wxc_sdk.people import Person
+from wxc_sdk.telephony.callqueue import CallQueue
+
+PERSON = {'id': 'p1', 'emails': ['alice@example.com'], 'displayName': 'Alice', 'created': '2022-07-01T12:00:00.000Z',
+          'phoneNumbers': [{'type': 'work', 'value': '+4961007739764'}]}
+
+
+class TestLazyModel(TestCase):
+
+    def test_001_attributes(self):
+        """
+        attributes of a proxy have the same values as the attributes of a fully validated model
+        """
+        lazy = Person.lazy(PERSON)
+        person = Person.parse_obj(PERSON)
+        self.assertIsInstance(lazy, LazyModel)
+        for attr in ('person_id', 'emails', 'display_name', 'created', 'phone_numbers', 'nick_name'):
+            self.assertEqual(getattr(person, attr), getattr(lazy, attr), attr)
+        self.assertIsInstance(lazy.created, datetime)
+
+    def test_002_projection(self):
+        """
+        only projected fields are kept
+        """
+        lazy = Person.lazy(PERSON, fields=['person_id', 'emails'])
+        self.assertEqual('p1', lazy.person_id)
+        self.assertEqual({'person_id': 'p1', 'emails': ['alice@example.com']}, lazy.dict())
+        with self.assertRaises(AttributeError):
+            _ = lazy.display_name
+
+    def test_003_dict(self):
+        """
+        dict() of a proxy is the same as dict() of the fully validated model
+        """
+        self.assertEqual(Person.parse_obj(PERSON).dict(), Person.lazy(PERSON).dict())
+
+    def test_004_properties(self):
+        """
+        properties of the model are available on the proxy
+        """
+        lazy = Person.lazy(PERSON)
+        person = Person.parse_obj(PERSON)
+        self.assertEqual(person.plus_e164, lazy.plus_e164)
+        self.assertEqual(person.tn, lazy.tn)
+        self.assertEqual('+4961007739764', lazy.tn.value)
+        self.assertNotIsInstance(lazy, Person)
+        # properties depending on fields which are not projected are not available
+        with self.assertRaises(AttributeError):
+            _ = Person.lazy(PERSON, fields=['person_id']).tn
+
+    def test_005_pre_root_validator(self):
+        """
+        pre root validators (CDR: snake case keys and empty values) are applied
+        """
+        lazy = CDR.lazy({'Start time': '2022-07-01T12:00:00.000Z', 'Duration': '17', 'Answered': 'true',
+                         'Calling line ID': 'NA'})
+        self.assertEqual(17, lazy.duration)
+        self.assertTrue(lazy.answered)
+        self.assertIsNone(lazy.calling_line_id)
+
+    def test_006_required_and_invalid(self):
+        """
+        errors surface when the attribute is accessed
+        """
+        lazy = Person.lazy({'id': 'p1', 'created': 'not a date'})
+        self.assertEqual('p1', lazy.person_id)
+        with self.assertRaises(ValidationError):
+            _ = lazy.created
+        with self.assertRaises(ValidationError):
+            lazy.validate()
+        with self.assertRaises(AttributeError):
+            _ = lazy.foo
+
+    def test_007_validate(self):
+        """
+        a full model can be created from the proxy
+        """
+        queue = CallQueue.lazy({'id': 'q1', 'name': 'queue', 'enabled': True})
+        self.assertEqual(CallQueue.parse_obj({'id': 'q1', 'name': 'queue', 'enabled': True}), queue.validate())
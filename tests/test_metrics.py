@@ -0,0 +1,145 @@
+"""
+Test request metrics and hooks
+"""
+import asyncio
+import json
+import logging
+import threading
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.json_codec import json_codec
+from wxc_sdk.metrics import RequestMetrics, RequestHooks, url_template
+from wxc_sdk.rest import RestSession, RestError
+from wxc_sdk.tokens import Tokens
+
+
+class Handler(MockHandler):
+    routes = [('GET', r'/v1/throttle/.+', 'throttle'),
+              ('GET', r'/v1/missing', 'missing'),
+              ('GET', r'/v1/.*', 'get'),
+              ('POST', r'/v1/.*', 'post')]
+    throttled = set()
+    lock = threading.Lock()
+
+    def throttle(self):
+        # first request per path is throttled
+        with self.lock:
+            first = self.path not in self.throttled
+            self.throttled.add(self.path)
+        if first:
+            self.reply(429, headers={'Retry-After': '0'})
+            return
+        self.get()
+
+    def missing(self):
+        self.reply(404, {'message': 'not found'})
+
+    def get(self):
+        self.reply(200, {'id': self.path})
+
+    def post(self):
+        self.body()
+        self.reply(200, {'ok': True})
+
+
+class FailingHooks(RequestHooks):
+    def request_start(self, method: str, template: str):
+        raise ValueError('broken hook')
+
+
+class TestMetrics(MockServerTestCase):
+    handler = Handler
+
+    def setUp(self) -> None:
+        Handler.throttled.clear()
+
+    def test_001_url_template(self):
+        for url, expected in (
+                ('https://webexapis.com/v1/people/Y2lzY29zcGFyazovL3VzL1BFT1BMRS8xMjM?callingData=true',
+                 '/v1/people/{id}'),
+                ('https://webexapis.com/v1/telephony/config/locations/Y2lzY29zcGFyazovL3VzL0xPQ0FUSU9OLzE/callQueues/'
+                 'Y2lzY29zcGFyazovL3VzL1FVRVVFLzE', '/v1/telephony/config/locations/{id}/callQueues/{id}'),
+                ('https://webexapis.com/v1/telephony/config/supportedDevices', '/v1/telephony/config/supportedDevices'),
+                ('https://webexapis.com/v1/telephony/config/announcementLanguages',
+                 '/v1/telephony/config/announcementLanguages'),
+                ('https://webexapis.com/v1/people/user%40example.com/features', '/v1/people/{id}/features'),
+                ('https://webexapis.com/v1/numbers/%2B4961007739764', '/v1/numbers/{id}'),
+                ('https://webexapis.com/v1/devices/2c3c0e1e-4d4e-4f5a-9b1b-1a2b3c4d5e6f', '/v1/devices/{id}')):
+            self.assertEqual(expected, url_template(url), url)
+
+    def test_002_sync(self):
+        metrics = RequestMetrics()
+        with RestSession(tokens=Tokens(access_token='token'), concurrent_requests=5,
+                         request_hooks=[metrics, FailingHooks()]) as session:
+            for i in range(3):
+                session.rest_get(url=f'{self.base}/people/person{i:08d}')
+            session.rest_get(url=f'{self.base}/throttle/Y2lzY29zcGFyazovL3VzL1BFT1BMRS8xMjM')
+            session.rest_post(url=f'{self.base}/people', json={'displayName': 'Alice'})
+            with self.assertRaises(RestError):
+                session.rest_get(url=f'{self.base}/missing')
+        people = metrics.endpoints[('GET', '/v1/people/{id}')]
+        self.assertEqual(3, people.requests)
+        self.assertEqual({200: 3}, dict(people.status))
+        self.assertTrue(people.bytes_in > 0)
+        throttle = metrics.endpoints[('GET', '/v1/throttle/{id}')]
+        self.assertEqual(2, throttle.requests)
+        self.assertEqual(1, throttle.retries)
+        self.assertEqual(1, metrics.throttled)
+        post = metrics.endpoints[('POST', '/v1/people')]
+        self.assertEqual(len(json_codec().dumps({'displayName': 'Alice'})), post.bytes_out)
+        self.assertEqual({404: 1}, dict(metrics.endpoints[('GET', '/v1/missing')].status))
+        self.assertEqual(0, metrics.in_flight)
+        self.assertEqual(1, metrics.max_in_flight)
+        self.assertEqual(7, metrics.requests)
+        self.assertIn('retry_after', metrics.sleep_seconds)
+
+        text = metrics.prometheus()
+        self.assertIn('wxc_sdk_request_duration_seconds_count{method="GET",endpoint="/v1/people/{id}"} 3', text)
+        self.assertIn('wxc_sdk_request_duration_seconds_bucket{method="GET",endpoint="/v1/people/{id}",le="+Inf"} 3',
+                      text)
+        self.assertIn('wxc_sdk_responses_total{method="GET",endpoint="/v1/throttle/{id}",status="429"} 1', text)
+        self.assertIn('wxc_sdk_throttled_total 1', text)
+        self.assertIn('wxc_sdk_requests_in_flight 0', text)
+        json.dumps(metrics.snapshot())
+
+    def test_003_async(self):
+        metrics = RequestMetrics()
+
+        async def run():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=10,
+                                     request_hooks=[metrics]) as session:
+                await asyncio.gather(*[session.rest_get(url=f'{self.base}/people/person{i:08d}')
+                                       for i in range(10)])
+                await session.rest_get(url=f'{self.base}/throttle/12345')
+                await session.rest_post(url=f'{self.base}/people', json={'displayName': 'Alice'})
+
+        asyncio.run(run())
+        people = metrics.endpoints[('GET', '/v1/people/{id}')]
+        self.assertEqual(10, people.requests)
+        self.assertTrue(people.bytes_in > 0)
+        throttle = metrics.endpoints[('GET', '/v1/throttle/{id}')]
+        self.assertEqual({200: 1, 429: 1}, dict(throttle.status))
+        self.assertEqual(1, throttle.retries)
+        self.assertTrue(metrics.endpoints[('POST', '/v1/people')].bytes_out > 0)
+        self.assertEqual(0, metrics.in_flight)
+        self.assertTrue(metrics.max_in_flight > 1)
+
+    def test_004_async_masked_debug_log(self):
+        """
+        with hooks JSON request bodies are still masked in the debug log
+        """
+        metrics = RequestMetrics()
+
+        async def run():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=5,
+                                     request_hooks=[metrics]) as session:
+                await session.rest_post(url=f'{self.base}/people', json={'displayName': 'Alice', 'password': 'secret'})
+
+        with self.assertLogs('wxc_sdk.as_rest', level=logging.DEBUG) as logs:
+            asyncio.run(run())
+        output = '\n'.join(logs.output)
+        self.assertIn('Alice', output)
+        self.assertNotIn('secret', output)
+        post = metrics.endpoints[('POST', '/v1/people')]
+        self.assertEqual(len(json_codec().dumps({'displayName': 'Alice', 'password': 'secret'})), post.bytes_out)
@@ -0,0 +1,249 @@
+"""
+Test bulk move of numbers w/ manage numbers jobs
+"""
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import time
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.job_runner import PollPolicy
+from wxc_sdk.number_mover import batch_numbers, NumberMover, AsNumberMover
+from wxc_sdk.telephony.jobs import NumberItem
+
+#: maximum number of numbers per job on the mock server
+LIMIT = 10
+
+#: run time of a job on the mock server
+JOB_DURATION = 0.05
+
+POLL = PollPolicy(initial=0.01, factor=2, maximum=0.02)
+
+
+def numbers(location: str, count: int, start: int = 0) -> NumberItem:
+    return NumberItem(location_id=location, numbers=[f'+1{location}{i:04d}' for i in range(start, start + count)])
+
+
+class Handler(MockHandler):
+    routes = [('POST', r'/v1/.+/(?P<job_id>job\d+)/actions/resume/invoke', 'resume_job'),
+              ('POST', r'/v1/.+', 'create_job'),
+              ('GET', r'/v1/.+/(?P<job_id>job\d+)/errors', 'job_errors'),
+              ('GET', r'/v1/.+/(?P<job_id>job\d+)', 'job_status')]
+    lock = threading.Lock()
+    jobs = {}
+    #: numbers moved so far
+    moved = []
+    #: numbers ending in 13 fail in the first job they are part of
+    failed = set()
+    conflicts = 0
+    resumed = []
+
+    @classmethod
+    def reset(cls):
+        cls.jobs.clear()
+        cls.moved.clear()
+        cls.failed.clear()
+        cls.resumed.clear()
+        cls.conflicts = 0
+
+    @classmethod
+    def add_job(cls, body: dict, paused: bool = False) -> dict:
+        now = time.monotonic()
+        job_id = f'job{len(cls.jobs)}'
+        job_numbers = [number for item in body['numberList'] for number in item['numbers']]
+        failed = [number for number in job_numbers if number.endswith('13') and number not in cls.failed]
+        cls.failed.update(failed)
+        job = cls.jobs[job_id] = {'id': job_id, 'numbers': job_numbers, 'done': now + JOB_DURATION,
+                                  'paused': paused, 'moved': False, 'failed': failed}
+        return job
+
+    @classmethod
+    def status(cls, job: dict) -> dict:
+        if job['paused']:
+            status = 'STOPPED'
+        elif time.monotonic() >= job['done']:
+            status = 'COMPLETED'
+            if not job['moved']:
+                job['moved'] = True
+                cls.moved.extend(number for number in job['numbers'] if number not in job['failed'])
+        else:
+            status = 'STARTED'
+        return {'id': job['id'], 'latestExecutionStatus': status,
+                'counts': {'totalNumbers': len(job['numbers']),
+                           'numbersFailed': len(job['failed']) if status == 'COMPLETED' else 0}}
+
+    def resume_job(self, job_id: str):
+        with self.lock:
+            job = self.jobs[job_id]
+            job['paused'] = False
+            job['done'] = time.monotonic() + JOB_DURATION
+            self.resumed.append(job['id'])
+        self.reply(204)
+
+    def create_job(self):
+        body = self.json()
+        with self.lock:
+            if sum(len(item['numbers']) for item in body['numberList']) > LIMIT:
+                self.reply(400, {'message': 'too many numbers'})
+                return
+            now = time.monotonic()
+            if any(not job['paused'] and job['done'] > now for job in self.jobs.values()):
+                Handler.conflicts += 1
+                self.reply(409, {'message': 'job already running'})
+                return
+            job = self.add_job(body)
+            self.reply(200, self.status(job))
+
+    def job_errors(self, job_id: str):
+        with self.lock:
+            job = self.jobs[job_id]
+            items = [{'item': number, 'itemNumber': i, 'trackingId': f'{job_id}-{i}',
+                      'error': {'key': '400', 'message': [{'code': '1', 'description': 'failed'}]}}
+                     for i, number in enumerate(job['numbers']) if number in job['failed']]
+            self.reply(200, {'items': items})
+
+    def job_status(self, job_id: str):
+        with self.lock:
+            self.reply(200, self.status(self.jobs[job_id]))
+
+
+class TestNumberMover(MockServerTestCase):
+    handler = Handler
+
+    def setUp(self) -> None:
+        Handler.reset()
+        self.dir = tempfile.TemporaryDirectory()
+        self.checkpoint = os.path.join(self.dir.name, 'move.jsonl')
+        # 30 numbers from two locations; two of them fail
+        self.number_list = [numbers('11', 11), numbers('22', 14), numbers('11', 5, start=12)]
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def api(self) -> WebexSimpleApi:
+        api = WebexSimpleApi(tokens='token', concurrent_requests=5)
+        api.session.BASE = self.base
+        return api
+
+    def test_001_batches(self):
+        batches = batch_numbers(self.number_list, batch_size=LIMIT)
+        self.assertEqual([10, 10, 10], [sum(len(item.numbers) for item in batch) for batch in batches])
+        self.assertEqual(['11', '22'], [item.location_id for item in batches[1]])
+        self.assertEqual([], batch_numbers([]))
+        self.assertEqual(4, len(batch_numbers(self.number_list * 2, batch_size=17)))
+
+    def test_002_move(self):
+        with self.api() as api:
+            mover = NumberMover(api, target_location_id='target', checkpoint=self.checkpoint, batch_size=LIMIT,
+                                poll=POLL)
+            summary = mover.move(self.number_list)
+        self.assertEqual(3, len(summary.batches))
+        self.assertEqual(['COMPLETED'] * 3, [batch.status for batch in summary.batches])
+        self.assertEqual(0, Handler.conflicts)
+        self.assertEqual(['+1110013', '+1220013'], sorted(summary.failed))
+        self.assertEqual(2, len(summary.errors))
+        self.assertEqual(28, summary.moved)
+        self.assertEqual(28, len(Handler.moved))
+
+        # numbers which failed in completed jobs are moved again
+        with self.api() as api:
+            mover = NumberMover(api, target_location_id='target', checkpoint=self.checkpoint, batch_size=LIMIT,
+                                poll=POLL)
+            summary = mover.move(self.number_list)
+        self.assertEqual(28, summary.skipped)
+        self.assertEqual([['+1110013', '+1220013']], [sorted(batch.numbers) for batch in summary.batches])
+        self.assertEqual(2, summary.moved)
+        self.assertEqual([], summary.failed)
+        self.assertEqual(30, len(Handler.moved))
+
+        # nothing left to do
+        with self.api() as api:
+            mover = NumberMover(api, target_location_id='target', checkpoint=self.checkpoint, batch_size=LIMIT,
+                                poll=POLL)
+            summary = mover.move(self.number_list)
+        self.assertEqual([], summary.batches)
+        self.assertEqual(30, summary.skipped)
+        self.assertEqual(4, len(Handler.jobs))
+
+    def test_003_resume(self):
+        with self.api() as api:
+            mover = NumberMover(api, target_location_id='target', checkpoint=self.checkpoint, batch_size=LIMIT,
+                                poll=POLL)
+            # stop after the first job
+            results = mover.run(self.number_list)
+            first = next(results)
+            results.close()
+        self.assertEqual('COMPLETED', first.status)
+        started = len(Handler.jobs)
+        self.assertLess(started, 3)
+
+        with self.api() as api:
+            mover = NumberMover(api, target_location_id='target', checkpoint=self.checkpoint, batch_size=LIMIT,
+                                poll=POLL)
+            summary = mover.move(self.number_list)
+        self.assertEqual(10, summary.skipped)
+        self.assertEqual(20, sum(len(batch.numbers) for batch in summary.batches))
+        # each number was moved exactly once; two numbers failed
+        self.assertEqual(sorted(set(Handler.moved)), sorted(Handler.moved))
+        self.assertEqual(28, len(Handler.moved))
+        self.assertEqual(3, len(Handler.jobs))
+
+    def test_004_resume_paused(self):
+        # a paused job from a previous run
+        paused = Handler.add_job({'numberList': [numbers('11', 3).dict(by_alias=True)]}, paused=True)
+        with open(self.checkpoint, mode='w') as f:
+            f.write(json.dumps({'event': 'started', 'jobId': paused['id'],
+                                'numberList': [{'locationId': '11', 'numbers': paused['numbers']}]}))
+            f.write('\n')
+        with self.api() as api:
+            mover = NumberMover(api, target_location_id='target', checkpoint=self.checkpoint, batch_size=LIMIT,
+                                poll=POLL)
+            summary = mover.move([numbers('11', 6)])
+        self.assertEqual([paused['id']], Handler.resumed)
+        self.assertEqual(['COMPLETED', 'COMPLETED'], [batch.status for batch in summary.batches])
+        self.assertEqual(6, summary.moved)
+        self.assertEqual(2, len(Handler.jobs))
+        self.assertEqual(0, Handler.conflicts)
+
+    def test_005_resume_completed_with_errors(self):
+        # a completed job from a previous run in which one number failed
+        done = numbers('11', 5)
+        with open(self.checkpoint, mode='w') as f:
+            f.write(json.dumps({'event': 'started', 'jobId': 'previous', 'numberList': [done.dict(by_alias=True)]}))
+            f.write('\n')
+            f.write(json.dumps({'event': 'done', 'jobId': 'previous', 'status': 'COMPLETED',
+                                'failed': ['+1110003']}))
+            f.write('\n')
+        with self.api() as api:
+            mover = NumberMover(api, target_location_id='target', checkpoint=self.checkpoint, batch_size=LIMIT,
+                                poll=POLL)
+            summary = mover.move([done])
+        self.assertEqual(4, summary.skipped)
+        self.assertEqual([['+1110003']], [batch.numbers for batch in summary.batches])
+        self.assertEqual(['+1110003'], Handler.moved)
+
+    def test_006_async(self):
+        async def run():
+            async with AsWebexSimpleApi(tokens='token', concurrent_requests=5) as api:
+                api.session.BASE = self.base
+                mover = AsNumberMover(api, target_location_id='target', checkpoint=self.checkpoint,
+                                      batch_size=LIMIT, poll=POLL)
+                return await mover.move(self.number_list)
+
+        summary = asyncio.run(run())
+        self.assertEqual(['COMPLETED'] * 3, [batch.status for batch in summary.batches])
+        self.assertEqual(28, summary.moved)
+        self.assertEqual(2, len(summary.errors))
+        self.assertEqual(0, Handler.conflicts)
+
+        summary = asyncio.run(run())
+        self.assertEqual(28, summary.skipped)
+        self.assertEqual(2, summary.moved)
+
+        summary = asyncio.run(run())
+        self.assertEqual(30, summary.skipped)
+        self.assertEqual([], summary.batches)
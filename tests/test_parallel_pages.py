@@ -0,0 +1,122 @@
+"""
+Test pagination w/ concurrent requests for offset based pagination
+"""
+import asyncio
+import threading
+import time
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.tokens import Tokens
+
+#: number of items on the mock server
+TOTAL = 95
+
+#: page size
+PAGE = 10
+
+
+class Handler(MockHandler):
+    routes = [('GET', r'/v1/items', 'items'),
+              ('GET', r'/v1/cursor', 'cursor')]
+    lock = threading.Lock()
+    #: start offsets (or cursors) of all requests
+    offsets = []
+    #: response delay for all pages except the last one
+    delay = 0
+    in_flight = 0
+    max_in_flight = 0
+
+    @classmethod
+    def reset(cls):
+        cls.offsets.clear()
+        cls.delay = 0
+        cls.in_flight = 0
+        cls.max_in_flight = 0
+
+    def page(self, param: str, path: str):
+        start = int(self.param(param, '0'))
+        size = int(self.param('max'))
+        cls = self.__class__
+        with cls.lock:
+            cls.offsets.append(start)
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        if not start < TOTAL <= start + size:
+            time.sleep(cls.delay)
+        with cls.lock:
+            cls.in_flight -= 1
+        headers = {}
+        if start + size < TOTAL:
+            headers['Link'] = f'<http://{self.headers["Host"]}{path}?max={size}&{param}={start + size}>; rel="next"'
+        self.reply(200, {'items': list(range(start, min(start + size, TOTAL)))}, headers=headers)
+
+    def items(self):
+        self.page('start', '/v1/items')
+
+    def cursor(self):
+        self.page('cursor', '/v1/cursor')
+
+
+class TestParallelPages(MockServerTestCase):
+    handler = Handler
+
+    def setUp(self) -> None:
+        Handler.reset()
+
+    def pages(self, url: str, parallel: int, ordered: bool = True) -> list[dict]:
+        async def run():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=20) as session:
+                return [page async for page in session._parallel_pages(url=url, params={'max': PAGE},
+                                                                       parallel=parallel, ordered=ordered)]
+
+        return asyncio.run(run())
+
+    def test_001_ordered(self):
+        Handler.delay = 0.02
+        pages = self.pages(f'{self.base}/items', parallel=4)
+        self.assertEqual(list(range(TOTAL)), [item for page in pages for item in page['items']])
+        self.assertGreater(Handler.max_in_flight, 1)
+        # requests beyond the last page are limited by the number of parallel requests
+        offsets = set(Handler.offsets)
+        self.assertEqual(len(Handler.offsets), len(offsets))
+        self.assertLessEqual(set(range(0, TOTAL, PAGE)), offsets)
+        self.assertLessEqual(max(offsets), TOTAL // PAGE * PAGE + 3 * PAGE)
+
+    def test_002_unordered(self):
+        async def run():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=20) as session:
+                return [item async for item in session.follow_pagination(url=f'{self.base}/items',
+                                                                          params={'max': PAGE},
+                                                                          parallel=4, ordered=False)]
+
+        items = asyncio.run(run())
+        self.assertEqual(list(range(TOTAL)), sorted(items))
+
+    def test_003_last_page_early(self):
+        """
+        last page is received before all other pages: pages beyond the last page are cancelled and no new pages
+        are requested
+        """
+        Handler.delay = 0.1
+        parallel = 12
+        pages = self.pages(f'{self.base}/items', parallel=parallel, ordered=False)
+        items = [item for page in pages for item in page['items']]
+        self.assertEqual(TOTAL // PAGE + 1, len(pages))
+        self.assertEqual(list(range(TOTAL)), sorted(items))
+        # the last page was yielded first
+        self.assertEqual(TOTAL // PAGE * PAGE, items[PAGE])
+        # only the initial batch of requests; nothing requested after the last page
+        offsets = set(Handler.offsets)
+        self.assertEqual(len(Handler.offsets), len(offsets))
+        self.assertLessEqual(set(range(0, TOTAL, PAGE)), offsets)
+        self.assertLessEqual(offsets, set(range(0, (parallel + 1) * PAGE, PAGE)))
+
+    def test_004_no_start(self):
+        """
+        next links w/o start parameter: fall back to following the next links
+        """
+        pages = self.pages(f'{self.base}/cursor', parallel=4)
+        self.assertEqual(list(range(TOTAL)), [item for page in pages for item in page['items']])
+        self.assertEqual(list(range(0, TOTAL, PAGE)), Handler.offsets)
+        self.assertEqual(1, Handler.max_in_flight)
@@ -0,0 +1,145 @@
+"""
+Test prefetch of pages in a background thread or task
+"""
+import asyncio
+import threading
+import time
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk.as_rest import AsRestSession, AsRestError
+from wxc_sdk.rest import RestSession, RestError
+from wxc_sdk.tokens import Tokens
+
+#: number of items on the mock server
+TOTAL = 95
+
+#: page size
+PAGE = 10
+
+#: prefetch depth used in tests
+PREFETCH = 3
+
+
+class Handler(MockHandler):
+    routes = [('GET', r'/v1/items', 'items'),
+              ('GET', r'/v1/broken', 'broken')]
+    lock = threading.Lock()
+    #: start offsets of all requests
+    offsets = []
+
+    def page(self, path: str):
+        start = int(self.param('start', '0'))
+        size = int(self.param('max'))
+        with self.lock:
+            self.offsets.append(start)
+        time.sleep(0.01)
+        headers = {}
+        if start + size < TOTAL:
+            headers['Link'] = f'<http://{self.headers["Host"]}{path}?max={size}&start={start + size}>; rel="next"'
+        self.reply(200, {'items': list(range(start, min(start + size, TOTAL)))}, headers=headers)
+
+    def items(self):
+        self.page('/v1/items')
+
+    def broken(self):
+        # pagination fails after the 3rd page
+        if int(self.param('start', '0')) >= 3 * PAGE:
+            self.reply(404, {'message': 'not found'})
+            return
+        self.page('/v1/broken')
+
+
+def prefetch_threads() -> list[threading.Thread]:
+    """
+    prefetch threads still running after giving them a chance to terminate
+    """
+    for _ in range(100):
+        threads = [thread for thread in threading.enumerate() if thread.name == 'pagination-prefetch']
+        if not threads:
+            break
+        time.sleep(0.01)
+    return threads
+
+
+class TestPrefetchPages(MockServerTestCase):
+    handler = Handler
+
+    def setUp(self) -> None:
+        Handler.offsets.clear()
+
+    def session(self) -> RestSession:
+        return RestSession(tokens=Tokens(access_token='token'), concurrent_requests=5)
+
+    def as_session(self) -> AsRestSession:
+        return AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=5)
+
+    def test_001_same_result(self):
+        with self.session() as session:
+            plain = list(session.follow_pagination(url=f'{self.base}/items', params={'max': PAGE}, prefetch=0))
+            prefetched = list(session.follow_pagination(url=f'{self.base}/items', params={'max': PAGE},
+                                                        prefetch=PREFETCH))
+        self.assertEqual(list(range(TOTAL)), plain)
+        self.assertEqual(plain, prefetched)
+
+    def test_002_consumer_stops_early(self):
+        with self.session() as session:
+            items = session.follow_pagination(url=f'{self.base}/items', params={'max': PAGE}, prefetch=PREFETCH)
+            self.assertEqual(0, next(items))
+            items.close()
+            self.assertEqual([], prefetch_threads())
+        # producer didn't read ahead more than the prefetch depth
+        self.assertLessEqual(len(Handler.offsets), PREFETCH + 1)
+
+    def test_003_error(self):
+        items = []
+        with self.session() as session:
+            with self.assertRaises(RestError) as exc:
+                for item in session.follow_pagination(url=f'{self.base}/broken', params={'max': PAGE},
+                                                      prefetch=PREFETCH):
+                    items.append(item)
+        self.assertEqual(404, exc.exception.response.status_code)
+        self.assertEqual(list(range(3 * PAGE)), items)
+        self.assertEqual([], prefetch_threads())
+
+    def test_004_async_same_result(self):
+        async def run():
+            async with self.as_session() as session:
+                plain = [item async for item in session.follow_pagination(url=f'{self.base}/items',
+                                                                           params={'max': PAGE}, prefetch=0)]
+                prefetched = [item async for item in session.follow_pagination(url=f'{self.base}/items',
+                                                                                params={'max': PAGE},
+                                                                                prefetch=PREFETCH)]
+                return plain, prefetched
+
+        plain, prefetched = asyncio.run(run())
+        self.assertEqual(list(range(TOTAL)), plain)
+        self.assertEqual(plain, prefetched)
+
+    def test_005_async_consumer_stops_early(self):
+        async def run():
+            async with self.as_session() as session:
+                items = session.follow_pagination(url=f'{self.base}/items', params={'max': PAGE}, prefetch=PREFETCH)
+                first = await items.__anext__()
+                await items.aclose()
+                # give the producer a chance to terminate
+                await asyncio.sleep(0.05)
+                return first, [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+
+        first, tasks = asyncio.run(run())
+        self.assertEqual(0, first)
+        self.assertEqual([], tasks)
+        self.assertLessEqual(len(Handler.offsets), PREFETCH + 1)
+
+    def test_006_async_error(self):
+        items = []
+
+        async def run():
+            async with self.as_session() as session:
+                async for item in session.follow_pagination(url=f'{self.base}/broken', params={'max': PAGE},
+                                                            prefetch=PREFETCH):
+                    items.append(item)
+
+        with self.assertRaises(AsRestError) as exc:
+            asyncio.run(run())
+        self.assertEqual(404, exc.exception.status)
+        self.assertEqual(list(range(3 * PAGE)), items)
@@ -0,0 +1,125 @@
+"""
+Test adaptive rate limiter
+"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from wxc_sdk.rate_limit import RateLimiter
+
+
+class TestRateLimiter(TestCase):
+
+    def test_001_burst(self):
+        """
+        requests within the burst size don't have to wait
+        """
+        limiter = RateLimiter(max_rate=10, burst=5)
+        waits = [limiter.reserve() for _ in range(5)]
+        self.assertTrue(all(w <= 0 for w in waits))
+        # .. but the next one has to wait for ~1/rate
+        wait = limiter.reserve()
+        self.assertAlmostEqual(0.1, wait, delta=0.02)
+
+    def test_002_429_blocks_all(self):
+        """
+        after a 429 all requests are held back for retry after and the rate drops
+        """
+        limiter = RateLimiter(max_rate=10, increase=0)
+        limiter.on_429(2)
+        self.assertAlmostEqual(5, limiter.rate, delta=0.01)
+        self.assertEqual(1, limiter.throttled)
+        wait = limiter.reserve()
+        self.assertGreater(wait, 1.9)
+
+    def test_003_single_decrease_per_backoff(self):
+        """
+        multiple 429s within the same backoff period only reduce the rate once
+        """
+        limiter = RateLimiter(max_rate=10, increase=0)
+        for _ in range(10):
+            limiter.on_429(1)
+        self.assertAlmostEqual(5, limiter.rate, delta=0.01)
+        self.assertEqual(10, limiter.throttled)
+
+    def test_004_min_rate(self):
+        """
+        rate never drops below min rate
+        """
+        limiter = RateLimiter(max_rate=10, min_rate=4, increase=0)
+        limiter.on_429(0)
+        limiter.on_429(0)
+        limiter.on_429(0)
+        self.assertAlmostEqual(4, limiter.rate, delta=0.01)
+
+    def test_005_additive_increase(self):
+        """
+        rate recovers after a 429
+        """
+        limiter = RateLimiter(max_rate=10, increase=50)
+        limiter.on_429(0)
+        time.sleep(0.05)
+        self.assertGreater(limiter.rate, 6)
+        time.sleep(0.1)
+        self.assertEqual(10, limiter.rate)
+
+    def test_006_async(self):
+        """
+        async acquire waits as well
+        """
+        limiter = RateLimiter(max_rate=20, burst=1)
+
+        async def run():
+            start = time.perf_counter()
+            await asyncio.gather(*[limiter.as_acquire() for _ in range(5)])
+            return time.perf_counter() - start
+
+        elapsed = asyncio.run(run())
+        self.assertAlmostEqual(0.2, elapsed, delta=0.05)
+
+    def test_007_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(max_rate=1, min_rate=2)
+        with self.assertRaises(ValueError):
+            RateLimiter(decrease=1)
+
+    def test_008_429_while_waiting(self):
+        """
+        requests already waiting for a token when a 429 is reported are held back until the end of the backoff period
+        """
+        limiter = RateLimiter(max_rate=20, burst=1, increase=0)
+
+        def request(_) -> float:
+            limiter.acquire()
+            return time.perf_counter() - start
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            sent = pool.map(request, range(10))
+            time.sleep(0.12)
+            limiter.on_429(0.5)
+            sent = sorted(sent)
+        self.assertEqual([], [t for t in sent if 0.13 < t < 0.6])
+        # after the backoff requests are spaced at the reduced rate
+        after = [t for t in sent if t >= 0.6]
+        self.assertGreater(len(after), 5)
+        self.assertTrue(all(b - a > 0.08 for a, b in zip(after, after[1:])))
+
+    def test_009_async_429_while_waiting(self):
+        limiter = RateLimiter(max_rate=20, burst=1, increase=0)
+
+        async def request() -> float:
+            await limiter.as_acquire()
+            return time.perf_counter() - start
+
+        async def run():
+            tasks = [asyncio.create_task(request()) for _ in range(10)]
+            await asyncio.sleep(0.12)
+            limiter.on_429(0.5)
+            return sorted(await asyncio.gather(*tasks))
+
+        start = time.perf_counter()
+        sent = asyncio.run(run())
+        self.assertEqual([], [t for t in sent if 0.13 < t < 0.6])
+        self.assertGreater(len([t for t in sent if t >= 0.6]), 5)
@@ -0,0 +1,164 @@
+"""
+Test incremental decoding of report payloads
+"""
+import asyncio
+import csv
+import gzip
+import io
+import os
+import random
+import tempfile
+import threading
+import zipfile
+from unittest import TestCase
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.reports import ReportDecoder, ReportDecompressor
+
+CSV = '\ufeff' + '\r\n'.join(['Start time,User,Comment'] +
+                             [f'2022-07-01T12:00:{i % 60:02}.000Z,user{i},"line 1\r\nline ""{i}"", äöü"'
+                              for i in range(500)] +
+                             ['2022-07-01T12:01:00.000Z,short']) + '\r\n'
+
+
+def chunks(data: bytes, seed: int = 0) -> list[bytes]:
+    """
+    split data in chunks of random size
+    """
+    rnd = random.Random(seed)
+    r = []
+    while data:
+        size = rnd.randint(1, 200)
+        r.append(data[:size])
+        data = data[size:]
+    return r
+
+
+def decode(data: bytes) -> list[dict]:
+    decoder = ReportDecoder()
+    rows = []
+    for chunk in chunks(data):
+        rows.extend(decoder.feed(chunk))
+    rows.extend(decoder.close())
+    return rows
+
+
+def zipped(data: bytes, compression: int) -> bytes:
+    f = io.BytesIO()
+    with zipfile.ZipFile(f, mode='w', compression=compression) as zf:
+        zf.writestr('report.csv', data)
+    return f.getvalue()
+
+
+class TestReportDecoder(TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.data = CSV.encode('utf-8')
+        cls.expected = list(csv.DictReader(io.StringIO(CSV.lstrip('\ufeff'), newline='')))
+
+    def test_001_plain(self):
+        rows = decode(self.data)
+        self.assertEqual(501, len(rows))
+        self.assertEqual(self.expected, rows)
+
+    def test_002_gzip(self):
+        self.assertEqual(self.expected, decode(gzip.compress(self.data)))
+
+    def test_003_zip(self):
+        self.assertEqual(self.expected, decode(zipped(self.data, zipfile.ZIP_DEFLATED)))
+
+    def test_004_zip_stored(self):
+        self.assertEqual(self.expected, decode(zipped(self.data, zipfile.ZIP_STORED)))
+
+    def test_005_decompressor(self):
+        decompressor = ReportDecompressor()
+        data = b''.join(decompressor.feed(chunk) for chunk in chunks(zipped(self.data, zipfile.ZIP_DEFLATED)))
+        data += decompressor.flush()
+        self.assertEqual('zip', decompressor.format)
+        self.assertEqual(self.data, data)
+
+    def test_006_empty(self):
+        self.assertEqual([], decode(b''))
+        self.assertEqual([], decode(b'a,b\n'))
+
+
+class Handler(MockHandler):
+    routes = [('GET', r'/v1/report.gz', 'report'),
+              ('GET', r'/v1/truncated.gz', 'truncated')]
+    lock = threading.Lock()
+    #: paths of requests seen so far; the first request for each path is throttled
+    seen = set()
+
+    def report(self):
+        with self.lock:
+            first = self.path not in self.seen
+            self.seen.add(self.path)
+        if first:
+            self.reply(429, headers={'Retry-After': '0'})
+            return
+        self.reply(200, body=gzip.compress(CSV.encode('utf-8')), content_type='application/gzip')
+
+    def truncated(self):
+        # connection is closed after half of the body
+        body = gzip.compress(CSV.encode('utf-8'))
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body[:len(body) // 2])
+
+
+class TestReportDownload(MockServerTestCase):
+    handler = Handler
+
+    def setUp(self) -> None:
+        Handler.seen.clear()
+        self.dir = tempfile.TemporaryDirectory()
+        self.data = CSV.encode('utf-8')
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def test_001_download_to_file(self):
+        path = os.path.join(self.dir.name, 'report.csv')
+        raw = os.path.join(self.dir.name, 'report.gz')
+        with WebexSimpleApi(tokens='token') as api:
+            self.assertEqual(len(self.data), api.reports.download_to_file(url=f'{self.base}/report.gz', path=path))
+            api.reports.download_to_file(url=f'{self.base}/report.gz', path=raw, decompress=False)
+            rows = list(api.reports.download(url=f'{self.base}/report.gz'))
+        with open(path, mode='rb') as f:
+            self.assertEqual(self.data, f.read())
+        with open(raw, mode='rb') as f:
+            self.assertEqual(self.data, gzip.decompress(f.read()))
+        self.assertEqual(501, len(rows))
+        self.assertEqual(['report.csv', 'report.gz'], sorted(os.listdir(self.dir.name)))
+
+    def test_002_truncated(self):
+        """
+        a failed download doesn't leave a (partial) file
+        """
+        path = os.path.join(self.dir.name, 'report.csv')
+        with WebexSimpleApi(tokens='token') as api:
+            with self.assertRaises(Exception):
+                api.reports.download_to_file(url=f'{self.base}/truncated.gz', path=path)
+        self.assertEqual([], os.listdir(self.dir.name))
+
+    def test_003_async(self):
+        path = os.path.join(self.dir.name, 'report.csv')
+        truncated = os.path.join(self.dir.name, 'truncated.csv')
+
+        async def run():
+            async with AsWebexSimpleApi(tokens='token') as api:
+                written = await api.reports.download_to_file(url=f'{self.base}/report.gz', path=path)
+                rows = await api.reports.download(url=f'{self.base}/report.gz')
+                with self.assertRaises(Exception):
+                    await api.reports.download_to_file(url=f'{self.base}/truncated.gz', path=truncated)
+                return written, rows
+
+        written, rows = asyncio.run(run())
+        self.assertEqual(len(self.data), written)
+        self.assertEqual(501, len(rows))
+        self.assertEqual(['report.csv'], os.listdir(self.dir.name))
@@ -0,0 +1,202 @@
+"""
+Test token manager: proactive and background refresh, retry after 401, single-flight refresh and shared token store
+"""
+import asyncio
+import os
+import tempfile
+import threading
+import time
+from urllib.parse import parse_qs
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.integration import Integration
+from wxc_sdk.rest import RestError
+from wxc_sdk.token_manager import TokenManager, FileTokenStore, CallbackTokenStore
+from wxc_sdk.tokens import Tokens
+
+
+class Handler(MockHandler):
+    routes = [('POST', r'/v1/access_token', 'access_token'),
+              ('GET', r'/v1/.*', 'get')]
+    lock = threading.Lock()
+    #: number of access tokens issued
+    refreshes = 0
+    #: the only access token accepted by the mock server
+    valid = None
+    #: lifetime of issued access tokens
+    expires_in = 3600
+    #: reject refresh requests
+    fail_refresh = False
+    #: number of 401 responses
+    unauthorized = 0
+
+    @classmethod
+    def reset(cls):
+        cls.refreshes = 0
+        cls.valid = None
+        cls.expires_in = 3600
+        cls.fail_refresh = False
+        cls.unauthorized = 0
+
+    def access_token(self):
+        form = parse_qs(self.body().decode())
+        # give concurrent callers a chance to pile up
+        time.sleep(0.05)
+        with self.lock:
+            if self.fail_refresh or form['grant_type'] != ['refresh_token']:
+                self.reply(400, {'message': 'invalid refresh token'})
+                return
+            Handler.refreshes += 1
+            Handler.valid = f'token{Handler.refreshes}'
+            data = {'access_token': Handler.valid, 'expires_in': Handler.expires_in, 'refresh_token': 'refresh',
+                    'refresh_token_expires_in': 7776000, 'token_type': 'Bearer', 'scope': 'spark:all'}
+        self.reply(200, data)
+
+    def get(self):
+        with self.lock:
+            if self.headers.get('Authorization') != f'Bearer {Handler.valid}':
+                Handler.unauthorized += 1
+                self.reply(401, {'message': 'The request requires a valid access token set in the Authorization '
+                                            'request header.'})
+                return
+        self.reply(200, {'path': self.url.path})
+
+
+def tokens(access_token: str = 'token0', expires_in: int = 3600) -> Tokens:
+    tokens = Tokens(access_token=access_token, expires_in=expires_in, refresh_token='refresh',
+                    refresh_token_expires_in=7776000, token_type='Bearer')
+    tokens.set_expiration()
+    return tokens
+
+
+class TestTokenManager(MockServerTestCase):
+    handler = Handler
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.integration = Integration(client_id='client', client_secret='secret', scopes='spark:all',
+                                      redirect_url='http://localhost:6001/redirect',
+                                      token_service=f'{cls.base}/access_token')
+
+    def setUp(self) -> None:
+        Handler.reset()
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def api(self, manager: TokenManager) -> WebexSimpleApi:
+        api = WebexSimpleApi(token_manager=manager, concurrent_requests=10)
+        api.session.BASE = self.base
+        return api
+
+    def test_001_retry_after_401(self):
+        manager = TokenManager(self.integration, tokens=tokens())
+        with self.api(manager) as api:
+            self.assertIs(manager.tokens, api.session._tokens)
+            result = api.session.rest_get(api.session.ep('ping'))
+        manager.close()
+        self.assertEqual({'path': '/v1/ping'}, result)
+        self.assertEqual(1, Handler.unauthorized)
+        self.assertEqual(1, Handler.refreshes)
+        self.assertEqual('token1', manager.tokens.access_token)
+
+    def test_002_single_flight(self):
+        manager = TokenManager(self.integration, tokens=tokens())
+        with self.api(manager) as api:
+            results = list(api.map(lambda i: api.session.rest_get(api.session.ep(f'ping/{i}')), range(20)))
+        manager.close()
+        self.assertEqual(20, len(results))
+        # many requests failed w/ 401 but the access token was only refreshed once
+        self.assertGreater(Handler.unauthorized, 1)
+        self.assertEqual(1, Handler.refreshes)
+        self.assertEqual(1, manager.refreshes)
+
+    def test_003_refresh_before_expiration(self):
+        Handler.valid = 'token0'
+        manager = TokenManager(self.integration, tokens=tokens(expires_in=60), min_lifetime=300)
+        with self.api(manager) as api:
+            api.session.rest_get(api.session.ep('ping'))
+            api.session.rest_get(api.session.ep('ping'))
+        manager.close()
+        # token was refreshed before the 1st request and no request failed
+        self.assertEqual(1, Handler.refreshes)
+        self.assertEqual(0, Handler.unauthorized)
+        self.assertGreater(manager.tokens.remaining, 300)
+
+    def test_004_refresh_fails(self):
+        Handler.fail_refresh = True
+        manager = TokenManager(self.integration, tokens=tokens())
+        with self.api(manager) as api:
+            with self.assertRaises(RestError) as exc:
+                api.session.rest_get(api.session.ep('ping'))
+        manager.close()
+        self.assertEqual(401, exc.exception.response.status_code)
+        self.assertEqual(1, Handler.unauthorized)
+
+    def test_005_background_refresh(self):
+        Handler.valid = 'token0'
+        with TokenManager(self.integration, tokens=tokens(expires_in=600), refresh_ahead=900) as manager:
+            for _ in range(100):
+                if manager.refreshes:
+                    break
+                time.sleep(0.02)
+        self.assertEqual(1, Handler.refreshes)
+        self.assertEqual('token1', manager.tokens.access_token)
+
+    def test_006_file_store(self):
+        path = os.path.join(self.dir.name, 'tokens.yml')
+        store = FileTokenStore(path)
+        store.write(tokens())
+        first = TokenManager(self.integration, store=store)
+        second = TokenManager(self.integration, store=FileTokenStore(path))
+        self.assertEqual('token0', second.tokens.access_token)
+
+        # first process refreshes; second process picks up the new token from the store after a 401
+        self.assertTrue(first.refresh(force=True))
+        self.assertEqual('token1', store.read().access_token)
+        with self.api(second) as api:
+            api.session.rest_get(api.session.ep('ping'))
+        first.close()
+        second.close()
+        self.assertEqual(1, Handler.refreshes)
+        self.assertEqual('token1', second.tokens.access_token)
+        self.assertEqual(1, second.refreshes)
+
+    def test_007_json_and_callback_store(self):
+        path = os.path.join(self.dir.name, 'tokens.json')
+        store = FileTokenStore(path)
+        self.assertIsNone(store.read())
+        with self.assertRaises(ValueError):
+            TokenManager(self.integration, store=store)
+        store.write(tokens())
+        self.assertEqual('token0', store.read().access_token)
+
+        cache = {}
+        callback_store = CallbackTokenStore(read_from_cache=lambda: cache.get('tokens'),
+                                            write_to_cache=lambda t: cache.update(tokens=t.copy()))
+        manager = TokenManager(self.integration, tokens=tokens(), store=callback_store)
+        # no refresh if the token is still valid
+        self.assertFalse(manager.refresh())
+        self.assertFalse(manager.refresh(failed_token='other'))
+        self.assertTrue(manager.refresh(failed_token='token0'))
+        manager.close()
+        self.assertEqual('token1', cache['tokens'].access_token)
+
+    def test_008_async(self):
+        manager = TokenManager(self.integration, tokens=tokens())
+
+        async def run():
+            async with AsWebexSimpleApi(token_manager=manager, concurrent_requests=10) as api:
+                api.session.BASE = self.base
+                return await asyncio.gather(*[api.session.rest_get(api.session.ep(f'ping/{i}')) for i in range(20)])
+
+        results = asyncio.run(run())
+        manager.close()
+        self.assertEqual(20, len(results))
+        self.assertGreater(Handler.unauthorized, 1)
+        self.assertEqual(1, Handler.refreshes)
+        self.assertEqual('token1', manager.tokens.access_token)
@@ -0,0 +1,208 @@
+"""
+Test streaming transcript downloads and bulk export of transcripts
+"""
+import asyncio
+import io
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk import WebexSimpleApi
+from wxc_sdk.as_api import AsWebexSimpleApi
+from wxc_sdk.cassette import Cassette
+from wxc_sdk.metrics import RequestMetrics
+from wxc_sdk.rest import RestError
+from wxc_sdk.transcript_export import TranscriptExporter, AsTranscriptExporter, ExportStatus
+from wxc_sdk.wire_log import WireLog
+
+TRANSCRIPTS = 5
+
+
+def content(transcript_id: str, fmt: str) -> bytes:
+    return f'WEBVTT {transcript_id} {fmt}\n'.encode() + bytes(range(256)) * 500
+
+
+class Handler(MockHandler):
+    routes = [('GET', r'/v1/admin/meetingTranscripts', 'list_transcripts'),
+              ('GET', r'/v1/links/(?P<transcript_id>\w+)\.(?P<fmt>\w+)', 'download'),
+              ('GET', r'/v1/meetingTranscripts/(?P<transcript_id>\w+)/download', 'download')]
+    #: paths of downloads seen so far; the first download for each path is throttled
+    seen = set()
+    downloads = []
+    lock = threading.Lock()
+
+    def list_transcripts(self):
+        base = f'http://{self.headers["Host"]}/v1'
+        site_url = self.param('siteUrl')
+        items = [{'id': f'transcript{i}', 'siteUrl': site_url,
+                  'startTime': f'2023-05-0{i + 1}T10:00:00Z', 'meetingTopic': f'Meeting {i}',
+                  'meetingId': f'meeting{i}', 'hostUserId': 'host', 'status': 'available',
+                  # only some transcripts have a download link for vtt
+                  'vttDownloadLink': f'{base}/links/transcript{i}.vtt' if i % 2 else None}
+                 for i in range(TRANSCRIPTS)]
+        # deleted transcripts are listed as well
+        items.append({'id': 'deleted', 'siteUrl': site_url, 'startTime': '2023-05-01T11:00:00Z',
+                      'meetingTopic': 'Deleted', 'meetingId': 'meeting', 'hostUserId': 'host',
+                      'status': 'deleted'})
+        self.reply(200, {'items': items})
+
+    def download(self, transcript_id: str, fmt: str = None):
+        fmt = fmt or self.param('format', 'vtt')
+        if transcript_id in ('missing', 'deleted'):
+            self.reply(404, {'message': 'transcript not found'})
+            return
+        with self.lock:
+            first = self.path not in self.seen
+            self.seen.add(self.path)
+        if first:
+            self.reply(429, headers={'Retry-After': '0'})
+            return
+        with self.lock:
+            self.downloads.append(self.path)
+        self.reply(200, body=content(transcript_id, fmt), content_type='text/vtt')
+
+
+class TestTranscriptExport(MockServerTestCase):
+    handler = Handler
+
+    def setUp(self) -> None:
+        Handler.seen.clear()
+        Handler.downloads.clear()
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def api(self) -> WebexSimpleApi:
+        api = WebexSimpleApi(tokens='token', concurrent_requests=3)
+        api.session.BASE = self.base
+        return api
+
+    def test_001_streaming(self):
+        expected = content('transcript1', 'txt')
+        with self.api() as api:
+            transcripts = api.meetings.transcripts
+            chunks = list(transcripts.download_chunks(transcript_id='transcript1', format='txt', chunk_size=1000))
+            self.assertEqual(expected, b''.join(chunks))
+            self.assertEqual(1000, len(chunks[0]))
+
+            path = os.path.join(self.dir.name, 'transcript.txt')
+            self.assertEqual(len(expected), transcripts.download_to_file(transcript_id='transcript1', file=path,
+                                                                         format='txt'))
+            with open(path, mode='rb') as f:
+                self.assertEqual(expected, f.read())
+
+            sink = io.BytesIO()
+            transcripts.download_to_file(transcript_id='transcript1', file=sink, format='txt')
+            self.assertEqual(expected, sink.getvalue())
+
+            # failed download doesn't leave a file behind
+            path = os.path.join(self.dir.name, 'missing.txt')
+            with self.assertRaises(RestError):
+                transcripts.download_to_file(transcript_id='missing', file=path)
+            self.assertEqual([], [name for name in os.listdir(self.dir.name) if name.startswith('missing')])
+
+    def test_002_async_streaming(self):
+        expected = content('transcript2', 'vtt')
+
+        async def run():
+            async with AsWebexSimpleApi(tokens='token', concurrent_requests=3) as api:
+                api.session.BASE = self.base
+                transcripts = api.meetings.transcripts
+                chunks = [chunk async for chunk in transcripts.download_chunks(transcript_id='transcript2')]
+                sink = io.BytesIO()
+                size = await transcripts.download_to_file(transcript_id='transcript2', file=sink)
+                return chunks, size, sink.getvalue()
+
+        chunks, size, data = asyncio.run(run())
+        self.assertEqual(expected, b''.join(chunks))
+        self.assertEqual(len(expected), size)
+        self.assertEqual(expected, data)
+
+    def check_export(self, results: list):
+        # deleted transcript is not downloaded
+        unavailable = [r for r in results if r.status == ExportStatus.unavailable]
+        self.assertEqual(['deleted'] * 2, [r.transcript.id for r in unavailable])
+        self.assertFalse(any('deleted' in path for path in Handler.downloads))
+        results = [r for r in results if r.status != ExportStatus.unavailable]
+        self.assertEqual(2 * TRANSCRIPTS, len(results))
+        self.assertTrue(all(r.status == ExportStatus.downloaded for r in results), [r.error for r in results])
+        for result in results:
+            with open(result.path, mode='rb') as f:
+                self.assertEqual(content(result.transcript.id, result.format), f.read())
+            self.assertEqual(os.path.getsize(result.path), result.size)
+        # download links are used if present
+        self.assertIn('/v1/links/transcript1.vtt', Handler.downloads)
+        self.assertIn('/v1/meetingTranscripts/transcript0/download?format=vtt', Handler.downloads)
+        self.assertIn('/v1/meetingTranscripts/transcript1/download?format=txt', Handler.downloads)
+        self.assertTrue(os.path.isfile(os.path.join(self.dir.name, '2023-05-03', 'transcript2.txt')))
+        with open(os.path.join(self.dir.name, 'index.jsonl')) as f:
+            index = [json.loads(line) for line in f]
+        self.assertEqual(2 * TRANSCRIPTS, len(index))
+        self.assertEqual({'Meeting 0'}, {r['meetingTopic'] for r in index if r['id'] == 'transcript0'})
+
+    def test_003_async_streaming_cassette(self):
+        """
+        async streaming uses the cassette of the session and reports to hooks and wire log
+        """
+        expected = content('transcript3', 'vtt')
+        path = os.path.join(self.dir.name, 'cassette.jsonl')
+
+        async def run(mode: str):
+            metrics = RequestMetrics()
+            wire = io.StringIO()
+            with Cassette(path, mode=mode) as cassette:
+                async with AsWebexSimpleApi(tokens='token', concurrent_requests=3, cassette=cassette,
+                                            request_hooks=[metrics], wire_log=WireLog(sink=wire)) as api:
+                    api.session.BASE = self.base
+                    chunks = [chunk async for chunk in
+                              api.meetings.transcripts.download_chunks(transcript_id='transcript3', chunk_size=1000)]
+                return b''.join(chunks), len(chunks), metrics, wire.getvalue().splitlines(), cassette
+
+        data, chunks, metrics, wire, cassette = asyncio.run(run('record'))
+        self.assertEqual(expected, data)
+        self.assertGreater(chunks, 1)
+        # 429 and 200
+        self.assertEqual(2, cassette.recorded)
+        self.assertEqual([429, 200], [json.loads(line)['status'] for line in wire])
+        self.assertEqual(1, metrics.requests)
+        self.assertEqual(len(expected), sum(stats.bytes_in for stats in metrics.endpoints.values()))
+
+        Handler.downloads.clear()
+        data, chunks, metrics, wire, cassette = asyncio.run(run('replay'))
+        self.assertEqual(expected, data)
+        self.assertGreater(chunks, 1)
+        self.assertEqual(2, cassette.played)
+        self.assertEqual([], Handler.downloads)
+        self.assertEqual(2, len(wire))
+        self.assertEqual(1, metrics.requests)
+
+    def test_004_export(self):
+        with self.api() as api:
+            exporter = TranscriptExporter(api, directory=self.dir.name, formats=['vtt', 'txt'])
+            results = list(exporter.run(site_url='example.webex.com',
+                                        from_=datetime(2023, 5, 1, tzinfo=timezone.utc), to_='2023-06-01'))
+            self.check_export(results)
+
+            # resume: remove one file and run again
+            os.unlink(results[0].path)
+            Handler.downloads.clear()
+            results = list(exporter.run(site_url='example.webex.com'))
+        self.assertEqual(1, len(Handler.downloads))
+        self.assertEqual(1, len([r for r in results if r.status == ExportStatus.downloaded]))
+        self.assertEqual(2 * TRANSCRIPTS - 1, len([r for r in results if r.status == ExportStatus.skipped]))
+
+    def test_005_async_export(self):
+        async def run():
+            async with AsWebexSimpleApi(tokens='token', concurrent_requests=3) as api:
+                api.session.BASE = self.base
+                exporter = AsTranscriptExporter(api, directory=self.dir.name, formats=['vtt', 'txt'])
+                return [r async for r in exporter.run(site_url='example.webex.com')]
+
+        self.check_export(asyncio.run(run()))
+        results = asyncio.run(run())
+        self.assertEqual([ExportStatus.skipped] * 2 * TRANSCRIPTS + [ExportStatus.unavailable] * 2,
+                         sorted((r.status for r in results), key=lambda status: status == ExportStatus.unavailable))
@@ -0,0 +1,131 @@
+"""
+Test structured wire logging
+"""
+import asyncio
+import json
+import logging
+from io import StringIO
+from unittest.mock import patch
+
+from tests.mock_server import MockHandler, MockServerTestCase
+from wxc_sdk.as_rest import AsRestSession
+from wxc_sdk.rest import RestSession
+from wxc_sdk.tokens import Tokens
+from wxc_sdk.wire_log import WireLog, debug_enabled
+
+
+class Handler(MockHandler):
+    routes = [('GET', r'/.*', 'get'),
+              ('POST', r'/.*', 'post')]
+
+    def get(self):
+        self.reply(200, {'items': ['x' * 100] * 100})
+
+    def post(self):
+        self.body()
+        self.reply(200, {'access_token': 'secret', 'expires_in': 3600})
+
+
+class TestWireLog(MockServerTestCase):
+    handler = Handler
+
+    def test_001_sync_jsonl(self):
+        stream = StringIO()
+        wire_log = WireLog(sink=stream, endpoints=[r'^/people'], max_body=50)
+        with RestSession(tokens=Tokens(access_token='token'), concurrent_requests=5, wire_log=wire_log) as session:
+            session.rest_get(url=f'{self.server_url}/people')
+            session.rest_get(url=f'{self.server_url}/locations')
+            session.rest_post(url=f'{self.server_url}/people/token', data={'client_secret': 'secret', 'a': '1'},
+                              content_type='application/x-www-form-urlencoded')
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(2, len(lines))
+        get, post = map(json.loads, lines)
+        self.assertEqual('GET', get['method'])
+        self.assertEqual(200, get['status'])
+        self.assertEqual('***', get['request_headers']['authorization'])
+        self.assertEqual(50, len(get['response_body']))
+        self.assertGreater(get['response_size'], 10000)
+        self.assertTrue(get['tracking_id'].startswith('SIMPLE_'))
+        self.assertEqual('client_secret=***&a=1', post['request_body'])
+        self.assertNotIn('secret', post['response_body'])
+
+    def test_002_async_jsonl(self):
+        stream = StringIO()
+        wire_log = WireLog(sink=stream, methods=['POST'], headers=False)
+
+        async def run():
+            async with AsRestSession(tokens=Tokens(access_token='token'), concurrent_requests=5,
+                                     wire_log=wire_log) as session:
+                await session.rest_get(url=f'{self.server_url}/people')
+                await session.rest_post(url=f'{self.server_url}/people', json={'password': 'secret'})
+
+        asyncio.run(run())
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(1, len(lines))
+        record = json.loads(lines[0])
+        self.assertEqual('POST', record['method'])
+        self.assertNotIn('request_headers', record)
+        self.assertNotIn('secret', record['request_body'])
+        self.assertNotIn('secret', record['response_body'])
+
+    def test_003_sampling_and_switch(self):
+        wire_log = WireLog(sink=StringIO(), sample_rate=0.5)
+        sampled = sum(wire_log.wants('GET', f'{self.server_url}/people') for _ in range(1000))
+        self.assertTrue(300 < sampled < 700)
+        wire_log.enabled = False
+        self.assertFalse(wire_log.wants('GET', f'{self.server_url}/people'))
+
+    def test_004_debug_enabled(self):
+        """
+        logger enabled for DEBUG but no handler emitting DEBUG records
+        """
+        parent = logging.getLogger('wxc_sdk_test_wire_log')
+        parent.propagate = False
+        parent.setLevel(logging.DEBUG)
+        logger = logging.getLogger('wxc_sdk_test_wire_log.child')
+        handler = logging.StreamHandler(StringIO())
+        handler.setLevel(logging.INFO)
+        parent.addHandler(handler)
+        try:
+            self.assertFalse(debug_enabled(logger))
+            handler.setLevel(logging.DEBUG)
+            self.assertTrue(debug_enabled(logger))
+        finally:
+            parent.removeHandler(handler)
+
+    def test_005_no_dump_without_handler(self):
+        """
+        legacy dump is skipped if no handler emits DEBUG records
+        """
+        logger = logging.getLogger('wxc_sdk.rest')
+        level, propagate = logger.level, logger.propagate
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        try:
+            with patch('wxc_sdk.rest.StringIO') as string_io:
+                with RestSession(tokens=Tokens(access_token='token'), concurrent_requests=5) as session:
+                    session.rest_get(url=f'{self.server_url}/people')
+            string_io.assert_not_called()
+        finally:
+            logger.setLevel(level)
+            logger.propagate = propagate
+
+    def test_006_logger_sink(self):
+        logger = logging.getLogger('wxc_sdk.test_wire_log.sink')
+        logger.propagate = False
+        stream = StringIO()
+        handler = logging.StreamHandler(stream)
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        try:
+            wire_log = WireLog(sink=logger)
+            with RestSession(tokens=Tokens(access_token='token'), concurrent_requests=5,
+                             wire_log=wire_log) as session:
+                session.rest_get(url=f'{self.server_url}/people')
+            self.assertEqual(1, wire_log.logged)
+            self.assertEqual('GET', json.loads(stream.getvalue())['method'])
+            # w/o handler nothing is logged
+            logger.removeHandler(handler)
+            self.assertFalse(wire_log.wants('GET', f'{self.server_url}/people'))
+        finally:
+            logger.removeHandler(handler)
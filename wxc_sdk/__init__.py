@@ -3,110 +3,142 @@ Simple SDK for Webex APIs with focus on Webex Calling specific endpoints
 """
 import logging
 import os
-from typing import Union
-
-from .attachment_actions import AttachmentActionsApi
-from .cdr import DetailedCDRApi
-from .devices import DevicesApi
-from .events import EventsApi
-from .groups import GroupsApi
-from .licenses import LicensesApi
-from .locations import LocationsApi
-from .meetings import MeetingsApi
-from .memberships import MembershipApi
-from .messages import MessagesApi
-from .organizations import OrganizationApi
-from .people import PeopleApi
-from .person_settings import PersonSettingsApi
-from .reports import ReportsApi
+from collections import deque
+from collections.abc import Callable, Generator, Iterable
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Union
+
+from .api_child import LazyApiChild
+from .cache import ResponseCache
+from .rate_limit import RateLimiter
 from .rest import RestSession
-from .room_tabs import RoomTabsApi
-from .rooms import RoomsApi
-from .team_memberships import TeamMembershipsApi
-from .teams import TeamsApi
-from .telephony import TelephonyApi
 from .tokens import Tokens
-from .webhook import WebhookApi
-from .workspace_locations import WorkspaceLocationApi
-from .workspaces import WorkspacesApi
-from .workspace_settings import WorkspaceSettingsApi
-from dataclasses import dataclass
 
-__all__ = ['WebexSimpleApi', 'Tokens']
+if TYPE_CHECKING:
+    from .attachment_actions import AttachmentActionsApi
+    from .cdr import DetailedCDRApi
+    from .devices import DevicesApi
+    from .events import EventsApi
+    from .groups import GroupsApi
+    from .licenses import LicensesApi
+    from .locations import LocationsApi
+    from .meetings import MeetingsApi
+    from .memberships import MembershipApi
+    from .messages import MessagesApi
+    from .organizations import OrganizationApi
+    from .people import PeopleApi
+    from .person_settings import PersonSettingsApi
+    from .reports import ReportsApi
+    from .room_tabs import RoomTabsApi
+    from .rooms import RoomsApi
+    from .team_memberships import TeamMembershipsApi
+    from .teams import TeamsApi
+    from .telephony import TelephonyApi
+    from .webhook import WebhookApi
+    from .workspace_locations import WorkspaceLocationApi
+    from .workspaces import WorkspacesApi
+    from .workspace_settings import WorkspaceSettingsApi
+
+__all__ = ['WebexSimpleApi', 'Tokens', 'RateLimiter', 'ResponseCache']
 
 __version__ = '1.15.0'
 
 log = logging.getLogger(__name__)
 
 
+def __getattr__(name: str):
+    """
+    Child API classes used to be imported here; import them on demand for backwards compatibility
+    """
+    for attr in vars(WebexSimpleApi).values():
+        if isinstance(attr, LazyApiChild) and attr.class_name == name:
+            return attr.api_class(WebexSimpleApi)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
 # noinspection PyShadowingNames
 @dataclass(init=False)
 class WebexSimpleApi:
     """
     The main API object
+
+    Child APIs are created on first access. The modules defining the child APIs are only imported then.
     """
 
     #: Attachment actions API :class:`attachment_actions.AttachmentActionsApi`
-    attachment_actions: AttachmentActionsApi
+    attachment_actions: 'AttachmentActionsApi' = LazyApiChild('.attachment_actions', 'AttachmentActionsApi')
     #: CDR API :class:`cdr.DetailedCDRApi`
-    cdr: DetailedCDRApi
+    cdr: 'DetailedCDRApi' = LazyApiChild('.cdr', 'DetailedCDRApi')
     #: devices API :class:`devices.DevicesApi`
-    devices: DevicesApi
+    devices: 'DevicesApi' = LazyApiChild('.devices', 'DevicesApi')
     #: events API; :class:`events.EventsApi`
-    events: EventsApi
+    events: 'EventsApi' = LazyApiChild('.events', 'EventsApi')
     #: groups API :class:`groups.GroupsApi`
-    groups: GroupsApi
+    groups: 'GroupsApi' = LazyApiChild('.groups', 'GroupsApi')
     #: Licenses API :class:`licenses.LicensesApi`
-    licenses: LicensesApi
+    licenses: 'LicensesApi' = LazyApiChild('.licenses', 'LicensesApi')
     #: Location API :class:`locations.LocationsApi`
-    locations: LocationsApi
+    locations: 'LocationsApi' = LazyApiChild('.locations', 'LocationsApi')
     #: meetings API :class:`meetings.MeetingsApi`
-    meetings: MeetingsApi
+    meetings: 'MeetingsApi' = LazyApiChild('.meetings', 'MeetingsApi')
     #: membership API :class:`memberships.MembershipApi`
-    membership: MembershipApi
+    membership: 'MembershipApi' = LazyApiChild('.memberships', 'MembershipApi')
     #: Messages API :class:`messages.MessagesApi`
-    messages: MessagesApi
+    messages: 'MessagesApi' = LazyApiChild('.messages', 'MessagesApi')
     #: organization settings API
-    organizations: OrganizationApi
+    organizations: 'OrganizationApi' = LazyApiChild('.organizations', 'OrganizationApi')
     #: Person settings API :class:`person_settings.PersonSettingsApi`
-    person_settings: PersonSettingsApi
+    person_settings: 'PersonSettingsApi' = LazyApiChild('.person_settings', 'PersonSettingsApi')
     #: People API :class:`people.PeopleApi`
-    people: PeopleApi
+    people: 'PeopleApi' = LazyApiChild('.people', 'PeopleApi')
     #: Reports API :class:`reports.ReportsApi`
-    reports: ReportsApi
+    reports: 'ReportsApi' = LazyApiChild('.reports', 'ReportsApi')
     #: Rooms API :class:`rooms.RoomsApi`
-    rooms: RoomsApi
+    rooms: 'RoomsApi' = LazyApiChild('.rooms', 'RoomsApi')
     #: Room tabs API :class:`room_tabs.RoomTabsApi`
-    room_tabs: RoomTabsApi
+    room_tabs: 'RoomTabsApi' = LazyApiChild('.room_tabs', 'RoomTabsApi')
     #: Teams API :class:`teams.TeamsApi`
-    teams: TeamsApi
+    teams: 'TeamsApi' = LazyApiChild('.teams', 'TeamsApi')
     #: Team memberships API :class:`TeamMembershipsApi`
-    team_memberships: TeamMembershipsApi
+    team_memberships: 'TeamMembershipsApi' = LazyApiChild('.team_memberships', 'TeamMembershipsApi')
     #: Telephony (features) API :class:`telephony.TelephonyApi`
-    telephony: TelephonyApi
+    telephony: 'TelephonyApi' = LazyApiChild('.telephony', 'TelephonyApi')
     #: Webhooks API :class:`webhook.WebhookApi`
-    webhook: WebhookApi
+    webhook: 'WebhookApi' = LazyApiChild('.webhook', 'WebhookApi')
     #: Workspaces API :class:`workspaces.WorkspacesApi`
-    workspaces: WorkspacesApi
+    workspaces: 'WorkspacesApi' = LazyApiChild('.workspaces', 'WorkspacesApi')
     #: Workspace locations API; :class:`workspace_locations.WorkspaceLocationApi`
-    workspace_locations: WorkspaceLocationApi
+    workspace_locations: 'WorkspaceLocationApi' = LazyApiChild('.workspace_locations', 'WorkspaceLocationApi')
     #: Workspace setting API :class:`workspace_settings.WorkspaceSettingsApi`
-    workspace_settings: WorkspaceSettingsApi
+    workspace_settings: 'WorkspaceSettingsApi' = LazyApiChild('.workspace_settings', 'WorkspaceSettingsApi')
     #: :class:`rest.RestSession` used for all API requests
     session: RestSession
 
-    def __init__(self, *, tokens: Union[str, Tokens] = None, concurrent_requests: int = 10, retry_429: bool = True):
+    def __init__(self, *, tokens: Union[str, Tokens] = None, concurrent_requests: int = 10, retry_429: bool = True,
+                 rate_limiter: RateLimiter = None, cache: ResponseCache = None, **session_args):
         """
 
         :param tokens: token to be used by the API. Can be a :class:`tokens.Tokens` instance, a string or None. If
-            None then an access token is expected in the WEBEX_ACCESS_TOKEN environment variable.
+            None then the tokens of the token manager (session argument `token_manager`) are used or an access token
+            is expected in the WEBEX_ACCESS_TOKEN environment variable.
         :param concurrent_requests: number of concurrent requests when using multi-threading
         :type concurrent_requests: int
         :param retry_429: automatically retry for 429 throttling response
         :type retry_429: bool
+        :param rate_limiter: rate limiter to be used for all requests. The same rate limiter can be shared by multiple
+            API instances (sync and async) to coordinate the request rate across all of them.
+        :type rate_limiter: :class:`rate_limit.RateLimiter`
+        :param cache: response cache for GET requests. The same cache can be shared by multiple API instances.
+        :type cache: :class:`cache.ResponseCache`
+        :param session_args: additional arguments for the REST session (:class:`rest.RestSession`), like lazy_models
+            or coalesce_requests. :class:`as_rest.AsRestSession` also accepts connection pool settings:
+            ``connector=ConnectorSettings(...)``
         """
         if isinstance(tokens, str):
             tokens = Tokens(access_token=tokens)
+        elif tokens is None and session_args.get('token_manager') is not None:
+            tokens = session_args['token_manager'].tokens
         elif tokens is None:
             tokens = os.getenv('WEBEX_ACCESS_TOKEN')
             if tokens is None:
@@ -114,30 +146,8 @@ class WebexSimpleApi:
                                  'WEBEX_ACCESS_TOKEN environment variable')
             tokens = Tokens(access_token=tokens)
 
-        session = RestSession(tokens=tokens, concurrent_requests=concurrent_requests, retry_429=retry_429)
-        self.attachment_actions = AttachmentActionsApi(session=session)
-        self.cdr = DetailedCDRApi(session=session)
-        self.devices = DevicesApi(session=session)
-        self.events = EventsApi(session=session)
-        self.groups = GroupsApi(session=session)
-        self.licenses = LicensesApi(session=session)
-        self.locations = LocationsApi(session=session)
-        self.meetings = MeetingsApi(session=session)
-        self.membership = MembershipApi(session=session)
-        self.messages = MessagesApi(session=session)
-        self.organizations = OrganizationApi(session=session)
-        self.person_settings = PersonSettingsApi(session=session)
-        self.people = PeopleApi(session=session)
-        self.reports = ReportsApi(session=session)
-        self.rooms = RoomsApi(session=session)
-        self.room_tabs = RoomTabsApi(session=session)
-        self.teams = TeamsApi(session=session)
-        self.team_memberships = TeamMembershipsApi(session=session)
-        self.telephony = TelephonyApi(session=session)
-        self.webhook = WebhookApi(session=session)
-        self.workspaces = WorkspacesApi(session=session)
-        self.workspace_locations = WorkspaceLocationApi(session=session)
-        self.workspace_settings = WorkspaceSettingsApi(session=session)
+        session = RestSession(tokens=tokens, concurrent_requests=concurrent_requests, retry_429=retry_429,
+                              rate_limiter=rate_limiter, cache=cache, **session_args)
         self.session = session
 
     @property
@@ -150,6 +160,182 @@ class WebexSimpleApi:
         """
         return self.session.access_token
 
+    def map(self, fn: Callable[..., Any], *iterables: Iterable,
+            ordered: bool = True) -> Generator[Any, None, None]:
+        """
+        Call a function concurrently for all items of the given iterable(s) and yield the results.
+
+        Calls are executed on the thread pool of the session (:attr:`rest.RestSession.executor`); the number of
+        workers is the number of concurrent requests of the API. Arguments are only taken from the iterables when a
+        worker is available; hence the iterables can be generators and can be large. 429 backoff applies to all
+        workers: while one request waits for a retry, no other requests of the session are sent.
+
+        If a call raises an exception, then the exception is raised when the result is due; all pending calls are
+        cancelled. Functions called with :meth:`map` should not use :meth:`map` or :meth:`gather` themselves.
+
+        Example:
+
+            .. code-block:: python
+
+                # get details for many users concurrently
+                details = list(api.map(api.people.details, person_ids))
+
+                # read DND settings; results are yielded as they become available
+                for dnd in api.map(api.person_settings.dnd.read, person_ids, ordered=False):
+                    ...
+
+        :param fn: function to call
+        :type fn: Callable
+        :param iterables: iterables with arguments for the function; one iterable for each positional argument
+        :param ordered: yield results in the order of the arguments. If False, then results are yielded as they
+            become available
+        :type ordered: bool
+        :return: yields results
+        """
+        '''async
+    async def map_gen(self, fn: Callable[..., Any], *iterables: Iterable,
+                      ordered: bool = True) -> AsyncGenerator[Any, None, None]:
+        """
+        Call a coroutine function concurrently for all items of the given iterable(s) and yield the results.
+
+        At most concurrent_requests calls are in flight at any time. Arguments are only taken from the iterables
+        when a call has completed; hence the iterables can be large.
+
+        If a call raises an exception, then the exception is raised when the result is due; all pending calls are
+        cancelled.
+
+        :param fn: coroutine function to call
+        :type fn: Callable
+        :param iterables: iterables with arguments for the function; one iterable for each positional argument
+        :param ordered: yield results in the order of the arguments. If False, then results are yielded as they
+            become available
+        :type ordered: bool
+        :return: yields results
+        """
+        window = 2 * self.session.concurrent_requests
+        if ordered:
+            pending = deque()
+        else:
+            pending = set()
+        try:
+            for args in zip(*iterables):
+                task = asyncio.create_task(fn(*args))
+                if ordered:
+                    pending.append(task)
+                    if len(pending) >= window:
+                        yield await pending.popleft()
+                else:
+                    pending.add(task)
+                    if len(pending) >= window:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            yield task.result()
+            while pending:
+                if ordered:
+                    yield await pending.popleft()
+                else:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def map(self, fn: Callable[..., Any], *iterables: Iterable, ordered: bool = True) -> List[Any]:
+        """
+        Call a coroutine function concurrently for all items of the given iterable(s) and return the results.
+
+        See :meth:`map_gen`
+
+        :return: list of results
+        """
+        return [r async for r in self.map_gen(fn, *iterables, ordered=ordered)]
+
+        '''
+        executor = self.session.executor
+        # twice as many calls as workers are queued so that all workers stay busy
+        window = 2 * self.session.concurrent_requests
+        if ordered:
+            pending = deque()
+        else:
+            pending = set()
+        try:
+            for args in zip(*iterables):
+                future = executor.submit(fn, *args)
+                if ordered:
+                    pending.append(future)
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+                else:
+                    pending.add(future)
+                    if len(pending) >= window:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            yield future.result()
+            while pending:
+                if ordered:
+                    yield pending.popleft().result()
+                else:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def gather(self, *calls: Callable[[], Any], return_exceptions: bool = False) -> list:
+        """
+        Execute calls concurrently and return the results in the order of the calls.
+
+        Calls are executed on the thread pool of the session (see :meth:`map`).
+
+        Example:
+
+            .. code-block:: python
+
+                person, dnd = api.gather(lambda: api.people.details(person_id),
+                                         lambda: api.person_settings.dnd.read(person_id))
+
+        :param calls: functions w/o arguments; use lambdas or :func:`functools.partial` to bind arguments
+        :param return_exceptions: return exceptions as results instead of raising the 1st exception. If False, then
+            all pending calls are cancelled on the 1st exception
+        :type return_exceptions: bool
+        :return: list of results
+        """
+        '''async
+    async def gather(self, *calls: Callable[[], Any], return_exceptions: bool = False) -> list:
+        """
+        Execute calls (coroutine functions) concurrently and return the results in the order of the calls.
+
+        Example:
+
+            .. code-block:: python
+
+                person, dnd = await api.gather(lambda: api.people.details(person_id),
+                                               lambda: api.person_settings.dnd.read(person_id))
+
+        :param calls: coroutine functions w/o arguments; use lambdas or :func:`functools.partial` to bind arguments
+        :param return_exceptions: return exceptions as results instead of raising the 1st exception
+        :type return_exceptions: bool
+        :return: list of results
+        """
+        return await asyncio.gather(*(call() for call in calls), return_exceptions=return_exceptions)
+
+        '''
+        executor = self.session.executor
+        futures = [executor.submit(call) for call in calls]
+        results = []
+        try:
+            for future in futures:
+                if return_exceptions:
+                    results.append(future.exception() or future.result())
+                else:
+                    results.append(future.result())
+        finally:
+            for future in futures:
+                future.cancel()
+        return results
+
     def close(self):
         self.session.close()
 
@@ -1,8 +1,15 @@
 from wxc_sdk.attachment_actions import AttachmentAction, AttachmentActionData
-from wxc_sdk.base import ApiModel, ApiModelWithErrors, CodeAndReason, RETRY_429_MAX_WAIT, SafeEnum, StrOrDict,\
-    dt_iso_str, enum_str, plus1, to_camel, webex_id_to_uuid
-from wxc_sdk.cdr import CDR, CDRCallType, CDRClientType, CDRDirection, CDROriginalReason, CDRRedirectReason,\
-    CDRRelatedReason, CDRUserType
+from wxc_sdk.base import ApiModel, ApiModelWithErrors, CodeAndReason, LazyModel, RETRY_429_MAX_WAIT, SafeEnum,\
+    StrOrDict, dt_iso_str, enum_str, plus1, to_camel, webex_id_to_uuid
+from wxc_sdk.bulk_upload import AsBulkUploader, BulkUploader, MultipartFile, UploadItem, UploadKind, UploadResult,\
+    UploadStatus, content_hash, read_manifest
+from wxc_sdk.cache import CacheBackend, CacheEntry, CachedResponse, MemoryCacheBackend, READ_MOSTLY_POLICIES,\
+    ResponseCache, SQLiteCacheBackend
+from wxc_sdk.cassette import Cassette, CassetteAdapter, CassetteMiss, ReplayResponse
+from wxc_sdk.cdr import CDR, CDRCallType, CDRClientType, CDRDirection, CDROriginalReason, CDRRecord,\
+    CDRRedirectReason, CDRRelatedReason, CDRUserType
+from wxc_sdk.cdr.columnar import CDRColumns, cdr_batches, cdr_record_batches, cdr_to_numpy, cdr_to_parquet
+from wxc_sdk.cdr.poller import CDRCheckpoint, CDRPoller
 from wxc_sdk.common import AcdCustomization, AlternateNumber, AnnAudioFile, AnnouncementLevel, AtaCustomization,\
     AtaDtmfMethod, AtaDtmfMode, AudioCodecPriority, AuthCode, Background, BackgroundImageColor,\
     BackgroundSelection, BacklightTimer, BacklightTimer68XX78XX, BluetoothMode, BluetoothSetting,\
@@ -23,6 +30,10 @@ from wxc_sdk.common.schedules import Event, RecurWeekly, RecurYearlyByDate, Recu
 from wxc_sdk.devices import ActivationCodeResponse, Device, TagOp
 from wxc_sdk.events import ComplianceEvent, EventData, EventResource, EventType
 from wxc_sdk.groups import Group, GroupMember
+from wxc_sdk.job_runner import AsJobFuture, AsJobRunner, JobFuture, JobKind, JobResult, JobRunner, PollPolicy,\
+    TERMINAL_STATUS
+from wxc_sdk.json_codec import JsonCodec, OrjsonCodec, StdJsonCodec, UjsonCodec, json_codec, json_dumps,\
+    json_loads, set_json_codec
 from wxc_sdk.licenses import License, SiteType
 from wxc_sdk.locations import CreateLocationFloorBody, Floor, Location, LocationAddress
 from wxc_sdk.meetings import AnswerCondition, ApprovalQuestion, ApprovalRule, AttendeePrivileges,\
@@ -51,6 +62,10 @@ from wxc_sdk.meetings.transcripts import DeleteTranscriptBody, Transcript, Trans
 from wxc_sdk.memberships import Membership, MembershipsData
 from wxc_sdk.messages import AdaptiveCard, AdaptiveCardAction, AdaptiveCardBody, Message, MessageAttachment,\
     MessagesData
+from wxc_sdk.metrics import DEFAULT_BUCKETS, EndpointStats, OpenTelemetryHooks, RequestHooks, RequestMetrics,\
+    url_template
+from wxc_sdk.number_mover import AsNumberMover, MAX_NUMBERS_PER_JOB, MoveBatchResult, MoveSummary, NumberMover,\
+    batch_numbers
 from wxc_sdk.organizations import Organization
 from wxc_sdk.people import PeopleStatus, Person, PersonAddress, PersonType, PhoneNumber, PhoneNumberType,\
     SipAddress, SipType
@@ -65,7 +80,8 @@ from wxc_sdk.person_settings.call_recording import CallRecordingSetting, Notific
     NotificationType, Record, StartStopAnnouncement
 from wxc_sdk.person_settings.caller_id import CallerId, CallerIdSelectedType, ExternalCallerIdNamePolicy
 from wxc_sdk.person_settings.calling_behavior import BehaviorType, CallingBehavior
-from wxc_sdk.person_settings.common import PersonSettingsApiChild
+from wxc_sdk.person_settings.common import BulkSettingsApiChild, PersonSettingsApiChild, SettingsChange,\
+    SettingsResult, settings_diff, settings_update
 from wxc_sdk.person_settings.dnd import DND
 from wxc_sdk.person_settings.exec_assistant import ExecAssistantType, _Helper
 from wxc_sdk.person_settings.forwarding import CallForwardingAlways, CallForwardingCommon, CallForwardingNoAnswer,\
@@ -82,7 +98,9 @@ from wxc_sdk.person_settings.privacy import Privacy
 from wxc_sdk.person_settings.push_to_talk import PTTConnectionType, PushToTalkAccessType, PushToTalkSettings
 from wxc_sdk.person_settings.receptionist import ReceptionistSettings
 from wxc_sdk.person_settings.voicemail import UnansweredCalls, VoicemailEnabledWithGreeting, VoicemailSettings
-from wxc_sdk.reports import CallingCDR, Report, ReportTemplate, ValidationRules
+from wxc_sdk.rate_limit import RateLimiter
+from wxc_sdk.reports import CallingCDR, Report, ReportDecoder, ReportDecompressor, ReportTemplate,\
+    ValidationRules
 from wxc_sdk.room_tabs import RoomTab
 from wxc_sdk.rooms import GetRoomMeetingDetailsResponse, Room
 from wxc_sdk.team_memberships import TeamMembership
@@ -138,9 +156,13 @@ from wxc_sdk.telephony.vm_rules import BlockContiguousSequences, BlockPreviousPa
 from wxc_sdk.telephony.voice_messaging import MessageSummary, VoiceMailPartyInformation, VoiceMessageDetails
 from wxc_sdk.telephony.voicemail_groups import VoicemailGroup, VoicemailGroupDetail
 from wxc_sdk.telephony.voiceportal import ExpirePasscode, FailedAttempts, PasscodeRules, VoicePortalSettings
+from wxc_sdk.token_manager import CallbackTokenStore, FileTokenStore, TokenManager, TokenStore
 from wxc_sdk.tokens import Tokens
+from wxc_sdk.transcript_export import AsTranscriptExporter, ExportResult, ExportStatus, TranscriptExporter
 from wxc_sdk.webhook import Webhook, WebhookCreate, WebhookEvent, WebhookEventData, WebhookEventType,\
     WebhookResource, WebhookStatus
+from wxc_sdk.wire_log import FORM_SECRET_KEYS, MASKED_HEADERS, SECRET_KEYS, WireLog, debug_enabled, mask_form,\
+    mask_headers, mask_json
 from wxc_sdk.workspace_locations import WorkspaceLocation, WorkspaceLocationFloor
 from wxc_sdk.workspace_settings.numbers import WorkspaceNumbers
 from wxc_sdk.workspaces import Calendar, CalendarType, CallingType, CapabilityMap, WorkSpaceType, Workspace,\
@@ -150,89 +172,98 @@ __all__ = ['AcdCustomization', 'Action', 'ActivationCodeResponse', 'AdaptiveCard
            'AdaptiveCardBody', 'AdmitParticipantsBody', 'Agent', 'AgentQueue', 'AlternateNumber',
            'AlternateNumberSettings', 'AnnAudioFile', 'Announcement', 'AnnouncementLanguage', 'AnnouncementLevel',
            'AnnouncementMode', 'AnswerCondition', 'AnswerObject', 'Answers', 'ApiModel', 'ApiModelWithErrors',
-           'AppServicesSettings', 'ApprovalQuestion', 'ApprovalRule', 'AtaCustomization', 'AtaDtmfMethod',
-           'AtaDtmfMode', 'AttachmentAction', 'AttachmentActionData', 'AttendeePrivileges', 'Audio',
-           'AudioCodecPriority', 'AudioConnectionOptions', 'AudioConnectionType', 'AudioSource', 'AudioType',
-           'AuthCode', 'AutoAttendant', 'AutoAttendantAction', 'AutoAttendantKeyConfiguration', 'AutoAttendantMenu',
-           'AutoRegistrationResult', 'AutoTransferNumbers', 'AvailableMember', 'AvailableRecallHuntGroup',
-           'Background', 'BackgroundImageColor', 'BackgroundSelection', 'BacklightTimer', 'BacklightTimer68XX78XX',
-           'BargeSettings', 'BehaviorType', 'BlockContiguousSequences', 'BlockPreviousPasscodes',
-           'BlockRepeatedDigits', 'BluetoothMode', 'BluetoothSetting', 'BreakoutSession', 'BusinessContinuity',
-           'CCSnippet', 'CDR', 'CDRCallType', 'CDRClientType', 'CDRDirection', 'CDROriginalReason',
-           'CDRRedirectReason', 'CDRRelatedReason', 'CDRUserType', 'CPActionType', 'CQHolidaySchedule',
-           'CQRoutingType', 'Calendar', 'CalendarType', 'CallBounce', 'CallForwardExpandedSoftKey', 'CallForwarding',
+           'AppServicesSettings', 'ApprovalQuestion', 'ApprovalRule', 'AsBulkUploader', 'AsJobFuture', 'AsJobRunner',
+           'AsNumberMover', 'AsTranscriptExporter', 'AtaCustomization', 'AtaDtmfMethod', 'AtaDtmfMode',
+           'AttachmentAction', 'AttachmentActionData', 'AttendeePrivileges', 'Audio', 'AudioCodecPriority',
+           'AudioConnectionOptions', 'AudioConnectionType', 'AudioSource', 'AudioType', 'AuthCode', 'AutoAttendant',
+           'AutoAttendantAction', 'AutoAttendantKeyConfiguration', 'AutoAttendantMenu', 'AutoRegistrationResult',
+           'AutoTransferNumbers', 'AvailableMember', 'AvailableRecallHuntGroup', 'Background', 'BackgroundImageColor',
+           'BackgroundSelection', 'BacklightTimer', 'BacklightTimer68XX78XX', 'BargeSettings', 'BehaviorType',
+           'BlockContiguousSequences', 'BlockPreviousPasscodes', 'BlockRepeatedDigits', 'BluetoothMode',
+           'BluetoothSetting', 'BreakoutSession', 'BulkSettingsApiChild', 'BulkUploader', 'BusinessContinuity',
+           'CCSnippet', 'CDR', 'CDRCallType', 'CDRCheckpoint', 'CDRClientType', 'CDRColumns', 'CDRDirection',
+           'CDROriginalReason', 'CDRPoller', 'CDRRecord', 'CDRRedirectReason', 'CDRRelatedReason', 'CDRUserType',
+           'CPActionType', 'CQHolidaySchedule', 'CQRoutingType', 'CacheBackend', 'CacheEntry', 'CachedResponse',
+           'Calendar', 'CalendarType', 'CallBounce', 'CallForwardExpandedSoftKey', 'CallForwarding',
            'CallForwardingAlways', 'CallForwardingCommon', 'CallForwardingNoAnswer', 'CallForwardingNumber',
            'CallForwardingNumberType', 'CallForwardingPerson', 'CallHistoryMethod', 'CallHistoryRecord',
            'CallInNumber', 'CallInNumbers', 'CallInfo', 'CallPark', 'CallParkExtension', 'CallParkRecall',
            'CallParkSettings', 'CallPickup', 'CallQueue', 'CallQueueCallPolicies', 'CallRecordingSetting',
-           'CallSourceInfo', 'CallSourceType', 'CallState', 'CallType', 'CallTypePermission', 'CallerId',
-           'CallerIdSelectedType', 'CallingBehavior', 'CallingCDR', 'CallingLineId', 'CallingPermissions',
-           'CallingType', 'CallsFrom', 'CapabilityMap', 'ChatObject', 'ClosedCaption', 'CnameRecord', 'CoHost',
-           'CodeAndReason', 'ComfortMessageBypass', 'ComfortMessageSetting', 'CommonDeviceCustomization',
-           'ComplianceEvent', 'CreateInviteesItem', 'CreateLocationFloorBody', 'CreateMeetingBody',
-           'CreateMeetingInviteeBody', 'CreateMeetingInviteesBody', 'CreateResponse', 'CustomNumbers', 'Customer',
-           'CustomizedQuestionForCreateMeeting', 'DND', 'DectCustomization', 'DectDevice', 'DefaultAudioType',
-           'DefaultVoicemailPinRules', 'DeleteTranscriptBody', 'DestinationType', 'Device', 'DeviceActivationState',
-           'DeviceCustomization', 'DeviceCustomizations', 'DeviceManagedBy', 'DeviceManufacturer', 'DeviceMember',
-           'DeviceMembersResponse', 'DeviceOwner', 'DeviceStatus', 'DeviceType', 'DialPatternStatus',
-           'DialPatternValidate', 'DialPatternValidationResult', 'DialPlan', 'DialResponse', 'Dialing',
-           'DirectoryMethod', 'DisplayCallqueueAgentSoftkey', 'DisplayNameSelection', 'DistinctiveRing',
-           'EmergencyDestination', 'EnabledAndNumberOfDays', 'EnabledAndValue', 'EntryAndExitTone',
-           'ErrorMessageObject', 'ErrorObject', 'Event', 'EventData', 'EventResource', 'EventType',
-           'ExecAssistantType', 'ExpirePasscode', 'ExternalCallerIdNamePolicy', 'ExternalTransfer', 'FailedAttempts',
-           'FeatureAccessCodeDestination', 'FeatureReference', 'FeatureSelector', 'Floor', 'ForcedForward',
-           'ForwardCallsTo', 'ForwardToSelection', 'ForwardingRule', 'ForwardingRuleDetails', 'ForwardingSetting',
-           'GetMeetingSurveyResponse', 'GetRoomMeetingDetailsResponse', 'Greeting', 'Group', 'GroupMember',
-           'HGCallPolicies', 'HGandCQ', 'HistoryType', 'HolidayService', 'HostedFeatureDestination',
+           'CallSourceInfo', 'CallSourceType', 'CallState', 'CallType', 'CallTypePermission', 'CallbackTokenStore',
+           'CallerId', 'CallerIdSelectedType', 'CallingBehavior', 'CallingCDR', 'CallingLineId', 'CallingPermissions',
+           'CallingType', 'CallsFrom', 'CapabilityMap', 'Cassette', 'CassetteAdapter', 'CassetteMiss', 'ChatObject',
+           'ClosedCaption', 'CnameRecord', 'CoHost', 'CodeAndReason', 'ComfortMessageBypass', 'ComfortMessageSetting',
+           'CommonDeviceCustomization', 'ComplianceEvent', 'CreateInviteesItem', 'CreateLocationFloorBody',
+           'CreateMeetingBody', 'CreateMeetingInviteeBody', 'CreateMeetingInviteesBody', 'CreateResponse',
+           'CustomNumbers', 'Customer', 'CustomizedQuestionForCreateMeeting', 'DEFAULT_BUCKETS', 'DND',
+           'DectCustomization', 'DectDevice', 'DefaultAudioType', 'DefaultVoicemailPinRules', 'DeleteTranscriptBody',
+           'DestinationType', 'Device', 'DeviceActivationState', 'DeviceCustomization', 'DeviceCustomizations',
+           'DeviceManagedBy', 'DeviceManufacturer', 'DeviceMember', 'DeviceMembersResponse', 'DeviceOwner',
+           'DeviceStatus', 'DeviceType', 'DialPatternStatus', 'DialPatternValidate', 'DialPatternValidationResult',
+           'DialPlan', 'DialResponse', 'Dialing', 'DirectoryMethod', 'DisplayCallqueueAgentSoftkey',
+           'DisplayNameSelection', 'DistinctiveRing', 'EmergencyDestination', 'EnabledAndNumberOfDays',
+           'EnabledAndValue', 'EndpointStats', 'EntryAndExitTone', 'ErrorMessageObject', 'ErrorObject', 'Event',
+           'EventData', 'EventResource', 'EventType', 'ExecAssistantType', 'ExpirePasscode', 'ExportResult',
+           'ExportStatus', 'ExternalCallerIdNamePolicy', 'ExternalTransfer', 'FORM_SECRET_KEYS', 'FailedAttempts',
+           'FeatureAccessCodeDestination', 'FeatureReference', 'FeatureSelector', 'FileTokenStore', 'Floor',
+           'ForcedForward', 'ForwardCallsTo', 'ForwardToSelection', 'ForwardingRule', 'ForwardingRuleDetails',
+           'ForwardingSetting', 'GetMeetingSurveyResponse', 'GetRoomMeetingDetailsResponse', 'Greeting', 'Group',
+           'GroupMember', 'HGCallPolicies', 'HGandCQ', 'HistoryType', 'HolidayService', 'HostedFeatureDestination',
            'HostedUserDestination', 'Hoteling', 'HttpProxy', 'HttpProxyMode', 'HuntGroup', 'IdAndName', 'IdOnly',
            'InProgressDevice', 'IncomingPermissions', 'InitiateMoveNumberJobsBody', 'InputMode',
            'InterceptAnnouncements', 'InterceptNumber', 'InterceptSetting', 'InterceptSettingIncoming',
            'InterceptSettingOutgoing', 'InterceptTypeIncoming', 'InterceptTypeOutgoing', 'InternalDialing',
            'InterpreterForSimultaneousInterpretation', 'Invitee', 'InviteeForCreateMeeting', 'JobError',
-           'JobErrorItem', 'JobErrorMessage', 'JobExecutionStatus', 'JoinMeetingBody', 'JoinMeetingResponse',
-           'License', 'LineKeyLabelSelection', 'LineKeyLedPattern', 'LinkRelation', 'Location', 'LocationAddress',
-           'LocationAndNumbers', 'LocationCallParkSettings', 'LocationMoHGreetingType', 'LocationMoHSetting',
-           'LocationVoiceMailSettings', 'LoggingLevel', 'MACState', 'MACStatus', 'MACValidationResponse',
+           'JobErrorItem', 'JobErrorMessage', 'JobExecutionStatus', 'JobFuture', 'JobKind', 'JobResult', 'JobRunner',
+           'JoinMeetingBody', 'JoinMeetingResponse', 'JsonCodec', 'LazyModel', 'License', 'LineKeyLabelSelection',
+           'LineKeyLedPattern', 'LinkRelation', 'Location', 'LocationAddress', 'LocationAndNumbers',
+           'LocationCallParkSettings', 'LocationMoHGreetingType', 'LocationMoHSetting', 'LocationVoiceMailSettings',
+           'LoggingLevel', 'MACState', 'MACStatus', 'MACValidationResponse', 'MASKED_HEADERS', 'MAX_NUMBERS_PER_JOB',
            'ManageNumberErrorItem', 'MediaFileType', 'MediaSessionQuality', 'Meeting', 'MeetingCallType',
            'MeetingDevice', 'MeetingOptions', 'MeetingPreferenceDetails', 'MeetingService', 'MeetingState',
            'MeetingTelephony', 'MeetingType', 'MeetingsSite', 'MemberCommon', 'Membership', 'MembershipsData',
-           'MenuKey', 'Message', 'MessageAttachment', 'MessageSummary', 'MessagesData', 'MohMessageSetting',
-           'MonitoredElement', 'MonitoredElementMember', 'MonitoredMember', 'Monitoring', 'MoveNumberCounts',
-           'MppCustomization', 'MppVlanDevice', 'NetworkConnectionType', 'NetworkType', 'NightService', 'NoAnswer',
-           'NoiseCancellation', 'NoteType', 'Notification', 'NotificationRepeat', 'NotificationType',
-           'NumberAndAction', 'NumberDetails', 'NumberItem', 'NumberJob', 'NumberListPhoneNumber',
-           'NumberListPhoneNumberType', 'NumberOwner', 'NumberState', 'NumberType', 'OfficeNumber',
-           'OnboardingMethod', 'OrganisationVoicemailSettings', 'OrganisationVoicemailSettingsAPI', 'Organization',
-           'OriginatorType', 'OutboundProxy', 'OutgoingPermissionCallType', 'OutgoingPermissions', 'OverflowAction',
+           'MemoryCacheBackend', 'MenuKey', 'Message', 'MessageAttachment', 'MessageSummary', 'MessagesData',
+           'MohMessageSetting', 'MonitoredElement', 'MonitoredElementMember', 'MonitoredMember', 'Monitoring',
+           'MoveBatchResult', 'MoveNumberCounts', 'MoveSummary', 'MppCustomization', 'MppVlanDevice', 'MultipartFile',
+           'NetworkConnectionType', 'NetworkType', 'NightService', 'NoAnswer', 'NoiseCancellation', 'NoteType',
+           'Notification', 'NotificationRepeat', 'NotificationType', 'NumberAndAction', 'NumberDetails', 'NumberItem',
+           'NumberJob', 'NumberListPhoneNumber', 'NumberListPhoneNumberType', 'NumberMover', 'NumberOwner',
+           'NumberState', 'NumberType', 'OfficeNumber', 'OnboardingMethod', 'OpenTelemetryHooks',
+           'OrganisationVoicemailSettings', 'OrganisationVoicemailSettingsAPI', 'Organization', 'OriginatorType',
+           'OrjsonCodec', 'OutboundProxy', 'OutgoingPermissionCallType', 'OutgoingPermissions', 'OverflowAction',
            'OverflowSetting', 'OwnerType', 'PSTNConnection', 'PTTConnectionType', 'Paging', 'PagingAgent',
            'ParkedAgainst', 'Participant', 'ParticipantState', 'PasscodeRules', 'PatchMeetingBody',
            'PatchMeetingResponse', 'PatternAction', 'PatternAndAction', 'PbxUserDestination', 'PeopleStatus',
            'Person', 'PersonAddress', 'PersonDevicesResponse', 'PersonForwardingSetting', 'PersonNumbers',
            'PersonPhoneNumber', 'PersonPlaceAgent', 'PersonSettingsApiChild', 'PersonType', 'PersonalMeetingRoom',
            'PersonalMeetingRoomOptions', 'Personality', 'PhoneLanguage', 'PhoneNumber', 'PhoneNumberType',
-           'PinLength', 'Policy', 'PreferredAnswerEndpoint', 'PreferredAnswerEndpointType', 'PreferredAnswerResponse',
-           'PrimaryOrShared', 'Privacy', 'PskObject', 'PstnNumberDestination', 'PushToTalkAccessType',
-           'PushToTalkSettings', 'QAObject', 'QualityResources', 'QueryMeetingParticipantsWithEmailBody', 'Question',
-           'QuestionAnswer', 'QuestionOption', 'QuestionType', 'QuestionWithAnswers', 'QueueCallerId',
-           'QueueSettings', 'RETRY_429_MAX_WAIT', 'RGTrunk', 'Recall', 'RecallHuntGroup', 'ReceptionistSettings',
-           'Record', 'RecordingState', 'RecurWeekly', 'RecurYearlyByDate', 'RecurYearlyByDay', 'Recurrence',
-           'RedirectReason', 'Redirection', 'Registration', 'RejectAction', 'RepoAnnouncement', 'Report',
-           'ReportTemplate', 'RepositoryUsage', 'ResponseStatus', 'ResponseStatusType', 'RingPattern', 'Room',
-           'RoomTab', 'RoomType', 'RouteGroup', 'RouteGroupUsage', 'RouteIdentity', 'RouteList',
-           'RouteListDestination', 'RouteListDetail', 'RouteType', 'SafeEnum', 'Schedule', 'ScheduleApiBase',
-           'ScheduleDay', 'ScheduleLevel', 'ScheduleMonth', 'ScheduleType', 'ScheduleTypeOrStr', 'ScheduleWeek',
-           'ScheduledMeeting', 'ScheduledType', 'SchedulingOptions', 'Sender', 'ServiceType',
+           'PinLength', 'Policy', 'PollPolicy', 'PreferredAnswerEndpoint', 'PreferredAnswerEndpointType',
+           'PreferredAnswerResponse', 'PrimaryOrShared', 'Privacy', 'PskObject', 'PstnNumberDestination',
+           'PushToTalkAccessType', 'PushToTalkSettings', 'QAObject', 'QualityResources',
+           'QueryMeetingParticipantsWithEmailBody', 'Question', 'QuestionAnswer', 'QuestionOption', 'QuestionType',
+           'QuestionWithAnswers', 'QueueCallerId', 'QueueSettings', 'READ_MOSTLY_POLICIES', 'RETRY_429_MAX_WAIT',
+           'RGTrunk', 'RateLimiter', 'Recall', 'RecallHuntGroup', 'ReceptionistSettings', 'Record', 'RecordingState',
+           'RecurWeekly', 'RecurYearlyByDate', 'RecurYearlyByDay', 'Recurrence', 'RedirectReason', 'Redirection',
+           'Registration', 'RejectAction', 'ReplayResponse', 'RepoAnnouncement', 'Report', 'ReportDecoder',
+           'ReportDecompressor', 'ReportTemplate', 'RepositoryUsage', 'RequestHooks', 'RequestMetrics',
+           'ResponseCache', 'ResponseStatus', 'ResponseStatusType', 'RingPattern', 'Room', 'RoomTab', 'RoomType',
+           'RouteGroup', 'RouteGroupUsage', 'RouteIdentity', 'RouteList', 'RouteListDestination', 'RouteListDetail',
+           'RouteType', 'SECRET_KEYS', 'SQLiteCacheBackend', 'SafeEnum', 'Schedule', 'ScheduleApiBase', 'ScheduleDay',
+           'ScheduleLevel', 'ScheduleMonth', 'ScheduleType', 'ScheduleTypeOrStr', 'ScheduleWeek', 'ScheduledMeeting',
+           'ScheduledType', 'SchedulingOptions', 'Sender', 'ServiceType', 'SettingsChange', 'SettingsResult',
            'SimultaneousInterpretation', 'SipAddress', 'SipType', 'SiteType', 'SoftKeyLayout', 'SoftKeyMenu',
-           'StandardRegistrationApproveRule', 'StartJobResponse', 'StartStopAnnouncement', 'StepExecutionStatus',
-           'StorageType', 'StrOrDict', 'StrandedCalls', 'StrandedCallsAction', 'SupportedDevice', 'SurveyResult',
-           'TagOp', 'Team', 'TeamMembership', 'Telephony', 'TelephonyCall', 'TelephonyDevice', 'TelephonyEvent',
-           'TelephonyEventData', 'TelephonyLocation', 'TelephonyParty', 'TestCallRoutingResult', 'Tokens',
-           'TrackingCode', 'TrackingCodeItem', 'TrackingCodeOption', 'TrackingCodeType', 'Transcript',
+           'StandardRegistrationApproveRule', 'StartJobResponse', 'StartStopAnnouncement', 'StdJsonCodec',
+           'StepExecutionStatus', 'StorageType', 'StrOrDict', 'StrandedCalls', 'StrandedCallsAction',
+           'SupportedDevice', 'SurveyResult', 'TERMINAL_STATUS', 'TagOp', 'Team', 'TeamMembership', 'Telephony',
+           'TelephonyCall', 'TelephonyDevice', 'TelephonyEvent', 'TelephonyEventData', 'TelephonyLocation',
+           'TelephonyParty', 'TestCallRoutingResult', 'TokenManager', 'TokenStore', 'Tokens', 'TrackingCode',
+           'TrackingCodeItem', 'TrackingCodeOption', 'TrackingCodeType', 'Transcript', 'TranscriptExporter',
            'TranscriptSnippet', 'TranscriptStatus', 'TransportType', 'Trunk', 'TrunkDestination', 'TrunkDetail',
            'TrunkDeviceType', 'TrunkType', 'TrunkTypeWithDeviceType', 'TrunkUsage', 'Type', 'UCMProfile',
-           'UnansweredCalls', 'UnlockedMeetingJoinSecurity', 'UpdateDefaultSiteBody', 'UpdateMeetingInviteeBody',
-           'UpdateNumbersResponse', 'UpdateParticipantBody', 'UpdateParticipantResponse', 'UpdatePersonNumbers',
-           'UpdatePersonPhoneNumber', 'UpdatePersonalMeetingRoomOptionsBody', 'UpdateTranscriptSnippetBody',
+           'UjsonCodec', 'UnansweredCalls', 'UnlockedMeetingJoinSecurity', 'UpdateDefaultSiteBody',
+           'UpdateMeetingInviteeBody', 'UpdateNumbersResponse', 'UpdateParticipantBody', 'UpdateParticipantResponse',
+           'UpdatePersonNumbers', 'UpdatePersonPhoneNumber', 'UpdatePersonalMeetingRoomOptionsBody',
+           'UpdateTranscriptSnippetBody', 'UploadItem', 'UploadKind', 'UploadResult', 'UploadStatus',
            'UsageRouteLists', 'UsbPortsObject', 'UserBase', 'UserNumber', 'UserType', 'ValidateExtensionStatus',
            'ValidateExtensionStatusState', 'ValidateExtensionsResponse', 'ValidatePhoneNumberStatus',
            'ValidatePhoneNumberStatusState', 'ValidatePhoneNumbersResponse', 'ValidationRules', 'ValidationStatus',
@@ -243,7 +274,10 @@ __all__ = ['AcdCustomization', 'Action', 'ActivationCodeResponse', 'AdaptiveCard
            'VoicemailNotifications', 'VoicemailSettings', 'VoicemailTransferToNumber', 'VolumeSettings',
            'WaitMessageSetting', 'WaitMode', 'Webhook', 'WebhookCreate', 'WebhookEvent', 'WebhookEventData',
            'WebhookEventType', 'WebhookResource', 'WebhookStatus', 'WelcomeMessageSetting',
-           'WifiAuthenticationMethod', 'WifiCustomization', 'WifiNetwork', 'WorkSpaceType', 'Workspace',
+           'WifiAuthenticationMethod', 'WifiCustomization', 'WifiNetwork', 'WireLog', 'WorkSpaceType', 'Workspace',
            'WorkspaceCalling', 'WorkspaceEmail', 'WorkspaceLocation', 'WorkspaceLocationFloor', 'WorkspaceNumbers',
-           'WorkspaceSupportedDevices', 'WorkspaceWebexCalling', '_Helper', 'dt_iso_str', 'enum_str', 'plus1',
-           'to_camel', 'webex_id_to_uuid']
+           'WorkspaceSupportedDevices', 'WorkspaceWebexCalling', '_Helper', 'batch_numbers', 'cdr_batches',
+           'cdr_record_batches', 'cdr_to_numpy', 'cdr_to_parquet', 'content_hash', 'debug_enabled', 'dt_iso_str',
+           'enum_str', 'json_codec', 'json_dumps', 'json_loads', 'mask_form', 'mask_headers', 'mask_json', 'plus1',
+           'read_manifest', 'set_json_codec', 'settings_diff', 'settings_update', 'to_camel', 'url_template',
+           'webex_id_to_uuid']
@@ -1,9 +1,11 @@
+import sys
 from dataclasses import dataclass
+from importlib import import_module
 
 from .base import StrOrDict
 from .rest import RestSession
 
-__all__ = ['ApiChild']
+__all__ = ['ApiChild', 'LazyApiChild']
 
 
 @dataclass(init=False)
@@ -40,8 +42,9 @@ class ApiChild:
         :return: endpoint URL
         :rtype: str
         """
-        path = path and f'/{path}' or ''
-        return self.session.ep(f'{self.base}{path}')
+        # avoid an empty path segment for children w/o endpoint prefix
+        path = '/'.join(p for p in (self.base, path) if p)
+        return self.session.ep(path)
 
     def get(self, *args, **kwargs) -> StrOrDict:
         """
@@ -90,3 +93,45 @@ class ApiChild:
         :param kwargs:
         """
         return self.session.rest_patch(*args, **kwargs)
+
+
+class LazyApiChild:
+    """
+    Descriptor for child APIs of :class:`WebexSimpleApi`.
+
+    The module defining the child API class is only imported and the child API is only instantiated on first access.
+    The instance is then stored in the instance dict and subsequent accesses don't hit the descriptor anymore.
+    The owner needs to have a session attribute.
+    """
+
+    def __init__(self, module: str, class_name: str):
+        """
+
+        :param module: module defining the child API class; relative to wxc_sdk
+        :type module: str
+        :param class_name: name of the child API class
+        :type class_name: str
+        """
+        self.module = module
+        self.class_name = class_name
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def api_class(self, owner: type) -> type:
+        """
+        Child API class. Classes available in the module of the owner are used directly (all async child API classes
+        are defined in the same module as :class:`AsWebexSimpleApi`); else the module is imported.
+        """
+        api_class = vars(sys.modules[owner.__module__]).get(self.class_name)
+        if api_class is None:
+            api_class = getattr(import_module(self.module, package='wxc_sdk'), self.class_name)
+        return api_class
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        api = self.api_class(owner)(session=instance.session)
+        instance.__dict__[self.name] = api
+        return api
@@ -1,22 +1,26 @@
 # auto-generated. DO NOT EDIT
+import asyncio
 import csv
 import json
 import logging
 import mimetypes
 import os
-from collections.abc import AsyncGenerator
+from collections import deque
+from collections.abc import AsyncGenerator, Iterable
 from dataclasses import dataclass
 from datetime import datetime, date, timedelta
 from dateutil import tz
 from dateutil.parser import isoparse
 from enum import Enum
+from functools import partial
 from io import BufferedReader
-from typing import Union, Dict, Optional, Literal, List
+from typing import Any, BinaryIO, Callable, Union, Dict, Optional, Literal, List
 
 from aiohttp import FormData
 from pydantic import parse_obj_as
 
 from wxc_sdk.all_types import *
+from wxc_sdk.api_child import LazyApiChild
 from wxc_sdk.as_rest import AsRestSession
 from wxc_sdk.base import to_camel, StrOrDict, dt_iso_str, enum_str
 from wxc_sdk.base import SafeEnum as Enum
@@ -52,8 +56,8 @@ CALLING_DATA_TIMEOUT_PROTECTION = False
 
 __all__ = ['AsAccessCodesApi', 'AsAgentCallerIdApi', 'AsAnnouncementApi', 'AsAnnouncementsRepositoryApi',
            'AsApiChild', 'AsAppServicesApi', 'AsAttachmentActionsApi', 'AsAutoAttendantApi', 'AsBargeApi',
-           'AsCQPolicyApi', 'AsCallInterceptApi', 'AsCallParkApi', 'AsCallPickupApi', 'AsCallQueueApi',
-           'AsCallRecordingApi', 'AsCallWaitingApi', 'AsCallerIdApi', 'AsCallingBehaviorApi',
+           'AsBulkSettingsApiChild', 'AsCQPolicyApi', 'AsCallInterceptApi', 'AsCallParkApi', 'AsCallPickupApi',
+           'AsCallQueueApi', 'AsCallRecordingApi', 'AsCallWaitingApi', 'AsCallerIdApi', 'AsCallingBehaviorApi',
            'AsCallparkExtensionApi', 'AsCallsApi', 'AsDetailedCDRApi', 'AsDeviceSettingsJobsApi', 'AsDevicesApi',
            'AsDialPlanApi', 'AsDndApi', 'AsEventsApi', 'AsExecAssistantApi', 'AsForwardingApi', 'AsGroupsApi',
            'AsHotelingApi', 'AsHuntGroupApi', 'AsIncomingPermissionsApi', 'AsInternalDialingApi', 'AsJobsApi',
@@ -109,8 +113,9 @@ class AsApiChild:
         :return: endpoint URL
         :rtype: str
         """
-        path = path and f'/{path}' or ''
-        return self.session.ep(f'{self.base}{path}')
+        # avoid an empty path segment for children w/o endpoint prefix
+        path = '/'.join(p for p in (self.base, path) if p)
+        return self.session.ep(path)
 
     async def get(self, *args, **kwargs) -> StrOrDict:
         """
@@ -194,7 +199,8 @@ class AsDetailedCDRApi(AsApiChild, base='devices'):
     """
 
     def get_cdr_history_gen(self, start_time: Union[str, datetime] = None, end_time: Union[datetime, str] = None,
-                        locations: list[str] = None, **params) -> AsyncGenerator[CDR, None, None]:
+                        locations: list[str] = None, raw: bool = False,
+                        **params) -> AsyncGenerator[CDR, None, None]:
         """
         Provides Webex Calling Detailed Call History data for your organization.
 
@@ -216,6 +222,9 @@ class AsDetailedCDRApi(AsApiChild, base='devices'):
         :param locations: Names of the location (as shown in Control Hub). Up to 10 comma-separated locations can be
             provided. Allows you to query reports by location.
         :type locations: list[str]
+        :param raw: yield dicts as returned by the API instead of :class:`CDR` instances; for example to be consumed
+            by :class:`CDRRecord` or :mod:`wxc_sdk.cdr.columnar`
+        :type raw: bool
         :param params: additional arguments
         :return:
         """
@@ -237,10 +246,11 @@ class AsDetailedCDRApi(AsApiChild, base='devices'):
         params['startTime'] = guess_datetime(start_time)
         params['endTime'] = guess_datetime(end_time)
         # noinspection PyTypeChecker
-        return self.session.follow_pagination(url=url, model=CDR, params=params, item_key='items')
+        return self.session.follow_pagination(url=url, model=None if raw else CDR, params=params, item_key='items')
 
     async def get_cdr_history(self, start_time: Union[str, datetime] = None, end_time: Union[datetime, str] = None,
-                        locations: list[str] = None, **params) -> List[CDR]:
+                        locations: list[str] = None, raw: bool = False,
+                        **params) -> List[CDR]:
         """
         Provides Webex Calling Detailed Call History data for your organization.
 
@@ -262,6 +272,9 @@ class AsDetailedCDRApi(AsApiChild, base='devices'):
         :param locations: Names of the location (as shown in Control Hub). Up to 10 comma-separated locations can be
             provided. Allows you to query reports by location.
         :type locations: list[str]
+        :param raw: yield dicts as returned by the API instead of :class:`CDR` instances; for example to be consumed
+            by :class:`CDRRecord` or :mod:`wxc_sdk.cdr.columnar`
+        :type raw: bool
         :param params: additional arguments
         :return:
         """
@@ -283,7 +296,7 @@ class AsDetailedCDRApi(AsApiChild, base='devices'):
         params['startTime'] = guess_datetime(start_time)
         params['endTime'] = guess_datetime(end_time)
         # noinspection PyTypeChecker
-        return [o async for o in self.session.follow_pagination(url=url, model=CDR, params=params, item_key='items')]
+        return [o async for o in self.session.follow_pagination(url=url, model=None if raw else CDR, params=params, item_key='items')]
 
 
 class AsDeviceSettingsJobsApi(AsApiChild, base='telephony/config/jobs/devices/callDeviceSettings'):
@@ -324,7 +337,7 @@ class AsDeviceSettingsJobsApi(AsApiChild, base='telephony/config/jobs/devices/ca
         :rtype: StartJobResponse
         """
         url = self.ep()
-        params = org_id and {'prgId': org_id} or None
+        params = org_id and {'orgId': org_id} or None
         body = {}
         if location_id:
             body['locationId'] = location_id
@@ -1411,11 +1424,14 @@ class AsMeetingClosedCaptionsApi(AsApiChild, base='meetingClosedCaptions'):
         url = self.ep(f'{closed_caption_id}/snippets')
         return [o async for o in self.session.follow_pagination(url=url, model=CCSnippet, params=params)]
 
-    async def download_snippets(self, closed_caption_id: str, meeting_id: str, format: str = None):
+    async def download_snippets(self, closed_caption_id: str, meeting_id: str, format: str = None) -> str:
         """
         Download meeting closed caption snippets from the meeting closed caption specified by closedCaptionId formatted
         either as a Video Text Track (.vtt) file or plain text (.txt) file.
 
+        The content is held in memory. Use :meth:`download_snippets_chunks` or :meth:`download_snippets_to_file` for
+        streaming downloads.
+
         :param closed_caption_id: Unique identifier for the meeting closed caption.
         :type closed_caption_id: str
         :param meeting_id: Unique identifier for the meeting instance which the closed caption snippets belong to. This
@@ -1424,15 +1440,63 @@ class AsMeetingClosedCaptionsApi(AsApiChild, base='meetingClosedCaptions'):
         :type meeting_id: str
         :param format: Format for the downloaded meeting closed caption snippets. Possible values: vtt, txt
         :type format: str
+        :return: closed caption snippets
+        :rtype: str
         """
-        # TODO: verify return and adapt
         params = {}
         params['meetingId'] = meeting_id
         if format is not None:
             params['format'] = format
         url = self.ep(f'{closed_caption_id}/download')
-        await super().get(url=url, params=params)
-        return
+        return await super().get(url=url, params=params)
+
+    async def download_snippets_chunks(self, closed_caption_id: str, meeting_id: str, format: str = None,
+                                       chunk_size: int = None) -> AsyncGenerator[bytes, None, None]:
+        """
+        Download meeting closed caption snippets and yield the content in chunks. The content is never held in
+        memory as a whole.
+
+        :param closed_caption_id: Unique identifier for the meeting closed caption.
+        :type closed_caption_id: str
+        :param meeting_id: Unique identifier for the meeting instance which the closed caption snippets belong to.
+        :type meeting_id: str
+        :param format: Format for the downloaded meeting closed caption snippets. Possible values: vtt, txt
+        :type format: str
+        :param chunk_size: size of the chunks; default: 64 KiB
+        :type chunk_size: int
+        :return: yields chunks of the content (bytes)
+        """
+        params = {'meetingId': meeting_id}
+        if format is not None:
+            params['format'] = format
+        url = self.ep(f'{closed_caption_id}/download')
+        async for chunk in self.session.rest_stream(url=url, params=params, chunk_size=chunk_size):
+            yield chunk
+        
+
+    async def download_snippets_to_file(self, closed_caption_id: str, meeting_id: str, file: Union[str, BinaryIO],
+                                        format: str = None) -> int:
+        """
+        Download meeting closed caption snippets and write them to a file chunk by chunk.
+
+        :param closed_caption_id: Unique identifier for the meeting closed caption.
+        :type closed_caption_id: str
+        :param meeting_id: Unique identifier for the meeting instance which the closed caption snippets belong to.
+        :type meeting_id: str
+        :param file: path of the file to write to or a binary file-like object (sink). A file at the given path is
+            only created once the download is complete.
+        :type file: Union[str, BinaryIO]
+        :param format: Format for the downloaded meeting closed caption snippets. Possible values: vtt, txt
+        :type format: str
+        :return: number of bytes written
+        :rtype: int
+        """
+        params = {'meetingId': meeting_id}
+        if format is not None:
+            params['format'] = format
+        url = self.ep(f'{closed_caption_id}/download')
+        return await self.session.rest_download(url=url, file=file, params=params)
+        
 
 
 class AsMeetingInviteesApi(AsApiChild, base='meetingInvitees'):
@@ -2573,10 +2637,13 @@ class AsMeetingTranscriptsApi(AsApiChild, base=''):
         url = self.ep('admin/meetingTranscripts')
         return [o async for o in self.session.follow_pagination(url=url, model=Transcript, params=params)]
 
-    async def download(self, transcript_id: str, format: str = None, host_email: str = None):
+    async def download(self, transcript_id: str, format: str = None, host_email: str = None) -> str:
         """
         Download a meeting transcript from the meeting transcript specified by transcriptId.
 
+        The transcript is held in memory. Use :meth:`download_chunks` or :meth:`download_to_file` for streaming
+        downloads.
+
         :param transcript_id: Unique identifier for the meeting transcript.
         :type transcript_id: str
         :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
@@ -2586,6 +2653,9 @@ class AsMeetingTranscriptsApi(AsApiChild, base=''):
             they manage and the API will return details for a meeting that is hosted by that user.
         :type host_email: str
 
+        :return: transcript content
+        :rtype: str
+
         documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/download-a-meeting-transcript
         """
         params = {}
@@ -2594,8 +2664,59 @@ class AsMeetingTranscriptsApi(AsApiChild, base=''):
         if host_email is not None:
             params['hostEmail'] = host_email
         url = self.ep(f'meetingTranscripts/{transcript_id}/download')
-        await super().get(url=url, params=params)
-        # TODO: fix. Find out what the actual return type is
+        return await super().get(url=url, params=params)
+
+    async def download_chunks(self, transcript_id: str, format: str = None, host_email: str = None,
+                              chunk_size: int = None) -> AsyncGenerator[bytes, None, None]:
+        """
+        Download a meeting transcript and yield the content in chunks. The transcript is never held in memory as a
+        whole.
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host.
+        :type host_email: str
+        :param chunk_size: size of the chunks; default: 64 KiB
+        :type chunk_size: int
+        :return: yields chunks of the transcript (bytes)
+        """
+        params = {}
+        if format is not None:
+            params['format'] = format
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep(f'meetingTranscripts/{transcript_id}/download')
+        async for chunk in self.session.rest_stream(url=url, params=params, chunk_size=chunk_size):
+            yield chunk
+        
+
+    async def download_to_file(self, transcript_id: str, file: Union[str, BinaryIO], format: str = None,
+                               host_email: str = None) -> int:
+        """
+        Download a meeting transcript and write it to a file chunk by chunk.
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param file: path of the file to write to or a binary file-like object (sink). A file at the given path is
+            only created once the download is complete.
+        :type file: Union[str, BinaryIO]
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host.
+        :type host_email: str
+        :return: number of bytes written
+        :rtype: int
+        """
+        params = {}
+        if format is not None:
+            params['format'] = format
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep(f'meetingTranscripts/{transcript_id}/download')
+        return await self.session.rest_download(url=url, file=file, params=params)
+        
 
     def list_snippets_gen(self, transcript_id: str, **params) -> AsyncGenerator[TranscriptSnippet, None, None]:
         """
@@ -4975,6 +5096,197 @@ class AsBargeApi(AsPersonSettingsApiChild):
         await self.put(ep, params=params, data=barge_settings.json())
 
 
+class AsBulkSettingsApiChild(AsApiChild, base=''):
+    """
+    Base class for APIs with person settings child APIs (:class:`AsPersonSettingsApiChild` instances) like
+    :class:`wxc_sdk.person_settings.PersonSettingsApi`. Adds bulk reading and updating of settings for many entities.
+    """
+
+    def bulk_features(self) -> list[str]:
+        """
+        Names of features that can be read in bulk: attributes with :class:`AsPersonSettingsApiChild` instances
+
+        :return: list of feature names
+        """
+        return sorted(name for name, value in self.__dict__.items()
+                      if isinstance(value, AsPersonSettingsApiChild) and hasattr(value, 'read'))
+
+    def bulk_readers(self, features: Optional[Iterable[str]]) -> dict[str, Callable]:
+        """
+        read() methods for the given features
+
+        :meta private:
+        """
+        available = self.bulk_features()
+        if features is None:
+            features = available
+        features = list(dict.fromkeys(features))
+        unknown = [feature for feature in features if feature not in available]
+        if unknown:
+            raise ValueError(f'unknown feature(s): {", ".join(unknown)}; available: {", ".join(available)}')
+        return {feature: getattr(self, feature).read for feature in features}
+
+    def bulk_configurators(self, features: Iterable[str]) -> dict[str, Callable]:
+        """
+        Methods to update settings for the given features: configure_settings() if available, else configure()
+
+        :meta private:
+        """
+        configurators = {}
+        not_supported = []
+        for feature in self.bulk_readers(features):
+            api = getattr(self, feature)
+            if not hasattr(api, 'configure'):
+                not_supported.append(feature)
+                continue
+            configurators[feature] = getattr(api, 'configure_settings', None) or api.configure
+        if not_supported:
+            raise ValueError(f'update not supported for feature(s): {", ".join(not_supported)}')
+        return configurators
+
+    async def run_concurrently(self, jobs: Iterable[Callable[[], Any]],
+                               max_workers: int = None) -> AsyncGenerator[Any, None, None]:
+        """
+        Run jobs (coroutine functions) concurrently with at most max_workers jobs in flight and yield the results as
+        they become available
+
+        Jobs are only taken from the iterable when a worker is available. max_workers defaults to the number of
+        concurrent requests of the session.
+
+        :meta private:
+        """
+        max_workers = max_workers or self.session.concurrent_requests
+        pending = set()
+        try:
+            for job in jobs:
+                pending.add(asyncio.create_task(job()))
+                if len(pending) >= max_workers:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        
+
+    async def read_bulk_gen(self, ids: Iterable[str], features: Iterable[str] = None, org_id: str = None,
+                            max_workers: int = None) -> AsyncGenerator[SettingsResult, None, None]:
+        """
+        Read settings of multiple features for many persons (workspaces, locations)
+
+        The read() calls of all features for all entities are executed concurrently with at most max_workers
+        requests in flight. Each request is subject to the 429 handling and the rate limiter of the session.
+
+        Results are yielded as they become available (not in request order). Errors don't stop the bulk read; failed
+        reads are reported as results with the error attribute set.
+
+        :param ids: person, workspace, or location ids
+        :type ids: Iterable[str]
+        :param features: names of the features to read like 'forwarding' or 'dnd'; see :meth:`bulk_features`.
+            Default: all features
+        :type features: Iterable[str]
+        :param org_id: organization the entities belong to
+        :type org_id: str
+        :param max_workers: maximum number of concurrent requests. Default: number of concurrent requests of the
+            session
+        :type max_workers: int
+        :return: yields one result per entity and feature
+        """
+        readers = self.bulk_readers(features)
+
+        async def read(entity_id: str, feature: str) -> SettingsResult:
+            try:
+                settings = await readers[feature](entity_id, org_id=org_id)
+            except Exception as e:
+                return SettingsResult(id=entity_id, feature=feature, error=e)
+            return SettingsResult(id=entity_id, feature=feature, settings=settings)
+
+        jobs = (partial(read, entity_id, feature) for entity_id in ids for feature in readers)
+        async for result in self.run_concurrently(jobs, max_workers=max_workers):
+            yield result
+
+    async def read_bulk(self, ids: Iterable[str], features: Iterable[str] = None, org_id: str = None,
+                        max_workers: int = None) -> List[SettingsResult]:
+        """
+        Read settings of multiple features for many persons (workspaces, locations)
+
+        See :meth:`read_bulk_gen`
+
+        :return: list of results; one result per entity and feature
+        :rtype: list[SettingsResult]
+        """
+        return [r async for r in self.read_bulk_gen(ids=ids, features=features, org_id=org_id,
+                                                    max_workers=max_workers)]
+
+        
+
+    async def apply_bulk_gen(self, desired: dict[str, dict[str, Any]], org_id: str = None, dry_run: bool = False,
+                             max_workers: int = None) -> AsyncGenerator[SettingsChange, None, None]:
+        """
+        Apply desired settings to many persons (workspaces, locations)
+
+        For each entity and feature the current settings are read and compared to the desired settings (see
+        :func:`settings_diff`). Settings are only updated if they differ from the desired settings. Entities are
+        processed concurrently with at most max_workers entities in flight. Each request is subject to the 429
+        handling and the rate limiter of the session.
+
+        Results are yielded as they become available. Errors don't stop the bulk apply; failures are reported as
+        results with the error attribute set.
+
+        :param desired: desired settings by entity id and feature: {id: {feature: desired settings}}. Desired settings
+            can be a (partial) model instance (only fields set explicitly are applied), a dict of attribute names and
+            values, or a plain value for features with plain settings like 'call_waiting'
+        :type desired: dict[str, dict[str, Any]]
+        :param org_id: organization the entities belong to
+        :type org_id: str
+        :param dry_run: only read the current settings and report the differences; don't update anything
+        :type dry_run: bool
+        :param max_workers: maximum number of concurrent requests. Default: number of concurrent requests of the
+            session
+        :type max_workers: int
+        :return: yields one result per entity and feature
+        """
+        configurators = self.bulk_configurators(set(f for features in desired.values() for f in features))
+
+        async def apply(entity_id: str, feature: str, settings: Any) -> SettingsChange:
+            change = SettingsChange(id=entity_id, feature=feature)
+            try:
+                current = await getattr(self, feature).read(entity_id, org_id=org_id)
+                change.diff = settings_diff(current, settings)
+                if change.diff and not dry_run:
+                    await configurators[feature](entity_id, settings_update(current, settings), org_id=org_id)
+                    change.applied = True
+            except Exception as e:
+                change.error = e
+            return change
+
+        jobs = (partial(apply, entity_id, feature, settings)
+                for entity_id, features in desired.items()
+                for feature, settings in features.items())
+        async for result in self.run_concurrently(jobs, max_workers=max_workers):
+            yield result
+
+    async def apply_bulk(self, desired: dict[str, dict[str, Any]], org_id: str = None, dry_run: bool = False,
+                         max_workers: int = None) -> List[SettingsChange]:
+        """
+        Apply desired settings to many persons (workspaces, locations)
+
+        See :meth:`apply_bulk_gen`
+
+        :return: list of results; one result per entity and feature
+        :rtype: list[SettingsChange]
+        """
+        return [r async for r in self.apply_bulk_gen(desired=desired, org_id=org_id, dry_run=dry_run,
+                                                     max_workers=max_workers)]
+
+        
+
+
 class AsCallInterceptApi(AsPersonSettingsApiChild):
     """
     API for person's call intercept settings
@@ -6669,7 +6981,7 @@ class AsVoicemailApi(AsPersonSettingsApiChild):
         params = org_id and {'orgId': org_id} or None
         await self.put(url, data=data, params=params)
 
-    async def _configure_greeting(self, *, person_id: str, content: Union[BufferedReader, str],
+    async def _configure_greeting(self, *, person_id: str, content: Union[BufferedReader, str, MultipartFile],
                             upload_as: str = None, org_id: str = None,
                             greeting_key: str):
         """
@@ -6679,8 +6991,9 @@ class AsVoicemailApi(AsPersonSettingsApiChild):
         :type person_id: str
         :param content: the file to be uploaded, can be a path to a file or a buffered reader (opened file); if a
             reader referring to an open file is passed then make sure to open the file as binary b/c otherwise the
-            content length might be calculated wrong
-        :type content: Union[BufferedReader, str]
+            content length might be calculated wrong. Can also be a prepared request body
+            (:class:`wxc_sdk.bulk_upload.MultipartFile`) which is streamed from disk and can be sent again on retries
+        :type content: Union[BufferedReader, str, MultipartFile]
         :param upload_as: filename for the content. Only required if content is a reader; has to be a .wav file name.
         :type upload_as: str
         :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
@@ -6688,83 +7001,47 @@ class AsVoicemailApi(AsPersonSettingsApiChild):
         :type org_id: str
         :param greeting_key: 'uploadBusyGreeting' or 'uploadNoAnswerGreeting'
         """
-        if isinstance(content, str):
-            upload_as = os.path.basename(content)
-            content = open(content, mode='rb')
-            must_close = True
+        must_close = False
+        if isinstance(content, MultipartFile):
+            # prepared request body
+            body = content
+            headers = {'Content-Type': content.content_type, 'Content-Length': str(len(content))}
         else:
-            must_close = False
-            # an existing reader
-            if not upload_as:
+            if isinstance(content, str):
+                upload_as = os.path.basename(content)
+                content = open(content, mode='rb')
+                must_close = True
+            elif not upload_as:
+                # an existing reader
                 raise ValueError('upload_as is required')
-        encoder = MultipartEncoder({'file': (upload_as, content, 'audio/wav')})
+            body = MultipartEncoder({'file': (upload_as, content, 'audio/wav')})
+            headers = {'Content-Type': body.content_type}
         ep = self.f_ep(person_id=person_id, path=f'actions/{greeting_key}/invoke')
         params = org_id and {'orgId': org_id} or None
         try:
-            await self.post(ep, data=encoder, headers={'Content-Type': encoder.content_type},
-                      params=params)
+            await self.post(ep, data=body, headers=headers, params=params)
         finally:
             if must_close:
                 content.close()
 
-    def configure_busy_greeting(self, person_id: str, content: Union[BufferedReader, str],
+    async def configure_busy_greeting(self, person_id: str, content: Union[BufferedReader, str, MultipartFile],
                                 upload_as: str = None, org_id: str = None):
-        """
-        Configure Busy Voicemail Greeting for a Person
-        Configure a Person's Busy Voicemail Greeting by uploading a Waveform Audio File Format, .wav, encoded audio
-        file.
-
-        Your request will need to be a multipart/form-data request rather than JSON, using the audio/wav Content-Type.
-
-        This API requires a full or user administrator auth token with the spark-admin:people_write scope or a user
-        auth token with spark:people_write scope can be used by a person to update their settings.
-
-        :param person_id: Unique identifier for the person.
-        :type person_id: str
-        :param content: the file to be uploaded, can be a path to a file or a buffered reader (opened file); if a
-            reader referring to an open file is passed then make sure to open the file as binary b/c otherwise the
-            content length might be calculated wrong
-        :type content: Union[BufferedReader, str]
-        :param upload_as: filename for the content. Only required if content is a reader; has to be a .wav file name.
-        :type upload_as: str
-        :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
-            may use this parameter as the default is the same organization as the token used to access API.
-        :type org_id: str
-        """
-        self._configure_greeting(person_id=person_id, content=content, upload_as=upload_as, org_id=org_id,
-                                 greeting_key='uploadBusyGreeting')
+        await self._configure_greeting(person_id=person_id, content=content, upload_as=upload_as, org_id=org_id,
+                                       greeting_key='uploadBusyGreeting')
+        
 
-    def configure_no_answer_greeting(self, person_id: str, content: Union[BufferedReader, str],
+    async def configure_no_answer_greeting(self, person_id: str, content: Union[BufferedReader, str, MultipartFile],
                                      upload_as: str = None, org_id: str = None):
-        """
-        Configure No Answer Voicemail Greeting for a Person
-        Configure a Person's No Answer Voicemail Greeting by uploading a Waveform Audio File Format, .wav, encoded
-        audio file.
-
-        Your request will need to be a multipart/form-data request rather than JSON, using the audio/wav Content-Type.
-
-        This API requires a full or user administrator auth token with the spark-admin:people_write scope or a user
-        auth token with spark:people_write scope can be used by a person to update their settings.
-
-        :param person_id: Unique identifier for the person.
-        :type person_id: str
-        :param content: the file to be uploaded, can be a path to a file or a buffered reader (opened file); if a
-            reader referring to an open file is passed then make sure to open the file as binary b/c otherwise the
-            content length might be calculated wrong
-        :type content: Union[BufferedReader, str]
-        :param upload_as: filename for the content. Only required if content is a reader; has to be a .wav file name.
-        :type upload_as: str
-        :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
-            may use this parameter as the default is the same organization as the token used to access API.
-        :type org_id: str
-        """
-        self._configure_greeting(person_id=person_id, content=content, upload_as=upload_as, org_id=org_id,
-                                 greeting_key='uploadNoAnswerGreeting')
+        await self._configure_greeting(person_id=person_id, content=content, upload_as=upload_as, org_id=org_id,
+                                       greeting_key='uploadNoAnswerGreeting')
+        
 
 
-class AsPersonSettingsApi(AsApiChild, base='people'):
+class AsPersonSettingsApi(AsBulkSettingsApiChild, base='people'):
     """
     API for all user level settings
+
+    Settings of many users can be read concurrently using :meth:`read_bulk`.
     """
 
     #: agent caller id Api
@@ -7056,21 +7333,71 @@ class AsReportsApi(AsApiChild, base='devices'):
         url = self.session.ep(f'reports/{report_id}')
         await super().delete(url=url)
 
-    async def download(self, url: str) -> List[dict]:
+    async def download_gen(self, url: str) -> AsyncGenerator[dict, None, None]:
         """
         Download a report from the given URL and yield the rows as dicts
 
+        The report is downloaded and decoded chunk by chunk; compressed (zip, gzip) payloads are decompressed on the
+        fly. Memory consumption does not depend on the size of the report.
+
+        :param url: download URL
+        :type url: str
+        :return: yields dicts
+        """
+        decoder = ReportDecoder()
+        async for chunk in self.session.rest_stream(url=url, chunk_size=ReportDecoder.chunk_size):
+            for row in decoder.feed(chunk):
+                yield row
+        for row in decoder.close():
+            yield row
+
+    async def download(self, url: str) -> List[dict]:
+        """
+        Download a report from the given URL and return the rows as dicts
+
         :param url: download URL
         :type url: str
         :return: list of dicts (one per row)
         :rtype: list[dict]
         """
-        headers = {'Authorization': f'Bearer {self.session.access_token}'}
-        async with self.session.get(url=url, headers=headers) as r:
-            r.raise_for_status()
-            lines = [line.decode(encoding='utf-8-sig') async for line in r.content]
-            reader = csv.DictReader(lines)
-            return list(reader)
+        return [row async for row in self.download_gen(url=url)]
+
+        
+
+    async def download_to_file(self, url: str, path: str, decompress: bool = True) -> int:
+        """
+        Download a report from the given URL and write it to a file
+
+        Data is written chunk by chunk; memory consumption does not depend on the size of the report. The data is
+        written to a temporary file (path + ".part") first, which is renamed once the download is complete: a file at
+        path always is complete.
+
+        :param url: download URL
+        :type url: str
+        :param path: path of the file to write to
+        :type path: str
+        :param decompress: decompress zip or gzip payloads and write the CSV data. If False, then the payload is
+            written as received.
+        :type decompress: bool
+        :return: number of bytes written
+        :rtype: int
+        """
+        if not decompress:
+            return await self.session.rest_download(url=url, file=path)
+        part = f'{path}.part'
+        decompressor = ReportDecompressor()
+        written = 0
+        try:
+            with open(part, mode='wb') as f:
+                async for chunk in self.session.rest_stream(url=url, chunk_size=ReportDecoder.chunk_size):
+                    written += f.write(decompressor.feed(chunk))
+                written += f.write(decompressor.flush())
+        except BaseException:
+            if os.path.exists(part):
+                os.remove(part)
+            raise
+        os.replace(part, path)
+        return written
 
         
 
@@ -7693,31 +8020,39 @@ class AsAnnouncementsRepositoryApi(AsApiChild, base='telephony/config'):
                                               params=params)]
 
     async def _upload_or_modify(self, *, url, name, file, upload_as, params, is_upload) -> dict:
-        if isinstance(file, str):
-            upload_as = upload_as or os.path.basename(file)
-            file = open(file, mode='rb')
-            must_close = True
+        must_close = False
+        if isinstance(file, MultipartFile):
+            # prepared request body; the announcement name is a form field
+            if 'name' not in file.fields:
+                file = file.with_fields(name=name)
+            elif file.fields['name'] != name:
+                raise ValueError(f'name {name!r} differs from name in request body: {file.fields["name"]!r}')
+            body = file
+            headers = {'Content-Type': file.content_type, 'Content-Length': str(len(file))}
         else:
-            must_close = False
-            # an existing reader
-            if not upload_as:
+            if isinstance(file, str):
+                upload_as = upload_as or os.path.basename(file)
+                file = open(file, mode='rb')
+                must_close = True
+            elif not upload_as:
+                # an existing reader
                 raise ValueError('upload_as is required')
-        encoder = MultipartEncoder({'name': name, 'file': (upload_as, file, 'audio/wav')})
+            body = MultipartEncoder({'name': name, 'file': (upload_as, file, 'audio/wav')})
+            headers = {'Content-Type': body.content_type}
         if is_upload:
             meth = super().post
         else:
             meth = super().put
         try:
-            data = await meth(url, data=encoder, headers={'Content-Type': encoder.content_type},
-                        params=params)
+            data = await meth(url, data=body, headers=headers, params=params)
         finally:
             if must_close:
                 file.close()
         return data
         
 
-    async def upload_announcement(self, name: str, file: Union[BufferedReader, str], upload_as: str = None,
-                            location_id: str = None,
+    async def upload_announcement(self, name: str, file: Union[BufferedReader, str, MultipartFile],
+                            upload_as: str = None, location_id: str = None,
                             org_id: str = None) -> str:
         params = org_id and {'orgId': org_id} or None
         if location_id is None:
@@ -7794,7 +8129,7 @@ class AsAnnouncementsRepositoryApi(AsApiChild, base='telephony/config'):
             url = self.ep(f'locations/{location_id}/announcements/{announcement_id}')
         await super().delete(url=url, params=params)
 
-    async def modify(self, announcement_id: str, name: str, file: Union[BufferedReader, str],
+    async def modify(self, announcement_id: str, name: str, file: Union[BufferedReader, str, MultipartFile],
                upload_as: str = None, location_id: str = None, org_id: str = None):
         params = org_id and {'orgId': org_id} or None
         if location_id is None:
@@ -13416,9 +13751,12 @@ class AsVoicemailRulesApi(AsApiChild, base='telephony/config/voicemail/rules'):
         await self.put(url, params=params, data=data)
 
 
-class AsTelephonyApi(AsApiChild, base='telephony/config'):
+class AsTelephonyApi(AsBulkSettingsApiChild, base='telephony/config'):
     """
     The telephony settings (features) API.
+
+    Location settings implemented by person settings APIs (permissions_out) can be read for many locations
+    concurrently using :meth:`read_bulk`.
     """
     #: access or authentication codes
     access_codes: AsAccessCodesApi
@@ -14260,13 +14598,15 @@ class AsWorkspaceNumbersApi(AsApiChild, base='workspaces'):
 
 
 @dataclass(init=False)
-class AsWorkspaceSettingsApi(AsApiChild, base='workspaces'):
+class AsWorkspaceSettingsApi(AsBulkSettingsApiChild, base='workspaces'):
     """
     API for all workspace settings.
 
     Most of the workspace settings are equivalent to corresponding user settings. For these settings the attributes of
     this class are instances of the respective user settings APIs. When calling endpoints of these APIs workspace IDs
     need to be passed to the ``person_id`` parameter of the called function.
+
+    Settings of many workspaces can be read concurrently using :meth:`read_bulk`.
     """
     forwarding: AsPersonForwardingApi
     call_waiting: AsCallWaitingApi
@@ -14518,69 +14858,83 @@ class AsWorkspacesApi(AsApiChild, base='workspaces'):
 class AsWebexSimpleApi:
     """
     The main API object
+
+    Child APIs are created on first access. The modules defining the child APIs are only imported then.
     """
 
     #: Attachment actions API :class:`AsAttachmentActionsApi`
-    attachment_actions: AsAttachmentActionsApi
+    attachment_actions: 'AsAttachmentActionsApi' = LazyApiChild('.attachment_actions', 'AsAttachmentActionsApi')
     #: CDR API :class:`AsDetailedCDRApi`
-    cdr: AsDetailedCDRApi
+    cdr: 'AsDetailedCDRApi' = LazyApiChild('.cdr', 'AsDetailedCDRApi')
     #: devices API :class:`AsDevicesApi`
-    devices: AsDevicesApi
+    devices: 'AsDevicesApi' = LazyApiChild('.devices', 'AsDevicesApi')
     #: events API; :class:`AsEventsApi`
-    events: AsEventsApi
+    events: 'AsEventsApi' = LazyApiChild('.events', 'AsEventsApi')
     #: groups API :class:`AsGroupsApi`
-    groups: AsGroupsApi
+    groups: 'AsGroupsApi' = LazyApiChild('.groups', 'AsGroupsApi')
     #: Licenses API :class:`AsLicensesApi`
-    licenses: AsLicensesApi
+    licenses: 'AsLicensesApi' = LazyApiChild('.licenses', 'AsLicensesApi')
     #: Location API :class:`AsLocationsApi`
-    locations: AsLocationsApi
+    locations: 'AsLocationsApi' = LazyApiChild('.locations', 'AsLocationsApi')
     #: meetings API :class:`AsMeetingsApi`
-    meetings: AsMeetingsApi
+    meetings: 'AsMeetingsApi' = LazyApiChild('.meetings', 'AsMeetingsApi')
     #: membership API :class:`AsMembershipApi`
-    membership: AsMembershipApi
+    membership: 'AsMembershipApi' = LazyApiChild('.memberships', 'AsMembershipApi')
     #: Messages API :class:`AsMessagesApi`
-    messages: AsMessagesApi
+    messages: 'AsMessagesApi' = LazyApiChild('.messages', 'AsMessagesApi')
     #: organization settings API
-    organizations: AsOrganizationApi
+    organizations: 'AsOrganizationApi' = LazyApiChild('.organizations', 'AsOrganizationApi')
     #: Person settings API :class:`AsPersonSettingsApi`
-    person_settings: AsPersonSettingsApi
+    person_settings: 'AsPersonSettingsApi' = LazyApiChild('.person_settings', 'AsPersonSettingsApi')
     #: People API :class:`AsPeopleApi`
-    people: AsPeopleApi
+    people: 'AsPeopleApi' = LazyApiChild('.people', 'AsPeopleApi')
     #: Reports API :class:`AsReportsApi`
-    reports: AsReportsApi
+    reports: 'AsReportsApi' = LazyApiChild('.reports', 'AsReportsApi')
     #: Rooms API :class:`AsRoomsApi`
-    rooms: AsRoomsApi
+    rooms: 'AsRoomsApi' = LazyApiChild('.rooms', 'AsRoomsApi')
     #: Room tabs API :class:`AsRoomTabsApi`
-    room_tabs: AsRoomTabsApi
+    room_tabs: 'AsRoomTabsApi' = LazyApiChild('.room_tabs', 'AsRoomTabsApi')
     #: Teams API :class:`AsTeamsApi`
-    teams: AsTeamsApi
+    teams: 'AsTeamsApi' = LazyApiChild('.teams', 'AsTeamsApi')
     #: Team memberships API :class:`AsTeamMembershipsApi`
-    team_memberships: AsTeamMembershipsApi
+    team_memberships: 'AsTeamMembershipsApi' = LazyApiChild('.team_memberships', 'AsTeamMembershipsApi')
     #: Telephony (features) API :class:`AsTelephonyApi`
-    telephony: AsTelephonyApi
+    telephony: 'AsTelephonyApi' = LazyApiChild('.telephony', 'AsTelephonyApi')
     #: Webhooks API :class:`AsWebhookApi`
-    webhook: AsWebhookApi
+    webhook: 'AsWebhookApi' = LazyApiChild('.webhook', 'AsWebhookApi')
     #: Workspaces API :class:`AsWorkspacesApi`
-    workspaces: AsWorkspacesApi
+    workspaces: 'AsWorkspacesApi' = LazyApiChild('.workspaces', 'AsWorkspacesApi')
     #: Workspace locations API; :class:`AsWorkspaceLocationApi`
-    workspace_locations: AsWorkspaceLocationApi
+    workspace_locations: 'AsWorkspaceLocationApi' = LazyApiChild('.workspace_locations', 'AsWorkspaceLocationApi')
     #: Workspace setting API :class:`AsWorkspaceSettingsApi`
-    workspace_settings: AsWorkspaceSettingsApi
+    workspace_settings: 'AsWorkspaceSettingsApi' = LazyApiChild('.workspace_settings', 'AsWorkspaceSettingsApi')
     #: :class:`AsRestSession` used for all API requests
     session: AsRestSession
 
-    def __init__(self, *, tokens: Union[str, Tokens] = None, concurrent_requests: int = 10, retry_429: bool = True):
+    def __init__(self, *, tokens: Union[str, Tokens] = None, concurrent_requests: int = 10, retry_429: bool = True,
+                 rate_limiter: RateLimiter = None, cache: ResponseCache = None, **session_args):
         """
 
         :param tokens: token to be used by the API. Can be a :class:`tokens.Tokens` instance, a string or None. If
-            None then an access token is expected in the WEBEX_ACCESS_TOKEN environment variable.
+            None then the tokens of the token manager (session argument `token_manager`) are used or an access token
+            is expected in the WEBEX_ACCESS_TOKEN environment variable.
         :param concurrent_requests: number of concurrent requests when using multi-threading
         :type concurrent_requests: int
         :param retry_429: automatically retry for 429 throttling response
         :type retry_429: bool
+        :param rate_limiter: rate limiter to be used for all requests. The same rate limiter can be shared by multiple
+            API instances (sync and async) to coordinate the request rate across all of them.
+        :type rate_limiter: :class:`rate_limit.RateLimiter`
+        :param cache: response cache for GET requests. The same cache can be shared by multiple API instances.
+        :type cache: :class:`cache.ResponseCache`
+        :param session_args: additional arguments for the REST session (:class:`rest.AsRestSession`), like lazy_models
+            or coalesce_requests. :class:`as_rest.AsRestSession` also accepts connection pool settings:
+            ``connector=ConnectorSettings(...)``
         """
         if isinstance(tokens, str):
             tokens = Tokens(access_token=tokens)
+        elif tokens is None and session_args.get('token_manager') is not None:
+            tokens = session_args['token_manager'].tokens
         elif tokens is None:
             tokens = os.getenv('WEBEX_ACCESS_TOKEN')
             if tokens is None:
@@ -14588,30 +14942,8 @@ class AsWebexSimpleApi:
                                  'WEBEX_ACCESS_TOKEN environment variable')
             tokens = Tokens(access_token=tokens)
 
-        session = AsRestSession(tokens=tokens, concurrent_requests=concurrent_requests, retry_429=retry_429)
-        self.attachment_actions = AsAttachmentActionsApi(session=session)
-        self.cdr = AsDetailedCDRApi(session=session)
-        self.devices = AsDevicesApi(session=session)
-        self.events = AsEventsApi(session=session)
-        self.groups = AsGroupsApi(session=session)
-        self.licenses = AsLicensesApi(session=session)
-        self.locations = AsLocationsApi(session=session)
-        self.meetings = AsMeetingsApi(session=session)
-        self.membership = AsMembershipApi(session=session)
-        self.messages = AsMessagesApi(session=session)
-        self.organizations = AsOrganizationApi(session=session)
-        self.person_settings = AsPersonSettingsApi(session=session)
-        self.people = AsPeopleApi(session=session)
-        self.reports = AsReportsApi(session=session)
-        self.rooms = AsRoomsApi(session=session)
-        self.room_tabs = AsRoomTabsApi(session=session)
-        self.teams = AsTeamsApi(session=session)
-        self.team_memberships = AsTeamMembershipsApi(session=session)
-        self.telephony = AsTelephonyApi(session=session)
-        self.webhook = AsWebhookApi(session=session)
-        self.workspaces = AsWorkspacesApi(session=session)
-        self.workspace_locations = AsWorkspaceLocationApi(session=session)
-        self.workspace_settings = AsWorkspaceSettingsApi(session=session)
+        session = AsRestSession(tokens=tokens, concurrent_requests=concurrent_requests, retry_429=retry_429,
+                              rate_limiter=rate_limiter, cache=cache, **session_args)
         self.session = session
 
     @property
@@ -14624,6 +14956,86 @@ class AsWebexSimpleApi:
         """
         return self.session.access_token
 
+    async def map_gen(self, fn: Callable[..., Any], *iterables: Iterable,
+                      ordered: bool = True) -> AsyncGenerator[Any, None, None]:
+        """
+        Call a coroutine function concurrently for all items of the given iterable(s) and yield the results.
+
+        At most concurrent_requests calls are in flight at any time. Arguments are only taken from the iterables
+        when a call has completed; hence the iterables can be large.
+
+        If a call raises an exception, then the exception is raised when the result is due; all pending calls are
+        cancelled.
+
+        :param fn: coroutine function to call
+        :type fn: Callable
+        :param iterables: iterables with arguments for the function; one iterable for each positional argument
+        :param ordered: yield results in the order of the arguments. If False, then results are yielded as they
+            become available
+        :type ordered: bool
+        :return: yields results
+        """
+        window = 2 * self.session.concurrent_requests
+        if ordered:
+            pending = deque()
+        else:
+            pending = set()
+        try:
+            for args in zip(*iterables):
+                task = asyncio.create_task(fn(*args))
+                if ordered:
+                    pending.append(task)
+                    if len(pending) >= window:
+                        yield await pending.popleft()
+                else:
+                    pending.add(task)
+                    if len(pending) >= window:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            yield task.result()
+            while pending:
+                if ordered:
+                    yield await pending.popleft()
+                else:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def map(self, fn: Callable[..., Any], *iterables: Iterable, ordered: bool = True) -> List[Any]:
+        """
+        Call a coroutine function concurrently for all items of the given iterable(s) and return the results.
+
+        See :meth:`map_gen`
+
+        :return: list of results
+        """
+        return [r async for r in self.map_gen(fn, *iterables, ordered=ordered)]
+
+        
+
+    async def gather(self, *calls: Callable[[], Any], return_exceptions: bool = False) -> list:
+        """
+        Execute calls (coroutine functions) concurrently and return the results in the order of the calls.
+
+        Example:
+
+            .. code-block:: python
+
+                person, dnd = await api.gather(lambda: api.people.details(person_id),
+                                               lambda: api.person_settings.dnd.read(person_id))
+
+        :param calls: coroutine functions w/o arguments; use lambdas or :func:`functools.partial` to bind arguments
+        :param return_exceptions: return exceptions as results instead of raising the 1st exception
+        :type return_exceptions: bool
+        :return: list of results
+        """
+        return await asyncio.gather(*(call() for call in calls), return_exceptions=return_exceptions)
+
+        
+
     async def close(self):
         await self.session.close()
 
@@ -4,27 +4,48 @@ REST session for Webex API requests
 import asyncio
 import json as json_mod
 import logging
+import os
 import urllib.parse
 import uuid
 from asyncio import Semaphore
-from collections.abc import AsyncGenerator
-from functools import wraps
+from collections.abc import AsyncGenerator, Iterable
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import wraps, partial
 from io import TextIOBase, StringIO
-from time import perf_counter_ns
-from typing import Tuple, Type, Optional, Any
+from itertools import count
+from ssl import SSLContext
+from time import perf_counter, perf_counter_ns
+from typing import Tuple, Type, Optional, Any, Union, BinaryIO, TYPE_CHECKING
 
-from aiohttp import ClientSession, ClientResponse, ClientResponseError, RequestInfo
+from aiohttp import BaseConnector, ClientSession, ClientResponse, ClientResponseError, RequestInfo, TCPConnector, \
+    TraceConfig
 from aiohttp.typedefs import LooseHeaders
 from pydantic import ValidationError
+from yarl import URL
 
 from .base import ApiModel, RETRY_429_MAX_WAIT
 from .base import StrOrDict
+from .cache import ResponseCache, CachedResponse
+from .cassette import Cassette
+from .json_codec import json_codec
+from .metrics import RequestHooks, url_template, call_hooks, request_end, body_size
+from .rate_limit import RateLimiter
+from .rest import stream_position, bearer_token, DOWNLOAD_CHUNK_SIZE
 from .tokens import Tokens
+from .wire_log import WireLog, debug_enabled, mask_headers, mask_json, mask_form
 
-__all__ = ['AsErrorMessage', 'AsSingleError', 'AsErrorDetail', 'AsRestError', 'as_dump_response', 'AsRestSession']
+if TYPE_CHECKING:
+    from .token_manager import TokenManager
+
+__all__ = ['AsErrorMessage', 'AsSingleError', 'AsErrorDetail', 'AsRestError', 'as_dump_response', 'ConnectorSettings',
+           'PoolStats', 'AsRestSession']
 
 log = logging.getLogger(__name__)
 
+# marker for the end of pagination in prefetch queue
+_PAGES_DONE = object()
+
 
 class AsErrorMessage(ApiModel):
     description: str
@@ -120,9 +141,10 @@ def as_dump_response(*, response: ClientResponse, response_data=None, data=None,
     :param diff_ns: time the request took (in ns)
     :type diff_ns: int
     """
-    if not log.isEnabledFor(logging.DEBUG):
-        return
     dump_log = dump_log or log
+    # only do the work if a handler actually emits the debug output
+    if not debug_enabled(dump_log):
+        return
     output = file or StringIO()
 
     # dump response objects in redirect history
@@ -138,19 +160,17 @@ def as_dump_response(*, response: ClientResponse, response_data=None, data=None,
           f'{response.request_info.method} {response.request_info.url}', file=output)
 
     # request headers
-    for k, v in response.request_info.headers.items():
-        if k.lower() == 'authorization':
-            v = 'Bearer ***'
+    for k, v in mask_headers(response.request_info.headers).items():
         print(f'  {k}: {v}', file=output)
 
     # request body
     body_str = ''
     if isinstance(data, dict):
-        body_str = str(urllib.parse.quote_plus(urllib.parse.urlencode(data)))
+        body_str = str(urllib.parse.quote_plus(urllib.parse.urlencode(mask_form(data.items()))))
     elif isinstance(data, str):
         body_str = data
     elif json:
-        body_str = json_mod.dumps(json)
+        body_str = json_mod.dumps(mask_json(json))
 
     if body_str:
         print('  --- body ---', file=output)
@@ -158,19 +178,14 @@ def as_dump_response(*, response: ClientResponse, response_data=None, data=None,
 
     print(' Response', file=output)
     # response headers
-    for k in response.headers:
-        print(f'  {k}: {response.headers[k]}', file=output)
+    for k, v in mask_headers(response.headers).items():
+        print(f'  {k}: {v}', file=output)
     # dump response body
     if response_data:
         print('  --- response body ---', file=output)
         try:
-            body = response_data
-            if 'access_token' in body:
-                # mask access token
-                body['access_token'] = '***'
-            elif 'refresh_token' in body:
-                body['refresh_token'] = '***'
-            body = json_mod.dumps(body, indent=2)
+            # mask_json() creates a copy: the response data returned to the caller is not touched
+            body = json_mod.dumps(mask_json(response_data), indent=2)
         except json_mod.JSONDecodeError:
             pass
         for line in body.splitlines():
@@ -182,21 +197,28 @@ def as_dump_response(*, response: ClientResponse, response_data=None, data=None,
 
 def retry_request(func):
     """
-    Decorator for the request method in the AsRestSession class. Used to implement backoff on 429 responses
+    Decorator for the request method in the AsRestSession class. Used to implement backoff on 429 responses.
+    Seekable (streamed) request bodies are rewound before a retry.
+
+    If the session has a token manager then an access token about to expire is refreshed before the request is sent
+    and the request is retried once with a new access token after a 401
 
     :param func:
     :return:
     """
 
-    async def giveup_429(e: ClientResponseError, retry_429: bool) -> bool:
+    async def giveup_429(e: ClientResponseError, retry_429: bool, rate_limiter: Optional[RateLimiter],
+                         hooks: list[RequestHooks]) -> bool:
         """
         callback for backoff on REST requests
 
         :param e: latest exception
         :param retry_429: retry on 429?
+        :param rate_limiter: rate limiter shared with other sessions, optional
+        :param hooks: hooks to notify about retries and waits
         :return: True -> break the backoff loop
         """
-        if e.status != 429 or not retry_429:
+        if e.status != 429:
             # Don't retry on anything other than 429
             return True
 
@@ -205,19 +227,62 @@ def retry_request(func):
 
         # never wait more than the defined maximum of 20 s
         retry_after = min(retry_after, RETRY_429_MAX_WAIT)
+        if rate_limiter:
+            # the rate limiter holds back all requests (not only this one) before they get sent
+            rate_limiter.on_429(retry_after)
+            if retry_429 and hooks:
+                call_hooks(hooks, 'retry', e.request_info.method, url_template(str(e.request_info.url)), 429,
+                           retry_after)
+            return not retry_429
+        if not retry_429:
+            return True
         log.warning(f'429 retry after {retry_after} on {e.request_info.method} {e.request_info.url}')
+        if hooks:
+            call_hooks(hooks, 'retry', e.request_info.method, url_template(str(e.request_info.url)), 429,
+                       retry_after)
         await asyncio.sleep(retry_after)
+        if hooks:
+            call_hooks(hooks, 'sleep', retry_after, 'retry_after')
         return False
 
+    async def refresh_401(e: ClientResponseError, session: 'AsRestSession') -> bool:
+        """
+        try to refresh the access token after a 401
+
+        :return: True -> retry the request
+        """
+        if e.status != 401:
+            return False
+        try:
+            await session.token_manager.as_refresh(failed_token=bearer_token(e.request_info.headers))
+        except Exception as refresh_error:
+            log.warning(f'failed to refresh access token after 401: {refresh_error}')
+            return False
+        return True
+
     @wraps(func)
     async def wrapper(session: 'AsRestSession', *args, **kwargs):
+        data = kwargs.get('data')
+        position = stream_position(data)
+        token_manager = session.token_manager
+        refreshed = False
+        if token_manager is not None:
+            await token_manager.as_ensure_valid()
         async with session._sem:
             while True:
+                if session.rate_limiter:
+                    waited = await session.rate_limiter.as_acquire()
+                    if waited and session.request_hooks:
+                        call_hooks(session.request_hooks, 'sleep', waited, 'rate_limiter')
                 try:
                     result = await func(session, *args, **kwargs)
                 except ClientResponseError as e:
-                    if await giveup_429(e, session.retry_429):
+                    if token_manager is not None and not refreshed and await refresh_401(e, session):
+                        refreshed = True
+                    elif await giveup_429(e, session.retry_429, session.rate_limiter, session.request_hooks):
                         raise
+                    if position is not None:
+                        data.seek(position)
                 else:
                     break
         return result
@@ -225,21 +290,334 @@ def retry_request(func):
     return wrapper
 
 
+def traced_request(func):
+    """
+    Decorator for the request method in the AsRestSession class. Reports each request to the hooks of the session (if
+    any)
+
+    :param func:
+    :return:
+    """
+
+    @wraps(func)
+    async def wrapper(session: 'AsRestSession', method: str, url: str, **kwargs):
+        hooks = session.request_hooks
+        if not hooks:
+            return await func(session, method, url, **kwargs)
+        body = kwargs.get('json')
+        # encode only to get the size of the request body; the request itself still has the JSON body so that it can
+        # be masked in logs
+        bytes_out = body_size(kwargs.get('data') if body is None else json_codec().dumps(body))
+        template = url_template(url)
+        contexts = call_hooks(hooks, 'request_start', method, template)
+        start = perf_counter()
+        status = None
+        bytes_in = 0
+        error = None
+        try:
+            result = await func(session, method, url, **kwargs)
+            response = result[0]
+            status = response.status
+            bytes_in = response.content.total_bytes
+            return result
+        except ClientResponseError as e:
+            status = e.status
+            bytes_in = int(e.headers and e.headers.get('Content-Length') or 0)
+            error = e
+            raise
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            request_end(hooks, contexts, method, template, status, perf_counter() - start, bytes_out, bytes_in,
+                        error)
+
+    return wrapper
+
+
+def cached_request(func):
+    """
+    Decorator for the request method in the AsRestSession class. Serves GET requests from the response cache of the
+    session (if any) and invalidates cached responses on all other requests
+
+    :param func:
+    :return:
+    """
+
+    @wraps(func)
+    async def wrapper(session: 'AsRestSession', method: str, url: str, headers=None, **kwargs):
+        cache = session.cache
+        if cache is None:
+            return await func(session, method, url=url, headers=headers, **kwargs)
+        if method != 'GET':
+            try:
+                return await func(session, method, url=url, headers=headers, **kwargs)
+            finally:
+                cache.invalidate(str(url))
+        key = cache.key(url=str(url), params=kwargs.get('params'), access_token=session.access_token)
+        if key is None:
+            return await func(session, method, url=url, headers=headers, **kwargs)
+        entry = cache.get(key)
+        if entry is not None:
+            if not entry.expired:
+                cache.hits += 1
+                log.debug(f'cache hit: {method} {url}')
+                return CachedResponse(entry, url=URL(entry.url)), entry.data()
+            if entry.etag:
+                # revalidate expired entry
+                headers = {**(headers or {}), 'If-None-Match': entry.etag}
+        cache.misses += 1
+        response, data = await func(session, method, url=url, headers=headers, **kwargs)
+        if entry is not None and response.status == 304:
+            cache.refresh(key, entry)
+            return CachedResponse(entry, url=URL(entry.url)), entry.data()
+        cache.put(key, url=str(url), response_url=str(response.url), data=data, link=response.headers.get('Link'),
+                  etag=response.headers.get('ETag'))
+        return response, data
+
+    return wrapper
+
+
+class _InFlight:
+    """
+    State of an in-flight GET request shared by all tasks waiting for the same result
+
+    :meta private:
+    """
+    __slots__ = ('task', 'waiters', 'copies')
+
+    def __init__(self):
+        self.task: Optional[asyncio.Task] = None
+        self.waiters = 0
+        self.copies = []
+
+
+def coalesced_request(func):
+    """
+    Decorator for the request method in the AsRestSession class. If enabled, identical concurrent GET requests are
+    coalesced (single-flight): only one request is sent and all callers get the result.
+
+    The request is executed in a separate task so that cancellation of one caller doesn't affect the others.
+
+    :param func:
+    :return:
+    """
+
+    @wraps(func)
+    async def wrapper(session: 'AsRestSession', method: str, url: str, headers=None, **kwargs):
+        if not session.coalesce_requests or method != 'GET' or kwargs.get('json') is not None or \
+                kwargs.get('data') is not None:
+            return await func(session, method, url=url, headers=headers, **kwargs)
+        params = kwargs.get('params')
+        key = (str(url), params and tuple(sorted((k, str(v)) for k, v in params.items() if v is not None)),
+               headers and tuple(sorted(headers.items())), session.access_token)
+        flight = session._in_flight.get(key)
+        if flight is None:
+            flight = _InFlight()
+            session._in_flight[key] = flight
+
+            async def request():
+                try:
+                    response, data = await func(session, method, url=url, headers=headers, **kwargs)
+                finally:
+                    del session._in_flight[key]
+                if flight.waiters > 1:
+                    # each waiter gets its own copy: callers are free to modify the result
+                    flight.copies = [deepcopy(data) for _ in range(flight.waiters)]
+                else:
+                    flight.copies = [data]
+                return response
+
+            flight.task = asyncio.ensure_future(request())
+            # make sure that exceptions are retrieved even if all waiters got cancelled
+            flight.task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        else:
+            log.debug(f'coalesced request: {method} {url}')
+        flight.waiters += 1
+        try:
+            response = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if not flight.task.done():
+                flight.waiters -= 1
+            raise
+        return response, flight.copies.pop()
+
+    return wrapper
+
+
+@dataclass
+class ConnectorSettings:
+    """
+    Settings for the connection pool (:class:`aiohttp.TCPConnector`) of an :class:`AsRestSession`
+
+    The defaults are aligned to the number of concurrent requests of the session and keep connections open long enough
+    to be reused by subsequent requests instead of setting up new TCP and TLS connections.
+    """
+    #: maximum number of connections; None: twice the number of concurrent requests of the session (streaming
+    #: downloads hold connections outside of the limit for concurrent requests)
+    limit: Optional[int] = None
+    #: maximum number of connections per host; 0: no limit
+    limit_per_host: int = 0
+    #: time in seconds resolved addresses are cached; None: cache forever
+    ttl_dns_cache: Optional[int] = 300
+    #: time in seconds idle connections are kept open for reuse
+    keepalive_timeout: float = 30
+    #: SSL context; None: default context of aiohttp
+    ssl_context: Optional[SSLContext] = None
+    #: close underlying transports of connections closed abnormally (for servers not terminating TLS correctly)
+    enable_cleanup_closed: bool = False
+
+    def connector(self, concurrent_requests: int) -> TCPConnector:
+        """
+        Create a connector with these settings
+
+        :param concurrent_requests: number of concurrent requests of the session; default for the connection limit
+        :return: new connector
+        """
+        return TCPConnector(limit=self.limit or 2 * concurrent_requests, limit_per_host=self.limit_per_host,
+                            ttl_dns_cache=self.ttl_dns_cache, keepalive_timeout=self.keepalive_timeout,
+                            ssl=self.ssl_context or True, enable_cleanup_closed=self.enable_cleanup_closed)
+
+
+@dataclass
+class PoolStats:
+    """
+    Connection pool statistics of an :class:`AsRestSession`
+    """
+    #: number of requests sent
+    requests: int = 0
+    #: number of new connections
+    connections_created: int = 0
+    #: number of requests sent on reused (kept alive) connections
+    connections_reused: int = 0
+    #: number of times a request had to wait for a free connection
+    connections_queued: int = 0
+    #: total time in seconds requests waited for a free connection
+    queue_wait: float = 0.0
+    #: number of DNS cache hits
+    dns_cache_hits: int = 0
+    #: number of DNS cache misses (resolutions)
+    dns_cache_misses: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """
+        share of connection acquisitions served by existing connections
+        """
+        total = self.connections_created + self.connections_reused
+        return self.connections_reused / total if total else 0.0
+
+    def trace_config(self) -> TraceConfig:
+        """
+        Trace config to collect the statistics
+
+        :meta private:
+        """
+
+        async def on_request_start(session, context, params):
+            self.requests += 1
+
+        async def on_connection_create_end(session, context, params):
+            self.connections_created += 1
+
+        async def on_connection_reuseconn(session, context, params):
+            self.connections_reused += 1
+
+        async def on_connection_queued_start(session, context, params):
+            self.connections_queued += 1
+            context.queued = perf_counter_ns()
+
+        async def on_connection_queued_end(session, context, params):
+            self.queue_wait += (perf_counter_ns() - context.queued) / 1e9
+
+        async def on_dns_cache_hit(session, context, params):
+            self.dns_cache_hits += 1
+
+        async def on_dns_cache_miss(session, context, params):
+            self.dns_cache_misses += 1
+
+        trace_config = TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        trace_config.on_connection_queued_start.append(on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(on_connection_queued_end)
+        trace_config.on_dns_cache_hit.append(on_dns_cache_hit)
+        trace_config.on_dns_cache_miss.append(on_dns_cache_miss)
+        return trace_config
+
+
 class AsRestSession(ClientSession):
     """
     REST session used for API requests:
             * includes an Authorization header in reach request
             * implements retries on 429
+            * optionally uses a :class:`wxc_sdk.rate_limit.RateLimiter` shared with other sessions
+            * optionally serves GET requests from a :class:`wxc_sdk.cache.ResponseCache`
+            * optionally coalesces identical concurrent GET requests
+            * optionally logs requests and responses to a :class:`wxc_sdk.wire_log.WireLog`
+            * optionally reports requests to :class:`wxc_sdk.metrics.RequestHooks` (metrics and tracing)
+            * optionally records requests to or replays requests from a :class:`wxc_sdk.cassette.Cassette`
             * loads deserializes JSON data if needed
+            * uses a connection pool sized for the number of concurrent requests and keeps connections alive for
+              reuse; see :class:`ConnectorSettings`
     """
     #: base URL for all Webex API requests
     BASE = 'https://webexapis.com/v1'
 
-    def __init__(self, *, tokens: Tokens, concurrent_requests: int, retry_429: bool = True):
-        super().__init__()
-        self._tokens = tokens
+    def __init__(self, *, tokens: Tokens, concurrent_requests: int, retry_429: bool = True,
+                 rate_limiter: RateLimiter = None, prefetch_pages: int = 0, parallel_pages: int = 0,
+                 lazy_models: bool = False, cache: ResponseCache = None, coalesce_requests: bool = False,
+                 connector: Union[BaseConnector, ConnectorSettings] = None, wire_log: WireLog = None,
+                 request_hooks: Iterable[RequestHooks] = None, cassette: Cassette = None,
+                 token_manager: 'TokenManager' = None):
+        """
+
+        :param connector: connector or settings for the connector to be used by the session. A connector passed
+            here is closed when the session is closed. Default: connector with default :class:`ConnectorSettings`
+        :type connector: Union[:class:`aiohttp.BaseConnector`, :class:`ConnectorSettings`]
+        :param wire_log: structured wire logging. If set then no debug dumps (:func:`as_dump_response`) are created
+        :type wire_log: :class:`wxc_sdk.wire_log.WireLog`
+        :param request_hooks: hooks notified about requests, retries and waits; see :mod:`wxc_sdk.metrics`
+        :type request_hooks: Iterable[:class:`wxc_sdk.metrics.RequestHooks`]
+        :param cassette: cassette to record requests to or replay requests from
+        :type cassette: :class:`wxc_sdk.cassette.Cassette`
+        :param token_manager: token manager refreshing the access token. If set then the tokens of the token manager
+            are used
+        :type token_manager: :class:`wxc_sdk.token_manager.TokenManager`
+        """
+        if not isinstance(connector, BaseConnector):
+            connector = (connector or ConnectorSettings()).connector(concurrent_requests=concurrent_requests)
+        #: connection pool statistics
+        self.pool_stats = PoolStats()
+        super().__init__(connector=connector, trace_configs=[self.pool_stats.trace_config()])
+        self._tokens = tokens if token_manager is None else token_manager.tokens
+        #: maximum number of concurrent requests
+        self.concurrent_requests = concurrent_requests
         self._sem = Semaphore(concurrent_requests)
         self.retry_429 = retry_429
+        #: rate limiter consulted before each request, optional
+        self.rate_limiter = rate_limiter
+        #: number of pages :meth:`follow_pagination` fetches in the background ahead of the consumer; 0: no prefetch
+        self.prefetch_pages = prefetch_pages
+        #: :meth:`follow_pagination` yields :class:`wxc_sdk.base.LazyModel` proxies instead of model instances
+        self.lazy_models = lazy_models
+        #: number of pages :meth:`follow_pagination` requests concurrently for endpoints with offset based
+        #: pagination; 0: no parallel requests
+        self.parallel_pages = parallel_pages
+        #: response cache for GET requests, optional
+        self.cache = cache
+        #: identical concurrent GET requests are coalesced: only one request is sent and all callers get the result
+        self.coalesce_requests = coalesce_requests
+        self._in_flight: dict[tuple, _InFlight] = dict()
+        #: structured wire logging, optional
+        self.wire_log = wire_log
+        #: hooks notified about requests, retries and waits
+        self.request_hooks: list[RequestHooks] = list(request_hooks or [])
+        #: cassette to record requests to or replay requests from, optional
+        self.cassette = cassette
+        #: token manager refreshing the access token, optional
+        self.token_manager = token_manager
 
     def ep(self, path: str = None):
         """
@@ -262,7 +640,25 @@ class AsRestSession(ClientSession):
         """
         return self._tokens.access_token
 
+    @property
+    def pool_state(self) -> dict[str, int]:
+        """
+        Current state of the connection pool: connection limits, number of connections in use and number of idle
+        connections. Connection counts are only available for connectors derived from :class:`aiohttp.BaseConnector`
+        """
+        connector = self.connector
+        # aiohttp doesn't expose connection counts; use internals if available
+        acquired = getattr(connector, '_acquired', None)
+        idle = getattr(connector, '_conns', None)
+        return {'limit': connector.limit,
+                'limit_per_host': connector.limit_per_host,
+                'in_use': len(acquired) if acquired is not None else -1,
+                'idle': sum(len(conns) for conns in idle.values()) if idle is not None else -1}
+
+    @cached_request
+    @coalesced_request
     @retry_request
+    @traced_request
     async def _request_w_response(self, method: str, url: str, headers=None, content_type: str = None,
                                   data=None, json=None, **kwargs) -> Tuple[ClientResponse, StrOrDict]:
         """
@@ -288,20 +684,31 @@ class AsRestSession(ClientSession):
             request_headers.update((k.lower(), v) for k, v in headers.items())
         if content_type:
             request_headers['content-type'] = content_type
+        codec = json_codec()
+        # JSON request bodies are encoded by the JSON codec
+        request_data = data if json is None else codec.dumps(json)
         # the event is cleared if any task hit a 429
         start = perf_counter_ns()
-        async with self.request(method, url=url, headers=request_headers,
-                                data=data, json=json, **kwargs) as response:
+        request = self.request if self.cassette is None else partial(self.cassette.as_request, self)
+        async with request(method, url=url, headers=request_headers, data=request_data, **kwargs) as response:
             # get response body as text or dict (parsed JSON)
             ct = response.headers.get('Content-Type')
             if not ct:
                 response_data = ''
             elif ct.startswith('application/json'):
-                response_data = await response.json()
+                body = await response.read()
+                response_data = codec.loads(body) if body.strip() else None
             else:
                 response_data = await response.text()
             diff_ns = perf_counter_ns() - start
-            as_dump_response(response=response, data=data, json=json, response_data=response_data, diff_ns=diff_ns)
+            wire_log = self.wire_log
+            if wire_log is None:
+                as_dump_response(response=response, data=data, json=json, response_data=response_data,
+                                 diff_ns=diff_ns)
+            elif wire_log.wants(method, url):
+                wire_log.log(method=method, url=str(response.url), status=response.status, elapsed_ns=diff_ns,
+                             request_headers=request_headers, request_body=request_data,
+                             response_headers=response.headers, response_body=await response.read())
             try:
                 response.raise_for_status()
             except ClientResponseError as error:
@@ -380,9 +787,270 @@ class AsRestSession(ClientSession):
         """
         return await self._rest_request('PATCH', *args, **kwargs)
 
+    @retry_request
+    async def _stream_response(self, method: str, url: str, headers: dict = None, **kwargs) -> ClientResponse:
+        """
+        Send a request and return the response w/o reading the body. The caller has to release the response.
+
+        Responses from a cassette are buffered. The wire log gets the request and the response headers; streamed
+        response bodies are not logged
+
+        :meta private:
+        """
+        request_headers = {'authorization': f'Bearer {self._tokens.access_token}',
+                           'TrackingID': f'SIMPLE_{uuid.uuid4()}'}
+        if headers:
+            request_headers.update((k.lower(), v) for k, v in headers.items())
+        start = perf_counter_ns()
+        if self.cassette is None:
+            response = await self.request(method, url=url, headers=request_headers, **kwargs)
+        else:
+            # buffered responses can be used after the context has been closed
+            async with self.cassette.as_request(self, method, url=url, headers=request_headers, stream=True,
+                                                **kwargs) as response:
+                pass
+        detail = None
+        try:
+            if response.status >= 400:
+                body = await response.read()
+                try:
+                    detail = json_codec().loads(body)
+                except ValueError:
+                    detail = body.decode(errors='replace')
+            wire_log = self.wire_log
+            if wire_log is not None and wire_log.wants(method, url):
+                wire_log.log(method=method, url=str(response.url), status=response.status,
+                             elapsed_ns=perf_counter_ns() - start, request_headers=request_headers,
+                             request_body=kwargs.get('data'), response_headers=response.headers,
+                             response_body=None if response.status < 400 else body)
+            if response.status >= 400:
+                raise AsRestError(request_info=response.request_info, history=response.history,
+                                  status=response.status, message=response.reason, headers=response.headers,
+                                  detail=detail)
+        except BaseException:
+            response.release()
+            raise
+        return response
+
+    async def rest_stream(self, url: str, params: dict = None, chunk_size: int = None,
+                          **kwargs) -> AsyncGenerator[bytes, None, None]:
+        """
+        GET request streaming the response body. The body is never held in memory as a whole. 429 responses are
+        retried like for any other request. The request is reported to the request hooks once the body has been
+        streamed
+
+        :param url: URL
+        :param params: URL parameters
+        :param chunk_size: size of the chunks to read; default: :data:`wxc_sdk.rest.DOWNLOAD_CHUNK_SIZE`
+        :return: yields chunks of the body
+        """
+        hooks = self.request_hooks
+        template = url_template(url)
+        contexts = call_hooks(hooks, 'request_start', 'GET', template) if hooks else None
+        start = perf_counter()
+        status = None
+        bytes_in = 0
+        error = None
+        try:
+            response = await self._stream_response('GET', url=url, params=params, **kwargs)
+            status = response.status
+            try:
+                async for chunk in response.content.iter_chunked(chunk_size or DOWNLOAD_CHUNK_SIZE):
+                    bytes_in += len(chunk)
+                    yield chunk
+            finally:
+                response.release()
+        except ClientResponseError as e:
+            status = e.status
+            error = e
+            raise
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if hooks:
+                request_end(hooks, contexts, 'GET', template, status, perf_counter() - start, 0, bytes_in, error)
+
+    async def rest_download(self, url: str, file: Union[str, BinaryIO], params: dict = None, **kwargs) -> int:
+        """
+        GET request writing the response body to a file chunk by chunk
+
+        :param url: URL
+        :param file: path of the file to write to or a binary file-like object. If a path is given then the body is
+            written to a temporary file (path + ".part") first, which is renamed once the download is complete: a file
+            at path always is complete
+        :param params: URL parameters
+        :return: number of bytes written
+        """
+        if isinstance(file, str):
+            part = f'{file}.part'
+            try:
+                with open(part, mode='wb') as f:
+                    written = await self.rest_download(url, f, params=params, **kwargs)
+            except BaseException:
+                if os.path.exists(part):
+                    os.remove(part)
+                raise
+            os.replace(part, file)
+            return written
+        written = 0
+        async for chunk in self.rest_stream(url, params=params, **kwargs):
+            written += file.write(chunk)
+        return written
+
+    async def _pagination_pages(self, url: str, params: dict = None,
+                                **kwargs) -> AsyncGenerator[StrOrDict, None, None]:
+        """
+        Follow RFC5988 pagination and yield the body of each page
+
+        :param url: start url for 1st GET
+        :param params: URL parameters for the 1st GET
+        :return: yields page bodies
+        :meta private:
+        """
+        while url:
+            log.debug(f'{self}.pagination: getting {url}')
+            response, data = await self._request_w_response('GET', url=url, params=params, **kwargs)
+            # params only in first request. In subsequent requests we rely on the completeness of the 'next' URL
+            params = None
+            # try to get the next page (if present)
+            try:
+                url = str(response.links['next']['url'])
+            except KeyError:
+                url = None
+            else:
+                # not needed any more, WXCAPIBULK-27 has been fixed
+                # if len((pagination_fix := url.split('https,https:/'))) > 1:
+                #     url = f'https://{pagination_fix[1]}'
+                pass
+            yield data
+
+    @staticmethod
+    async def _prefetch_pages(pages: AsyncGenerator[StrOrDict, None, None],
+                              prefetch: int) -> AsyncGenerator[StrOrDict, None, None]:
+        """
+        Consume a generator of pages in a background task and fetch up to prefetch pages ahead of the consumer
+
+        :param pages: page generator
+        :param prefetch: max number of pages to fetch ahead
+        :return: yields page bodies
+        :meta private:
+        """
+        queue = asyncio.Queue()
+        slots = Semaphore(prefetch)
+
+        async def producer():
+            try:
+                while True:
+                    await slots.acquire()
+                    try:
+                        page = await pages.__anext__()
+                    except StopAsyncIteration:
+                        queue.put_nowait((_PAGES_DONE, None))
+                        return
+                    queue.put_nowait((page, None))
+            except Exception as e:
+                queue.put_nowait((None, e))
+            finally:
+                await pages.aclose()
+
+        task = asyncio.create_task(producer())
+        try:
+            while True:
+                page, error = await queue.get()
+                if error is not None:
+                    raise error
+                if page is _PAGES_DONE:
+                    break
+                slots.release()
+                yield page
+        finally:
+            # consumer is done or gone: terminate the producer
+            task.cancel()
+
+    async def _parallel_pages(self, url: str, params: dict = None, parallel: int = 10, ordered: bool = True,
+                              **kwargs) -> AsyncGenerator[StrOrDict, None, None]:
+        """
+        Offset based pagination with concurrent requests.
+
+        After the 1st GET the 'next' link is checked for a start parameter. If present, then the remaining pages
+        are requested concurrently by setting the start parameter to the offsets of the pages. As the total number of
+        items is not known upfront pages are requested until a page without a 'next' link is found. Else the 'next'
+        links are followed sequentially.
+
+        :param url: start url for 1st GET
+        :param params: URL parameters for the 1st GET
+        :param parallel: max number of pages requested concurrently
+        :param ordered: yield pages in order. If False then pages are yielded as they are received
+        :return: yields page bodies
+        :meta private:
+        """
+        log.debug(f'{self}.pagination: getting {url}')
+        response, data = await self._request_w_response('GET', url=url, params=params, **kwargs)
+        yield data
+        try:
+            next_url = URL(str(response.links['next']['url']))
+        except KeyError:
+            return
+        try:
+            next_start = int(next_url.query['start'])
+            page_len = next_start - int(response.url.query.get('start', 0))
+        except (KeyError, ValueError):
+            page_len = 0
+        if page_len <= 0:
+            # no offset based pagination: follow the 'next' links
+            log.debug(f'{self}.pagination: no offset based pagination, following next links')
+            async for data in self._pagination_pages(url=str(next_url), **kwargs):
+                yield data
+            return
+
+        async def get_page(offset: int) -> Tuple[bool, StrOrDict]:
+            page_url = str(next_url.update_query(start=offset))
+            log.debug(f'{self}.pagination: getting {page_url}')
+            page_response, page_data = await self._request_w_response('GET', url=page_url, **kwargs)
+            return 'next' in page_response.links, page_data
+
+        offsets = count(next_start, page_len)
+        # pending requests and the offset of the respective page
+        pending: dict[asyncio.Task, int] = dict()
+        # offset of the last page
+        last = None
+        try:
+            while True:
+                # keep the desired number of requests in flight until we know where the last page is
+                while last is None and len(pending) < parallel:
+                    offset = next(offsets)
+                    pending[asyncio.create_task(get_page(offset))] = offset
+                if not pending:
+                    break
+                if ordered:
+                    done = [min(pending, key=pending.get)]
+                    await asyncio.wait(done)
+                else:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    done = sorted(done, key=pending.get)
+                for task in done:
+                    offset = pending.pop(task, None)
+                    if offset is None:
+                        # cancelled: beyond the last page
+                        continue
+                    has_next, data = task.result()
+                    if not has_next:
+                        # this is the last page; all pages after this one are empty
+                        last = offset if last is None else min(last, offset)
+                        for beyond in [t for t, o in pending.items() if o > last]:
+                            beyond.cancel()
+                            pending.pop(beyond)
+                    yield data
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def follow_pagination(self, url: str, model: Type[ApiModel] = None,
                                 params: dict = None,
-                                item_key: str = None, **kwargs) -> AsyncGenerator[ApiModel, None, None]:
+                                item_key: str = None, prefetch: int = None, parallel: int = None,
+                                ordered: bool = True, lazy: bool = None, fields: Iterable[str] = None,
+                                **kwargs) -> AsyncGenerator[ApiModel, None, None]:
         """
         Handling RFC5988 pagination of list requests. Generator of parsed objects
 
@@ -394,32 +1062,62 @@ class AsRestSession(ClientSession):
         :type params: Optional[dict]
         :param item_key: key to list of values
         :type item_key: str
+        :param prefetch: number of pages to fetch in a background task ahead of the consumer. 0: no prefetch.
+            Default: :attr:`prefetch_pages`
+        :type prefetch: int
+        :param parallel: for list endpoints supporting offset based pagination (start and max parameters): max number
+            of pages to request concurrently. 0: no parallel requests. Default: :attr:`parallel_pages`
+        :type parallel: int
+        :param ordered: only used with parallel requests: yield items in order. If False then items are yielded as
+            pages are received
+        :type ordered: bool
+        :param lazy: yield :class:`wxc_sdk.base.LazyModel` proxies instead of fully validated model instances.
+            Default: :attr:`lazy_models`
+        :type lazy: bool
+        :param fields: names of model fields to keep in the yielded objects; implies lazy
+        :type fields: Iterable[str]
         :return: yields parsed objects
+
+        Example:
+
+            .. code-block:: python
+
+                # get all numbers with up to 20 concurrent requests; numbers are yielded in any order
+                numbers = [number async for number in
+                           api.session.follow_pagination(url=api.telephony.ep('numbers'),
+                                                         model=NumberListPhoneNumber,
+                                                         params={'max': 500}, item_key='phoneNumbers',
+                                                         parallel=20, ordered=False)]
+
+                # .. or use parallel requests for all paginated list calls
+                api.session.parallel_pages = 10
+                users = await api.people.list(calling_data=True)
         """
 
         def noop(x):
             return x
 
+        if lazy is None:
+            lazy = self.lazy_models
         if model is None or not issubclass(model, ApiModel):
             model = noop
+        elif lazy or fields is not None:
+            model = partial(model.lazy, fields=fields)
         else:
             model = model.parse_obj
 
-        while url:
-            log.debug(f'{self}.pagination: getting {url}')
-            response, data = await self._request_w_response('GET', url=url, params=params, **kwargs)
-            # params only in first request. In subsequent requests we rely on the completeness of the 'next' URL
-            params = None
-            # try to get the next page (if present)
-            try:
-                url = str(response.links['next']['url'])
-            except KeyError:
-                url = None
-            else:
-                # not needed any more, WXCAPIBULK-27 has been fixed
-                # if len((pagination_fix := url.split('https,https:/'))) > 1:
-                #     url = f'https://{pagination_fix[1]}'
-                pass
+        if prefetch is None:
+            prefetch = self.prefetch_pages
+        if parallel is None:
+            parallel = self.parallel_pages
+        if parallel:
+            pages = self._parallel_pages(url=url, params=params, parallel=parallel, ordered=ordered, **kwargs)
+        else:
+            pages = self._pagination_pages(url=url, params=params, **kwargs)
+            if prefetch:
+                pages = self._prefetch_pages(pages=pages, prefetch=prefetch)
+
+        async for data in pages:
             if not data:
                 continue
             # return all items
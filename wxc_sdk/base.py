@@ -1,15 +1,20 @@
 import base64
 import logging
 import sys
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Optional, Union
+from typing import Optional, Union, Type, Any
 
 from aenum import Enum, extend_enum
 from dateutil import tz
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, ValidationError, Extra
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
 
-__all__ = ['StrOrDict', 'webex_id_to_uuid', 'to_camel', 'ApiModel', 'CodeAndReason', 'ApiModelWithErrors', 'plus1',
-           'dt_iso_str', 'SafeEnum', 'enum_str', 'RETRY_429_MAX_WAIT']
+from .json_codec import json_loads, json_dumps
+
+__all__ = ['StrOrDict', 'webex_id_to_uuid', 'to_camel', 'ApiModel', 'LazyModel', 'CodeAndReason', 'ApiModelWithErrors',
+           'plus1', 'dt_iso_str', 'SafeEnum', 'enum_str', 'RETRY_429_MAX_WAIT']
 
 StrOrDict = Union[str, dict]
 
@@ -87,6 +92,9 @@ class ApiModel(BaseModel):
         extra = 'forbid' if 'unittest' in sys.modules or 'pytest' in sys.modules else 'allow'
         # store values instead of enum types
         use_enum_values = True
+        # use the pluggable JSON codec for .json() and .parse_raw()
+        json_loads = json_loads
+        json_dumps = json_dumps
 
     def json(self, *args, exclude_none=True, by_alias=True, **kwargs) -> str:
         return super().json(*args, exclude_none=exclude_none, by_alias=by_alias, **kwargs)
@@ -99,6 +107,130 @@ class ApiModel(BaseModel):
             raise e
         return r
 
+    @classmethod
+    def lazy(cls, obj: dict, fields: Iterable[str] = None) -> 'LazyModel':
+        """
+        Create a :class:`LazyModel` proxy for an instance of this model w/o validating the data upfront
+
+        :param obj: dict to create the proxy from
+        :param fields: names of the fields to keep; optional
+        :return: lazy proxy
+        """
+        return LazyModel(cls, obj, fields=fields)
+
+
+class LazyModel:
+    """
+    Lightweight proxy for an :class:`ApiModel` instance.
+
+    The proxy keeps the original dict and only validates a field when the respective attribute is accessed. Validated
+    values are cached. Pre root validators of the model are applied when the proxy is created; field validators
+    are applied on attribute access. Post root validators are only applied when the full model is created
+    using :meth:`validate`.
+
+    If a set of field names is given then only these fields are kept and any access to other fields raises an
+    AttributeError.
+
+    Properties of the model are available on the proxy as well. Methods of the model are not, and the proxy is not an
+    instance of the model: ``isinstance(proxy, Person)`` is False. Use :meth:`validate` to get a model instance.
+
+    Example:
+
+        .. code-block:: python
+
+            api.session.lazy_models = True
+            emails = {person.person_id: person.emails[0] for person in api.people.list()}
+    """
+    __slots__ = ('_model', '_raw', '_values', '_fields')
+
+    def __init__(self, model: Type[ApiModel], raw: dict, fields: Iterable[str] = None):
+        """
+
+        :param model: model to proxy for
+        :param raw: dict with the data
+        :param fields: names of the fields to keep; optional
+        """
+        for pre_root_validator in model.__pre_root_validators__:
+            raw = pre_root_validator(model, raw)
+        if fields is not None:
+            fields = frozenset(fields)
+            keys = set(fields)
+            keys.update(model.__fields__[name].alias for name in fields if name in model.__fields__)
+            raw = {k: v for k, v in raw.items() if k in keys}
+        self._model = model
+        self._raw = raw
+        self._values = dict()
+        self._fields = fields
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes not found the usual way
+        if name.startswith('_'):
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        if name not in self._model.__fields__:
+            # properties of the model are evaluated on the proxy
+            attr = getattr(self._model, name, None)
+            if isinstance(attr, property):
+                return attr.fget(self)
+        if self._fields is not None and name not in self._fields:
+            raise AttributeError(f'{name} not in projected fields of {self._model.__name__}')
+        try:
+            field = self._model.__fields__[name]
+        except KeyError:
+            if self._model.__config__.extra == Extra.allow and name in self._raw:
+                return self._raw[name]
+            raise AttributeError(f"'{self._model.__name__}' object has no attribute '{name}'")
+        if field.alias in self._raw:
+            value = self._raw[field.alias]
+        elif name in self._raw:
+            value = self._raw[name]
+        elif field.required:
+            raise ValidationError([ErrorWrapper(MissingError(), loc=field.alias)], self._model)
+        else:
+            value = field.get_default()
+            self._values[name] = value
+            return value
+        value, errors = field.validate(value, self._values, loc=field.alias, cls=self._model)
+        if errors:
+            raise ValidationError([errors], self._model)
+        if self._model.__config__.use_enum_values and isinstance(value, Enum):
+            value = value.value
+        self._values[name] = value
+        return value
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._model.__name__}, {self._raw!r})'
+
+    # method names are taken from pydantic.BaseModel: these names can't be used as field names and hence can't
+    # conflict with attributes of the model
+
+    def dict(self) -> dict:
+        """
+        Field values by field name; same as :meth:`pydantic.BaseModel.dict` of the fully validated model. For a
+        projection only the projected fields are included. All (projected) fields are validated.
+        """
+        model = self._model
+        names = [name for name in model.__fields__ if self._fields is None or name in self._fields]
+        values = {name: getattr(self, name) for name in names}
+        if self._fields is not None:
+            return model.construct(**values).dict(include=set(names))
+        if model.__config__.extra == Extra.allow:
+            known = set(model.__fields__)
+            known.update(field.alias for field in model.__fields__.values())
+            values.update((k, v) for k, v in self._raw.items() if k not in known)
+        return model.construct(**values).dict()
+
+    def validate(self) -> ApiModel:
+        """
+        Create a fully validated model instance
+
+        :return: model instance
+        """
+        return self._model.parse_obj(self._raw)
+
 
 class CodeAndReason(ApiModel):
     code: str
@@ -0,0 +1,391 @@
+"""
+Bulk upload of voicemail greetings and announcements
+
+:class:`BulkUploader` (and :class:`AsBulkUploader` for the async API) upload voicemail greetings for many people and
+announcements to the announcement repository concurrently:
+
+* the items to upload are defined in a manifest (see :func:`read_manifest`): person or location and path of the .wav
+  file
+* files are streamed from disk (:class:`MultipartFile`); at no time is a file loaded into memory
+* uploads run concurrently on the API (:meth:`wxc_sdk.WebexSimpleApi.map`); the number of concurrent requests and the
+  rate limiter of the session apply. Uploads hitting a 429 are retried with the same (rewound) stream
+* identical announcements (same content hash, same repository) are only uploaded once; all manifest items for the
+  same audio reference the same announcement
+* results are yielded per item as uploads complete
+
+Example:
+
+    .. code-block:: python
+
+        # manifest.csv:
+        # kind,path,person_id,location_id,name
+        # busy_greeting,greetings/busy.wav,Y2lzY29...,,
+        # announcement,audio/welcome.wav,,Y2lzY29...,Welcome
+        uploader = BulkUploader(api)
+        for result in uploader.run(read_manifest('manifest.csv')):
+            print(result.item.path, result.status, result.error or '')
+"""
+import asyncio
+import csv
+import hashlib
+import io
+import os
+import time
+import uuid
+from collections.abc import Generator, AsyncGenerator, Iterable
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+    from .as_api import AsWebexSimpleApi
+
+__all__ = ['MultipartFile', 'UploadKind', 'UploadItem', 'UploadStatus', 'UploadResult', 'read_manifest',
+           'content_hash', 'BulkUploader', 'AsBulkUploader']
+
+# chunk size for hashing
+_CHUNK = 1 << 20
+
+
+class MultipartFile(io.RawIOBase):
+    """
+    multipart/form-data request body with a single file streamed from disk and optional form fields.
+
+    Unlike :class:`requests_toolbelt.MultipartEncoder` the body can be used with both sessions
+    (:class:`wxc_sdk.rest.RestSession` and :class:`wxc_sdk.as_rest.AsRestSession`), has a known length, and is
+    seekable so that it can be sent again on retries. The file is only opened while the body is read.
+    """
+
+    def __init__(self, path: str, *, field: str = 'file', filename: str = None, media_type: str = 'audio/wav',
+                 fields: dict[str, str] = None, boundary: str = None):
+        """
+
+        :param path: path of the file
+        :param field: name of the form field for the file
+        :param filename: filename for the upload; default: file name of path
+        :param media_type: media type of the file
+        :param fields: additional form fields
+        :param boundary: multipart boundary; default: random boundary
+        """
+        super().__init__()
+        boundary = boundary or uuid.uuid4().hex
+        self.path = path
+        self.field = field
+        self.filename = filename or os.path.basename(path)
+        self.media_type = media_type
+        #: additional form fields
+        self.fields = dict(fields or {})
+        self._boundary = boundary
+        filename = self.filename.replace('"', '%22')
+        #: content type for the request incl. the boundary
+        self.content_type = f'multipart/form-data; boundary={boundary}'
+        self._head = b''.join(f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+                              f'{value}\r\n'.encode() for name, value in (fields or {}).items())
+        self._head += (f'--{boundary}\r\nContent-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+                       f'Content-Type: {media_type}\r\n\r\n').encode()
+        self._tail = f'\r\n--{boundary}--\r\n'.encode()
+        self._size = os.path.getsize(path)
+        self._pos = 0
+        self._file = None
+
+    def with_fields(self, **fields: str) -> 'MultipartFile':
+        """
+        New request body for the same file with additional form fields
+
+        :param fields: form fields to add or replace
+        :return: new request body
+        """
+        return MultipartFile(self.path, field=self.field, filename=self.filename, media_type=self.media_type,
+                             fields={**self.fields, **fields}, boundary=self._boundary)
+
+    def __len__(self) -> int:
+        return len(self._head) + self._size + len(self._tail)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self)
+        self._pos = max(0, min(offset, len(self)))
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast('B')
+        head, size = len(self._head), self._size
+        written = 0
+        while written < len(view) and self._pos < len(self):
+            pos = self._pos
+            if pos < head:
+                chunk = self._head[pos:pos + len(view) - written]
+            elif pos < head + size:
+                if self._file is None:
+                    self._file = open(self.path, mode='rb')
+                if self._file.tell() != pos - head:
+                    self._file.seek(pos - head)
+                chunk = self._file.read(min(len(view) - written, head + size - pos))
+                if not chunk:
+                    raise ValueError(f'{self.path} is shorter than expected')
+            else:
+                chunk = self._tail[pos - head - size:pos - head - size + len(view) - written]
+            view[written:written + len(chunk)] = chunk
+            written += len(chunk)
+            self._pos += len(chunk)
+        if self._pos >= len(self):
+            self._close_file()
+        return written
+
+    def _close_file(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self):
+        """
+        Close the file. The body stays usable: reading again (after :meth:`seek`) reopens the file. Both HTTP client
+        libraries close bodies after sending; retries need to be able to send the body again.
+        """
+        self._close_file()
+
+
+class UploadKind(str, Enum):
+    busy_greeting = 'busy_greeting'
+    no_answer_greeting = 'no_answer_greeting'
+    #: announcement in the announcement repository of the organization or a location
+    announcement = 'announcement'
+
+
+@dataclass
+class UploadItem:
+    """
+    An item to upload
+    """
+    kind: UploadKind
+    #: path of the .wav file
+    path: str
+    #: person to upload the greeting for; required for greetings
+    person_id: Optional[str] = None
+    #: location for announcements; None: organization level announcement
+    location_id: Optional[str] = None
+    #: name of the announcement; default: file name w/o extension
+    name: Optional[str] = None
+    org_id: Optional[str] = None
+
+    def __post_init__(self):
+        self.kind = UploadKind(self.kind)
+        if self.kind == UploadKind.announcement:
+            self.name = self.name or os.path.splitext(os.path.basename(self.path))[0]
+        elif not self.person_id:
+            raise ValueError(f'person_id is required for {self.kind.value}: {self.path}')
+
+    def body(self) -> MultipartFile:
+        """
+        request body for the upload
+        """
+        if self.kind == UploadKind.announcement:
+            return MultipartFile(self.path, fields={'name': self.name})
+        return MultipartFile(self.path)
+
+
+class UploadStatus(str, Enum):
+    uploaded = 'uploaded'
+    #: identical announcement has been uploaded for another item; see announcement_id
+    deduplicated = 'deduplicated'
+    failed = 'failed'
+
+
+@dataclass
+class UploadResult:
+    """
+    Result of the upload of an item
+    """
+    item: UploadItem
+    status: UploadStatus
+    #: id of the announcement (announcements only)
+    announcement_id: Optional[str] = None
+    #: SHA-256 hash of the file content (announcements only)
+    content_hash: Optional[str] = None
+    error: Optional[Exception] = None
+    #: time the upload took
+    seconds: float = 0.0
+
+
+def read_manifest(path: str) -> list[UploadItem]:
+    """
+    Read a manifest from a CSV file.
+
+    Columns: kind (see :class:`UploadKind`), path, person_id, location_id, name, org_id. Only kind and path are
+    required; empty values are ignored. Relative file paths are relative to the location of the manifest.
+
+    :param path: path of the CSV file
+    :return: list of items
+    """
+    base = os.path.dirname(os.path.abspath(path))
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    items = []
+    for row in rows:
+        row = {k.strip(): v.strip() for k, v in row.items() if k and v and v.strip()}
+        row['path'] = os.path.join(base, row['path'])
+        items.append(UploadItem(**row))
+    return items
+
+
+def content_hash(path: str) -> str:
+    """
+    SHA-256 hash of a file's content; the file is read in chunks
+    """
+    sha = hashlib.sha256()
+    with open(path, mode='rb') as f:
+        while chunk := f.read(_CHUNK):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _announcement_paths(items: list[UploadItem]) -> list[str]:
+    """
+    distinct paths of all announcements
+    """
+    return list(dict.fromkeys(item.path for item in items if item.kind == UploadKind.announcement))
+
+
+def _groups(items: list[UploadItem], hashes: dict[str, str]) -> list[list[UploadItem]]:
+    """
+    group items for upload: announcements with identical content for the same repository are grouped; only the
+    first item of each group gets uploaded
+    """
+    groups: dict[tuple, list[UploadItem]] = dict()
+    for i, item in enumerate(items):
+        if item.kind == UploadKind.announcement:
+            key = (hashes[item.path], item.location_id, item.org_id)
+        else:
+            key = (i,)
+        groups.setdefault(key, []).append(item)
+    return list(groups.values())
+
+
+def _group_results(group: list[UploadItem], hashes: dict[str, str], announcement_id: Optional[str],
+                   error: Optional[Exception], seconds: float) -> list[UploadResult]:
+    """
+    results for a group of items based on the upload of the first item
+    """
+    first = group[0]
+    sha = hashes.get(first.path)
+    if error is not None:
+        return [UploadResult(item=item, status=UploadStatus.failed, content_hash=sha, error=error,
+                             seconds=seconds) for item in group]
+    return [UploadResult(item=item, status=UploadStatus.deduplicated if i else UploadStatus.uploaded,
+                         announcement_id=announcement_id, content_hash=sha, seconds=0.0 if i else seconds)
+            for i, item in enumerate(group)]
+
+
+class BulkUploader:
+    """
+    Upload voicemail greetings and announcements concurrently
+    """
+
+    def __init__(self, api: 'WebexSimpleApi'):
+        self.api = api
+
+    def _upload(self, item: UploadItem, body: MultipartFile) -> Optional[str]:
+        """
+        upload an item
+
+        :return: announcement id for announcements
+        """
+        if item.kind == UploadKind.announcement:
+            return self.api.telephony.announcements_repo.upload_announcement(name=item.name, file=body,
+                                                                             location_id=item.location_id,
+                                                                             org_id=item.org_id)
+        voicemail = self.api.person_settings.voicemail
+        configure = voicemail.configure_busy_greeting if item.kind == UploadKind.busy_greeting else \
+            voicemail.configure_no_answer_greeting
+        configure(person_id=item.person_id, content=body, org_id=item.org_id)
+        return None
+
+    def _upload_group(self, group: list[UploadItem], hashes: dict[str, str]) -> list[UploadResult]:
+        item = group[0]
+        start = time.perf_counter()
+        announcement_id, error = None, None
+        try:
+            with item.body() as body:
+                announcement_id = self._upload(item, body)
+        except Exception as e:
+            error = e
+        return _group_results(group, hashes, announcement_id, error, time.perf_counter() - start)
+
+    def run(self, items: Iterable[UploadItem]) -> Generator[UploadResult, None, None]:
+        """
+        Upload all items
+
+        :param items: items to upload; for example from :func:`read_manifest`
+        :return: yields one result per item as uploads complete
+        """
+        items = list(items)
+        paths = _announcement_paths(items)
+        hashes = dict(zip(paths, self.api.map(content_hash, paths)))
+        groups = _groups(items, hashes)
+        for results in self.api.map(self._upload_group, groups, [hashes] * len(groups), ordered=False):
+            yield from results
+
+
+class AsBulkUploader:
+    """
+    Upload voicemail greetings and announcements concurrently using the async API
+    """
+
+    def __init__(self, api: 'AsWebexSimpleApi'):
+        self.api = api
+
+    async def _upload(self, item: UploadItem, body: MultipartFile) -> Optional[str]:
+        """
+        upload an item
+
+        :return: announcement id for announcements
+        """
+        if item.kind == UploadKind.announcement:
+            return await self.api.telephony.announcements_repo.upload_announcement(name=item.name, file=body,
+                                                                                   location_id=item.location_id,
+                                                                                   org_id=item.org_id)
+        voicemail = self.api.person_settings.voicemail
+        configure = voicemail.configure_busy_greeting if item.kind == UploadKind.busy_greeting else \
+            voicemail.configure_no_answer_greeting
+        await configure(person_id=item.person_id, content=body, org_id=item.org_id)
+        return None
+
+    async def _upload_group(self, group: list[UploadItem], hashes: dict[str, str]) -> list[UploadResult]:
+        item = group[0]
+        start = time.perf_counter()
+        announcement_id, error = None, None
+        try:
+            with item.body() as body:
+                announcement_id = await self._upload(item, body)
+        except Exception as e:
+            error = e
+        return _group_results(group, hashes, announcement_id, error, time.perf_counter() - start)
+
+    async def run(self, items: Iterable[UploadItem]) -> AsyncGenerator[UploadResult, None]:
+        """
+        Upload all items
+
+        :param items: items to upload; for example from :func:`read_manifest`
+        :return: yields one result per item as uploads complete
+        """
+        items = list(items)
+        paths = _announcement_paths(items)
+        loop = asyncio.get_running_loop()
+        hashes = dict(zip(paths, await asyncio.gather(*[loop.run_in_executor(None, content_hash, path)
+                                                         for path in paths])))
+        groups = _groups(items, hashes)
+        async for results in self.api.map_gen(self._upload_group, groups, [hashes] * len(groups), ordered=False):
+            for result in results:
+                yield result
@@ -0,0 +1,317 @@
+"""
+Response cache for REST sessions
+
+A :class:`ResponseCache` can be used by :class:`wxc_sdk.rest.RestSession` and :class:`wxc_sdk.as_rest.AsRestSession`
+to serve GET requests for rarely changing data from a cache instead of sending the requests to Webex.
+
+* cache keys are based on URL, query parameters and (a hash of) the access token
+* the TTL is determined per endpoint: regular expressions are matched against the URL path. Endpoints w/o matching
+  policy use the default TTL; a TTL of 0 disables caching
+* a PUT/POST/PATCH/DELETE request invalidates all cached responses for the same path, parent paths, and child paths
+* expired responses with an ETag are revalidated using If-None-Match
+* entries are kept in memory (LRU) or in an SQLite database (:class:`SQLiteCacheBackend`)
+
+Example:
+
+    .. code-block:: python
+
+        cache = ResponseCache(policies=READ_MOSTLY_POLICIES)
+        api = WebexSimpleApi(tokens=tokens, cache=cache)
+"""
+import hashlib
+import logging
+import re
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Optional, Union
+from urllib.parse import urlparse, urlencode
+
+from requests.utils import parse_header_links
+
+from .json_codec import json_loads, json_dumps
+
+__all__ = ['CacheEntry', 'CacheBackend', 'MemoryCacheBackend', 'SQLiteCacheBackend', 'CachedResponse',
+           'ResponseCache', 'READ_MOSTLY_POLICIES']
+
+log = logging.getLogger(__name__)
+
+#: TTL policies for some read-mostly configuration endpoints
+READ_MOSTLY_POLICIES = {
+    r'/telephony/config/supportedDevices$': 3600,
+    r'/telephony/config/announcementLanguages$': 86400,
+    r'/telephony/config/callingProfiles$': 3600,
+    r'/telephony/config/locations/[^/]+/schedules': 300,
+    r'/v1/locations$': 300,
+}
+
+
+@dataclass
+class CacheEntry:
+    """
+    A cached response
+    """
+    #: path of the request URL; used for invalidation
+    path: str
+    #: URL of the response
+    url: str
+    #: response body; JSON encoded if is_json is set
+    body: str
+    is_json: bool
+    #: Link header of the response
+    link: Optional[str]
+    #: ETag header of the response
+    etag: Optional[str]
+    #: expiry as epoch time
+    expires: float
+
+    @property
+    def expired(self) -> bool:
+        return time.time() >= self.expires
+
+    def data(self) -> Union[str, dict]:
+        """
+        Response body; each call returns a new object
+        """
+        return json_loads(self.body) if self.is_json else self.body
+
+
+def related_paths(path: str, other: str) -> bool:
+    """
+    Check whether one path is equal to or a parent of the other path
+
+    :meta private:
+    """
+    if len(path) > len(other):
+        path, other = other, path
+    return other.startswith(path) and (len(other) == len(path) or other[len(path)] == '/')
+
+
+class CacheBackend:
+    """
+    Base class for cache storage backends
+    """
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def put(self, key: str, entry: CacheEntry):
+        raise NotImplementedError
+
+    def invalidate(self, path: str) -> int:
+        """
+        Remove all entries for the given path, its parent paths and child paths
+
+        :return: number of removed entries
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-memory LRU cache backend; thread safe
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, path: str) -> int:
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if related_paths(entry.path, path)]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    Cache backend storing entries in an SQLite database. The cache survives restarts and can be shared by multiple
+    processes.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        """
+
+        :param path: path of the SQLite database file
+        :type path: str
+        :param max_entries: maximum number of entries; entries with the oldest expiry are removed first
+        :type max_entries: int
+        """
+        self.max_entries = max_entries
+        self._lock = Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute('CREATE TABLE IF NOT EXISTS response_cache (key TEXT PRIMARY KEY, path TEXT, url TEXT, '
+                         'body TEXT, is_json INTEGER, link TEXT, etag TEXT, expires REAL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS response_cache_expires ON response_cache (expires)')
+
+    def close(self):
+        self._db.close()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._db.execute('SELECT path, url, body, is_json, link, etag, expires FROM response_cache '
+                                   'WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        path, url, body, is_json, link, etag, expires = row
+        return CacheEntry(path=path, url=url, body=body, is_json=bool(is_json), link=link, etag=etag,
+                          expires=expires)
+
+    def put(self, key: str, entry: CacheEntry):
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                             (key, entry.path, entry.url, entry.body, int(entry.is_json), entry.link, entry.etag,
+                              entry.expires))
+            count, = self._db.execute('SELECT COUNT(*) FROM response_cache').fetchone()
+            if count > self.max_entries:
+                self._db.execute('DELETE FROM response_cache WHERE key IN (SELECT key FROM response_cache '
+                                 'ORDER BY expires LIMIT ?)', (count - self.max_entries,))
+
+    def invalidate(self, path: str) -> int:
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM response_cache WHERE path = ? OR path LIKE ? || '/%' "
+                                      "OR ? LIKE path || '/%'", (path, path, path))
+            return cursor.rowcount
+
+    def clear(self):
+        with self._lock:
+            self._db.execute('DELETE FROM response_cache')
+
+
+class CachedResponse:
+    """
+    Stand-in for a response object for responses served from the cache. Has the attributes of
+    :class:`requests.Response` and :class:`aiohttp.ClientResponse` used by the REST sessions.
+
+    :meta private:
+    """
+    status_code = 200
+    status = 200
+
+    def __init__(self, entry: CacheEntry, url=None):
+        self.url = url or entry.url
+        self.headers = {k: v for k, v in (('Link', entry.link), ('ETag', entry.etag)) if v}
+        self.links = {link.get('rel') or link.get('url'): link
+                      for link in parse_header_links(entry.link)} if entry.link else {}
+
+
+class ResponseCache:
+    """
+    Cache for GET responses; can be shared by multiple sessions (sync and async)
+    """
+
+    def __init__(self, *, ttl: float = 0, policies: dict[str, float] = None, backend: CacheBackend = None,
+                 max_entries: int = 1000):
+        """
+
+        :param ttl: default TTL in seconds for endpoints w/o matching policy. 0: don't cache
+        :type ttl: float
+        :param policies: TTLs in seconds by regular expression to be matched against the URL path. The first
+            matching policy wins
+        :type policies: dict[str, float]
+        :param backend: storage backend. Default: :class:`MemoryCacheBackend`
+        :type backend: :class:`CacheBackend`
+        :param max_entries: maximum number of entries for the default backend
+        :type max_entries: int
+        """
+        self.ttl = ttl
+        self.policies = [(re.compile(pattern), policy_ttl) for pattern, policy_ttl in (policies or {}).items()]
+        self.backend = MemoryCacheBackend(max_entries=max_entries) if backend is None else backend
+        #: number of requests served from the cache
+        self.hits = 0
+        #: number of cacheable requests not served from the cache
+        self.misses = 0
+
+    def ttl_for(self, path: str) -> float:
+        """
+        TTL for a URL path
+        """
+        for pattern, ttl in self.policies:
+            if pattern.search(path):
+                return ttl
+        return self.ttl
+
+    def key(self, url: str, params: Optional[dict], access_token: str) -> Optional[str]:
+        """
+        Cache key for a GET request
+
+        :return: key or None if the request is not cacheable
+        """
+        parsed = urlparse(url)
+        if self.ttl_for(parsed.path) <= 0:
+            return None
+        if params:
+            params = sorted((k, str(v)) for k, v in params.items() if v is not None)
+        token = hashlib.sha256(access_token.encode()).hexdigest()[:16]
+        return f'{token} {url} {urlencode(params or [])}'
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """
+        Get an entry (valid or expired)
+        """
+        return self.backend.get(key)
+
+    def put(self, key: str, url: str, response_url: str, data: Union[str, dict], link: Optional[str],
+            etag: Optional[str]) -> CacheEntry:
+        """
+        Store a response in the cache
+
+        :param key: cache key
+        :param url: request URL
+        :param response_url: URL of the response
+        :param data: response body (text or parsed JSON)
+        :param link: Link header of the response
+        :param etag: ETag header of the response
+        """
+        path = urlparse(url).path
+        is_json = not isinstance(data, str)
+        entry = CacheEntry(path=path, url=response_url, body=json_dumps(data) if is_json else data, is_json=is_json,
+                           link=link, etag=etag, expires=time.time() + self.ttl_for(path))
+        self.backend.put(key, entry)
+        return entry
+
+    def refresh(self, key: str, entry: CacheEntry):
+        """
+        Extend the lifetime of an entry after successful revalidation
+        """
+        entry.expires = time.time() + self.ttl_for(entry.path)
+        self.backend.put(key, entry)
+
+    def invalidate(self, url: str):
+        """
+        Invalidate all entries related to the given URL: same path, parent paths, or child paths
+        """
+        removed = self.backend.invalidate(urlparse(url).path)
+        if removed:
+            log.debug(f'invalidated {removed} cached responses for {url}')
+
+    def clear(self):
+        self.backend.clear()
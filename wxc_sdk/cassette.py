@@ -0,0 +1,407 @@
+"""
+Record and replay of REST requests
+
+A :class:`Cassette` can be set for :class:`wxc_sdk.rest.RestSession` and :class:`wxc_sdk.as_rest.AsRestSession` to
+record all requests and responses to a file and to replay them later w/o access to Webex. Cassettes are useful for
+deterministic tests of code using the SDK and for reproducing issues reported by users.
+
+* interactions are stored as compact JSON lines; the file is compressed if the file name ends with `.gz`
+* secrets are masked before anything is written: authorization header, cookies, tokens, client secret and passwords
+  in request and response bodies (see :mod:`wxc_sdk.wire_log`)
+* on replay requests are matched by method, URL path and query parameters (and optionally by request body).
+  Interactions with the same key are replayed in the recorded order
+* optional timing emulation: on replay each response is delayed by the recorded response time multiplied by a factor
+
+Example:
+
+    .. code-block:: python
+
+        # record
+        with Cassette('people.jsonl.gz', mode='record') as cassette:
+            api = WebexSimpleApi(tokens=tokens, cassette=cassette)
+            people = list(api.people.list())
+
+        # replay: no requests are sent to Webex
+        with Cassette('people.jsonl.gz', mode='replay') as cassette:
+            api = WebexSimpleApi(tokens='dummy', cassette=cassette)
+            assert people == list(api.people.list())
+"""
+import asyncio
+import base64
+import gzip
+import logging
+import os
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from threading import Lock
+from typing import Any, Optional, Union
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, unquote
+
+from requests import Response, PreparedRequest
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, parse_header_links
+
+from .json_codec import json_codec
+from .wire_log import mask_headers, mask_json, mask_form
+
+__all__ = ['Cassette', 'CassetteMiss', 'CassetteAdapter', 'ReplayResponse']
+
+log = logging.getLogger(__name__)
+
+#: response headers not recorded: bodies are stored decoded and w/o transfer encoding
+SKIPPED_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive'})
+
+MODES = ('record', 'replay', 'auto')
+
+
+class CassetteMiss(LookupError):
+    """
+    No recorded interaction for a request on replay
+    """
+    pass
+
+
+def _mask_url(url: str) -> str:
+    """
+    URL with secrets in query parameters masked
+    """
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = urlencode(mask_form(parse_qsl(parts.query, keep_blank_values=True)), safe='*')
+    return urlunsplit(parts._replace(query=query))
+
+
+def _text(body: Any) -> str:
+    if body is None:
+        return ''
+    if isinstance(body, (bytes, bytearray)):
+        return bytes(body).decode('utf-8', errors='replace')
+    if isinstance(body, str):
+        return body
+    # multipart or streamed data is not recorded
+    return f'<{body.__class__.__name__}>'
+
+
+def _masked_body(body: Union[str, bytes, None], content_type: Optional[str]) -> Union[str, Any]:
+    """
+    masked request body for recording and matching; JSON bodies are parsed
+    """
+    body = _text(body)
+    if not body:
+        return ''
+    content_type = (content_type or '').lower()
+    if content_type.startswith('application/json'):
+        try:
+            return mask_json(json_codec().loads(body))
+        except ValueError:
+            return body
+    if content_type.startswith('application/x-www-form-urlencoded'):
+        return urlencode(mask_form(parse_qsl(body, keep_blank_values=True)), safe='*')
+    return body
+
+
+class Cassette:
+    """
+    Record requests and responses to a file and replay them
+    """
+
+    def __init__(self, path: str, *, mode: str = 'auto', timing: float = 0.0, match_body: bool = False,
+                 repeat: bool = False):
+        """
+
+        :param path: path of the cassette file. Compressed if the name ends with `.gz`
+        :param mode: 'record': record all interactions, existing recordings are overwritten; 'replay': replay
+            recorded interactions; 'auto': replay if the file exists, else record
+        :param timing: timing emulation on replay: responses are delayed by the recorded response time multiplied
+            by this factor. 0: no delay, 1.0: replay in real time
+        :param match_body: on replay also match request bodies (after masking)
+        :param repeat: on replay the last interaction for a key is repeated once all interactions for the key have
+            been played. If not set a :class:`CassetteMiss` is raised
+        """
+        if mode not in MODES:
+            raise ValueError(f'invalid mode: {mode}, should be one of {", ".join(MODES)}')
+        if mode == 'auto':
+            mode = 'replay' if os.path.exists(path) else 'record'
+        self.path = path
+        #: 'record' or 'replay'
+        self.mode = mode
+        #: factor for the recorded response times on replay; 0: no delay
+        self.timing = timing
+        self.match_body = match_body
+        self.repeat = repeat
+        #: number of recorded interactions
+        self.recorded = 0
+        #: number of replayed interactions
+        self.played = 0
+        self._lock = Lock()
+        self._file = None
+        # recorded interactions by key
+        self._interactions: dict[tuple, deque[dict]] = defaultdict(deque)
+        # last played interaction by key; for repeat
+        self._last: dict[tuple, dict] = dict()
+        if self.recording:
+            self._file = gzip.open(path, mode='wt', encoding='utf-8') if path.endswith('.gz') else \
+                open(path, mode='w', encoding='utf-8')
+        else:
+            self._load()
+
+    @property
+    def recording(self) -> bool:
+        return self.mode == 'record'
+
+    def _load(self):
+        loads = json_codec().loads
+        with (gzip.open(self.path, mode='rt', encoding='utf-8') if self.path.endswith('.gz')
+              else open(self.path, encoding='utf-8')) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                interaction = loads(line)
+                request = interaction['request']
+                self._interactions[self._key(request['method'], request['url'], request.get('body'))].append(
+                    interaction)
+
+    def _key(self, method: str, url: str, body: Any) -> tuple:
+        """
+        key to match requests: method, path, sorted query parameters, and (masked) body if configured
+        """
+        parts = urlsplit(url)
+        query = tuple(sorted(mask_form(parse_qsl(parts.query, keep_blank_values=True))))
+        key = (method.upper(), unquote(parts.path), query)
+        if self.match_body:
+            key += (json_codec().dumps(body, sort_keys=True),)
+        return key
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def record(self, *, method: str, url: str, request_body: Union[str, bytes, None], content_type: Optional[str],
+               status: int, reason: str, response_url: str, response_headers, response_body: bytes,
+               elapsed: float):
+        """
+        Record an interaction; secrets are masked
+
+        :param method: HTTP method
+        :param url: request URL incl. query parameters
+        :param request_body: request body
+        :param content_type: content type of request body
+        :param status: response status code
+        :param reason: response reason
+        :param response_url: response URL
+        :param response_headers: response headers
+        :param response_body: response body
+        :param elapsed: response time in seconds
+        """
+        codec = json_codec()
+        response = {'status': status, 'reason': reason, 'url': _mask_url(response_url),
+                    'headers': [(k, v) for k, v in mask_headers(response_headers).items()
+                                if k.lower() not in SKIPPED_HEADERS],
+                    'elapsed_ms': round(elapsed * 1000, 1)}
+        ct = (response_headers.get('Content-Type') or '').lower()
+        if ct.startswith('application/json') and response_body.strip():
+            try:
+                response['json'] = mask_json(codec.loads(response_body))
+            except ValueError:
+                response['text'] = _text(response_body)
+        else:
+            try:
+                response['text'] = response_body.decode('utf-8')
+            except UnicodeDecodeError:
+                response['base64'] = base64.b64encode(response_body).decode()
+        interaction = {'request': {'method': method, 'url': _mask_url(url),
+                                   'body': _masked_body(request_body, content_type)},
+                       'response': response}
+        line = codec.dumps(interaction)
+        with self._lock:
+            if self._file is None:
+                raise ValueError('cassette is closed')
+            self._file.write(f'{line}\n')
+            self._file.flush()
+            self.recorded += 1
+
+    def play(self, *, method: str, url: str, request_body: Union[str, bytes, None],
+             content_type: Optional[str]) -> dict:
+        """
+        Get the recorded response for a request
+
+        :return: recorded response
+        :raises CassetteMiss: no (more) recorded interaction for the request
+        """
+        key = self._key(method, _mask_url(url), _masked_body(request_body, content_type))
+        with self._lock:
+            interactions = self._interactions.get(key)
+            if interactions:
+                interaction = interactions.popleft()
+                self._last[key] = interaction
+            elif self.repeat and key in self._last:
+                interaction = self._last[key]
+            else:
+                raise CassetteMiss(f'no recorded interaction for {method} {url}')
+            self.played += 1
+        log.debug(f'replay: {method} {url}')
+        return interaction['response']
+
+    def delay(self, response: dict) -> float:
+        """
+        delay for a recorded response based on timing emulation
+        """
+        return self.timing * response.get('elapsed_ms', 0) / 1000
+
+    @staticmethod
+    def body(response: dict) -> bytes:
+        """
+        body of a recorded response
+        """
+        if 'json' in response:
+            return json_codec().dumps(response['json']).encode()
+        if 'base64' in response:
+            return base64.b64decode(response['base64'])
+        return response.get('text', '').encode()
+
+    @asynccontextmanager
+    async def as_request(self, session, method: str, url: str, *, headers=None, data=None, params=None,
+                         stream: bool = False, **kwargs):
+        """
+        Replacement for :meth:`aiohttp.ClientSession.request` used by :class:`wxc_sdk.as_rest.AsRestSession`
+
+        :param stream: when recording yield a buffered copy of the response. The body of the original response has
+            been consumed for the recording and can't be streamed anymore. Buffered responses can be used after
+            the context has been closed
+        :meta private:
+        """
+        # aiohttp is only imported when needed; the synchronous SDK doesn't depend on it
+        from yarl import URL
+
+        request_url = URL(url)
+        if params:
+            request_url = request_url.update_query(params)
+        content_type = (headers or {}).get('content-type')
+        request_body = urlencode(data) if isinstance(data, dict) else data
+        if self.recording:
+            start = time.perf_counter()
+            async with session.request(method, url=url, headers=headers, data=data, params=params,
+                                       **kwargs) as response:
+                body = await response.read()
+                self.record(method=method, url=str(request_url), request_body=request_body,
+                            content_type=content_type, status=response.status, reason=response.reason,
+                            response_url=str(response.url), response_headers=response.headers, response_body=body,
+                            elapsed=time.perf_counter() - start)
+                if stream:
+                    response = ReplayResponse({'status': response.status, 'reason': response.reason,
+                                               'url': str(response.url), 'headers': list(response.headers.items())},
+                                              method=method, url=request_url, headers=headers, body=body)
+                yield response
+            return
+        recorded = self.play(method=method, url=str(request_url), request_body=request_body,
+                             content_type=content_type)
+        delay = self.delay(recorded)
+        if delay:
+            await asyncio.sleep(delay)
+        yield ReplayResponse(recorded, method=method, url=request_url, headers=headers)
+
+
+class ReplayResponse:
+    """
+    Stand-in for :class:`aiohttp.ClientResponse` for replayed responses. Has the attributes used by
+    :class:`wxc_sdk.as_rest.AsRestSession`.
+
+    :meta private:
+    """
+
+    class _Content:
+        def __init__(self, body: bytes):
+            self._body = body
+            self.total_bytes = len(body)
+
+        async def iter_chunked(self, n: int) -> AsyncGenerator[bytes, None]:
+            body = self._body
+            for i in range(0, len(body), n):
+                yield body[i:i + n]
+
+    def __init__(self, recorded: dict, method: str, url, headers=None, body: bytes = None):
+        from aiohttp import RequestInfo
+        from multidict import CIMultiDict, CIMultiDictProxy
+        from yarl import URL
+
+        self.status: int = recorded['status']
+        self.reason: str = recorded['reason']
+        self.url = URL(recorded['url'])
+        self.headers = CIMultiDictProxy(CIMultiDict(recorded['headers']))
+        self._body = Cassette.body(recorded) if body is None else body
+        self.content = self._Content(self._body)
+        self.request_info = RequestInfo(url, method, CIMultiDictProxy(CIMultiDict(headers or {})), url)
+        self.history = ()
+        link = self.headers.get('Link')
+        self.links = {link.get('rel') or link.get('url'): link
+                      for link in parse_header_links(link)} if link else {}
+
+    async def read(self) -> bytes:
+        return self._body
+
+    def release(self):
+        pass
+
+    async def text(self, encoding: str = None) -> str:
+        return self._body.decode(encoding or get_encoding_from_headers(self.headers) or 'utf-8')
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            from aiohttp import ClientResponseError
+            raise ClientResponseError(self.request_info, self.history, status=self.status, message=self.reason,
+                                      headers=self.headers)
+
+
+class CassetteAdapter(HTTPAdapter):
+    """
+    Transport adapter for :class:`requests.Session` recording to or replaying from a :class:`Cassette`
+
+    :meta private:
+    """
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        cassette = self.cassette
+        content_type = request.headers.get('content-type')
+        if cassette.recording:
+            start = time.perf_counter()
+            response = super().send(request, **kwargs)
+            body = response.content
+            cassette.record(method=request.method, url=request.url, request_body=request.body,
+                            content_type=content_type, status=response.status_code, reason=response.reason,
+                            response_url=response.url, response_headers=response.headers, response_body=body,
+                            elapsed=time.perf_counter() - start)
+            return response
+        recorded = cassette.play(method=request.method, url=request.url, request_body=request.body,
+                                 content_type=content_type)
+        delay = cassette.delay(recorded)
+        if delay:
+            time.sleep(delay)
+        response = Response()
+        response.status_code = recorded['status']
+        response.reason = recorded['reason']
+        response.headers = CaseInsensitiveDict(recorded['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = recorded['url']
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(milliseconds=recorded.get('elapsed_ms', 0))
+        response._content = cassette.body(recorded)
+        response._content_consumed = True
+        return response
@@ -1,22 +1,26 @@
 """
 CDR API
 """
+import csv
 import re
-from collections.abc import Generator
+from collections.abc import Generator, Iterable, Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Union
+from enum import Enum as PyEnum
+from typing import Optional, Union, Any, TextIO, get_args
 
 from dateutil import tz
 from dateutil.parser import isoparse
 from pydantic import Field, root_validator, Extra
+from pydantic.datetime_parse import parse_datetime
+from pydantic.validators import bool_validator
 
 from ..api_child import ApiChild
 from ..base import ApiModel, dt_iso_str
 from ..base import SafeEnum as Enum
 
 __all__ = ['CDRCallType', 'CDRClientType', 'CDRDirection', 'CDROriginalReason', 'CDRRedirectReason',
-           'CDRRelatedReason', 'CDRUserType', 'CDR', 'DetailedCDRApi']
+           'CDRRelatedReason', 'CDRUserType', 'CDR', 'CDRRecord', 'DetailedCDRApi']
 
 
 class CDRCallType(str, Enum):
@@ -340,6 +344,238 @@ class CDR(ApiModel):
     call_outcome_reason: Optional[str]
 
 
+def _str(value: Any) -> str:
+    return value if isinstance(value, str) else str(value)
+
+
+def _datetime(value: Any) -> datetime:
+    # fast path for ISO 8601 strings; the pydantic parser handles everything else
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return parse_datetime(value)
+
+
+def _enum_converter(enum_classes: list[type]) -> Callable[[Any], str]:
+    """
+    Converter for enum fields. Values are looked up once and then cached: all records share the same str instances.
+
+    :meta private:
+    """
+    cache: dict[Any, str] = dict()
+
+    def convert(value: Any) -> str:
+        try:
+            return cache[value]
+        except KeyError:
+            pass
+        converted = _str(value)
+        for enum_class in enum_classes:
+            try:
+                converted = enum_class(value).value
+            except ValueError:
+                continue
+            break
+        cache[value] = converted
+        return converted
+
+    return convert
+
+
+def _field_converter(field_type: Any) -> Callable[[Any], Any]:
+    """
+    Get a converter for values of a CDR field
+
+    :meta private:
+    """
+    if field_type is datetime:
+        return _datetime
+    if field_type is int:
+        return int
+    if field_type is bool:
+        return bool_validator
+    enum_classes = [t for t in (get_args(field_type) or (field_type,))
+                    if isinstance(t, type) and issubclass(t, PyEnum)]
+    if enum_classes:
+        return _enum_converter(enum_classes)
+    return _str
+
+
+class CDRRecord:
+    """
+    Compact representation of a CDR.
+
+    Has the same attributes as :class:`CDR` but uses __slots__ and skips pydantic validation. Column names are
+    mapped to attributes once per column name (not once per record) and enum values are cached; records share the
+    str instances of enum values. Attributes not present in the source data are None. Unknown columns are kept in
+    :attr:`extra`.
+
+    Use :meth:`from_dicts` or :meth:`from_csv` to create records in bulk.
+
+    Example:
+
+        .. code-block:: python
+
+            # parse a CDR report downloaded from Webex
+            cdrs = list(CDRRecord.from_dicts(api.reports.download(url=url)))
+
+            # ... or read CDRs from a CSV file
+            cdrs = list(CDRRecord.from_csv('cdrs.csv'))
+    """
+    __slots__ = tuple(CDR.__fields__) + ('extra',)
+
+    #: column name -> (attribute, converter); shared by all records
+    _columns: dict[str, tuple[str, Callable[[Any], Any]]] = dict()
+
+    #: converter for each attribute
+    _converters: dict[str, Callable[[Any], Any]] = {name: _field_converter(field.type_)
+                                                    for name, field in CDR.__fields__.items()}
+
+    #: attribute names by name and alias
+    _names: dict[str, str] = {**{field.alias: name for name, field in CDR.__fields__.items()},
+                              **{name: name for name in CDR.__fields__}}
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes which have not been set
+        if name in CDR.__fields__:
+            return None
+        if name == 'extra':
+            return dict()
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def __repr__(self):
+        values = ', '.join(f'{k}={v!r}' for k, v in self.dict().items())
+        return f'{self.__class__.__name__}({values})'
+
+    def __eq__(self, other):
+        if not isinstance(other, CDRRecord):
+            return NotImplemented
+        return self.dict() == other.dict()
+
+    @classmethod
+    def _column(cls, column: str) -> tuple[str, Optional[Callable[[Any], Any]]]:
+        """
+        Attribute name and converter for a column
+
+        :return: tuple of attribute name and converter. Converter is None for unknown columns
+        """
+        try:
+            return cls._columns[column]
+        except KeyError:
+            pass
+        name = cls._names.get(column)
+        if name is None:
+            # CSV style column name like "Start time"
+            name = normalize_name(column)
+            name = cls._names.get(name, name)
+        r = (name, cls._converters.get(name))
+        cls._columns[column] = r
+        return r
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CDRRecord':
+        """
+        Create a record from a dict
+
+        :param data: dict with CDR data. Keys can be space separated column names (like in CSV reports), snake_case
+            attribute names or aliases
+        :return: record
+        """
+        column = cls._column
+        record = object.__new__(cls)
+        extra = None
+        for key, value in data.items():
+            if value == '' or value == 'NA' or value is None:
+                continue
+            name, converter = column(key)
+            if converter is None:
+                if extra is None:
+                    extra = dict()
+                extra[name] = value
+                continue
+            object.__setattr__(record, name, converter(value))
+        if extra:
+            record.extra = extra
+        return record
+
+    @classmethod
+    def from_dicts(cls, dicts: Iterable[dict]) -> Generator['CDRRecord', None, None]:
+        """
+        Yield records from dicts; for example the rows of a report downloaded using
+        :meth:`wxc_sdk.reports.ReportsApi.download`
+
+        :param dicts: iterable with the dicts to yield records from
+        :return: yields :class:`CDRRecord` instances
+        """
+        from_dict = cls.from_dict
+        for data in dicts:
+            yield from_dict(data)
+
+    @classmethod
+    def from_csv(cls, source: Union[str, TextIO, Iterable[str]]) -> Generator['CDRRecord', None, None]:
+        """
+        Yield records from CSV data. The first line has to be the header.
+
+        The mapping of columns to attributes is determined once based on the header and rows are parsed without
+        creating intermediate dicts.
+
+        :param source: path of a CSV file, file object or iterable of lines
+        :return: yields :class:`CDRRecord` instances
+        """
+        if isinstance(source, str):
+            with open(source, mode='r', encoding='utf-8-sig', newline='') as f:
+                yield from cls.from_csv(f)
+            return
+        reader = csv.reader(source)
+        header = next(reader, None)
+        if header is None:
+            return
+        header[0] = header[0].lstrip('\ufeff')
+        columns = [(i, *cls._column(column)) for i, column in enumerate(header)]
+        known = [(i, name, converter) for i, name, converter in columns if converter is not None]
+        unknown = [(i, name) for i, name, converter in columns if converter is None]
+        new = object.__new__
+        set_attr = object.__setattr__
+        n = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < n:
+                row.extend([''] * (n - len(row)))
+            record = new(cls)
+            for i, name, converter in known:
+                value = row[i]
+                if value == '' or value == 'NA':
+                    continue
+                set_attr(record, name, converter(value))
+            if unknown:
+                extra = {name: row[i] for i, name in unknown if row[i] != '' and row[i] != 'NA'}
+                if extra:
+                    record.extra = extra
+            yield record
+
+    def dict(self) -> dict[str, Any]:
+        """
+        Attributes which are set (and extra columns) as dict
+        """
+        r = dict()
+        for name in CDR.__fields__:
+            try:
+                r[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        r.update(self.extra)
+        return r
+
+    def to_cdr(self) -> CDR:
+        """
+        Create a fully validated :class:`CDR` instance from the record
+
+        :return: CDR
+        """
+        return CDR.parse_obj(self.dict())
+
+
 @dataclass(init=False)
 class DetailedCDRApi(ApiChild, base='devices'):
     """
@@ -355,7 +591,8 @@ class DetailedCDRApi(ApiChild, base='devices'):
     """
 
     def get_cdr_history(self, start_time: Union[str, datetime] = None, end_time: Union[datetime, str] = None,
-                        locations: list[str] = None, **params) -> Generator[CDR, None, None]:
+                        locations: list[str] = None, raw: bool = False,
+                        **params) -> Generator[CDR, None, None]:
         """
         Provides Webex Calling Detailed Call History data for your organization.
 
@@ -377,6 +614,9 @@ class DetailedCDRApi(ApiChild, base='devices'):
         :param locations: Names of the location (as shown in Control Hub). Up to 10 comma-separated locations can be
             provided. Allows you to query reports by location.
         :type locations: list[str]
+        :param raw: yield dicts as returned by the API instead of :class:`CDR` instances; for example to be consumed
+            by :class:`CDRRecord` or :mod:`wxc_sdk.cdr.columnar`
+        :type raw: bool
         :param params: additional arguments
         :return:
         """
@@ -398,4 +638,4 @@ class DetailedCDRApi(ApiChild, base='devices'):
         params['startTime'] = guess_datetime(start_time)
         params['endTime'] = guess_datetime(end_time)
         # noinspection PyTypeChecker
-        return self.session.follow_pagination(url=url, model=CDR, params=params, item_key='items')
+        return self.session.follow_pagination(url=url, model=None if raw else CDR, params=params, item_key='items')
@@ -0,0 +1,299 @@
+"""
+Columnar export of CDRs
+
+Instead of creating one object per CDR, CDR data is collected in column buffers and emitted as Arrow record batches,
+written to Parquet files, or converted to NumPy structured arrays. Sources are iterables of dicts as yielded by
+:meth:`wxc_sdk.cdr.DetailedCDRApi.get_cdr_history` (with raw=True) or :meth:`wxc_sdk.reports.ReportsApi.download`.
+
+Arrow and Parquet output requires pyarrow; NumPy output requires numpy. Both are optional and not installed with
+wxc_sdk.
+
+Example:
+
+    .. code-block:: python
+
+        # write CDRs from the CDR feed to a Parquet file
+        cdr_to_parquet(api.cdr.get_cdr_history(raw=True), 'cdrs.parquet')
+
+        # load a Calling Detailed Call History report into a pandas DataFrame
+        table = pyarrow.Table.from_batches(cdr_record_batches(api.reports.download(url=url)))
+        df = table.to_pandas()
+"""
+from collections.abc import Generator, Iterable
+from datetime import datetime
+from enum import Enum
+from typing import Any, Optional, Union, get_args
+
+from . import CDR, CDRRecord
+
+__all__ = ['CDRColumns', 'cdr_batches', 'cdr_record_batches', 'cdr_to_parquet', 'cdr_to_numpy']
+
+
+def _column_kind(field_type: Any) -> str:
+    """
+    Kind of column for a CDR field: 'timestamp', 'int', 'bool', 'category' or 'str'
+
+    :meta private:
+    """
+    if field_type is datetime:
+        return 'timestamp'
+    if field_type is int:
+        return 'int'
+    if field_type is bool:
+        return 'bool'
+    if any(isinstance(t, type) and issubclass(t, Enum) for t in (get_args(field_type) or (field_type,))):
+        return 'category'
+    return 'str'
+
+
+#: column kind for each CDR attribute
+COLUMN_KINDS = {name: _column_kind(field.type_) for name, field in CDR.__fields__.items()}
+
+
+class CDRColumns:
+    """
+    Column buffers for CDR data.
+
+    Values are converted with the same (cached) converters used by :class:`wxc_sdk.cdr.CDRRecord`. Columns not
+    defined in :class:`wxc_sdk.cdr.CDR` are ignored.
+    """
+
+    def __init__(self, columns: Iterable[str] = None):
+        """
+
+        :param columns: names of the CDR attributes to collect. Default: all attributes
+        :type columns: Iterable[str]
+        """
+        columns = list(columns or CDR.__fields__)
+        unknown = [name for name in columns if name not in CDR.__fields__]
+        if unknown:
+            raise ValueError(f'unknown CDR attributes: {", ".join(unknown)}')
+        #: collected values by attribute name
+        self.columns: dict[str, list] = {name: [] for name in columns}
+        self._rows = 0
+
+    def __len__(self):
+        return self._rows
+
+    def append(self, data: dict):
+        """
+        Add a CDR to the buffers
+
+        :param data: dict with CDR data. Keys can be space separated column names (like in CSV reports), snake_case
+            attribute names or aliases
+        """
+        columns = self.columns
+        column = CDRRecord._column
+        rows = self._rows
+        for key, value in data.items():
+            if value == '' or value == 'NA' or value is None:
+                continue
+            name, converter = column(key)
+            values = columns.get(name)
+            if values is None or converter is None:
+                continue
+            # fill gaps
+            if len(values) < rows:
+                values.extend([None] * (rows - len(values)))
+            values.append(converter(value))
+        self._rows = rows + 1
+
+    def extend(self, dicts: Iterable[dict]):
+        """
+        Add multiple CDRs to the buffers
+
+        :param dicts: CDRs to add
+        """
+        append = self.append
+        for data in dicts:
+            append(data)
+
+    def _padded(self) -> dict[str, list]:
+        """
+        pad all columns to the same length
+        """
+        rows = self._rows
+        for values in self.columns.values():
+            if len(values) < rows:
+                values.extend([None] * (rows - len(values)))
+        return self.columns
+
+    def clear(self):
+        """
+        Clear all buffers
+        """
+        for values in self.columns.values():
+            values.clear()
+        self._rows = 0
+
+    def to_dict(self) -> dict[str, list]:
+        """
+        Collected data as dict of lists; all lists have the same length
+        """
+        return {name: list(values) for name, values in self._padded().items()}
+
+    def to_arrow(self) -> 'pyarrow.RecordBatch':
+        """
+        Create an Arrow record batch from the collected data.
+
+        Timestamps are UTC timestamps with ms resolution, enum values are dictionary encoded (categorical).
+
+        :return: record batch
+        :rtype: :class:`pyarrow.RecordBatch`
+        """
+        import pyarrow as pa
+
+        arrow_types = {'timestamp': pa.timestamp('ms', tz='UTC'),
+                       'int': pa.int64(),
+                       'bool': pa.bool_(),
+                       'category': pa.string(),
+                       'str': pa.string()}
+        arrays = []
+        for name, values in self._padded().items():
+            kind = COLUMN_KINDS[name]
+            array = pa.array(values, type=arrow_types[kind])
+            if kind == 'category':
+                array = array.dictionary_encode()
+            arrays.append(array)
+        return pa.RecordBatch.from_arrays(arrays, names=list(self.columns))
+
+    def to_numpy(self) -> 'numpy.ndarray':
+        """
+        Create a NumPy structured array from the collected data.
+
+        Timestamps are datetime64[ms] values in UTC (NaT for missing values), integer columns are float (NaN for
+        missing values). All other columns are object columns; enum values are shared str instances.
+
+        :return: structured array
+        :rtype: :class:`numpy.ndarray`
+        """
+        import numpy as np
+
+        dtypes = {'timestamp': 'datetime64[ms]', 'int': 'f8', 'bool': 'O', 'category': 'O', 'str': 'O'}
+        columns = self._padded()
+        result = np.empty(self._rows, dtype=[(name, dtypes[COLUMN_KINDS[name]]) for name in columns])
+        for name, values in columns.items():
+            kind = COLUMN_KINDS[name]
+            if kind == 'timestamp':
+                # datetime64 has no timezone: convert to naive UTC
+                result[name] = [np.datetime64('NaT') if v is None
+                                else np.datetime64(round(v.timestamp() * 1000), 'ms')
+                                for v in values]
+            elif kind == 'int':
+                result[name] = np.array([np.nan if v is None else v for v in values], dtype='f8')
+            else:
+                result[name] = values
+        return result
+
+
+def _batches(dicts: Iterable[dict], batch_size: int,
+             columns: Optional[Iterable[str]]) -> Generator[CDRColumns, None, None]:
+    """
+    Collect CDRs in column buffers and yield full buffers
+
+    :meta private:
+    """
+    buffer = CDRColumns(columns=columns)
+    append = buffer.append
+    for data in dicts:
+        append(data)
+        if len(buffer) >= batch_size:
+            yield buffer
+            buffer.clear()
+    if len(buffer):
+        yield buffer
+
+
+def cdr_batches(dicts: Iterable[dict], batch_size: int = 65536,
+                columns: Iterable[str] = None) -> Generator[Union['pyarrow.RecordBatch', 'numpy.ndarray'], None, None]:
+    """
+    Stream CDRs into Arrow record batches if pyarrow is installed; NumPy structured arrays otherwise.
+
+    :param dicts: CDR data; for example from :meth:`wxc_sdk.reports.ReportsApi.download`
+    :type dicts: Iterable[dict]
+    :param batch_size: maximum number of rows per batch
+    :type batch_size: int
+    :param columns: names of CDR attributes to include. Default: all attributes
+    :type columns: Iterable[str]
+    :return: yields record batches or structured arrays
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        convert = CDRColumns.to_numpy
+    else:
+        convert = CDRColumns.to_arrow
+    if columns is not None:
+        columns = list(columns)
+    for buffer in _batches(dicts, batch_size, columns):
+        yield convert(buffer)
+
+
+def cdr_record_batches(dicts: Iterable[dict], batch_size: int = 65536,
+                       columns: Iterable[str] = None) -> Generator['pyarrow.RecordBatch', None, None]:
+    """
+    Stream CDRs into Arrow record batches. Requires pyarrow.
+
+    :param dicts: CDR data; for example from :meth:`wxc_sdk.reports.ReportsApi.download`
+    :type dicts: Iterable[dict]
+    :param batch_size: maximum number of rows per record batch
+    :type batch_size: int
+    :param columns: names of CDR attributes to include. Default: all attributes
+    :type columns: Iterable[str]
+    :return: yields record batches
+    """
+    if columns is not None:
+        columns = list(columns)
+    for buffer in _batches(dicts, batch_size, columns):
+        yield buffer.to_arrow()
+
+
+def cdr_to_parquet(dicts: Iterable[dict], path: str, batch_size: int = 65536, columns: Iterable[str] = None,
+                   **kwargs) -> int:
+    """
+    Write CDRs to a Parquet file. Requires pyarrow.
+
+    Data is written in batches; memory consumption is bounded by the batch size.
+
+    :param dicts: CDR data; for example from :meth:`wxc_sdk.reports.ReportsApi.download`
+    :type dicts: Iterable[dict]
+    :param path: path of the Parquet file
+    :type path: str
+    :param batch_size: maximum number of rows per record batch (row group)
+    :type batch_size: int
+    :param columns: names of CDR attributes to include. Default: all attributes
+    :type columns: Iterable[str]
+    :param kwargs: additional arguments for :class:`pyarrow.parquet.ParquetWriter`
+    :return: number of rows written
+    :rtype: int
+    """
+    import pyarrow.parquet as pq
+
+    rows = 0
+    writer = None
+    try:
+        for batch in cdr_record_batches(dicts, batch_size=batch_size, columns=columns):
+            if writer is None:
+                writer = pq.ParquetWriter(path, batch.schema, **kwargs)
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return rows
+
+
+def cdr_to_numpy(dicts: Iterable[dict], columns: Iterable[str] = None) -> 'numpy.ndarray':
+    """
+    Read CDRs into a NumPy structured array. Requires numpy.
+
+    :param dicts: CDR data; for example from :meth:`wxc_sdk.reports.ReportsApi.download`
+    :type dicts: Iterable[dict]
+    :param columns: names of CDR attributes to include. Default: all attributes
+    :type columns: Iterable[str]
+    :return: structured array; see :meth:`CDRColumns.to_numpy`
+    :rtype: :class:`numpy.ndarray`
+    """
+    buffer = CDRColumns(columns=columns)
+    buffer.extend(dicts)
+    return buffer.to_numpy()
@@ -0,0 +1,209 @@
+"""
+Incremental collection of CDRs
+
+The CDR feed is rate-limited to one call every 5 minutes per organization. CDRs are available 5 minutes after the end
+of a call and can be retrieved for 48 hours. :class:`CDRPoller` collects CDRs incrementally:
+
+* the end of the last collected window (watermark) is kept in a checkpoint
+* each call only requests CDRs after the watermark (with a small overlap to catch CDRs with the same report time)
+* CDRs in the overlap are deduplicated based on correlation ID and local call ID
+* calls are scheduled to respect the rate limit; the time of the last call is part of the checkpoint so that the rate
+  limit is also respected after a restart
+
+Example:
+
+    .. code-block:: python
+
+        poller = CDRPoller(api=api.cdr, checkpoint_path='cdr_checkpoint.json')
+        for cdr in poller.run():
+            process(cdr)
+"""
+import json
+import logging
+import os
+from collections.abc import Generator, Iterable
+from datetime import datetime, timedelta, timezone
+from threading import Event
+from typing import Optional, Union
+
+from pydantic import Field
+
+from . import CDR, CDRRecord, DetailedCDRApi
+from ..base import ApiModel
+from ..rest import RestError
+
+__all__ = ['CDRCheckpoint', 'CDRPoller']
+
+log = logging.getLogger(__name__)
+
+#: minimum time between two calls to the CDR feed
+CDR_POLL_INTERVAL = timedelta(minutes=5)
+#: CDRs are available this long after the end of a call
+CDR_DELAY = timedelta(minutes=5, seconds=30)
+#: CDRs can be retrieved this long
+CDR_RETENTION = timedelta(hours=47, minutes=58)
+
+
+class CDRCheckpoint(ApiModel):
+    """
+    State of a :class:`CDRPoller`
+    """
+    #: all CDRs with a report time before the watermark have been collected
+    watermark: Optional[datetime]
+    #: time of the last call to the CDR feed
+    last_call: Optional[datetime]
+    #: dedup keys of CDRs in the overlap window before the watermark
+    seen: list[str] = Field(default_factory=list)
+
+
+def cdr_key(cdr: Union[CDR, dict]) -> tuple[str, Optional[datetime]]:
+    """
+    Dedup key and report time of a CDR. The key is based on correlation ID and local call ID with a fallback to the
+    report id
+
+    :meta private:
+    """
+    if isinstance(cdr, dict):
+        cdr = CDRRecord.from_dict(cdr)
+    if cdr.correlation_id or cdr.local_call_id:
+        key = f'{cdr.correlation_id}/{cdr.local_call_id}'
+    else:
+        key = f'report/{cdr.report_id}'
+    return key, cdr.report_time
+
+
+class CDRPoller:
+    """
+    Long-running incremental CDR collector with watermark checkpointing.
+
+    The checkpoint is read from and written to a JSON file. To store the checkpoint somewhere else, override
+    :meth:`read_checkpoint` and :meth:`write_checkpoint`.
+    """
+
+    def __init__(self, *, api: DetailedCDRApi, checkpoint_path: str = None, locations: Iterable[str] = None,
+                 overlap: timedelta = timedelta(minutes=2), interval: timedelta = CDR_POLL_INTERVAL,
+                 raw: bool = False):
+        """
+
+        :param api: CDR API to use
+        :type api: :class:`wxc_sdk.cdr.DetailedCDRApi`
+        :param checkpoint_path: path of JSON file to persist the checkpoint. If None then the checkpoint is only kept
+            in memory
+        :type checkpoint_path: str
+        :param locations: only collect CDRs of these locations (names)
+        :type locations: Iterable[str]
+        :param overlap: each call requests CDRs starting this long before the watermark; CDRs in the overlap are
+            deduplicated
+        :type overlap: timedelta
+        :param interval: minimum time between two calls
+        :type interval: timedelta
+        :param raw: yield dicts instead of :class:`wxc_sdk.cdr.CDR` instances
+        :type raw: bool
+        """
+        self.api = api
+        self.checkpoint_path = checkpoint_path
+        self.locations = list(locations) if locations else None
+        self.overlap = overlap
+        self.interval = interval
+        self.raw = raw
+        self._stop = Event()
+        self.checkpoint = self.read_checkpoint() or CDRCheckpoint()
+
+    def read_checkpoint(self) -> Optional[CDRCheckpoint]:
+        """
+        Read checkpoint from file
+
+        :return: checkpoint or None if no checkpoint could be read
+        """
+        if not self.checkpoint_path:
+            return None
+        try:
+            return CDRCheckpoint.parse_file(self.checkpoint_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f'failed to read checkpoint from {self.checkpoint_path}: {e}')
+            return None
+
+    def write_checkpoint(self, checkpoint: CDRCheckpoint):
+        """
+        Write checkpoint to file. The file is replaced atomically.
+
+        :param checkpoint: checkpoint to persist
+        """
+        if not self.checkpoint_path:
+            return
+        temp_path = f'{self.checkpoint_path}.tmp'
+        with open(temp_path, mode='w') as f:
+            json.dump(json.loads(checkpoint.json()), f, indent=2)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def next_call(self) -> float:
+        """
+        Time in seconds until the next call to the CDR feed is allowed
+        """
+        if self.checkpoint.last_call is None:
+            return 0.0
+        elapsed = datetime.now(tz=timezone.utc) - self.checkpoint.last_call
+        return max(0.0, (self.interval - elapsed).total_seconds())
+
+    def poll(self) -> list[Union[CDR, dict]]:
+        """
+        Collect all new CDRs since the watermark. Waits until the next call is allowed.
+
+        The checkpoint is only updated after all CDRs of the window have been retrieved.
+
+        :return: list of new CDRs
+        """
+        wait = self.next_call()
+        if wait and self._stop.wait(wait):
+            return []
+        now = datetime.now(tz=timezone.utc)
+        end_time = now - CDR_DELAY
+        start_time = now - CDR_RETENTION
+        if self.checkpoint.watermark:
+            start_time = max(start_time, self.checkpoint.watermark - self.overlap)
+        if start_time >= end_time:
+            return []
+        seen = set(self.checkpoint.seen)
+        self.checkpoint.last_call = now
+        try:
+            cdrs = list(self.api.get_cdr_history(start_time=start_time, end_time=end_time, locations=self.locations,
+                                                 raw=self.raw))
+        except RestError as e:
+            if e.response.status_code != 404:
+                self.write_checkpoint(self.checkpoint)
+                raise
+            # no CDRs in the requested window
+            cdrs = []
+        # only CDRs in the overlap of the next window need to be remembered
+        next_start = end_time - self.overlap
+        new_cdrs = []
+        new_seen = []
+        for cdr in cdrs:
+            key, report_time = cdr_key(cdr)
+            if report_time is None or report_time >= next_start:
+                new_seen.append(key)
+            if key in seen:
+                continue
+            seen.add(key)
+            new_cdrs.append(cdr)
+        self.checkpoint = CDRCheckpoint(watermark=end_time, last_call=now, seen=new_seen)
+        self.write_checkpoint(self.checkpoint)
+        log.debug(f'poll: {start_time}-{end_time}, got {len(cdrs)} CDRs, {len(new_cdrs)} new')
+        return new_cdrs
+
+    def run(self) -> Generator[Union[CDR, dict], None, None]:
+        """
+        Collect CDRs until :meth:`stop` is called
+
+        :return: yields new CDRs
+        """
+        while not self._stop.is_set():
+            yield from self.poll()
+
+    def stop(self):
+        """
+        Stop :meth:`run`; can be called from a different thread
+        """
+        self._stop.set()
@@ -11,6 +11,7 @@ import urllib.parse
 import uuid
 import webbrowser
 from collections.abc import Callable
+from contextlib import nullcontext
 from dataclasses import dataclass
 from typing import Union, Optional
 
@@ -131,11 +132,13 @@ class Integration:
         tokens.set_expiration()
         return tokens
 
-    def refresh(self, tokens: Tokens):
+    def refresh(self, tokens: Tokens, session: requests.Session = None):
         """
         Try to get a new access token using the refresh token.
 
         :param tokens: Tokens. Access token and expirations get updated in place.
+        :param session: session to use for the request; by default a new session is created for each request
+        :type session: requests.Session
         :raise:
             :class:`requests.HTTPError`: if request to obtain new access token fails
         """
@@ -147,7 +150,7 @@ class Integration:
         }
         try:
             url = self.token_service
-            with requests.Session() as session:
+            with nullcontext(session) if session is not None else requests.Session() as session:
                 with session.post(url=url, data=data) as response:
                     dump_response(response=response, dump_log=log)
                     response.raise_for_status()
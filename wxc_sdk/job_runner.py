@@ -0,0 +1,625 @@
+"""
+Runner for telephony jobs
+
+Device settings jobs (:class:`wxc_sdk.telephony.jobs.DeviceSettingsJobsApi`) and manage numbers jobs
+(:class:`wxc_sdk.telephony.jobs.ManageNumbersJobsApi`) are executed asynchronously by Webex. Only one device settings
+job can run per organization at any given time; starting another job results in a 409 error.
+
+:class:`JobRunner` (and :class:`AsJobRunner` for the async API) take care of this:
+
+* jobs are queued and executed one after the other per organization and job type; jobs for different organizations
+  run in parallel. The next job is started as soon as the previous job is done
+* a job that can't be started because another job is running (409) is started again after a backoff
+* the status of a job is polled with an adaptive delay (:class:`PollPolicy`): fast while the job is young, slower
+  the longer the job runs
+* each job is represented by a future (:class:`JobFuture`, :class:`AsJobFuture`) which resolves to a
+  :class:`JobResult` once the job is done. Errors of the job can be iterated while the job is still running
+
+Example:
+
+    .. code-block:: python
+
+        with JobRunner(api, stream_errors=True) as runner:
+            futures = [runner.change_device_settings(location_id=location.location_id, customization=customization)
+                       for location in locations]
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                print(result.job.location_name, result.job.latest_execution_status, len(result.errors))
+"""
+import asyncio
+import time
+from collections import deque
+from collections.abc import Generator, AsyncGenerator, Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from enum import Enum
+from threading import Lock, Condition, Thread
+from typing import Optional, Union, Any, TYPE_CHECKING
+
+from .as_rest import AsRestError
+from .common import DeviceCustomization
+from .rest import RestError
+from .telephony.jobs import StartJobResponse, NumberJob, JobErrorItem, ManageNumberErrorItem, NumberItem
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+    from .as_api import AsWebexSimpleApi
+
+__all__ = ['TERMINAL_STATUS', 'JobKind', 'PollPolicy', 'JobResult', 'JobFuture', 'AsJobFuture', 'JobRunner',
+           'AsJobRunner']
+
+#: values of latest_execution_status of jobs which are done
+TERMINAL_STATUS = frozenset(('COMPLETED', 'FAILED', 'STOPPED', 'ABANDONED'))
+
+JobStatus = Union[StartJobResponse, NumberJob]
+JobErrorType = Union[JobErrorItem, ManageNumberErrorItem]
+
+
+class JobKind(str, Enum):
+    device_settings = 'device_settings'
+    manage_numbers = 'manage_numbers'
+
+
+@dataclass
+class PollPolicy:
+    """
+    Delays between status requests for a job. The delay starts at `initial` and is multiplied by `factor` after each
+    request up to `maximum`. The same delays are used to retry starting a job after a 409.
+    """
+    #: delay before the first status request (seconds)
+    initial: float = 1.0
+    #: factor applied to the delay after each request
+    factor: float = 1.5
+    #: maximum delay between status requests (seconds)
+    maximum: float = 30.0
+    #: maximum time to wait for a job to start and complete (seconds); None: wait forever
+    timeout: Optional[float] = None
+
+    def delays(self) -> Generator[float, None, None]:
+        """
+        infinite sequence of delays
+        """
+        delay = self.initial
+        while True:
+            yield delay
+            delay = min(delay * self.factor, self.maximum)
+
+
+@dataclass
+class JobResult:
+    """
+    Result of a job
+    """
+    kind: JobKind
+    #: final status of the job
+    job: JobStatus
+    #: errors reported for the job
+    errors: list[JobErrorType] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """
+        job completed w/o errors
+        """
+        return self.job.latest_execution_status == 'COMPLETED' and not self.errors
+
+
+def _error_key(item: JobErrorType) -> str:
+    """
+    key to identify an error reported repeatedly while polling. item_number and tracking_id are optional for manage
+    numbers jobs: use the complete error
+    """
+    return item.json()
+
+
+def _may_have_errors(job: JobStatus, seen: int) -> bool:
+    """
+    check whether it's worth to request errors for a job. Manage numbers jobs report the number of failed numbers
+    """
+    if isinstance(job, NumberJob) and job.counts and job.counts.numbers_failed is not None:
+        return job.counts.numbers_failed > seen
+    return True
+
+
+class _JobState:
+    """
+    State of a job shared by sync and async futures
+    """
+
+    def __init__(self, kind: JobKind, org_id: Optional[str], args: dict[str, Any], attached_id: str = None):
+        self.kind = kind
+        self.org_id = org_id
+        #: parameters to start the job
+        self.args = args
+        #: id of a job started elsewhere which is only tracked
+        self.attached_id = attached_id
+        #: latest status of the job; None until the job is started
+        self.job: Optional[JobStatus] = None
+        self._errors: list[JobErrorType] = []
+        self._error_keys: set[str] = set()
+        self._finished = False
+
+    @property
+    def key(self) -> tuple[JobKind, Optional[str]]:
+        """
+        jobs with the same key are executed one after the other
+        """
+        return self.kind, self.org_id
+
+    @property
+    def error_count(self) -> int:
+        return len(self._errors)
+
+    def _add_errors(self, items: list[JobErrorType]) -> bool:
+        """
+        add new errors; return True if there were any
+        """
+        new = False
+        for item in items:
+            key = _error_key(item)
+            if key not in self._error_keys:
+                self._error_keys.add(key)
+                self._errors.append(item)
+                new = True
+        return new
+
+    def job_result(self) -> JobResult:
+        return JobResult(kind=self.kind, job=self.job, errors=list(self._errors))
+
+
+class JobFuture(Future, _JobState):
+    """
+    Future for a job executed by a :class:`JobRunner`. The result is a :class:`JobResult`
+    """
+
+    def __init__(self, kind: JobKind, org_id: Optional[str], args: dict[str, Any], attached_id: str = None):
+        Future.__init__(self)
+        _JobState.__init__(self, kind=kind, org_id=org_id, args=args, attached_id=attached_id)
+        self._error_condition = Condition()
+
+    def add_errors(self, items: list[JobErrorType]):
+        """
+        :meta private:
+        """
+        with self._error_condition:
+            if self._add_errors(items):
+                self._error_condition.notify_all()
+
+    def finish(self):
+        """
+        :meta private:
+        """
+        with self._error_condition:
+            self._finished = True
+            self._error_condition.notify_all()
+
+    def errors(self) -> Generator[JobErrorType, None, None]:
+        """
+        Errors of the job as they are reported. The generator ends when the job is done.
+        """
+        i = 0
+        while True:
+            with self._error_condition:
+                while i >= len(self._errors) and not self._finished:
+                    self._error_condition.wait()
+                new = self._errors[i:]
+                done = self._finished
+            i += len(new)
+            yield from new
+            if done and not new:
+                return
+
+
+class AsJobFuture(_JobState):
+    """
+    Awaitable for a job executed by an :class:`AsJobRunner`. The result is a :class:`JobResult`
+    """
+
+    def __init__(self, kind: JobKind, org_id: Optional[str], args: dict[str, Any], attached_id: str = None):
+        super().__init__(kind=kind, org_id=org_id, args=args, attached_id=attached_id)
+        self.future = asyncio.get_running_loop().create_future()
+        self._error_condition = asyncio.Condition()
+
+    def __await__(self):
+        return self.future.__await__()
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def result(self) -> JobResult:
+        return self.future.result()
+
+    def cancel(self) -> bool:
+        """
+        cancel a queued job; jobs already started can't be cancelled
+        """
+        if self.job is not None:
+            return False
+        return self.future.cancel()
+
+    async def add_errors(self, items: list[JobErrorType]):
+        """
+        :meta private:
+        """
+        async with self._error_condition:
+            if self._add_errors(items):
+                self._error_condition.notify_all()
+
+    async def finish(self):
+        """
+        :meta private:
+        """
+        async with self._error_condition:
+            self._finished = True
+            self._error_condition.notify_all()
+
+    async def errors(self) -> AsyncGenerator[JobErrorType, None]:
+        """
+        Errors of the job as they are reported. The generator ends when the job is done.
+        """
+        i = 0
+        while True:
+            async with self._error_condition:
+                await self._error_condition.wait_for(lambda: i < len(self._errors) or self._finished)
+                new = self._errors[i:]
+                done = self._finished
+            i += len(new)
+            for item in new:
+                yield item
+            if done and not new:
+                return
+
+
+class _RunnerBase:
+    """
+    Common code for sync and async runner
+    """
+
+    def __init__(self, poll: PollPolicy = None, stream_errors: bool = False,
+                 on_start: Callable[[_JobState], Any] = None):
+        self.poll = poll or PollPolicy()
+        self.stream_errors = stream_errors
+        self.on_start = on_start
+        #: queued jobs per key
+        self._queues: dict[tuple, deque] = {}
+        self._closed = False
+
+    def _started(self, state: _JobState):
+        if self.on_start is not None and state.attached_id is None:
+            self.on_start(state)
+
+    def _deadline(self) -> Optional[float]:
+        return self.poll.timeout and time.monotonic() + self.poll.timeout
+
+    @staticmethod
+    def _check_deadline(deadline: Optional[float], state: _JobState):
+        if deadline and time.monotonic() > deadline:
+            job_id = state.job and state.job.id
+            raise TimeoutError(f'{state.kind.value} job {job_id or "(not started)"} not done in time')
+
+    @staticmethod
+    def _device_settings_args(location_id: Optional[str], customization: DeviceCustomization,
+                              org_id: Optional[str]) -> dict[str, Any]:
+        return dict(location_id=location_id, customization=customization, org_id=org_id)
+
+    @staticmethod
+    def _manage_numbers_args(operation: str, target_location_id: str,
+                             number_list: list[NumberItem]) -> dict[str, Any]:
+        return dict(operation=operation, target_location_id=target_location_id, number_list=number_list)
+
+
+class JobRunner(_RunnerBase):
+    """
+    Execute jobs one after the other per organization and poll their status.
+
+    Each organization (and job type) with queued jobs is served by a worker thread.
+    """
+
+    def __init__(self, api: 'WebexSimpleApi', poll: PollPolicy = None, stream_errors: bool = False,
+                 on_start: Callable[[JobFuture], Any] = None):
+        """
+
+        :param api: API
+        :param poll: delays between status requests
+        :param stream_errors: request errors while jobs are running so that they can be consumed via
+            :meth:`JobFuture.errors` as they appear. Else errors are requested once when a job is done.
+        :param on_start: called with the future of a job once the job has been started; the job id is available as
+            `future.job.id`. Called from the worker thread.
+        """
+        super().__init__(poll=poll, stream_errors=stream_errors, on_start=on_start)
+        self.api = api
+        self._lock = Lock()
+        self._threads: list[Thread] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self, cancel: bool = False):
+        """
+        Stop accepting new jobs and wait for all queued jobs to complete
+
+        :param cancel: cancel queued jobs which haven't been started yet
+        """
+        with self._lock:
+            self._closed = True
+            if cancel:
+                for queue in self._queues.values():
+                    for future in queue:
+                        future.cancel()
+            threads = list(self._threads)
+        for thread in threads:
+            thread.join()
+
+    def change_device_settings(self, location_id: Optional[str], customization: DeviceCustomization,
+                               org_id: str = None) -> JobFuture:
+        """
+        Queue a job to change device settings; see :meth:`wxc_sdk.telephony.jobs.DeviceSettingsJobsApi.change`
+
+        :return: future for the job
+        """
+        return self._submit(JobFuture(kind=JobKind.device_settings, org_id=org_id,
+                                      args=self._device_settings_args(location_id, customization, org_id)))
+
+    def manage_numbers(self, operation: str, target_location_id: str, number_list: list[NumberItem]) -> JobFuture:
+        """
+        Queue a manage numbers job; see :meth:`wxc_sdk.telephony.jobs.ManageNumbersJobsApi.initiate_job`
+
+        :return: future for the job
+        """
+        return self._submit(JobFuture(kind=JobKind.manage_numbers, org_id=None,
+                                      args=self._manage_numbers_args(operation, target_location_id, number_list)))
+
+    def attach(self, kind: JobKind, job_id: str, org_id: str = None) -> JobFuture:
+        """
+        Track a job which was started elsewhere (for example by a previous run). The job is queued like any other job
+        so that subsequent jobs for the same organization are only started after this job is done.
+
+        :return: future for the job
+        """
+        return self._submit(JobFuture(kind=kind, org_id=org_id, args={}, attached_id=job_id))
+
+    def _submit(self, future: JobFuture) -> JobFuture:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('runner is closed')
+            queue = self._queues.get(future.key)
+            start = queue is None
+            if start:
+                queue = self._queues[future.key] = deque()
+            queue.append(future)
+            if start:
+                thread = Thread(target=self._work, args=(future.key,), daemon=True)
+                self._threads = [t for t in self._threads if t.is_alive()]
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def _work(self, key: tuple):
+        """
+        worker: execute the queued jobs for one key
+        """
+        while True:
+            with self._lock:
+                queue = self._queues[key]
+                if not queue:
+                    self._queues.pop(key)
+                    return
+                future = queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                future.finish()
+                continue
+            try:
+                result = self._execute(future)
+            except Exception as e:
+                future.finish()
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def _start(self, future: JobFuture, deadline: Optional[float]) -> JobStatus:
+        """
+        start a job; retry while another job is running
+        """
+        jobs = self.api.telephony.jobs
+        start: Callable[..., JobStatus] = (jobs.device_settings.change if future.kind == JobKind.device_settings
+                                           else jobs.manage_numbers.initiate_job)
+        if future.attached_id:
+            return self._status(future, job_id=future.attached_id)
+        for delay in self.poll.delays():
+            try:
+                return start(**future.args)
+            except RestError as e:
+                if e.response.status_code != 409:
+                    raise
+            self._check_deadline(deadline, future)
+            time.sleep(delay)
+
+    def _status(self, future: JobFuture, job_id: str = None) -> JobStatus:
+        jobs = self.api.telephony.jobs
+        job_id = job_id or future.job.id
+        if future.kind == JobKind.device_settings:
+            return jobs.device_settings.get_status(job_id=job_id, org_id=future.org_id)
+        return jobs.manage_numbers.job_status(job_id=job_id)
+
+    def _errors(self, future: JobFuture):
+        if not _may_have_errors(future.job, future.error_count):
+            return
+        jobs = self.api.telephony.jobs
+        if future.kind == JobKind.device_settings:
+            items = jobs.device_settings.job_errors(job_id=future.job.id, org_id=future.org_id)
+        else:
+            items = jobs.manage_numbers.list_job_errors(job_id=future.job.id, org_id=future.org_id)
+        future.add_errors(list(items))
+
+    def _execute(self, future: JobFuture) -> JobResult:
+        deadline = self._deadline()
+        future.job = self._start(future, deadline)
+        self._started(future)
+        delays = self.poll.delays()
+        while future.job.latest_execution_status not in TERMINAL_STATUS:
+            self._check_deadline(deadline, future)
+            time.sleep(next(delays))
+            future.job = self._status(future)
+            if self.stream_errors:
+                self._errors(future)
+        self._errors(future)
+        future.finish()
+        return future.job_result()
+
+
+class AsJobRunner(_RunnerBase):
+    """
+    Execute jobs one after the other per organization and poll their status using the async API.
+
+    Each organization (and job type) with queued jobs is served by a task.
+    """
+
+    def __init__(self, api: 'AsWebexSimpleApi', poll: PollPolicy = None, stream_errors: bool = False,
+                 on_start: Callable[[AsJobFuture], Any] = None):
+        """
+
+        :param api: API
+        :param poll: delays between status requests
+        :param stream_errors: request errors while jobs are running so that they can be consumed via
+            :meth:`AsJobFuture.errors` as they appear. Else errors are requested once when a job is done.
+        :param on_start: called with the future of a job once the job has been started; the job id is available as
+            `future.job.id`
+        """
+        super().__init__(poll=poll, stream_errors=stream_errors, on_start=on_start)
+        self.api = api
+        self._tasks: set[asyncio.Task] = set()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self, cancel: bool = False):
+        """
+        Stop accepting new jobs and wait for all queued jobs to complete
+
+        :param cancel: cancel queued jobs which haven't been started yet
+        """
+        self._closed = True
+        if cancel:
+            for queue in self._queues.values():
+                for future in queue:
+                    future.cancel()
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def change_device_settings(self, location_id: Optional[str], customization: DeviceCustomization,
+                               org_id: str = None) -> AsJobFuture:
+        """
+        Queue a job to change device settings; see :meth:`wxc_sdk.telephony.jobs.DeviceSettingsJobsApi.change`
+
+        :return: awaitable for the job
+        """
+        return self._submit(AsJobFuture(kind=JobKind.device_settings, org_id=org_id,
+                                        args=self._device_settings_args(location_id, customization, org_id)))
+
+    def manage_numbers(self, operation: str, target_location_id: str, number_list: list[NumberItem]) -> AsJobFuture:
+        """
+        Queue a manage numbers job; see :meth:`wxc_sdk.telephony.jobs.ManageNumbersJobsApi.initiate_job`
+
+        :return: awaitable for the job
+        """
+        return self._submit(AsJobFuture(kind=JobKind.manage_numbers, org_id=None,
+                                        args=self._manage_numbers_args(operation, target_location_id, number_list)))
+
+    def attach(self, kind: JobKind, job_id: str, org_id: str = None) -> AsJobFuture:
+        """
+        Track a job which was started elsewhere (for example by a previous run). The job is queued like any other job
+        so that subsequent jobs for the same organization are only started after this job is done.
+
+        :return: awaitable for the job
+        """
+        return self._submit(AsJobFuture(kind=kind, org_id=org_id, args={}, attached_id=job_id))
+
+    def _submit(self, future: AsJobFuture) -> AsJobFuture:
+        if self._closed:
+            raise RuntimeError('runner is closed')
+        queue = self._queues.get(future.key)
+        if queue is None:
+            queue = self._queues[future.key] = deque()
+            task = asyncio.create_task(self._work(future.key))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        queue.append(future)
+        return future
+
+    async def _work(self, key: tuple):
+        """
+        worker: execute the queued jobs for one key
+        """
+        queue = self._queues[key]
+        try:
+            while queue:
+                future = queue.popleft()
+                if future.future.done():
+                    # cancelled
+                    await future.finish()
+                    continue
+                try:
+                    result = await self._execute(future)
+                except Exception as e:
+                    await future.finish()
+                    future.future.set_exception(e)
+                else:
+                    future.future.set_result(result)
+        finally:
+            self._queues.pop(key, None)
+
+    async def _start(self, future: AsJobFuture, deadline: Optional[float]) -> JobStatus:
+        """
+        start a job; retry while another job is running
+        """
+        jobs = self.api.telephony.jobs
+        start = (jobs.device_settings.change if future.kind == JobKind.device_settings
+                 else jobs.manage_numbers.initiate_job)
+        if future.attached_id:
+            return await self._status(future, job_id=future.attached_id)
+        for delay in self.poll.delays():
+            try:
+                return await start(**future.args)
+            except AsRestError as e:
+                if e.status != 409:
+                    raise
+            self._check_deadline(deadline, future)
+            await asyncio.sleep(delay)
+
+    async def _status(self, future: AsJobFuture, job_id: str = None) -> JobStatus:
+        jobs = self.api.telephony.jobs
+        job_id = job_id or future.job.id
+        if future.kind == JobKind.device_settings:
+            return await jobs.device_settings.get_status(job_id=job_id, org_id=future.org_id)
+        return await jobs.manage_numbers.job_status(job_id=job_id)
+
+    async def _errors(self, future: AsJobFuture):
+        if not _may_have_errors(future.job, future.error_count):
+            return
+        jobs = self.api.telephony.jobs
+        if future.kind == JobKind.device_settings:
+            items = await jobs.device_settings.job_errors(job_id=future.job.id, org_id=future.org_id)
+        else:
+            items = await jobs.manage_numbers.list_job_errors(job_id=future.job.id, org_id=future.org_id)
+        await future.add_errors(items)
+
+    async def _execute(self, future: AsJobFuture) -> JobResult:
+        deadline = self._deadline()
+        future.job = await self._start(future, deadline)
+        self._started(future)
+        delays = self.poll.delays()
+        while future.job.latest_execution_status not in TERMINAL_STATUS:
+            self._check_deadline(deadline, future)
+            await asyncio.sleep(next(delays))
+            future.job = await self._status(future)
+            if self.stream_errors:
+                await self._errors(future)
+        await self._errors(future)
+        await future.finish()
+        return future.job_result()
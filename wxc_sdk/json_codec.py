@@ -0,0 +1,196 @@
+"""
+Pluggable JSON codec
+
+All JSON encoding and decoding of the SDK goes through the current codec:
+
+* response bodies in :class:`wxc_sdk.rest.RestSession` and :class:`wxc_sdk.as_rest.AsRestSession`
+* JSON request bodies passed as `json` to the sessions
+* :meth:`wxc_sdk.base.ApiModel.json` and :meth:`wxc_sdk.base.ApiModel.parse_raw`
+* entries of the response cache (:class:`wxc_sdk.cache.ResponseCache`)
+
+By default `orjson` is used if installed; else the standard library `json` module. The codec can be selected
+explicitly by calling :func:`set_json_codec` or by setting the `WXC_SDK_JSON_CODEC` environment variable to `json`,
+`orjson`, or `ujson` before importing wxc_sdk.
+
+Example:
+
+    .. code-block:: python
+
+        from wxc_sdk.json_codec import set_json_codec
+
+        set_json_codec('ujson')
+"""
+import json
+import logging
+import os
+from typing import Any, Callable, Optional, Union
+
+__all__ = ['JsonCodec', 'StdJsonCodec', 'OrjsonCodec', 'UjsonCodec', 'json_codec', 'set_json_codec', 'json_loads',
+           'json_dumps']
+
+log = logging.getLogger(__name__)
+
+
+class JsonCodec:
+    """
+    Base class for JSON codecs
+    """
+    #: name of the codec; can be used in :func:`set_json_codec`
+    name: str = ''
+
+    def loads(self, s: Union[str, bytes]) -> Any:
+        """
+        Decode JSON
+
+        :param s: JSON string or UTF-8 encoded bytes
+        :return: decoded object
+        """
+        raise NotImplementedError
+
+    def dumps(self, obj: Any, *, default: Callable[[Any], Any] = None, **kwargs) -> str:
+        """
+        Encode an object as JSON
+
+        :param obj: object to encode
+        :param default: called for objects that can't be serialized otherwise
+        :param kwargs: additional arguments for :func:`json.dumps` like `indent`. Codecs not supporting the arguments
+            fall back to the standard library
+        :return: JSON string
+        """
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}()'
+
+
+class StdJsonCodec(JsonCodec):
+    """
+    Codec based on the standard library `json` module
+    """
+    name = 'json'
+
+    def loads(self, s: Union[str, bytes]) -> Any:
+        return json.loads(s)
+
+    def dumps(self, obj: Any, *, default: Callable[[Any], Any] = None, **kwargs) -> str:
+        return json.dumps(obj, default=default, **kwargs)
+
+
+#: the standard library codec; fallback for other codecs
+_std_codec = StdJsonCodec()
+
+
+class OrjsonCodec(JsonCodec):
+    """
+    Codec based on `orjson`. Requires orjson.
+
+    Datetime objects and dataclasses are passed to the `default` function so that the serialization of models (for
+    example custom `json_encoders`) is the same as with the standard library. Output is compact (no whitespace).
+    """
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._loads = orjson.loads
+        self._dumps = orjson.dumps
+        self._option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def loads(self, s: Union[str, bytes]) -> Any:
+        return self._loads(s)
+
+    def dumps(self, obj: Any, *, default: Callable[[Any], Any] = None, **kwargs) -> str:
+        if kwargs:
+            return _std_codec.dumps(obj, default=default, **kwargs)
+        try:
+            return self._dumps(obj, default=default, option=self._option).decode()
+        except self._orjson.JSONEncodeError:
+            # for example integers exceeding 64 bit
+            return _std_codec.dumps(obj, default=default)
+
+
+class UjsonCodec(JsonCodec):
+    """
+    Codec based on `ujson`. Requires ujson.
+    """
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._loads = ujson.loads
+        self._dumps = ujson.dumps
+
+    def loads(self, s: Union[str, bytes]) -> Any:
+        return self._loads(s)
+
+    def dumps(self, obj: Any, *, default: Callable[[Any], Any] = None, **kwargs) -> str:
+        if kwargs:
+            return _std_codec.dumps(obj, default=default, **kwargs)
+        return self._dumps(obj, default=default, ensure_ascii=False, escape_forward_slashes=False)
+
+
+CODECS = {codec.name: codec for codec in (StdJsonCodec, OrjsonCodec, UjsonCodec)}
+
+
+def _auto_codec() -> JsonCodec:
+    """
+    Codec selected by WXC_SDK_JSON_CODEC environment variable; orjson if installed, else standard library
+
+    :meta private:
+    """
+    name = os.getenv('WXC_SDK_JSON_CODEC')
+    if name:
+        try:
+            return CODECS[name]()
+        except (KeyError, ImportError) as e:
+            log.warning(f'JSON codec "{name}" not available: {e!r}')
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return _std_codec
+
+
+_codec: JsonCodec = _auto_codec()
+
+
+def json_codec() -> JsonCodec:
+    """
+    Current JSON codec
+    """
+    return _codec
+
+
+def set_json_codec(codec: Optional[Union[str, JsonCodec]]) -> JsonCodec:
+    """
+    Set the JSON codec used by the SDK
+
+    :param codec: codec instance or name of a codec: 'json', 'orjson', or 'ujson'. None: automatic selection
+    :type codec: Union[str, JsonCodec]
+    :return: previous codec
+    :raises ImportError: if the package for a codec selected by name is not installed
+    """
+    global _codec
+    previous = _codec
+    if codec is None:
+        codec = _auto_codec()
+    elif isinstance(codec, str):
+        try:
+            codec = CODECS[codec]()
+        except KeyError:
+            raise ValueError(f'unknown JSON codec: {codec}')
+    _codec = codec
+    return previous
+
+
+def json_loads(s: Union[str, bytes]) -> Any:
+    """
+    Decode JSON using the current codec
+    """
+    return _codec.loads(s)
+
+
+def json_dumps(obj: Any, *, default: Callable[[Any], Any] = None, **kwargs) -> str:
+    """
+    Encode JSON using the current codec
+    """
+    return _codec.dumps(obj, default=default, **kwargs)
@@ -1,7 +1,7 @@
 __all__ = ['ClosedCaption', 'CCSnippet', 'MeetingClosedCaptionsApi']
 
 from collections.abc import Generator
-from typing import Optional
+from typing import Optional, Union, BinaryIO
 
 from ...api_child import ApiChild
 from ...base import ApiModel
@@ -89,11 +89,14 @@ class MeetingClosedCaptionsApi(ApiChild, base='meetingClosedCaptions'):
         url = self.ep(f'{closed_caption_id}/snippets')
         return self.session.follow_pagination(url=url, model=CCSnippet, params=params)
 
-    def download_snippets(self, closed_caption_id: str, meeting_id: str, format: str = None):
+    def download_snippets(self, closed_caption_id: str, meeting_id: str, format: str = None) -> str:
         """
         Download meeting closed caption snippets from the meeting closed caption specified by closedCaptionId formatted
         either as a Video Text Track (.vtt) file or plain text (.txt) file.
 
+        The content is held in memory. Use :meth:`download_snippets_chunks` or :meth:`download_snippets_to_file` for
+        streaming downloads.
+
         :param closed_caption_id: Unique identifier for the meeting closed caption.
         :type closed_caption_id: str
         :param meeting_id: Unique identifier for the meeting instance which the closed caption snippets belong to. This
@@ -102,12 +105,105 @@ class MeetingClosedCaptionsApi(ApiChild, base='meetingClosedCaptions'):
         :type meeting_id: str
         :param format: Format for the downloaded meeting closed caption snippets. Possible values: vtt, txt
         :type format: str
+        :return: closed caption snippets
+        :rtype: str
         """
-        # TODO: verify return and adapt
         params = {}
         params['meetingId'] = meeting_id
         if format is not None:
             params['format'] = format
         url = self.ep(f'{closed_caption_id}/download')
-        super().get(url=url, params=params)
-        return
+        return super().get(url=url, params=params)
+
+    def download_snippets_chunks(self, closed_caption_id: str, meeting_id: str, format: str = None,
+                                 chunk_size: int = None) -> Generator[bytes, None, None]:
+        """
+        Download meeting closed caption snippets and yield the content in chunks. The content is never held in
+        memory as a whole.
+
+        :param closed_caption_id: Unique identifier for the meeting closed caption.
+        :type closed_caption_id: str
+        :param meeting_id: Unique identifier for the meeting instance which the closed caption snippets belong to.
+        :type meeting_id: str
+        :param format: Format for the downloaded meeting closed caption snippets. Possible values: vtt, txt
+        :type format: str
+        :param chunk_size: size of the chunks; default: 64 KiB
+        :type chunk_size: int
+        :return: yields chunks of the content (bytes)
+        """
+        '''async
+    async def download_snippets_chunks(self, closed_caption_id: str, meeting_id: str, format: str = None,
+                                       chunk_size: int = None) -> AsyncGenerator[bytes, None, None]:
+        """
+        Download meeting closed caption snippets and yield the content in chunks. The content is never held in
+        memory as a whole.
+
+        :param closed_caption_id: Unique identifier for the meeting closed caption.
+        :type closed_caption_id: str
+        :param meeting_id: Unique identifier for the meeting instance which the closed caption snippets belong to.
+        :type meeting_id: str
+        :param format: Format for the downloaded meeting closed caption snippets. Possible values: vtt, txt
+        :type format: str
+        :param chunk_size: size of the chunks; default: 64 KiB
+        :type chunk_size: int
+        :return: yields chunks of the content (bytes)
+        """
+        params = {'meetingId': meeting_id}
+        if format is not None:
+            params['format'] = format
+        url = self.ep(f'{closed_caption_id}/download')
+        async for chunk in self.session.rest_stream(url=url, params=params, chunk_size=chunk_size):
+            yield chunk
+        '''
+        params = {'meetingId': meeting_id}
+        if format is not None:
+            params['format'] = format
+        url = self.ep(f'{closed_caption_id}/download')
+        yield from self.session.rest_stream(url=url, params=params, chunk_size=chunk_size)
+
+    def download_snippets_to_file(self, closed_caption_id: str, meeting_id: str, file: Union[str, BinaryIO],
+                                  format: str = None) -> int:
+        """
+        Download meeting closed caption snippets and write them to a file chunk by chunk.
+
+        :param closed_caption_id: Unique identifier for the meeting closed caption.
+        :type closed_caption_id: str
+        :param meeting_id: Unique identifier for the meeting instance which the closed caption snippets belong to.
+        :type meeting_id: str
+        :param file: path of the file to write to or a binary file-like object (sink). A file at the given path is
+            only created once the download is complete.
+        :type file: Union[str, BinaryIO]
+        :param format: Format for the downloaded meeting closed caption snippets. Possible values: vtt, txt
+        :type format: str
+        :return: number of bytes written
+        :rtype: int
+        """
+        '''async
+    async def download_snippets_to_file(self, closed_caption_id: str, meeting_id: str, file: Union[str, BinaryIO],
+                                        format: str = None) -> int:
+        """
+        Download meeting closed caption snippets and write them to a file chunk by chunk.
+
+        :param closed_caption_id: Unique identifier for the meeting closed caption.
+        :type closed_caption_id: str
+        :param meeting_id: Unique identifier for the meeting instance which the closed caption snippets belong to.
+        :type meeting_id: str
+        :param file: path of the file to write to or a binary file-like object (sink). A file at the given path is
+            only created once the download is complete.
+        :type file: Union[str, BinaryIO]
+        :param format: Format for the downloaded meeting closed caption snippets. Possible values: vtt, txt
+        :type format: str
+        :return: number of bytes written
+        :rtype: int
+        """
+        params = {'meetingId': meeting_id}
+        if format is not None:
+            params['format'] = format
+        url = self.ep(f'{closed_caption_id}/download')
+        return await self.session.rest_download(url=url, file=file, params=params)
+        '''
+        params = {'meetingId': meeting_id}
+        if format is not None:
+            params['format'] = format
+        url = self.ep(f'{closed_caption_id}/download')
+        return self.session.rest_download(url=url, file=file, params=params)
@@ -2,7 +2,7 @@
 Meeting transcripts API
 """
 from collections.abc import Generator
-from typing import Optional
+from typing import Optional, Union, BinaryIO
 
 from ...api_child import ApiChild
 from ...base import ApiModel
@@ -158,10 +158,13 @@ class MeetingTranscriptsApi(ApiChild, base=''):
         url = self.ep('admin/meetingTranscripts')
         return self.session.follow_pagination(url=url, model=Transcript, params=params)
 
-    def download(self, transcript_id: str, format: str = None, host_email: str = None):
+    def download(self, transcript_id: str, format: str = None, host_email: str = None) -> str:
         """
         Download a meeting transcript from the meeting transcript specified by transcriptId.
 
+        The transcript is held in memory. Use :meth:`download_chunks` or :meth:`download_to_file` for streaming
+        downloads.
+
         :param transcript_id: Unique identifier for the meeting transcript.
         :type transcript_id: str
         :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
@@ -171,6 +174,9 @@ class MeetingTranscriptsApi(ApiChild, base=''):
             they manage and the API will return details for a meeting that is hosted by that user.
         :type host_email: str
 
+        :return: transcript content
+        :rtype: str
+
         documentation: https://developer.webex.com/docs/api/v1/meeting-transcripts/download-a-meeting-transcript
         """
         params = {}
@@ -179,8 +185,108 @@ class MeetingTranscriptsApi(ApiChild, base=''):
         if host_email is not None:
             params['hostEmail'] = host_email
         url = self.ep(f'meetingTranscripts/{transcript_id}/download')
-        super().get(url=url, params=params)
-        # TODO: fix. Find out what the actual return type is
+        return super().get(url=url, params=params)
+
+    def download_chunks(self, transcript_id: str, format: str = None, host_email: str = None,
+                        chunk_size: int = None) -> Generator[bytes, None, None]:
+        """
+        Download a meeting transcript and yield the content in chunks. The transcript is never held in memory as a
+        whole.
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host.
+        :type host_email: str
+        :param chunk_size: size of the chunks; default: 64 KiB
+        :type chunk_size: int
+        :return: yields chunks of the transcript (bytes)
+        """
+        '''async
+    async def download_chunks(self, transcript_id: str, format: str = None, host_email: str = None,
+                              chunk_size: int = None) -> AsyncGenerator[bytes, None, None]:
+        """
+        Download a meeting transcript and yield the content in chunks. The transcript is never held in memory as a
+        whole.
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host.
+        :type host_email: str
+        :param chunk_size: size of the chunks; default: 64 KiB
+        :type chunk_size: int
+        :return: yields chunks of the transcript (bytes)
+        """
+        params = {}
+        if format is not None:
+            params['format'] = format
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep(f'meetingTranscripts/{transcript_id}/download')
+        async for chunk in self.session.rest_stream(url=url, params=params, chunk_size=chunk_size):
+            yield chunk
+        '''
+        params = {}
+        if format is not None:
+            params['format'] = format
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep(f'meetingTranscripts/{transcript_id}/download')
+        yield from self.session.rest_stream(url=url, params=params, chunk_size=chunk_size)
+
+    def download_to_file(self, transcript_id: str, file: Union[str, BinaryIO], format: str = None,
+                         host_email: str = None) -> int:
+        """
+        Download a meeting transcript and write it to a file chunk by chunk.
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param file: path of the file to write to or a binary file-like object (sink). A file at the given path is
+            only created once the download is complete.
+        :type file: Union[str, BinaryIO]
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host.
+        :type host_email: str
+        :return: number of bytes written
+        :rtype: int
+        """
+        '''async
+    async def download_to_file(self, transcript_id: str, file: Union[str, BinaryIO], format: str = None,
+                               host_email: str = None) -> int:
+        """
+        Download a meeting transcript and write it to a file chunk by chunk.
+
+        :param transcript_id: Unique identifier for the meeting transcript.
+        :type transcript_id: str
+        :param file: path of the file to write to or a binary file-like object (sink). A file at the given path is
+            only created once the download is complete.
+        :type file: Union[str, BinaryIO]
+        :param format: Format for the downloaded meeting transcript. Possible values: vtt, txt
+        :type format: str
+        :param host_email: Email address for the meeting host.
+        :type host_email: str
+        :return: number of bytes written
+        :rtype: int
+        """
+        params = {}
+        if format is not None:
+            params['format'] = format
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep(f'meetingTranscripts/{transcript_id}/download')
+        return await self.session.rest_download(url=url, file=file, params=params)
+        '''
+        params = {}
+        if format is not None:
+            params['format'] = format
+        if host_email is not None:
+            params['hostEmail'] = host_email
+        url = self.ep(f'meetingTranscripts/{transcript_id}/download')
+        return self.session.rest_download(url=url, file=file, params=params)
 
     def list_snippets(self, transcript_id: str, **params) -> Generator[TranscriptSnippet, None, None]:
         """
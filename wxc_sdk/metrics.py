@@ -0,0 +1,404 @@
+"""
+Request metrics and tracing hooks for REST sessions
+
+:class:`RequestHooks` instances passed to :class:`wxc_sdk.rest.RestSession` or :class:`wxc_sdk.as_rest.AsRestSession`
+(`request_hooks` parameter) are notified about each request sent to Webex, about retries, and about time spent
+waiting for the rate limiter or for the Retry-After time of 429 responses. Requests served from the response cache
+or coalesced with other requests are not reported.
+
+URLs are reduced to endpoint templates (:func:`url_template`): path segments which look like ids, numbers, phone
+numbers or email addresses are replaced with {id} to keep the number of distinct endpoints low.
+
+* :class:`RequestMetrics` aggregates metrics in memory: latency histograms and status counts per endpoint template,
+  429 counts, retries, time slept, bytes sent and received, and in-flight requests. Metrics can be exported in the
+  Prometheus text format
+* :class:`OpenTelemetryHooks` records metrics and spans with OpenTelemetry. Requires opentelemetry-api.
+
+Example:
+
+    .. code-block:: python
+
+        metrics = RequestMetrics()
+        api = WebexSimpleApi(tokens=tokens, request_hooks=[metrics])
+        ...
+        print(metrics.prometheus())
+"""
+import bisect
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from threading import Lock
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+__all__ = ['url_template', 'RequestHooks', 'EndpointStats', 'RequestMetrics', 'OpenTelemetryHooks',
+           'DEFAULT_BUCKETS']
+
+log = logging.getLogger(__name__)
+
+#: default upper bounds (in seconds) of the latency histogram buckets
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# a path segment is an id if it contains a digit and is long enough (Webex ids, UUIDs, MAC addresses), or if it's a
+# number, a phone number, or an email address
+_ID_SEGMENT = re.compile(r'(?=.*\d)[^/]{8,}|\d+|(?:\+|%2B).+|.*(?:@|%40).*', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _path_template(path: str) -> str:
+    return '/'.join('{id}' if _ID_SEGMENT.fullmatch(segment) else segment for segment in path.split('/'))
+
+
+def url_template(url: str) -> str:
+    """
+    Endpoint template for a URL: URL path with id segments replaced by {id}
+
+    .. code-block:: python
+
+        url_template('https://webexapis.com/v1/people/Y2lzY29zcGFyazovL3VzL1BFT1BMRS8xMjM?callingData=true')
+        # '/v1/people/{id}'
+
+    :param url: request URL
+    :return: template
+    """
+    return _path_template(urlparse(url).path)
+
+
+class RequestHooks:
+    """
+    Base class for request hooks. All methods are no-ops; subclasses override the methods they need.
+
+    Hooks are called from the threads (sync) or tasks (async) sending the requests and must be thread safe. Exceptions
+    raised by hooks are logged and ignored.
+    """
+
+    def request_start(self, method: str, template: str) -> Any:
+        """
+        A request is about to be sent
+
+        :param method: HTTP method
+        :param template: endpoint template; see :func:`url_template`
+        :return: context passed to :meth:`request_end`
+        """
+        return None
+
+    def request_end(self, context: Any, method: str, template: str, status: Optional[int], elapsed: float,
+                    bytes_out: int, bytes_in: int, error: Optional[BaseException]):
+        """
+        A request has completed
+
+        :param context: return value of :meth:`request_start`
+        :param method: HTTP method
+        :param template: endpoint template
+        :param status: HTTP status; None if no response was received
+        :param elapsed: duration of the request in seconds
+        :param bytes_out: size of the request body
+        :param bytes_in: size of the response body
+        :param error: exception if the request failed (HTTP error or connection error)
+        """
+        pass
+
+    def retry(self, method: str, template: str, status: int, retry_after: float):
+        """
+        A failed request (429) will be retried
+
+        :param method: HTTP method
+        :param template: endpoint template
+        :param status: HTTP status of the failed request
+        :param retry_after: Retry-After time in seconds
+        """
+        pass
+
+    def sleep(self, seconds: float, reason: str):
+        """
+        A request was held back
+
+        :param seconds: time in seconds
+        :param reason: 'rate_limiter': wait for the rate limiter, 'retry_after': wait for the Retry-After time of a 429
+            response before retrying, 'backoff': wait for the Retry-After time of a 429 response to some other request
+        """
+        pass
+
+
+def call_hooks(hooks: list[RequestHooks], name: str, *args) -> list[Any]:
+    """
+    Call a hook method on all hooks; exceptions are logged
+
+    :meta private:
+    """
+    results = []
+    for hook in hooks:
+        try:
+            results.append(getattr(hook, name)(*args))
+        except Exception as e:
+            log.warning(f'{hook.__class__.__name__}.{name}() failed: {e!r}')
+            results.append(None)
+    return results
+
+
+def request_end(hooks: list[RequestHooks], contexts: list[Any], method: str, template: str, status: Optional[int],
+                elapsed: float, bytes_out: int, bytes_in: int, error: Optional[BaseException]):
+    """
+    Call :meth:`RequestHooks.request_end` on all hooks
+
+    :meta private:
+    """
+    for hook, context in zip(hooks, contexts):
+        try:
+            hook.request_end(context, method, template, status, elapsed, bytes_out, bytes_in, error)
+        except Exception as e:
+            log.warning(f'{hook.__class__.__name__}.request_end() failed: {e!r}')
+
+
+def body_size(body: Any) -> int:
+    """
+    Size of a request or response body
+
+    :meta private:
+    """
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode())
+    return 0
+
+
+@dataclass
+class EndpointStats:
+    """
+    Metrics for one endpoint template and method
+    """
+    #: number of requests
+    requests: int = 0
+    #: number of requests by HTTP status; status 0: no response
+    status: dict[int, int] = field(default_factory=lambda: defaultdict(int))
+    #: number of requests per latency histogram bucket; last bucket: +Inf
+    buckets: list[int] = field(default_factory=list)
+    #: total latency in seconds
+    latency: float = 0.0
+    #: maximum latency in seconds
+    max_latency: float = 0.0
+    #: total size of request bodies
+    bytes_out: int = 0
+    #: total size of response bodies
+    bytes_in: int = 0
+    #: number of retries
+    retries: int = 0
+
+    @property
+    def throttled(self) -> int:
+        """
+        number of 429 responses
+        """
+        return self.status.get(429, 0)
+
+    @property
+    def avg_latency(self) -> float:
+        return self.requests and self.latency / self.requests
+
+
+class RequestMetrics(RequestHooks):
+    """
+    In-memory request metrics. Thread safe; can be shared by multiple sessions.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+
+        :param buckets: upper bounds of the latency histogram buckets in seconds
+        :type buckets: tuple[float, ...]
+        """
+        self.bucket_bounds = tuple(sorted(buckets))
+        self._lock = Lock()
+        #: metrics by (method, endpoint template)
+        self.endpoints: dict[tuple[str, str], EndpointStats] = dict()
+        #: total time slept in seconds by reason; see :meth:`RequestHooks.sleep`
+        self.sleep_seconds: dict[str, float] = defaultdict(float)
+        #: number of requests currently in flight
+        self.in_flight = 0
+        #: maximum number of requests in flight
+        self.max_in_flight = 0
+
+    def _stats(self, method: str, template: str) -> EndpointStats:
+        key = (method, template)
+        stats = self.endpoints.get(key)
+        if stats is None:
+            stats = EndpointStats(buckets=[0] * (len(self.bucket_bounds) + 1))
+            self.endpoints[key] = stats
+        return stats
+
+    def request_start(self, method: str, template: str) -> Any:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def request_end(self, context: Any, method: str, template: str, status: Optional[int], elapsed: float,
+                    bytes_out: int, bytes_in: int, error: Optional[BaseException]):
+        with self._lock:
+            self.in_flight -= 1
+            stats = self._stats(method, template)
+            stats.requests += 1
+            stats.status[status or 0] += 1
+            stats.buckets[bisect.bisect_left(self.bucket_bounds, elapsed)] += 1
+            stats.latency += elapsed
+            stats.max_latency = max(stats.max_latency, elapsed)
+            stats.bytes_out += bytes_out
+            stats.bytes_in += bytes_in
+
+    def retry(self, method: str, template: str, status: int, retry_after: float):
+        with self._lock:
+            self._stats(method, template).retries += 1
+
+    def sleep(self, seconds: float, reason: str):
+        with self._lock:
+            self.sleep_seconds[reason] += seconds
+
+    @property
+    def requests(self) -> int:
+        """
+        total number of requests
+        """
+        return sum(stats.requests for stats in self.endpoints.values())
+
+    @property
+    def throttled(self) -> int:
+        """
+        total number of 429 responses
+        """
+        return sum(stats.throttled for stats in self.endpoints.values())
+
+    def reset(self):
+        """
+        Reset all metrics except the in-flight gauge
+        """
+        with self._lock:
+            self.endpoints.clear()
+            self.sleep_seconds.clear()
+            self.max_in_flight = self.in_flight
+
+    def snapshot(self) -> dict:
+        """
+        Metrics as dict (JSON serializable)
+        """
+        with self._lock:
+            return {'in_flight': self.in_flight,
+                    'max_in_flight': self.max_in_flight,
+                    'sleep_seconds': dict(self.sleep_seconds),
+                    'endpoints': [{'method': method,
+                                   'endpoint': template,
+                                   'requests': stats.requests,
+                                   'status': {str(k): v for k, v in stats.status.items()},
+                                   'avg_latency': stats.avg_latency,
+                                   'max_latency': stats.max_latency,
+                                   'bytes_out': stats.bytes_out,
+                                   'bytes_in': stats.bytes_in,
+                                   'retries': stats.retries}
+                                  for (method, template), stats in self.endpoints.items()]}
+
+    def prometheus(self, prefix: str = 'wxc_sdk') -> str:
+        """
+        Metrics in the Prometheus text exposition format
+
+        :param prefix: prefix for metric names
+        :return: text to be served on a /metrics endpoint
+        """
+
+        def labels(**kwargs) -> str:
+            values = ','.join(f'{k}="{v}"' for k, v in kwargs.items())
+            return f'{{{values}}}'
+
+        lines = []
+        with self._lock:
+            endpoints = sorted(self.endpoints.items())
+            name = f'{prefix}_request_duration_seconds'
+            lines.append(f'# TYPE {name} histogram')
+            for (method, template), stats in endpoints:
+                cumulative = 0
+                for bound, count in zip(self.bucket_bounds + ('+Inf',), stats.buckets):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{labels(method=method, endpoint=template, le=bound)} {cumulative}')
+                lines.append(f'{name}_sum{labels(method=method, endpoint=template)} {stats.latency}')
+                lines.append(f'{name}_count{labels(method=method, endpoint=template)} {stats.requests}')
+            name = f'{prefix}_responses_total'
+            lines.append(f'# TYPE {name} counter')
+            for (method, template), stats in endpoints:
+                for status, count in sorted(stats.status.items()):
+                    lines.append(f'{name}{labels(method=method, endpoint=template, status=status)} {count}')
+            for metric, attr in (('request_bytes_total', 'bytes_out'), ('response_bytes_total', 'bytes_in'),
+                                 ('retries_total', 'retries')):
+                name = f'{prefix}_{metric}'
+                lines.append(f'# TYPE {name} counter')
+                for (method, template), stats in endpoints:
+                    lines.append(f'{name}{labels(method=method, endpoint=template)} {getattr(stats, attr)}')
+            name = f'{prefix}_throttled_total'
+            lines.append(f'# TYPE {name} counter')
+            lines.append(f'{name} {sum(stats.throttled for _, stats in endpoints)}')
+            name = f'{prefix}_sleep_seconds_total'
+            lines.append(f'# TYPE {name} counter')
+            for reason, seconds in sorted(self.sleep_seconds.items()):
+                lines.append(f'{name}{labels(reason=reason)} {seconds}')
+            name = f'{prefix}_requests_in_flight'
+            lines.append(f'# TYPE {name} gauge')
+            lines.append(f'{name} {self.in_flight}')
+        return '\n'.join(lines) + '\n'
+
+
+class OpenTelemetryHooks(RequestHooks):
+    """
+    Record metrics and client spans with OpenTelemetry. Requires opentelemetry-api.
+
+    Metrics: wxc_sdk.request.duration (histogram, s), wxc_sdk.request.size and wxc_sdk.response.size (counters,
+    By), wxc_sdk.retries (counter), wxc_sdk.sleep (counter, s), and wxc_sdk.requests.in_flight (up/down counter).
+    """
+
+    def __init__(self, meter: 'opentelemetry.metrics.Meter' = None, tracer: 'opentelemetry.trace.Tracer' = None,
+                 spans: bool = True):
+        """
+
+        :param meter: meter to use. Default: meter 'wxc_sdk' of the global meter provider
+        :param tracer: tracer to use. Default: tracer 'wxc_sdk' of the global tracer provider
+        :param spans: create a client span for each request
+        :type spans: bool
+        """
+        from opentelemetry import metrics, trace
+
+        meter = meter or metrics.get_meter('wxc_sdk')
+        self._tracer = (tracer or trace.get_tracer('wxc_sdk')) if spans else None
+        self._span_kind = trace.SpanKind.CLIENT
+        self._status_error = trace.StatusCode.ERROR
+        self._duration = meter.create_histogram('wxc_sdk.request.duration', unit='s')
+        self._bytes_out = meter.create_counter('wxc_sdk.request.size', unit='By')
+        self._bytes_in = meter.create_counter('wxc_sdk.response.size', unit='By')
+        self._retries = meter.create_counter('wxc_sdk.retries')
+        self._sleep = meter.create_counter('wxc_sdk.sleep', unit='s')
+        self._in_flight = meter.create_up_down_counter('wxc_sdk.requests.in_flight')
+
+    def request_start(self, method: str, template: str) -> Any:
+        self._in_flight.add(1)
+        if self._tracer is None:
+            return None
+        return self._tracer.start_span(f'{method} {template}', kind=self._span_kind,
+                                       attributes={'http.method': method, 'http.route': template})
+
+    def request_end(self, context: Any, method: str, template: str, status: Optional[int], elapsed: float,
+                    bytes_out: int, bytes_in: int, error: Optional[BaseException]):
+        attributes = {'http.method': method, 'http.route': template, 'http.status_code': status or 0}
+        self._in_flight.add(-1)
+        self._duration.record(elapsed, attributes=attributes)
+        self._bytes_out.add(bytes_out, attributes=attributes)
+        self._bytes_in.add(bytes_in, attributes=attributes)
+        if context is not None:
+            if status:
+                context.set_attribute('http.status_code', status)
+            if error is not None:
+                context.record_exception(error)
+                context.set_status(self._status_error)
+            context.end()
+
+    def retry(self, method: str, template: str, status: int, retry_after: float):
+        self._retries.add(1, attributes={'http.method': method, 'http.route': template})
+
+    def sleep(self, seconds: float, reason: str):
+        self._sleep.add(seconds, attributes={'reason': reason})
@@ -0,0 +1,384 @@
+"""
+Move large numbers of phone numbers between locations
+
+:meth:`wxc_sdk.telephony.jobs.ManageNumbersJobsApi.initiate_job` only accepts a limited number of numbers per job and
+only one job runs at a time. :class:`NumberMover` (and :class:`AsNumberMover` for the async API) take care of moving
+any number of numbers to a target location:
+
+* numbers are split into batches of at most :data:`MAX_NUMBERS_PER_JOB` numbers (see :func:`batch_numbers`)
+* jobs are executed by a :class:`wxc_sdk.job_runner.JobRunner`: the next job is started as soon as the previous job
+  is done
+* errors of all jobs are collected (:class:`MoveSummary`)
+* progress is recorded in an optional checkpoint file. When run again with the same checkpoint, numbers already moved
+  are skipped, jobs still running are tracked instead of being started again, and paused jobs are resumed. Numbers of
+  jobs which failed or were abandoned and numbers which failed in completed jobs are moved again
+
+Example:
+
+    .. code-block:: python
+
+        mover = NumberMover(api, target_location_id=target.location_id, checkpoint='move.jsonl')
+        summary = mover.move([NumberItem(location_id=source.location_id, numbers=numbers)])
+        print(f'moved {summary.moved} numbers, failed: {summary.failed}')
+"""
+import asyncio
+import json
+import os
+import time
+from collections.abc import Generator, AsyncGenerator, Iterable
+from concurrent.futures import as_completed, CancelledError
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Optional, Union, Any, TYPE_CHECKING
+
+from .job_runner import JobRunner, AsJobRunner, JobKind, PollPolicy, JobFuture, AsJobFuture
+from .json_codec import json_dumps
+from .telephony.jobs import NumberItem, NumberJob, ManageNumberErrorItem
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+    from .as_api import AsWebexSimpleApi
+
+__all__ = ['MAX_NUMBERS_PER_JOB', 'batch_numbers', 'MoveBatchResult', 'MoveSummary', 'NumberMover', 'AsNumberMover']
+
+#: maximum number of numbers in a single manage numbers job
+MAX_NUMBERS_PER_JOB = 1000
+
+#: job status values after which the numbers of a job are moved again
+_RETRY_STATUS = frozenset(('FAILED', 'ABANDONED'))
+
+
+def batch_numbers(number_list: Iterable[NumberItem],
+                  batch_size: int = MAX_NUMBERS_PER_JOB) -> list[list[NumberItem]]:
+    """
+    Split numbers into batches for manage numbers jobs. Numbers from the same source location are combined; each
+    batch has at most `batch_size` numbers and all batches but the last one are full.
+
+    :param number_list: numbers to move
+    :param batch_size: maximum number of numbers per batch
+    :return: list of batches
+    """
+    by_location: dict[Optional[str], list[str]] = {}
+    for item in number_list:
+        by_location.setdefault(item.location_id, []).extend(item.numbers or [])
+    batches: list[list[NumberItem]] = []
+    batch: list[NumberItem] = []
+    size = 0
+    for location_id, numbers in by_location.items():
+        while numbers:
+            chunk, numbers = numbers[:batch_size - size], numbers[batch_size - size:]
+            batch.append(NumberItem(location_id=location_id, numbers=chunk))
+            size += len(chunk)
+            if size == batch_size:
+                batches.append(batch)
+                batch, size = [], 0
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+@dataclass
+class MoveBatchResult:
+    """
+    Result of a job moving a batch of numbers
+    """
+    #: numbers moved by the job
+    number_list: list[NumberItem]
+    #: id of the job; None if the job couldn't be started
+    job_id: Optional[str] = None
+    #: final status of the job: COMPLETED, FAILED, STOPPED (paused), ABANDONED
+    status: Optional[str] = None
+    job: Optional[NumberJob] = None
+    #: errors reported for the job
+    errors: list[ManageNumberErrorItem] = field(default_factory=list)
+    #: exception if the job couldn't be started or tracked
+    error: Optional[Exception] = None
+
+    @property
+    def numbers(self) -> list[str]:
+        return [number for item in self.number_list for number in item.numbers or []]
+
+    @property
+    def failed_numbers(self) -> list[str]:
+        """
+        numbers which were not moved
+        """
+        if self.status != 'COMPLETED':
+            return self.numbers
+        return [error.item for error in self.errors if error.item]
+
+
+@dataclass
+class MoveSummary:
+    """
+    Aggregated results of a move
+    """
+    batches: list[MoveBatchResult] = field(default_factory=list)
+    #: number of numbers skipped because they had been moved in a previous run
+    skipped: int = 0
+
+    @property
+    def errors(self) -> list[ManageNumberErrorItem]:
+        """
+        errors of all jobs
+        """
+        return [error for batch in self.batches for error in batch.errors]
+
+    @property
+    def failed(self) -> list[str]:
+        """
+        numbers which were not moved
+        """
+        return [number for batch in self.batches for number in batch.failed_numbers]
+
+    @property
+    def moved(self) -> int:
+        """
+        number of numbers moved
+        """
+        return sum(len(batch.numbers) for batch in self.batches) - len(self.failed)
+
+
+def _number_keys(number_list: Iterable[NumberItem]) -> set[tuple[Optional[str], str]]:
+    return {(item.location_id, number) for item in number_list for number in item.numbers or []}
+
+
+class _MoverBase:
+    """
+    Common code for sync and async mover
+    """
+
+    def __init__(self, target_location_id: str, checkpoint: str = None, batch_size: int = MAX_NUMBERS_PER_JOB,
+                 poll: PollPolicy = None, operation: str = 'MOVE'):
+        self.target_location_id = target_location_id
+        self.checkpoint = checkpoint
+        self.batch_size = batch_size
+        self.poll = poll or PollPolicy(initial=2.0, maximum=60.0)
+        self.operation = operation
+        self._checkpoint_lock = Lock()
+
+    def _record(self, record: dict[str, Any]):
+        """
+        append a record to the checkpoint file
+        """
+        if not self.checkpoint:
+            return
+        line = json_dumps(record)
+        with self._checkpoint_lock:
+            with open(self.checkpoint, mode='a') as f:
+                f.write(f'{line}\n')
+
+    def _job_started(self, future: Union[JobFuture, AsJobFuture]):
+        self._record({'event': 'started', 'jobId': future.job.id,
+                      'numberList': [{'locationId': item.location_id, 'numbers': item.numbers}
+                                     for item in future.args['number_list']]})
+
+    def _plan(self, number_list: Iterable[NumberItem]) -> tuple[list[NumberItem], dict[str, list[NumberItem]], int]:
+        """
+        Determine what needs to be done based on the checkpoint
+
+        :return: tuple of numbers still to move, jobs still in flight (job id -> numbers), and number of numbers
+            skipped because they have been moved already
+        """
+        number_list = list(number_list)
+        started: dict[str, list[NumberItem]] = {}
+        done: dict[str, dict] = {}
+        if self.checkpoint and os.path.isfile(self.checkpoint):
+            with open(self.checkpoint) as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    if record['event'] == 'started':
+                        started[record['jobId']] = [NumberItem.parse_obj(item) for item in record['numberList']]
+                    elif record['event'] == 'done':
+                        done[record['jobId']] = record
+        in_flight = {job_id: numbers for job_id, numbers in started.items() if job_id not in done}
+        moved = set()
+        for job_id, record in done.items():
+            if record['status'] in _RETRY_STATUS or job_id not in started:
+                continue
+            # numbers which failed in a completed job are moved again
+            failed = set(record.get('failed') or ())
+            moved.update(key for key in _number_keys(started[job_id]) if key[1] not in failed)
+        requested = _number_keys(number_list)
+        exclude = moved | set().union(*map(_number_keys, in_flight.values()))
+        pending = [NumberItem(location_id=item.location_id,
+                              numbers=[n for n in item.numbers or [] if (item.location_id, n) not in exclude])
+                   for item in number_list]
+        return pending, in_flight, len(requested & moved)
+
+    def _batch_result(self, future: Union[JobFuture, AsJobFuture], number_list: list[NumberItem],
+                      error: Optional[Exception]) -> MoveBatchResult:
+        job: Optional[NumberJob] = future.job
+        if error is not None:
+            return MoveBatchResult(number_list=number_list, job_id=job and job.id, job=job, error=error)
+        result = future.job_result()
+        batch = MoveBatchResult(number_list=number_list, job_id=job.id, status=job.latest_execution_status,
+                                job=job, errors=result.errors)
+        if batch.status != 'STOPPED':
+            # paused jobs are resumed in the next run
+            self._record({'event': 'done', 'jobId': job.id, 'status': batch.status,
+                          'failed': batch.failed_numbers})
+        return batch
+
+
+class NumberMover(_MoverBase):
+    """
+    Move any number of numbers to a target location using manage numbers jobs
+    """
+
+    def __init__(self, api: 'WebexSimpleApi', target_location_id: str, checkpoint: str = None,
+                 batch_size: int = MAX_NUMBERS_PER_JOB, poll: PollPolicy = None, operation: str = 'MOVE'):
+        """
+
+        :param api: API
+        :param target_location_id: location to move the numbers to
+        :param checkpoint: path of a checkpoint file; progress is recorded in this file and a subsequent run with the
+            same checkpoint continues where the previous run stopped
+        :param batch_size: maximum number of numbers per job
+        :param poll: delays between status requests for jobs
+        :param operation: operation for the jobs
+        """
+        super().__init__(target_location_id=target_location_id, checkpoint=checkpoint, batch_size=batch_size,
+                         poll=poll, operation=operation)
+        self.api = api
+
+    def _resume(self, job_id: str):
+        """
+        resume a paused job and wait until it's running again
+        """
+        jobs = self.api.telephony.jobs.manage_numbers
+        if jobs.job_status(job_id=job_id).latest_execution_status != 'STOPPED':
+            return
+        jobs.resume_job(job_id=job_id)
+        for _, delay in zip(range(10), self.poll.delays()):
+            if jobs.job_status(job_id=job_id).latest_execution_status != 'STOPPED':
+                break
+            time.sleep(delay)
+
+    def run(self, number_list: Iterable[NumberItem]) -> Generator[MoveBatchResult, None, None]:
+        """
+        Move numbers to the target location
+
+        :param number_list: numbers to move
+        :return: yields one result per job as jobs complete
+        """
+        pending, in_flight, _ = self._plan(number_list)
+        yield from self._run(pending, in_flight)
+
+    def _run(self, pending: list[NumberItem],
+             in_flight: dict[str, list[NumberItem]]) -> Generator[MoveBatchResult, None, None]:
+        runner = JobRunner(self.api, poll=self.poll, on_start=self._job_started)
+        try:
+            futures: dict[JobFuture, list[NumberItem]] = {}
+            for job_id, numbers in in_flight.items():
+                self._resume(job_id)
+                futures[runner.attach(JobKind.manage_numbers, job_id)] = numbers
+            for batch in batch_numbers(pending, self.batch_size):
+                future = runner.manage_numbers(operation=self.operation, target_location_id=self.target_location_id,
+                                               number_list=batch)
+                futures[future] = batch
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except CancelledError:
+                    continue
+                except Exception as e:
+                    yield self._batch_result(future, futures[future], error=e)
+                else:
+                    yield self._batch_result(future, futures[future], error=None)
+        finally:
+            # cancel queued jobs if the caller stops consuming results
+            runner.close(cancel=True)
+
+    def move(self, number_list: Iterable[NumberItem]) -> MoveSummary:
+        """
+        Move numbers to the target location and wait for all jobs to complete
+
+        :param number_list: numbers to move
+        :return: summary of the move
+        """
+        pending, in_flight, skipped = self._plan(number_list)
+        return MoveSummary(batches=list(self._run(pending, in_flight)), skipped=skipped)
+
+
+class AsNumberMover(_MoverBase):
+    """
+    Move any number of numbers to a target location using manage numbers jobs and the async API
+    """
+
+    def __init__(self, api: 'AsWebexSimpleApi', target_location_id: str, checkpoint: str = None,
+                 batch_size: int = MAX_NUMBERS_PER_JOB, poll: PollPolicy = None, operation: str = 'MOVE'):
+        """
+
+        :param api: API
+        :param target_location_id: location to move the numbers to
+        :param checkpoint: path of a checkpoint file; progress is recorded in this file and a subsequent run with the
+            same checkpoint continues where the previous run stopped
+        :param batch_size: maximum number of numbers per job
+        :param poll: delays between status requests for jobs
+        :param operation: operation for the jobs
+        """
+        super().__init__(target_location_id=target_location_id, checkpoint=checkpoint, batch_size=batch_size,
+                         poll=poll, operation=operation)
+        self.api = api
+
+    async def _resume(self, job_id: str):
+        """
+        resume a paused job and wait until it's running again
+        """
+        jobs = self.api.telephony.jobs.manage_numbers
+        if (await jobs.job_status(job_id=job_id)).latest_execution_status != 'STOPPED':
+            return
+        await jobs.resume_job(job_id=job_id)
+        for _, delay in zip(range(10), self.poll.delays()):
+            if (await jobs.job_status(job_id=job_id)).latest_execution_status != 'STOPPED':
+                break
+            await asyncio.sleep(delay)
+
+    async def run(self, number_list: Iterable[NumberItem]) -> AsyncGenerator[MoveBatchResult, None]:
+        """
+        Move numbers to the target location
+
+        :param number_list: numbers to move
+        :return: yields one result per job as jobs complete
+        """
+        pending, in_flight, _ = self._plan(number_list)
+        async for result in self._run(pending, in_flight):
+            yield result
+
+    async def _run(self, pending: list[NumberItem],
+                   in_flight: dict[str, list[NumberItem]]) -> AsyncGenerator[MoveBatchResult, None]:
+        runner = AsJobRunner(self.api, poll=self.poll, on_start=self._job_started)
+        try:
+            futures: dict[asyncio.Future, tuple[AsJobFuture, list[NumberItem]]] = {}
+            for job_id, numbers in in_flight.items():
+                await self._resume(job_id)
+                future = runner.attach(JobKind.manage_numbers, job_id)
+                futures[future.future] = (future, numbers)
+            for batch in batch_numbers(pending, self.batch_size):
+                future = runner.manage_numbers(operation=self.operation, target_location_id=self.target_location_id,
+                                               number_list=batch)
+                futures[future.future] = (future, batch)
+            waiting = set(futures)
+            while waiting:
+                done, waiting = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                for done_future in done:
+                    future, numbers = futures[done_future]
+                    if done_future.cancelled():
+                        continue
+                    yield self._batch_result(future, numbers, error=done_future.exception())
+        finally:
+            # cancel queued jobs if the caller stops consuming results
+            await runner.close(cancel=True)
+
+    async def move(self, number_list: Iterable[NumberItem]) -> MoveSummary:
+        """
+        Move numbers to the target location and wait for all jobs to complete
+
+        :param number_list: numbers to move
+        :return: summary of the move
+        """
+        pending, in_flight, skipped = self._plan(number_list)
+        return MoveSummary(batches=[batch async for batch in self._run(pending, in_flight)], skipped=skipped)
@@ -14,6 +14,7 @@ from .call_recording import CallRecordingApi
 from .call_waiting import CallWaitingApi
 from .caller_id import CallerIdApi
 from .calling_behavior import CallingBehaviorApi
+from .common import BulkSettingsApiChild
 from .dnd import DndApi
 from .exec_assistant import ExecAssistantApi
 from .forwarding import PersonForwardingApi
@@ -27,7 +28,6 @@ from .privacy import PrivacyApi
 from .push_to_talk import PushToTalkApi
 from .receptionist import ReceptionistApi
 from .voicemail import VoicemailApi
-from ..api_child import ApiChild
 from ..base import ApiModel
 from ..base import SafeEnum as Enum
 from ..common import UserType, PrimaryOrShared
@@ -102,9 +102,11 @@ class PersonDevicesResponse(ApiModel):
 
 
 @dataclass(init=False)
-class PersonSettingsApi(ApiChild, base='people'):
+class PersonSettingsApi(BulkSettingsApiChild, base='people'):
     """
     API for all user level settings
+
+    Settings of many users can be read concurrently using :meth:`read_bulk`.
     """
 
     #: agent caller id Api
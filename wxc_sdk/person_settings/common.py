@@ -1,7 +1,17 @@
+from collections.abc import Generator, Iterable
+from concurrent.futures import FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Optional
+
+from pydantic import parse_obj_as
+
 from ..api_child import ApiChild
+from ..base import ApiModel
 from ..rest import RestSession
 
-__all__ = ['PersonSettingsApiChild']
+__all__ = ['PersonSettingsApiChild', 'SettingsResult', 'SettingsChange', 'settings_diff', 'settings_update',
+           'BulkSettingsApiChild']
 
 
 class PersonSettingsApiChild(ApiChild, base=''):
@@ -53,3 +63,442 @@ class PersonSettingsApiChild(ApiChild, base=''):
         # locations     telephony/config/locations  /               telephony/config/locations/{person_id}{path}
         # person        people                      /features       people/{person_id}/features/{feature}{path}
         return self.session.ep(f'{self.selector}/{person_id}{self.feature_prefix}{self.feature}{path}')
+
+
+@dataclass
+class SettingsResult:
+    """
+    Result of reading one feature for one person, workspace, or location in a bulk read
+    """
+    #: person, workspace, or location id
+    id: str
+    #: feature; name of the settings API attribute like 'forwarding'
+    feature: str
+    #: settings as returned by the read() method of the feature API; None if reading the settings failed
+    settings: Any = None
+    #: exception raised when reading the settings failed
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class SettingsChange:
+    """
+    Result of applying desired settings of one feature for one person, workspace, or location in a bulk apply
+    """
+    #: person, workspace, or location id
+    id: str
+    #: feature; name of the settings API attribute like 'forwarding'
+    feature: str
+    #: differences between current and desired settings: {attribute path: (current value, desired value)}
+    diff: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+    #: True if the settings were updated
+    applied: bool = False
+    #: exception raised when reading or updating the settings failed
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def changed(self) -> bool:
+        """
+        current settings differ from the desired settings
+        """
+        return bool(self.diff)
+
+
+def _desired_attributes(desired: Any) -> Any:
+    """
+    Desired settings as dict of attribute names; for models only the fields set explicitly are considered
+
+    :meta private:
+    """
+    if isinstance(desired, ApiModel):
+        return {name: getattr(desired, name) for name in desired.__fields_set__}
+    return desired
+
+
+def settings_diff(current: Any, desired: Any, path: str = '') -> dict[str, tuple[Any, Any]]:
+    """
+    Field level differences between current and desired settings.
+
+    Only attributes present in the desired settings are compared. Desired settings can be a (partial) model instance
+    (only fields set explicitly are compared), a dict of attribute names and values, or a plain value like a bool.
+    Nested models are compared attribute by attribute.
+
+    Example:
+
+        .. code-block:: python
+
+            forwarding = api.person_settings.forwarding.read(person_id=person_id)
+            diff = settings_diff(forwarding, {'call_forwarding': {'always': {'enabled': False}}})
+            # {'call_forwarding.always.enabled': (True, False)}
+
+    :param current: current settings
+    :param desired: desired settings
+    :param path: attribute path of the settings; used as prefix for the keys of the result
+    :return: differences: {attribute path: (current value, desired value)}
+    """
+    desired = _desired_attributes(desired)
+    if isinstance(desired, dict) and isinstance(current, ApiModel):
+        diff = {}
+        for name, value in desired.items():
+            if name not in current.__fields__:
+                raise ValueError(f'{current.__class__.__name__} has no attribute "{name}"')
+            diff.update(settings_diff(getattr(current, name), value, path=f'{path}.{name}' if path else name))
+        return diff
+    if isinstance(desired, dict) and current is None:
+        return {path: (None, desired)} if desired else {}
+    if current != desired:
+        return {path: (current, desired)}
+    return {}
+
+
+def settings_update(current: Any, desired: Any) -> Any:
+    """
+    Settings with the desired settings applied to the current settings.
+
+    The current settings are not modified. See :func:`settings_diff` for the supported formats of desired settings.
+
+    :param current: current settings
+    :param desired: desired settings
+    :return: updated settings
+    """
+    desired = _desired_attributes(desired)
+    if not isinstance(desired, dict) or not isinstance(current, ApiModel):
+        return desired
+    update = {}
+    for name, value in desired.items():
+        old = getattr(current, name)
+        if isinstance(value, dict) and old is None:
+            # create a new instance of the nested model
+            value = parse_obj_as(current.__fields__[name].outer_type_, value)
+        update[name] = settings_update(old, value)
+    return current.copy(update=update)
+
+
+class BulkSettingsApiChild(ApiChild, base=''):
+    """
+    Base class for APIs with person settings child APIs (:class:`PersonSettingsApiChild` instances) like
+    :class:`wxc_sdk.person_settings.PersonSettingsApi`. Adds bulk reading and updating of settings for many entities.
+    """
+
+    def bulk_features(self) -> list[str]:
+        """
+        Names of features that can be read in bulk: attributes with :class:`PersonSettingsApiChild` instances
+
+        :return: list of feature names
+        """
+        return sorted(name for name, value in self.__dict__.items()
+                      if isinstance(value, PersonSettingsApiChild) and hasattr(value, 'read'))
+
+    def bulk_readers(self, features: Optional[Iterable[str]]) -> dict[str, Callable]:
+        """
+        read() methods for the given features
+
+        :meta private:
+        """
+        available = self.bulk_features()
+        if features is None:
+            features = available
+        features = list(dict.fromkeys(features))
+        unknown = [feature for feature in features if feature not in available]
+        if unknown:
+            raise ValueError(f'unknown feature(s): {", ".join(unknown)}; available: {", ".join(available)}')
+        return {feature: getattr(self, feature).read for feature in features}
+
+    def bulk_configurators(self, features: Iterable[str]) -> dict[str, Callable]:
+        """
+        Methods to update settings for the given features: configure_settings() if available, else configure()
+
+        :meta private:
+        """
+        configurators = {}
+        not_supported = []
+        for feature in self.bulk_readers(features):
+            api = getattr(self, feature)
+            if not hasattr(api, 'configure'):
+                not_supported.append(feature)
+                continue
+            configurators[feature] = getattr(api, 'configure_settings', None) or api.configure
+        if not_supported:
+            raise ValueError(f'update not supported for feature(s): {", ".join(not_supported)}')
+        return configurators
+
+    def run_concurrently(self, jobs: Iterable[Callable[[], Any]],
+                         max_workers: int = None) -> Generator[Any, None, None]:
+        """
+        Run jobs concurrently with at most max_workers jobs in flight and yield the results as they become available
+
+        Jobs are only taken from the iterable when a worker is available. Jobs are executed in the thread pool of the
+        session. max_workers defaults to the number of concurrent requests of the session.
+
+        :meta private:
+        """
+        '''async
+    async def run_concurrently(self, jobs: Iterable[Callable[[], Any]],
+                               max_workers: int = None) -> AsyncGenerator[Any, None, None]:
+        """
+        Run jobs (coroutine functions) concurrently with at most max_workers jobs in flight and yield the results as
+        they become available
+
+        Jobs are only taken from the iterable when a worker is available. max_workers defaults to the number of
+        concurrent requests of the session.
+
+        :meta private:
+        """
+        max_workers = max_workers or self.session.concurrent_requests
+        pending = set()
+        try:
+            for job in jobs:
+                pending.add(asyncio.create_task(job()))
+                if len(pending) >= max_workers:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        yield task.result()
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        '''
+        max_workers = max_workers or self.session.concurrent_requests
+        pool = self.session.executor
+        pending = set()
+        try:
+            for job in jobs:
+                pending.add(pool.submit(job))
+                if len(pending) >= max_workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        finally:
+            # consumer is done or gone: don't start any more jobs
+            for future in pending:
+                future.cancel()
+
+    def read_bulk(self, ids: Iterable[str], features: Iterable[str] = None, org_id: str = None,
+                  max_workers: int = None) -> Generator[SettingsResult, None, None]:
+        """
+        Read settings of multiple features for many persons (workspaces, locations)
+
+        The read() calls of all features for all entities are executed concurrently with at most max_workers
+        requests in flight. Each request is subject to the 429 handling and the rate limiter of the session.
+
+        Results are yielded as they become available (not in request order). Errors don't stop the bulk read; failed
+        reads are reported as results with the error attribute set.
+
+        Example:
+
+            .. code-block:: python
+
+                for result in api.person_settings.read_bulk(ids=person_ids, features=['forwarding', 'dnd']):
+                    if result.ok:
+                        print(result.id, result.feature, result.settings)
+                    else:
+                        print(result.id, result.feature, f'failed: {result.error}')
+
+        :param ids: person, workspace, or location ids
+        :type ids: Iterable[str]
+        :param features: names of the features to read like 'forwarding' or 'dnd'; see :meth:`bulk_features`.
+            Default: all features
+        :type features: Iterable[str]
+        :param org_id: organization the entities belong to
+        :type org_id: str
+        :param max_workers: maximum number of concurrent requests. Default: number of concurrent requests of the
+            session
+        :type max_workers: int
+        :return: yields one result per entity and feature
+        """
+        '''async
+    async def read_bulk_gen(self, ids: Iterable[str], features: Iterable[str] = None, org_id: str = None,
+                            max_workers: int = None) -> AsyncGenerator[SettingsResult, None, None]:
+        """
+        Read settings of multiple features for many persons (workspaces, locations)
+
+        The read() calls of all features for all entities are executed concurrently with at most max_workers
+        requests in flight. Each request is subject to the 429 handling and the rate limiter of the session.
+
+        Results are yielded as they become available (not in request order). Errors don't stop the bulk read; failed
+        reads are reported as results with the error attribute set.
+
+        :param ids: person, workspace, or location ids
+        :type ids: Iterable[str]
+        :param features: names of the features to read like 'forwarding' or 'dnd'; see :meth:`bulk_features`.
+            Default: all features
+        :type features: Iterable[str]
+        :param org_id: organization the entities belong to
+        :type org_id: str
+        :param max_workers: maximum number of concurrent requests. Default: number of concurrent requests of the
+            session
+        :type max_workers: int
+        :return: yields one result per entity and feature
+        """
+        readers = self.bulk_readers(features)
+
+        async def read(entity_id: str, feature: str) -> SettingsResult:
+            try:
+                settings = await readers[feature](entity_id, org_id=org_id)
+            except Exception as e:
+                return SettingsResult(id=entity_id, feature=feature, error=e)
+            return SettingsResult(id=entity_id, feature=feature, settings=settings)
+
+        jobs = (partial(read, entity_id, feature) for entity_id in ids for feature in readers)
+        async for result in self.run_concurrently(jobs, max_workers=max_workers):
+            yield result
+
+    async def read_bulk(self, ids: Iterable[str], features: Iterable[str] = None, org_id: str = None,
+                        max_workers: int = None) -> List[SettingsResult]:
+        """
+        Read settings of multiple features for many persons (workspaces, locations)
+
+        See :meth:`read_bulk_gen`
+
+        :return: list of results; one result per entity and feature
+        :rtype: list[SettingsResult]
+        """
+        return [r async for r in self.read_bulk_gen(ids=ids, features=features, org_id=org_id,
+                                                    max_workers=max_workers)]
+
+        '''
+        readers = self.bulk_readers(features)
+
+        def read(entity_id: str, feature: str) -> SettingsResult:
+            try:
+                settings = readers[feature](entity_id, org_id=org_id)
+            except Exception as e:
+                return SettingsResult(id=entity_id, feature=feature, error=e)
+            return SettingsResult(id=entity_id, feature=feature, settings=settings)
+
+        jobs = (partial(read, entity_id, feature) for entity_id in ids for feature in readers)
+        yield from self.run_concurrently(jobs, max_workers=max_workers)
+
+    def apply_bulk(self, desired: dict[str, dict[str, Any]], org_id: str = None, dry_run: bool = False,
+                   max_workers: int = None) -> Generator[SettingsChange, None, None]:
+        """
+        Apply desired settings to many persons (workspaces, locations)
+
+        For each entity and feature the current settings are read and compared to the desired settings (see
+        :func:`settings_diff`). Settings are only updated if they differ from the desired settings. Entities are
+        processed concurrently with at most max_workers entities in flight. Each request is subject to the 429
+        handling and the rate limiter of the session.
+
+        Results are yielded as they become available. Errors don't stop the bulk apply; failures are reported as
+        results with the error attribute set.
+
+        Example:
+
+            .. code-block:: python
+
+                desired = {person_id: {'dnd': {'enabled': False},
+                                       'forwarding': {'call_forwarding': {'always': {'enabled': False}}}}
+                           for person_id in person_ids}
+                # dry run: only report changes
+                for change in api.person_settings.apply_bulk(desired=desired, dry_run=True):
+                    if change.changed:
+                        print(change.id, change.feature, change.diff)
+
+        :param desired: desired settings by entity id and feature: {id: {feature: desired settings}}. Desired settings
+            can be a (partial) model instance (only fields set explicitly are applied), a dict of attribute names and
+            values, or a plain value for features with plain settings like 'call_waiting'
+        :type desired: dict[str, dict[str, Any]]
+        :param org_id: organization the entities belong to
+        :type org_id: str
+        :param dry_run: only read the current settings and report the differences; don't update anything
+        :type dry_run: bool
+        :param max_workers: maximum number of concurrent requests. Default: number of concurrent requests of the
+            session
+        :type max_workers: int
+        :return: yields one result per entity and feature
+        """
+        '''async
+    async def apply_bulk_gen(self, desired: dict[str, dict[str, Any]], org_id: str = None, dry_run: bool = False,
+                             max_workers: int = None) -> AsyncGenerator[SettingsChange, None, None]:
+        """
+        Apply desired settings to many persons (workspaces, locations)
+
+        For each entity and feature the current settings are read and compared to the desired settings (see
+        :func:`settings_diff`). Settings are only updated if they differ from the desired settings. Entities are
+        processed concurrently with at most max_workers entities in flight. Each request is subject to the 429
+        handling and the rate limiter of the session.
+
+        Results are yielded as they become available. Errors don't stop the bulk apply; failures are reported as
+        results with the error attribute set.
+
+        :param desired: desired settings by entity id and feature: {id: {feature: desired settings}}. Desired settings
+            can be a (partial) model instance (only fields set explicitly are applied), a dict of attribute names and
+            values, or a plain value for features with plain settings like 'call_waiting'
+        :type desired: dict[str, dict[str, Any]]
+        :param org_id: organization the entities belong to
+        :type org_id: str
+        :param dry_run: only read the current settings and report the differences; don't update anything
+        :type dry_run: bool
+        :param max_workers: maximum number of concurrent requests. Default: number of concurrent requests of the
+            session
+        :type max_workers: int
+        :return: yields one result per entity and feature
+        """
+        configurators = self.bulk_configurators(set(f for features in desired.values() for f in features))
+
+        async def apply(entity_id: str, feature: str, settings: Any) -> SettingsChange:
+            change = SettingsChange(id=entity_id, feature=feature)
+            try:
+                current = await getattr(self, feature).read(entity_id, org_id=org_id)
+                change.diff = settings_diff(current, settings)
+                if change.diff and not dry_run:
+                    await configurators[feature](entity_id, settings_update(current, settings), org_id=org_id)
+                    change.applied = True
+            except Exception as e:
+                change.error = e
+            return change
+
+        jobs = (partial(apply, entity_id, feature, settings)
+                for entity_id, features in desired.items()
+                for feature, settings in features.items())
+        async for result in self.run_concurrently(jobs, max_workers=max_workers):
+            yield result
+
+    async def apply_bulk(self, desired: dict[str, dict[str, Any]], org_id: str = None, dry_run: bool = False,
+                         max_workers: int = None) -> List[SettingsChange]:
+        """
+        Apply desired settings to many persons (workspaces, locations)
+
+        See :meth:`apply_bulk_gen`
+
+        :return: list of results; one result per entity and feature
+        :rtype: list[SettingsChange]
+        """
+        return [r async for r in self.apply_bulk_gen(desired=desired, org_id=org_id, dry_run=dry_run,
+                                                     max_workers=max_workers)]
+
+        '''
+        configurators = self.bulk_configurators(set(f for features in desired.values() for f in features))
+
+        def apply(entity_id: str, feature: str, settings: Any) -> SettingsChange:
+            change = SettingsChange(id=entity_id, feature=feature)
+            try:
+                current = getattr(self, feature).read(entity_id, org_id=org_id)
+                change.diff = settings_diff(current, settings)
+                if change.diff and not dry_run:
+                    configurators[feature](entity_id, settings_update(current, settings), org_id=org_id)
+                    change.applied = True
+            except Exception as e:
+                change.error = e
+            return change
+
+        jobs = (partial(apply, entity_id, feature, settings)
+                for entity_id, features in desired.items()
+                for feature, settings in features.items())
+        yield from self.run_concurrently(jobs, max_workers=max_workers)
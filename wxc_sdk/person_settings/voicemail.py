@@ -9,6 +9,7 @@ from requests_toolbelt.multipart.encoder import MultipartEncoder
 
 from .common import PersonSettingsApiChild
 from ..base import ApiModel
+from ..bulk_upload import MultipartFile
 from ..common import Greeting, VoicemailMessageStorage, StorageType, VoicemailEnabled, VoicemailNotifications, \
     VoicemailFax, VoicemailTransferToNumber, VoicemailCopyOfMessage
 
@@ -144,7 +145,7 @@ class VoicemailApi(PersonSettingsApiChild):
         params = org_id and {'orgId': org_id} or None
         self.put(url, data=data, params=params)
 
-    def _configure_greeting(self, *, person_id: str, content: Union[BufferedReader, str],
+    def _configure_greeting(self, *, person_id: str, content: Union[BufferedReader, str, MultipartFile],
                             upload_as: str = None, org_id: str = None,
                             greeting_key: str):
         """
@@ -154,8 +155,9 @@ class VoicemailApi(PersonSettingsApiChild):
         :type person_id: str
         :param content: the file to be uploaded, can be a path to a file or a buffered reader (opened file); if a
             reader referring to an open file is passed then make sure to open the file as binary b/c otherwise the
-            content length might be calculated wrong
-        :type content: Union[BufferedReader, str]
+            content length might be calculated wrong. Can also be a prepared request body
+            (:class:`wxc_sdk.bulk_upload.MultipartFile`) which is streamed from disk and can be sent again on retries
+        :type content: Union[BufferedReader, str, MultipartFile]
         :param upload_as: filename for the content. Only required if content is a reader; has to be a .wav file name.
         :type upload_as: str
         :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
@@ -163,26 +165,30 @@ class VoicemailApi(PersonSettingsApiChild):
         :type org_id: str
         :param greeting_key: 'uploadBusyGreeting' or 'uploadNoAnswerGreeting'
         """
-        if isinstance(content, str):
-            upload_as = os.path.basename(content)
-            content = open(content, mode='rb')
-            must_close = True
+        must_close = False
+        if isinstance(content, MultipartFile):
+            # prepared request body
+            body = content
+            headers = {'Content-Type': content.content_type, 'Content-Length': str(len(content))}
         else:
-            must_close = False
-            # an existing reader
-            if not upload_as:
+            if isinstance(content, str):
+                upload_as = os.path.basename(content)
+                content = open(content, mode='rb')
+                must_close = True
+            elif not upload_as:
+                # an existing reader
                 raise ValueError('upload_as is required')
-        encoder = MultipartEncoder({'file': (upload_as, content, 'audio/wav')})
+            body = MultipartEncoder({'file': (upload_as, content, 'audio/wav')})
+            headers = {'Content-Type': body.content_type}
         ep = self.f_ep(person_id=person_id, path=f'actions/{greeting_key}/invoke')
         params = org_id and {'orgId': org_id} or None
         try:
-            self.post(ep, data=encoder, headers={'Content-Type': encoder.content_type},
-                      params=params)
+            self.post(ep, data=body, headers=headers, params=params)
         finally:
             if must_close:
                 content.close()
 
-    def configure_busy_greeting(self, person_id: str, content: Union[BufferedReader, str],
+    def configure_busy_greeting(self, person_id: str, content: Union[BufferedReader, str, MultipartFile],
                                 upload_as: str = None, org_id: str = None):
         """
         Configure Busy Voicemail Greeting for a Person
@@ -198,18 +204,25 @@ class VoicemailApi(PersonSettingsApiChild):
         :type person_id: str
         :param content: the file to be uploaded, can be a path to a file or a buffered reader (opened file); if a
             reader referring to an open file is passed then make sure to open the file as binary b/c otherwise the
-            content length might be calculated wrong
-        :type content: Union[BufferedReader, str]
+            content length might be calculated wrong. Can also be a prepared request body
+            (:class:`wxc_sdk.bulk_upload.MultipartFile`) which is streamed from disk and can be sent again on retries
+        :type content: Union[BufferedReader, str, MultipartFile]
         :param upload_as: filename for the content. Only required if content is a reader; has to be a .wav file name.
         :type upload_as: str
         :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
             may use this parameter as the default is the same organization as the token used to access API.
         :type org_id: str
         """
+        '''async
+    async def configure_busy_greeting(self, person_id: str, content: Union[BufferedReader, str, MultipartFile],
+                                upload_as: str = None, org_id: str = None):
+        await self._configure_greeting(person_id=person_id, content=content, upload_as=upload_as, org_id=org_id,
+                                       greeting_key='uploadBusyGreeting')
+        '''
         self._configure_greeting(person_id=person_id, content=content, upload_as=upload_as, org_id=org_id,
                                  greeting_key='uploadBusyGreeting')
 
-    def configure_no_answer_greeting(self, person_id: str, content: Union[BufferedReader, str],
+    def configure_no_answer_greeting(self, person_id: str, content: Union[BufferedReader, str, MultipartFile],
                                      upload_as: str = None, org_id: str = None):
         """
         Configure No Answer Voicemail Greeting for a Person
@@ -225,13 +238,20 @@ class VoicemailApi(PersonSettingsApiChild):
         :type person_id: str
         :param content: the file to be uploaded, can be a path to a file or a buffered reader (opened file); if a
             reader referring to an open file is passed then make sure to open the file as binary b/c otherwise the
-            content length might be calculated wrong
-        :type content: Union[BufferedReader, str]
+            content length might be calculated wrong. Can also be a prepared request body
+            (:class:`wxc_sdk.bulk_upload.MultipartFile`) which is streamed from disk and can be sent again on retries
+        :type content: Union[BufferedReader, str, MultipartFile]
         :param upload_as: filename for the content. Only required if content is a reader; has to be a .wav file name.
         :type upload_as: str
         :param org_id: Person is in this organization. Only admin users of another organization (such as partners)
             may use this parameter as the default is the same organization as the token used to access API.
         :type org_id: str
         """
+        '''async
+    async def configure_no_answer_greeting(self, person_id: str, content: Union[BufferedReader, str, MultipartFile],
+                                     upload_as: str = None, org_id: str = None):
+        await self._configure_greeting(person_id=person_id, content=content, upload_as=upload_as, org_id=org_id,
+                                       greeting_key='uploadNoAnswerGreeting')
+        '''
         self._configure_greeting(person_id=person_id, content=content, upload_as=upload_as, org_id=org_id,
                                  greeting_key='uploadNoAnswerGreeting')
@@ -0,0 +1,192 @@
+"""
+Adaptive rate limiting for REST sessions
+
+A :class:`RateLimiter` instance can be shared by any number of :class:`wxc_sdk.rest.RestSession` and
+:class:`wxc_sdk.as_rest.AsRestSession` instances (and hence by any number of threads and tasks). All requests sent
+through these sessions draw from the same token bucket. As soon as one request is throttled with a 429 response the
+send rate is reduced for all requests (multiplicative decrease) and all requests are held back for the time
+indicated in the Retry-After header. Afterwards the rate slowly increases again (additive increase) until the
+configured maximum is reached.
+
+Example:
+
+    .. code-block:: python
+
+        limiter = RateLimiter(max_rate=20)
+        api = WebexSimpleApi(tokens=tokens, concurrent_requests=50, rate_limiter=limiter)
+        async with AsWebexSimpleApi(tokens=tokens, concurrent_requests=50, rate_limiter=limiter) as as_api:
+            ...
+"""
+import asyncio
+import logging
+import time
+from threading import Lock
+from typing import Optional, Tuple
+
+__all__ = ['RateLimiter']
+
+log = logging.getLogger(__name__)
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter with AIMD (additive increase, multiplicative decrease) rate adaptation.
+
+    Thread safe and can be used from sync and async code at the same time.
+    """
+
+    def __init__(self, *, max_rate: float = 10.0, min_rate: float = 0.5, burst: int = None,
+                 increase: float = 0.2, decrease: float = 0.5):
+        """
+
+        :param max_rate: maximum (and initial) number of requests per second
+        :type max_rate: float
+        :param min_rate: the request rate never drops below this number of requests per second
+        :type min_rate: float
+        :param burst: capacity of the token bucket; maximum number of requests that can be sent back to back.
+            Default: max_rate
+        :type burst: int
+        :param increase: additive increase of the request rate in requests per second for each second w/o 429
+        :type increase: float
+        :param decrease: factor applied to the request rate when a 429 is received
+        :type decrease: float
+        """
+        if not 0 < min_rate <= max_rate:
+            raise ValueError('min_rate has to be positive and not larger than max_rate')
+        if not 0 < decrease < 1:
+            raise ValueError('decrease has to be between 0 and 1')
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.burst = burst or max(1, int(max_rate))
+        self.increase = increase
+        self.decrease = decrease
+        self._lock = Lock()
+        self._rate = max_rate
+        self._tokens = float(self.burst)
+        # time of last refill of the bucket. Can be in the future if we are blocked after a 429
+        self._last = time.monotonic()
+        # end of the current backoff period
+        self._blocked_until = 0.0
+        # number of 429s reported; reservations made before the last 429 are void
+        self._backoffs = 0
+        #: number of 429 responses reported to the limiter
+        self.throttled = 0
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(rate={self.rate:.2f}, max_rate={self.max_rate}, ' \
+               f'throttled={self.throttled})'
+
+    @property
+    def rate(self) -> float:
+        """
+        current request rate in requests per second
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._rate
+
+    def _refill(self, now: float):
+        """
+        Refill the bucket and increase the rate based on the time passed since the last refill. Needs to be called
+        with the lock held.
+        """
+        if now <= self._last:
+            return
+        elapsed = now - self._last
+        self._rate = min(self.max_rate, self._rate + self.increase * elapsed)
+        self._tokens = min(self.burst, self._tokens + self._rate * elapsed)
+        self._last = now
+
+    def _reserve(self, backoffs: int = None) -> Optional[Tuple[float, int]]:
+        """
+        Reserve a token for a request
+
+        :param backoffs: number of backoffs at the time of a previous reservation. If given, then a new token is only
+            reserved if a 429 was reported since the previous reservation; the previous reservation then is void
+        :return: None if the previous reservation is still valid; else time in seconds to wait before the request can be
+            sent and the current number of backoffs
+        """
+        with self._lock:
+            if backoffs is not None and backoffs == self._backoffs:
+                return None
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = self._last - now
+            if self._tokens < 0:
+                wait += -self._tokens / self._rate
+            return wait, self._backoffs
+
+    def reserve(self) -> float:
+        """
+        Reserve a token for a request
+
+        :return: time in seconds to wait before the request can be sent
+        :rtype: float
+        """
+        return self._reserve()[0]
+
+    def acquire(self) -> float:
+        """
+        Wait until the next request can be sent.
+
+        If a 429 is reported while waiting, then the wait is extended to the end of the backoff period and the request
+        is spaced at the reduced rate.
+
+        :return: time waited in seconds
+        :rtype: float
+        """
+        waited = 0.0
+        reservation = self._reserve()
+        while reservation is not None:
+            wait, backoffs = reservation
+            if wait <= 0:
+                break
+            time.sleep(wait)
+            waited += wait
+            reservation = self._reserve(backoffs)
+        return waited
+
+    async def as_acquire(self) -> float:
+        """
+        Wait until the next request can be sent; async variant of :meth:`acquire`
+
+        :return: time waited in seconds
+        :rtype: float
+        """
+        waited = 0.0
+        reservation = self._reserve()
+        while reservation is not None:
+            wait, backoffs = reservation
+            if wait <= 0:
+                break
+            await asyncio.sleep(wait)
+            waited += wait
+            reservation = self._reserve(backoffs)
+        return waited
+
+    def on_429(self, retry_after: float):
+        """
+        Report a 429 response.
+
+        All requests are held back for retry_after seconds and the rate is reduced. Only the first 429 during a backoff
+        period reduces the rate: requests which were already in flight when the first 429 was received are likely to
+        also get throttled and should not further reduce the rate.
+
+        :param retry_after: time to wait as indicated in the Retry-After header of the response
+        :type retry_after: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.throttled += 1
+            if now >= self._blocked_until:
+                self._rate = max(self.min_rate, self._rate * self.decrease)
+                log.warning(f'429 received, holding requests for {retry_after} seconds, new rate: '
+                            f'{self._rate:.2f}/s')
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+            # no tokens are available until the end of the backoff period. Pending reservations are void: requests
+            # waiting for a token reserve a new one after their wait
+            self._backoffs += 1
+            self._last = max(self._last, self._blocked_until)
+            self._tokens = 0.0
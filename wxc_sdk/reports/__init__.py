@@ -1,7 +1,12 @@
 """
 Reports API
 """
+import codecs
 import csv
+import io
+import os
+import struct
+import zlib
 from collections.abc import Generator, Iterable
 from dataclasses import dataclass
 from datetime import datetime, date
@@ -13,7 +18,8 @@ from ..api_child import ApiChild
 from ..base import ApiModel, to_camel
 from ..cdr import CDR
 
-__all__ = ['ValidationRules', 'ReportTemplate', 'Report', 'ReportsApi', 'CallingCDR']
+__all__ = ['ValidationRules', 'ReportTemplate', 'Report', 'ReportsApi', 'CallingCDR', 'ReportDecompressor',
+           'ReportDecoder']
 
 
 class ValidationRules(ApiModel):
@@ -86,11 +92,205 @@ class CallingCDR(CDR):
                 # download call history report from Webex
                 cdrs = list(CallingCDR.from_dicts(api.reports.download(url=url)))
 
+        For large reports consider using :meth:`wxc_sdk.cdr.CDRRecord.from_dicts` to create compact records w/o
+        pydantic validation.
         """
         for record in dicts:
             yield cls.parse_obj(record)
 
 
+class ReportDecompressor:
+    """
+    Incremental decompression of report payloads.
+
+    Zip files (first member only) and gzip files are decompressed on the fly; everything else is passed through.
+    Zip files are decoded based on the local file header, so they don't have to be read completely before the
+    content can be decompressed.
+    """
+    #: signature of a zip local file header
+    ZIP_MAGIC = b'PK\x03\x04'
+    #: signature of gzip files
+    GZIP_MAGIC = b'\x1f\x8b'
+
+    def __init__(self):
+        self._buffer = b''
+        #: detected format: 'zip', 'gzip', 'plain' or None if not yet determined
+        self.format = None
+        self._decompressor = None
+        # remaining bytes of a stored (uncompressed) zip member
+        self._stored = None
+        self._eof = False
+
+    def feed(self, data: bytes) -> bytes:
+        """
+        Decompress the next chunk of data
+
+        :param data: next chunk of the payload
+        :return: decompressed data available so far
+        """
+        if self._eof:
+            return b''
+        if self._decompressor is None and self._stored is None and self.format != 'plain':
+            self._buffer += data
+            if not self._start():
+                return b''
+            data, self._buffer = self._buffer, b''
+        if self.format == 'plain':
+            return data
+        if self._stored is not None:
+            data = data[:self._stored]
+            self._stored -= len(data)
+            self._eof = not self._stored
+            return data
+        r = self._decompressor.decompress(data)
+        # ignore anything after the end of the (first) compressed stream
+        self._eof = self._decompressor.eof
+        return r
+
+    def _start(self) -> bool:
+        """
+        Determine the format and initialize the decompressor
+
+        :return: False if more data is needed
+        """
+        buffer = self._buffer
+        if len(buffer) < 4:
+            return False
+        if buffer.startswith(self.GZIP_MAGIC):
+            self.format = 'gzip'
+            self._decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            return True
+        if not buffer.startswith(self.ZIP_MAGIC):
+            self.format = 'plain'
+            return True
+        # zip local file header
+        if len(buffer) < 30:
+            return False
+        _, _, flags, method, _, _, _, compressed_size, _, name_len, extra_len = struct.unpack('<IHHHHHIIIHH',
+                                                                                            buffer[:30])
+        header_len = 30 + name_len + extra_len
+        if len(buffer) < header_len:
+            return False
+        self.format = 'zip'
+        self._buffer = buffer[header_len:]
+        if method == 8:
+            self._decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+        elif method == 0 and not flags & 0x08:
+            self._stored = compressed_size
+        else:
+            raise ValueError(f'unsupported zip file: compression method {method}, flags {flags:#x}')
+        return True
+
+    def flush(self) -> bytes:
+        """
+        Get remaining decompressed data at the end of the payload
+        """
+        if self.format is None:
+            # less than 4 bytes of payload
+            self.format = 'plain'
+            data, self._buffer = self._buffer, b''
+            return data
+        if self._decompressor is not None and not self._eof:
+            return self._decompressor.flush()
+        return b''
+
+
+class ReportDecoder:
+    """
+    Incremental decoder for CSV report payloads: decompresses, decodes and parses data chunk by chunk. Only the
+    current chunk, the rows decoded from a slice of the chunk, and an incomplete last record are held in memory.
+
+    Example:
+
+        .. code-block:: python
+
+            decoder = ReportDecoder()
+            for chunk in chunks:
+                for row in decoder.feed(chunk):
+                    ...
+            for row in decoder.close():
+                ...
+    """
+    #: default size of chunks to read from the network
+    chunk_size = 1 << 20
+    #: chunks are decoded in slices of this size
+    slice_size = 1 << 14
+
+    def __init__(self, encoding: str = 'utf-8-sig'):
+        """
+
+        :param encoding: text encoding of the CSV data
+        :type encoding: str
+        """
+        self._decompressor = ReportDecompressor()
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self._pending = ''
+        #: field names from the header line
+        self.fieldnames: Optional[list[str]] = None
+
+    def feed(self, data: bytes) -> Generator[dict, None, None]:
+        """
+        Decode the next chunk of the payload
+
+        :param data: next chunk of the payload
+        :return: yields rows completed by this chunk
+        """
+        # compressed data is processed in slices to limit the size of the decompressed data held in memory
+        slice_size = self.slice_size
+        for i in range(0, len(data), slice_size):
+            yield from self._feed(data[i:i + slice_size])
+
+    def _feed(self, data: bytes) -> list[dict]:
+        text = self._decoder.decode(self._decompressor.feed(data))
+        if not text:
+            return []
+        text = self._pending + text
+        # only parse complete records: the record ends at a line end with an even number of quotes before it
+        cut = text.rfind('\n') + 1
+        quotes = text.count('"', 0, cut)
+        while quotes % 2 and cut:
+            previous = text.rfind('\n', 0, cut - 1) + 1
+            quotes -= text.count('"', previous, cut)
+            cut = previous
+        self._pending = text[cut:]
+        return self._rows(text[:cut])
+
+    def close(self) -> list[dict]:
+        """
+        Decode the rest of the payload at the end
+
+        :return: remaining rows
+        """
+        text = self._decoder.decode(self._decompressor.flush(), final=True)
+        text, self._pending = self._pending + text, ''
+        return self._rows(text)
+
+    def _rows(self, text: str) -> list[dict]:
+        """
+        Parse complete CSV records; same semantics as csv.DictReader
+        """
+        if not text:
+            return []
+        reader = csv.reader(io.StringIO(text, newline=''))
+        if self.fieldnames is None:
+            self.fieldnames = next(reader, None)
+        fieldnames = self.fieldnames
+        lf = len(fieldnames or [])
+        rows = []
+        for row in reader:
+            if not row:
+                continue
+            d = dict(zip(fieldnames, row))
+            lr = len(row)
+            if lf < lr:
+                d[None] = row[lf:]
+            elif lf > lr:
+                for key in fieldnames[lr:]:
+                    d[key] = None
+            rows.append(d)
+        return rows
+
+
 @dataclass(init=False)
 class ReportsApi(ApiChild, base='devices'):
     """
@@ -242,31 +442,117 @@ class ReportsApi(ApiChild, base='devices'):
         """
         Download a report from the given URL and yield the rows as dicts
 
+        The report is downloaded and decoded chunk by chunk; compressed (zip, gzip) payloads are decompressed on the
+        fly. Memory consumption does not depend on the size of the report.
+
         :param url: download URL
         :type url: str
         :return: yields dicts
         """
         '''async
-    async def download(self, url: str) -> List[dict]:
+    async def download_gen(self, url: str) -> AsyncGenerator[dict, None, None]:
         """
         Download a report from the given URL and yield the rows as dicts
 
+        The report is downloaded and decoded chunk by chunk; compressed (zip, gzip) payloads are decompressed on the
+        fly. Memory consumption does not depend on the size of the report.
+
+        :param url: download URL
+        :type url: str
+        :return: yields dicts
+        """
+        decoder = ReportDecoder()
+        async for chunk in self.session.rest_stream(url=url, chunk_size=ReportDecoder.chunk_size):
+            for row in decoder.feed(chunk):
+                yield row
+        for row in decoder.close():
+            yield row
+
+    async def download(self, url: str) -> List[dict]:
+        """
+        Download a report from the given URL and return the rows as dicts
+
         :param url: download URL
         :type url: str
         :return: list of dicts (one per row)
         :rtype: list[dict]
         """
-        headers = {'Authorization': f'Bearer {self.session.access_token}'}
-        async with self.session.get(url=url, headers=headers) as r:
-            r.raise_for_status()
-            lines = [line.decode(encoding='utf-8-sig') async for line in r.content]
-            reader = csv.DictReader(lines)
-            return list(reader)
+        return [row async for row in self.download_gen(url=url)]
+
+        '''
+        decoder = ReportDecoder()
+        for chunk in self.session.rest_stream(url=url, chunk_size=ReportDecoder.chunk_size):
+            yield from decoder.feed(chunk)
+        yield from decoder.close()
+
+    def download_to_file(self, url: str, path: str, decompress: bool = True) -> int:
+        """
+        Download a report from the given URL and write it to a file
+
+        Data is written chunk by chunk; memory consumption does not depend on the size of the report. The data is
+        written to a temporary file (path + ".part") first, which is renamed once the download is complete: a file at
+        path always is complete.
+
+        :param url: download URL
+        :type url: str
+        :param path: path of the file to write to
+        :type path: str
+        :param decompress: decompress zip or gzip payloads and write the CSV data. If False, then the payload is
+            written as received.
+        :type decompress: bool
+        :return: number of bytes written
+        :rtype: int
+        """
+        '''async
+    async def download_to_file(self, url: str, path: str, decompress: bool = True) -> int:
+        """
+        Download a report from the given URL and write it to a file
+
+        Data is written chunk by chunk; memory consumption does not depend on the size of the report. The data is
+        written to a temporary file (path + ".part") first, which is renamed once the download is complete: a file at
+        path always is complete.
+
+        :param url: download URL
+        :type url: str
+        :param path: path of the file to write to
+        :type path: str
+        :param decompress: decompress zip or gzip payloads and write the CSV data. If False, then the payload is
+            written as received.
+        :type decompress: bool
+        :return: number of bytes written
+        :rtype: int
+        """
+        if not decompress:
+            return await self.session.rest_download(url=url, file=path)
+        part = f'{path}.part'
+        decompressor = ReportDecompressor()
+        written = 0
+        try:
+            with open(part, mode='wb') as f:
+                async for chunk in self.session.rest_stream(url=url, chunk_size=ReportDecoder.chunk_size):
+                    written += f.write(decompressor.feed(chunk))
+                written += f.write(decompressor.flush())
+        except BaseException:
+            if os.path.exists(part):
+                os.remove(part)
+            raise
+        os.replace(part, path)
+        return written
 
         '''
-        headers = {'Authorization': f'Bearer {self.session.access_token}'}
-        with self.session.get(url=url, stream=True, headers=headers) as r:
-            r.raise_for_status()
-            lines = (line.decode(encoding='utf-8-sig') for line in r.iter_lines())
-            reader = csv.DictReader(lines)
-            yield from reader
+        if not decompress:
+            return self.session.rest_download(url=url, file=path)
+        part = f'{path}.part'
+        decompressor = ReportDecompressor()
+        written = 0
+        try:
+            with open(part, mode='wb') as f:
+                for chunk in self.session.rest_stream(url=url, chunk_size=ReportDecoder.chunk_size):
+                    written += f.write(decompressor.feed(chunk))
+                written += f.write(decompressor.flush())
+        except BaseException:
+            if os.path.exists(part):
+                os.remove(part)
+            raise
+        os.replace(part, path)
+        return written
@@ -3,13 +3,17 @@ REST session for Webex API requests
 """
 import json
 import logging
+import os
 import time
 import uuid
-from collections.abc import Generator
-from functools import wraps
+from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from functools import wraps, partial
 from io import TextIOBase, StringIO
-from threading import Semaphore
-from typing import Tuple, Type, Optional
+from queue import Queue
+from threading import Semaphore, Thread, Event, Lock
+from typing import Tuple, Type, Optional, Any, Union, BinaryIO, TYPE_CHECKING
 from urllib.parse import parse_qsl
 
 from pydantic import BaseModel, ValidationError, Field
@@ -18,12 +22,27 @@ from requests.adapters import HTTPAdapter
 from requests.models import PreparedRequest
 
 from .base import ApiModel, StrOrDict, RETRY_429_MAX_WAIT
+from .cache import ResponseCache, CachedResponse
+from .json_codec import json_codec
+from .metrics import RequestHooks, url_template, call_hooks, request_end, body_size
+from .rate_limit import RateLimiter
 from .tokens import Tokens
+from .wire_log import WireLog, debug_enabled, mask_headers, mask_json, mask_form
+
+if TYPE_CHECKING:
+    from .cassette import Cassette
+    from .token_manager import TokenManager
 
 __all__ = ['SingleError', 'ErrorDetail', 'RestError', 'RestSession', 'dump_response']
 
 log = logging.getLogger(__name__)
 
+#: chunk size for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+# marker for the end of pagination in prefetch queue
+_PAGES_DONE = object()
+
 
 class SingleError(BaseModel):
     """
@@ -79,8 +98,8 @@ class RestError(HTTPError):
         super().__init__(msg, response=response)
         # try to parse the body of the API response
         try:
-            self.detail = ErrorDetail.parse_obj(json.loads(response.text))
-        except (json.JSONDecodeError, ValidationError):
+            self.detail = ErrorDetail.parse_obj(json_codec().loads(response.content))
+        except (ValueError, ValidationError):
             self.detail = response.text
 
     def __str__(self):
@@ -126,9 +145,10 @@ def dump_response(response: Response, file: TextIOBase = None, dump_log: logging
     :param diff_ns: time the request took (in ns)
     :type diff_ns: int
     """
-    if not log.isEnabledFor(logging.DEBUG):
-        return
     dump_log = dump_log or log
+    # only do the work if a handler actually emits the debug output
+    if not debug_enabled(dump_log):
+        return
     output = file or StringIO()
 
     # dump response objects in redirect history
@@ -144,9 +164,7 @@ def dump_response(response: Response, file: TextIOBase = None, dump_log: logging
           f'{response.request.method} {response.request.url}', file=output)
 
     # request headers
-    for k, v in response.request.headers.items():
-        if k.lower() == 'authorization':
-            v = 'Bearer ***'
+    for k, v in mask_headers(response.request.headers).items():
         print(f'  {k}: {v}', file=output)
 
     # request body
@@ -155,31 +173,24 @@ def dump_response(response: Response, file: TextIOBase = None, dump_log: logging
         print('  --- body ---', file=output)
         ct = response.request.headers.get('content-type').lower()
         if ct.startswith('application/json'):
-            for line in json.dumps(json.loads(request_body), indent=2).splitlines():
+            for line in json.dumps(mask_json(json.loads(request_body)), indent=2).splitlines():
                 print(f'  {line}', file=output)
         elif ct.startswith('application/x-www-form-urlencoded'):
-            for k, v in parse_qsl(request_body):
-                print(f'  {k}: {"***" if k == "client_secret" else v}',
-                      file=output)
+            for k, v in mask_form(parse_qsl(request_body)):
+                print(f'  {k}: {v}', file=output)
         else:
             print(f'  {request_body}', file=output)
 
     print(' Response', file=output)
     # response headers
-    for k in response.headers:
-        print(f'  {k}: {response.headers[k]}', file=output)
+    for k, v in mask_headers(response.headers).items():
+        print(f'  {k}: {v}', file=output)
     body = response.text
     # dump response body
     if body:
         print('  --- response body ---', file=output)
         try:
-            body = json.loads(body)
-            if 'access_token' in body:
-                # mask access token
-                body['access_token'] = '***'
-            elif 'refresh_token' in body:
-                body['refresh_token'] = '***'
-            body = json.dumps(body, indent=2)
+            body = json.dumps(mask_json(json.loads(body)), indent=2)
         except json.JSONDecodeError:
             pass
         for line in body.splitlines():
@@ -189,25 +200,57 @@ def dump_response(response: Response, file: TextIOBase = None, dump_log: logging
         dump_log.debug(output.getvalue())
 
 
+def stream_position(data: Any) -> Optional[int]:
+    """
+    Current position of a seekable request body (stream); None for other bodies
+
+    :meta private:
+    """
+    if not (hasattr(data, 'seek') and hasattr(data, 'tell')):
+        return None
+    try:
+        return data.tell()
+    except OSError:
+        return None
+
+
+def bearer_token(headers) -> Optional[str]:
+    """
+    Access token from the authorization header of a request
+
+    :meta private:
+    """
+    authorization = headers.get('authorization') or ''
+    if not authorization.lower().startswith('bearer '):
+        return None
+    return authorization[7:]
+
+
 def retry_request(func):
     """
-    Decorator for the request method in the RestSession class. Used to implement backoff on 429 responses
+    Decorator for the request method in the RestSession class. Used to implement backoff on 429 responses.
+    Seekable (streamed) request bodies are rewound before a retry.
+
+    If the session has a token manager then an access token about to expire is refreshed before the request is sent
+    and the request is retried once with a new access token after a 401
 
     :param func:
     :return:
     """
 
-    def giveup_429(e: RestError, retry_429: bool) -> bool:
+    def giveup_429(e: RestError, session: 'RestSession') -> bool:
         """
         callback for backoff on REST requests
 
         :param e: latest exception
-        :param retry_429: retry on 429?
+        :param session: session; has retry_429 setting and optional rate limiter shared with other sessions
         :return: True -> break the backoff loop
         """
+        retry_429 = session.retry_429
+        rate_limiter = session.rate_limiter
         response = e.response
         response: Response
-        if response.status_code != 429 or not retry_429:
+        if response.status_code != 429:
             # Don't retry on anything other than 429
             return True
 
@@ -216,18 +259,69 @@ def retry_request(func):
 
         # never wait more than the defined maximum
         retry_after = min(retry_after, RETRY_429_MAX_WAIT)
+        if rate_limiter:
+            # the rate limiter holds back all requests (not only this one) before they get sent
+            rate_limiter.on_429(retry_after)
+            if retry_429 and session.request_hooks:
+                call_hooks(session.request_hooks, 'retry', response.request.method,
+                           url_template(response.request.url), 429, retry_after)
+            return not retry_429
+        if not retry_429:
+            return True
+        if session.request_hooks:
+            call_hooks(session.request_hooks, 'retry', response.request.method, url_template(response.request.url),
+                       429, retry_after)
+        # hold back all other requests of the session (other threads) as well
+        session._backoff_until = max(session._backoff_until, time.monotonic() + retry_after)
         time.sleep(retry_after)
+        if session.request_hooks:
+            call_hooks(session.request_hooks, 'sleep', retry_after, 'retry_after')
         return False
 
+    def refresh_401(e: RestError, session: 'RestSession') -> bool:
+        """
+        try to refresh the access token after a 401
+
+        :return: True -> retry the request
+        """
+        if e.response.status_code != 401:
+            return False
+        try:
+            session.token_manager.refresh(failed_token=bearer_token(e.response.request.headers))
+        except Exception as refresh_error:
+            log.warning(f'failed to refresh access token after 401: {refresh_error}')
+            return False
+        return True
+
     @wraps(func)
     def wrapper(session: 'RestSession', *args, **kwargs):
+        data = kwargs.get('data')
+        position = stream_position(data)
+        token_manager = session.token_manager
+        refreshed = False
+        if token_manager is not None:
+            token_manager.ensure_valid()
         with session._sem:
             while True:
+                if session.rate_limiter:
+                    waited = session.rate_limiter.acquire()
+                    if waited and session.request_hooks:
+                        call_hooks(session.request_hooks, 'sleep', waited, 'rate_limiter')
+                else:
+                    backoff = session._backoff_until - time.monotonic()
+                    if backoff > 0:
+                        time.sleep(backoff)
+                        if session.request_hooks:
+                            call_hooks(session.request_hooks, 'sleep', backoff, 'backoff')
                 try:
                     result = func(session, *args, **kwargs)
                 except RestError as e:
-                    if giveup_429(e, session.retry_429):
+                    if token_manager is not None and not refreshed and refresh_401(e, session):
+                        refreshed = True
+                    elif giveup_429(e, session):
                         raise
+                    if position is not None:
+                        data.seek(position)
                 else:
                     break
         return result
@@ -235,23 +329,214 @@ def retry_request(func):
     return wrapper
 
 
+def traced_request(func):
+    """
+    Decorator for the request method in the RestSession class. Reports each request to the hooks of the session (if
+    any)
+
+    :param func:
+    :return:
+    """
+
+    @wraps(func)
+    def wrapper(session: 'RestSession', method: str, url: str, **kwargs):
+        hooks = session.request_hooks
+        if not hooks:
+            return func(session, method, url, **kwargs)
+        template = url_template(url)
+        contexts = call_hooks(hooks, 'request_start', method, template)
+        start = time.perf_counter()
+        response = None
+        error = None
+        try:
+            result = func(session, method, url, **kwargs)
+            response = result[0]
+            return result
+        except RestError as e:
+            response = e.response
+            error = e
+            raise
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            if response is None:
+                status, bytes_out, bytes_in = None, 0, 0
+            else:
+                status = response.status_code
+                bytes_out = body_size(response.request.body)
+                bytes_in = len(response.content)
+            request_end(hooks, contexts, method, template, status, elapsed, bytes_out, bytes_in, error)
+
+    return wrapper
+
+
+def cached_request(func):
+    """
+    Decorator for the request method in the RestSession class. Serves GET requests from the response cache of the
+    session (if any) and invalidates cached responses on all other requests
+
+    :param func:
+    :return:
+    """
+
+    @wraps(func)
+    def wrapper(session: 'RestSession', method: str, url: str, headers=None, **kwargs):
+        cache = session.cache
+        if cache is None:
+            return func(session, method, url=url, headers=headers, **kwargs)
+        if method != 'GET':
+            try:
+                return func(session, method, url=url, headers=headers, **kwargs)
+            finally:
+                cache.invalidate(url)
+        key = cache.key(url=url, params=kwargs.get('params'), access_token=session.access_token)
+        if key is None:
+            return func(session, method, url=url, headers=headers, **kwargs)
+        entry = cache.get(key)
+        if entry is not None:
+            if not entry.expired:
+                cache.hits += 1
+                log.debug(f'cache hit: {method} {url}')
+                return CachedResponse(entry), entry.data()
+            if entry.etag:
+                # revalidate expired entry
+                headers = {**(headers or {}), 'If-None-Match': entry.etag}
+        cache.misses += 1
+        response, data = func(session, method, url=url, headers=headers, **kwargs)
+        if entry is not None and response.status_code == 304:
+            cache.refresh(key, entry)
+            return CachedResponse(entry), entry.data()
+        cache.put(key, url=url, response_url=str(response.url), data=data, link=response.headers.get('Link'),
+                  etag=response.headers.get('ETag'))
+        return response, data
+
+    return wrapper
+
+
+class _InFlight:
+    """
+    State of an in-flight GET request shared by all callers waiting for the same result
+
+    :meta private:
+    """
+    __slots__ = ('done', 'waiters', 'response', 'copies', 'error')
+
+    def __init__(self):
+        self.done = Event()
+        self.waiters = 0
+        self.response = None
+        self.copies = []
+        self.error = None
+
+
+def coalesced_request(func):
+    """
+    Decorator for the request method in the RestSession class. If enabled, identical concurrent GET requests are
+    coalesced (single-flight): only one request is sent and all callers get the result.
+
+    :param func:
+    :return:
+    """
+
+    @wraps(func)
+    def wrapper(session: 'RestSession', method: str, url: str, headers=None, **kwargs):
+        if not session.coalesce_requests or method != 'GET' or 'json' in kwargs or 'data' in kwargs:
+            return func(session, method, url=url, headers=headers, **kwargs)
+        params = kwargs.get('params')
+        key = (url, params and tuple(sorted((k, str(v)) for k, v in params.items() if v is not None)),
+               headers and tuple(sorted(headers.items())), session.access_token)
+        with session._in_flight_lock:
+            flight = session._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = session._in_flight[key] = _InFlight()
+            else:
+                flight.waiters += 1
+        if not leader:
+            log.debug(f'coalesced request: {method} {url}')
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response, flight.copies.pop()
+        try:
+            response, data = func(session, method, url=url, headers=headers, **kwargs)
+        except BaseException as e:
+            flight.error = e
+            raise
+        else:
+            flight.response = response
+            return response, data
+        finally:
+            with session._in_flight_lock:
+                del session._in_flight[key]
+            if flight.error is None and flight.waiters:
+                # each waiter gets its own copy: callers are free to modify the result
+                flight.copies = [deepcopy(data) for _ in range(flight.waiters)]
+            flight.done.set()
+
+    return wrapper
+
+
 class RestSession(Session):
     """
     REST session used for API requests:
             * includes an Authorization header in reach request
             * implements retries on 429
+            * optionally uses a :class:`wxc_sdk.rate_limit.RateLimiter` shared with other sessions
+            * optionally serves GET requests from a :class:`wxc_sdk.cache.ResponseCache`
+            * optionally coalesces identical concurrent GET requests
+            * optionally logs requests and responses to a :class:`wxc_sdk.wire_log.WireLog`
+            * optionally reports requests to :class:`wxc_sdk.metrics.RequestHooks` (metrics and tracing)
+            * optionally records requests to or replays requests from a :class:`wxc_sdk.cassette.Cassette`
+            * optionally refreshes the access token using a :class:`wxc_sdk.token_manager.TokenManager`
             * loads deserializes JSON data if needed
     """
     #: base URL for all Webex API requests
     BASE = 'https://webexapis.com/v1'
 
-    def __init__(self, *, tokens: Tokens, concurrent_requests: int, retry_429: bool = True):
+    def __init__(self, *, tokens: Tokens, concurrent_requests: int, retry_429: bool = True,
+                 rate_limiter: RateLimiter = None, prefetch_pages: int = 0,
+                 lazy_models: bool = False, cache: ResponseCache = None, coalesce_requests: bool = False,
+                 wire_log: WireLog = None, request_hooks: Iterable[RequestHooks] = None, cassette: 'Cassette' = None,
+                 token_manager: 'TokenManager' = None):
         super().__init__()
-        self.mount('http://', HTTPAdapter(pool_maxsize=concurrent_requests))
-        self.mount('https://', HTTPAdapter(pool_maxsize=concurrent_requests))
-        self._tokens = tokens
+        if cassette is not None:
+            # imported on demand to keep import of wxc_sdk fast
+            from .cassette import CassetteAdapter
+        for prefix in ('http://', 'https://'):
+            self.mount(prefix, HTTPAdapter(pool_maxsize=concurrent_requests) if cassette is None
+                       else CassetteAdapter(cassette, pool_maxsize=concurrent_requests))
+        self._tokens = tokens if token_manager is None else token_manager.tokens
+        #: maximum number of concurrent requests; also the number of workers of :attr:`executor`
+        self.concurrent_requests = concurrent_requests
         self._sem = Semaphore(concurrent_requests)
+        # after a 429 (w/o rate limiter) no requests are sent before this time (time.monotonic())
+        self._backoff_until = 0.0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()
         self.retry_429 = retry_429
+        #: rate limiter consulted before each request, optional
+        self.rate_limiter = rate_limiter
+        #: number of pages :meth:`follow_pagination` fetches in the background ahead of the consumer; 0: no prefetch
+        self.prefetch_pages = prefetch_pages
+        #: :meth:`follow_pagination` yields :class:`wxc_sdk.base.LazyModel` proxies instead of model instances
+        self.lazy_models = lazy_models
+        #: response cache for GET requests, optional
+        self.cache = cache
+        #: identical concurrent GET requests are coalesced: only one request is sent and all callers get the result
+        self.coalesce_requests = coalesce_requests
+        self._in_flight: dict[tuple, _InFlight] = dict()
+        self._in_flight_lock = Lock()
+        #: structured wire logging, optional. If set then no debug dumps (:func:`dump_response`) are created
+        self.wire_log = wire_log
+        #: hooks notified about requests, retries and waits; see :mod:`wxc_sdk.metrics`
+        self.request_hooks: list[RequestHooks] = list(request_hooks or [])
+        #: cassette to record requests to or replay requests from, optional. Set at creation of the session
+        self.cassette = cassette
+        #: token manager refreshing the access token, optional. If set then the tokens of the token manager are used
+        self.token_manager = token_manager
 
     def ep(self, path: str = None):
         """
@@ -274,7 +559,29 @@ class RestSession(Session):
         """
         return self._tokens.access_token
 
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Thread pool to execute requests concurrently; created on first use. The number of workers is the number of
+        concurrent requests of the session.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrent_requests,
+                                                    thread_name_prefix='wxc_sdk')
+            return self._executor
+
+    def close(self):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        super().close()
+
+    @cached_request
+    @coalesced_request
     @retry_request
+    @traced_request
     def _request_w_response(self, method: str, url: str, headers=None, content_type: str = None,
                             **kwargs) -> Tuple[Response, StrOrDict]:
         """
@@ -300,11 +607,23 @@ class RestSession(Session):
             request_headers.update((k.lower(), v) for k, v in headers.items())
         if content_type:
             request_headers['content-type'] = content_type
+        codec = json_codec()
+        body = kwargs.pop('json', None)
+        if body is not None:
+            # JSON request bodies are encoded by the JSON codec
+            kwargs['data'] = codec.dumps(body).encode()
         start = time.perf_counter_ns()
         response = self.request(method, url=url, headers=request_headers, **kwargs)
         diff_ns = time.perf_counter_ns() - start
         try:
-            dump_response(response, diff_ns=diff_ns)
+            wire_log = self.wire_log
+            if wire_log is None:
+                dump_response(response, diff_ns=diff_ns)
+            elif wire_log.wants(method, url):
+                request = response.request
+                wire_log.log(method=method, url=request.url, status=response.status_code, elapsed_ns=diff_ns,
+                             request_headers=request.headers, request_body=request.body,
+                             response_headers=response.headers, response_body=response.content)
             try:
                 response.raise_for_status()
             except HTTPError as error:
@@ -315,8 +634,8 @@ class RestSession(Session):
             ct = response.headers.get('Content-Type')
             if not ct:
                 data = ''
-            elif ct.startswith('application/json') and response.text:
-                data = response.json()
+            elif ct.startswith('application/json') and response.content.strip():
+                data = codec.loads(response.content)
             else:
                 data = response.text
         finally:
@@ -389,8 +708,177 @@ class RestSession(Session):
         """
         return self._rest_request('PATCH', *args, **kwargs)
 
+    @retry_request
+    def _stream_response(self, method: str, url: str, headers: dict = None, **kwargs) -> Response:
+        """
+        Send a request and return the response w/o reading the body. The caller has to close the response.
+
+        The wire log gets the request and the response headers; streamed response bodies are not logged
+
+        :meta private:
+        """
+        request_headers = {'authorization': f'Bearer {self._tokens.access_token}',
+                           'TrackingID': f'SIMPLE_{uuid.uuid4()}'}
+        if headers:
+            request_headers.update((k.lower(), v) for k, v in headers.items())
+        response = self.request(method, url=url, headers=request_headers, stream=True, **kwargs)
+        wire_log = self.wire_log
+        if wire_log is not None and wire_log.wants(method, url):
+            request = response.request
+            wire_log.log(method=method, url=request.url, status=response.status_code,
+                         elapsed_ns=int(response.elapsed.total_seconds() * 1e9),
+                         request_headers=request.headers, request_body=request.body,
+                         response_headers=response.headers, response_body=None if response.ok else response.content)
+        try:
+            response.raise_for_status()
+        except HTTPError as error:
+            try:
+                raise RestError(error.args[0], response=error.response)
+            finally:
+                response.close()
+        return response
+
+    def rest_stream(self, url: str, params: dict = None, chunk_size: int = None,
+                    **kwargs) -> Generator[bytes, None, None]:
+        """
+        GET request streaming the response body. The body is never held in memory as a whole. 429 responses are
+        retried like for any other request. The request is reported to the request hooks once the body has been
+        streamed
+
+        :param url: URL
+        :param params: URL parameters
+        :param chunk_size: size of the chunks to read; default: :data:`DOWNLOAD_CHUNK_SIZE`
+        :return: yields chunks of the body
+        """
+        hooks = self.request_hooks
+        template = url_template(url)
+        contexts = call_hooks(hooks, 'request_start', 'GET', template) if hooks else None
+        start = time.perf_counter()
+        status = None
+        bytes_in = 0
+        error = None
+        try:
+            with self._stream_response('GET', url=url, params=params, **kwargs) as response:
+                status = response.status_code
+                for chunk in response.iter_content(chunk_size=chunk_size or DOWNLOAD_CHUNK_SIZE):
+                    bytes_in += len(chunk)
+                    yield chunk
+        except RestError as e:
+            status = e.response.status_code
+            error = e
+            raise
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            if hooks:
+                request_end(hooks, contexts, 'GET', template, status, time.perf_counter() - start, 0, bytes_in,
+                            error)
+
+    def rest_download(self, url: str, file: Union[str, BinaryIO], params: dict = None, **kwargs) -> int:
+        """
+        GET request writing the response body to a file chunk by chunk
+
+        :param url: URL
+        :param file: path of the file to write to or a binary file-like object. If a path is given then the body is
+            written to a temporary file (path + ".part") first, which is renamed once the download is complete: a file
+            at path always is complete
+        :param params: URL parameters
+        :return: number of bytes written
+        """
+        if isinstance(file, str):
+            part = f'{file}.part'
+            try:
+                with open(part, mode='wb') as f:
+                    written = self.rest_download(url, f, params=params, **kwargs)
+            except BaseException:
+                if os.path.exists(part):
+                    os.remove(part)
+                raise
+            os.replace(part, file)
+            return written
+        written = 0
+        for chunk in self.rest_stream(url, params=params, **kwargs):
+            written += file.write(chunk)
+        return written
+
+    def _pagination_pages(self, url: str, params: dict = None, **kwargs) -> Generator[StrOrDict, None, None]:
+        """
+        Follow RFC5988 pagination and yield the body of each page
+
+        :param url: start url for 1st GET
+        :param params: URL parameters for the 1st GET
+        :return: yields page bodies
+        :meta private:
+        """
+        while url:
+            # not needed any more, WXCAPIBULK-27 has been fixed
+            # if url.startswith('https,'):
+            #     url = url[6:]
+            log.debug(f'{self}.pagination: getting {url}')
+            response, data = self._request_w_response('GET', url=url, params=params, **kwargs)
+            # params only in first request. In subsequent requests we rely on the completeness of the 'next' URL
+            params = None
+            # try to get the next page (if present)
+            try:
+                url = str(response.links['next']['url'])
+            except KeyError:
+                url = None
+            yield data
+
+    @staticmethod
+    def _prefetch_pages(pages: Generator[StrOrDict, None, None],
+                        prefetch: int) -> Generator[StrOrDict, None, None]:
+        """
+        Consume a generator of pages in a background thread and fetch up to prefetch pages ahead of the consumer
+
+        :param pages: page generator
+        :param prefetch: max number of pages to fetch ahead
+        :return: yields page bodies
+        :meta private:
+        """
+        queue = Queue()
+        slots = Semaphore(prefetch)
+        stop = Event()
+
+        def producer():
+            try:
+                while True:
+                    # wait for a free slot; check regularly whether the consumer is gone
+                    while not slots.acquire(timeout=0.1):
+                        if stop.is_set():
+                            return
+                    if stop.is_set():
+                        return
+                    try:
+                        page = next(pages)
+                    except StopIteration:
+                        queue.put((_PAGES_DONE, None))
+                        return
+                    queue.put((page, None))
+            except Exception as e:
+                queue.put((None, e))
+            finally:
+                pages.close()
+
+        thread = Thread(target=producer, name='pagination-prefetch', daemon=True)
+        thread.start()
+        try:
+            while True:
+                page, error = queue.get()
+                if error is not None:
+                    raise error
+                if page is _PAGES_DONE:
+                    break
+                slots.release()
+                yield page
+        finally:
+            # consumer is done or gone: tell the producer to terminate
+            stop.set()
+
     def follow_pagination(self, url: str, model: Type[ApiModel] = None,
-                          params: dict = None, item_key: str = None, **kwargs) -> Generator[ApiModel, None, None]:
+                          params: dict = None, item_key: str = None, prefetch: int = None, lazy: bool = None,
+                          fields: Iterable[str] = None, **kwargs) -> Generator[ApiModel, None, None]:
         """
         Handling RFC5988 pagination of list requests. Generator of parsed objects
 
@@ -402,30 +890,36 @@ class RestSession(Session):
         :type params: Optional[dict]
         :param item_key: key to list of values
         :type item_key: str
+        :param prefetch: number of pages to fetch in a background thread ahead of the consumer. 0: no prefetch.
+            Default: :attr:`prefetch_pages`
+        :type prefetch: int
+        :param lazy: yield :class:`wxc_sdk.base.LazyModel` proxies instead of fully validated model instances.
+            Default: :attr:`lazy_models`
+        :type lazy: bool
+        :param fields: names of model fields to keep in the yielded objects; implies lazy
+        :type fields: Iterable[str]
         :return: yields parsed objects
         """
 
         def noop(x):
             return x
 
+        if lazy is None:
+            lazy = self.lazy_models
         if model is None or not issubclass(model, ApiModel):
             model = noop
+        elif lazy or fields is not None:
+            model = partial(model.lazy, fields=fields)
         else:
             model = model.parse_obj
 
-        while url:
-            # not needed any more, WXCAPIBULK-27 has been fixed
-            # if url.startswith('https,'):
-            #     url = url[6:]
-            log.debug(f'{self}.pagination: getting {url}')
-            response, data = self._request_w_response('GET', url=url, params=params, **kwargs)
-            # params only in first request. In subsequent requests we rely on the completeness of the 'next' URL
-            params = None
-            # try to get the next page (if present)
-            try:
-                url = str(response.links['next']['url'])
-            except KeyError:
-                url = None
+        if prefetch is None:
+            prefetch = self.prefetch_pages
+        pages = self._pagination_pages(url=url, params=params, **kwargs)
+        if prefetch:
+            pages = self._prefetch_pages(pages=pages, prefetch=prefetch)
+
+        for data in pages:
             if not data:
                 continue
             # return all items
@@ -29,12 +29,12 @@ from .vm_rules import VoicemailRulesApi
 from .voice_messaging import VoiceMessagingApi
 from .voicemail_groups import VoicemailGroupsApi
 from .voiceportal import VoicePortalApi
-from ..api_child import ApiChild
 from ..base import ApiModel, to_camel, plus1
 from ..base import SafeEnum as Enum
 from ..common import UserType, RouteIdentity, NumberState, ValidateExtensionsResponse, ValidatePhoneNumbersResponse, \
     DeviceCustomization, IdAndName
 from ..common.schedules import ScheduleApi, ScheduleApiBase
+from ..person_settings.common import BulkSettingsApiChild
 from ..person_settings.permissions_out import OutgoingPermissionsApi
 from ..rest import RestSession
 
@@ -440,9 +440,12 @@ class AnnouncementLanguage(ApiModel):
 
 
 @dataclass(init=False)
-class TelephonyApi(ApiChild, base='telephony/config'):
+class TelephonyApi(BulkSettingsApiChild, base='telephony/config'):
     """
     The telephony settings (features) API.
+
+    Location settings implemented by person settings APIs (permissions_out) can be read for many locations
+    concurrently using :meth:`read_bulk`.
     """
     #: access or authentication codes
     access_codes: AccessCodesApi
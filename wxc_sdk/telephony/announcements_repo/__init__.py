@@ -14,6 +14,7 @@ from requests_toolbelt import MultipartEncoder
 
 from ...api_child import ApiChild
 from ...base import ApiModel
+from ...bulk_upload import MultipartFile
 from ...common import IdAndName, MediaFileType, AnnouncementLevel
 
 __all__ = ['RepoAnnouncement', 'AnnouncementsRepositoryApi', 'RepositoryUsage', 'FeatureReference']
@@ -133,52 +134,68 @@ class AnnouncementsRepositoryApi(ApiChild, base='telephony/config'):
         """
         '''async
     async def _upload_or_modify(self, *, url, name, file, upload_as, params, is_upload) -> dict:
-        if isinstance(file, str):
-            upload_as = upload_as or os.path.basename(file)
-            file = open(file, mode='rb')
-            must_close = True
+        must_close = False
+        if isinstance(file, MultipartFile):
+            # prepared request body; the announcement name is a form field
+            if 'name' not in file.fields:
+                file = file.with_fields(name=name)
+            elif file.fields['name'] != name:
+                raise ValueError(f'name {name!r} differs from name in request body: {file.fields["name"]!r}')
+            body = file
+            headers = {'Content-Type': file.content_type, 'Content-Length': str(len(file))}
         else:
-            must_close = False
-            # an existing reader
-            if not upload_as:
+            if isinstance(file, str):
+                upload_as = upload_as or os.path.basename(file)
+                file = open(file, mode='rb')
+                must_close = True
+            elif not upload_as:
+                # an existing reader
                 raise ValueError('upload_as is required')
-        encoder = MultipartEncoder({'name': name, 'file': (upload_as, file, 'audio/wav')})
+            body = MultipartEncoder({'name': name, 'file': (upload_as, file, 'audio/wav')})
+            headers = {'Content-Type': body.content_type}
         if is_upload:
             meth = super().post
         else:
             meth = super().put
         try:
-            data = await meth(url, data=encoder, headers={'Content-Type': encoder.content_type},
-                        params=params)
+            data = await meth(url, data=body, headers=headers, params=params)
         finally:
             if must_close:
                 file.close()
         return data
         '''
-        if isinstance(file, str):
-            upload_as = upload_as or os.path.basename(file)
-            file = open(file, mode='rb')
-            must_close = True
+        must_close = False
+        if isinstance(file, MultipartFile):
+            # prepared request body; the announcement name is a form field
+            if 'name' not in file.fields:
+                file = file.with_fields(name=name)
+            elif file.fields['name'] != name:
+                raise ValueError(f'name {name!r} differs from name in request body: {file.fields["name"]!r}')
+            body = file
+            headers = {'Content-Type': file.content_type, 'Content-Length': str(len(file))}
         else:
-            must_close = False
-            # an existing reader
-            if not upload_as:
+            if isinstance(file, str):
+                upload_as = upload_as or os.path.basename(file)
+                file = open(file, mode='rb')
+                must_close = True
+            elif not upload_as:
+                # an existing reader
                 raise ValueError('upload_as is required')
-        encoder = MultipartEncoder({'name': name, 'file': (upload_as, file, 'audio/wav')})
+            body = MultipartEncoder({'name': name, 'file': (upload_as, file, 'audio/wav')})
+            headers = {'Content-Type': body.content_type}
         if is_upload:
             meth = super().post
         else:
             meth = super().put
         try:
-            data = meth(url, data=encoder, headers={'Content-Type': encoder.content_type},
-                        params=params)
+            data = meth(url, data=body, headers=headers, params=params)
         finally:
             if must_close:
                 file.close()
         return data
 
-    def upload_announcement(self, name: str, file: Union[BufferedReader, str], upload_as: str = None,
-                            location_id: str = None,
+    def upload_announcement(self, name: str, file: Union[BufferedReader, str, MultipartFile],
+                            upload_as: str = None, location_id: str = None,
                             org_id: str = None) -> str:
         """
         Upload a binary file to the announcement repository at organization or location level.
@@ -190,8 +207,10 @@ class AnnouncementsRepositoryApi(ApiChild, base='telephony/config'):
         :type name: str
         :param file: the file to be uploaded, can be a path to a file or a buffered reader (opened file); if a
             reader referring to an open file is passed then make sure to open the file as binary b/c otherwise the
-            content length might be calculated wrong
-        :type file: Union[BufferedReader, str]
+            content length might be calculated wrong. Can also be a prepared request body
+            (:class:`wxc_sdk.bulk_upload.MultipartFile`). `name` is added as form field to a request body w/o name
+            field; a different name in the request body raises a ValueError
+        :type file: Union[BufferedReader, str, MultipartFile]
         :param upload_as: filename for the content. Only required if content is a reader; has to be a .wav file name.
         :type upload_as: str
         :param location_id: Unique identifier of a location where an announcement is being created.
@@ -227,8 +246,8 @@ class AnnouncementsRepositoryApi(ApiChild, base='telephony/config'):
 
         """
         '''async
-    async def upload_announcement(self, name: str, file: Union[BufferedReader, str], upload_as: str = None,
-                            location_id: str = None,
+    async def upload_announcement(self, name: str, file: Union[BufferedReader, str, MultipartFile],
+                            upload_as: str = None, location_id: str = None,
                             org_id: str = None) -> str:
         params = org_id and {'orgId': org_id} or None
         if location_id is None:
@@ -313,7 +332,7 @@ class AnnouncementsRepositoryApi(ApiChild, base='telephony/config'):
             url = self.ep(f'locations/{location_id}/announcements/{announcement_id}')
         super().delete(url=url, params=params)
 
-    def modify(self, announcement_id: str, name: str, file: Union[BufferedReader, str],
+    def modify(self, announcement_id: str, name: str, file: Union[BufferedReader, str, MultipartFile],
                upload_as: str = None, location_id: str = None, org_id: str = None):
         """
         Modify an existing announcement greeting
@@ -325,8 +344,10 @@ class AnnouncementsRepositoryApi(ApiChild, base='telephony/config'):
         :type name: str
         :param file: the file to be uploaded, can be a path to a file or a buffered reader (opened file); if a
             reader referring to an open file is passed then make sure to open the file as binary b/c otherwise the
-            content length might be calculated wrong
-        :type file: Union[BufferedReader, str]
+            content length might be calculated wrong. Can also be a prepared request body
+            (:class:`wxc_sdk.bulk_upload.MultipartFile`). `name` is added as form field to a request body w/o name
+            field; a different name in the request body raises a ValueError
+        :type file: Union[BufferedReader, str, MultipartFile]
         :param upload_as: filename for the content. Only required if content is a reader; has to be a .wav file name.
         :type upload_as: str
         :param location_id: Unique identifier of a location where announcement is being deleted.
@@ -336,7 +357,7 @@ class AnnouncementsRepositoryApi(ApiChild, base='telephony/config'):
 
         """
         '''async
-    async def modify(self, announcement_id: str, name: str, file: Union[BufferedReader, str],
+    async def modify(self, announcement_id: str, name: str, file: Union[BufferedReader, str, MultipartFile],
                upload_as: str = None, location_id: str = None, org_id: str = None):
         params = org_id and {'orgId': org_id} or None
         if location_id is None:
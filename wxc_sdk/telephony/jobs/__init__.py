@@ -157,7 +157,7 @@ class DeviceSettingsJobsApi(ApiChild, base='telephony/config/jobs/devices/callDe
         :rtype: StartJobResponse
         """
         url = self.ep()
-        params = org_id and {'prgId': org_id} or None
+        params = org_id and {'orgId': org_id} or None
         body = {}
         if location_id:
             body['locationId'] = location_id
@@ -0,0 +1,314 @@
+"""
+Token refresh for long running applications
+
+A :class:`TokenManager` keeps the tokens of an integration valid:
+
+* the access token is refreshed in the background ahead of its expiration (:meth:`TokenManager.start`)
+* sessions (:class:`wxc_sdk.rest.RestSession`, :class:`wxc_sdk.as_rest.AsRestSession`) created with a token manager
+  refresh an access token about to expire before sending a request, and retry a request once with a new access
+  token if the request fails with a 401
+* concurrent refreshes are serialized: only one refresh request is sent and all callers get the new token
+  (single-flight)
+* tokens can be shared across processes using a :class:`TokenStore`. :class:`FileTokenStore` keeps tokens in a
+  file protected by a file lock; :class:`CallbackTokenStore` uses the same read/write callbacks as
+  :meth:`wxc_sdk.integration.Integration.get_cached_tokens`
+
+Example:
+
+    .. code-block:: python
+
+        store = FileTokenStore('tokens.yml')
+        tokens = integration.get_cached_tokens_from_yml('tokens.yml')
+        with TokenManager(integration, tokens=tokens, store=store) as manager:
+            api = WebexSimpleApi(token_manager=manager)
+            ...
+"""
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+from collections.abc import Callable, Generator
+from contextlib import contextmanager, nullcontext
+from threading import Lock, Thread, Event
+from typing import Optional
+
+import requests
+import yaml
+
+from .integration import Integration
+from .tokens import Tokens
+
+__all__ = ['TokenStore', 'CallbackTokenStore', 'FileTokenStore', 'TokenManager']
+
+log = logging.getLogger(__name__)
+
+
+class TokenStore:
+    """
+    Storage for tokens shared by multiple processes. Subclasses implement :meth:`read` and :meth:`write` and can
+    implement :meth:`lock` to serialize refreshes across processes.
+    """
+
+    def read(self) -> Optional[Tokens]:
+        """
+        read tokens from the store
+
+        :return: tokens or None if no tokens are available
+        """
+        raise NotImplementedError
+
+    def write(self, tokens: Tokens):
+        """
+        write tokens to the store
+        """
+        raise NotImplementedError
+
+    @contextmanager
+    def lock(self) -> Generator[None, None, None]:
+        """
+        context manager to hold an exclusive lock on the store while tokens are refreshed. The default
+        implementation doesn't lock
+        """
+        yield
+
+
+class CallbackTokenStore(TokenStore):
+    """
+    Token store using callbacks to read and write tokens; same callbacks as used by
+    :meth:`wxc_sdk.integration.Integration.get_cached_tokens`
+    """
+
+    def __init__(self, read_from_cache: Callable[[], Optional[Tokens]], write_to_cache: Callable[[Tokens], None]):
+        self.read_from_cache = read_from_cache
+        self.write_to_cache = write_to_cache
+
+    def read(self) -> Optional[Tokens]:
+        return self.read_from_cache()
+
+    def write(self, tokens: Tokens):
+        self.write_to_cache(tokens)
+
+
+class FileTokenStore(TokenStore):
+    """
+    Tokens in a YML (.yml, .yaml) or JSON file. Files are replaced atomically and refreshes are serialized using a
+    lock file (`<path>.lock`)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    @property
+    def _yml(self) -> bool:
+        return os.path.splitext(self.path)[1].lower() in ('.yml', '.yaml')
+
+    def read(self) -> Optional[Tokens]:
+        try:
+            with open(self.path, mode='r') as f:
+                data = yaml.safe_load(f) if self._yml else json.load(f)
+            return Tokens.parse_obj(data)
+        except Exception as e:
+            log.info(f'failed to read tokens from file: {e}')
+            return None
+
+    def write(self, tokens: Tokens):
+        data = json.loads(tokens.json())
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tokens')
+        try:
+            with os.fdopen(fd, mode='w') as f:
+                if self._yml:
+                    yaml.safe_dump(data, f)
+                else:
+                    json.dump(data, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    @contextmanager
+    def lock(self) -> Generator[None, None, None]:
+        with open(f'{self.path}.lock', mode='a+') as f:
+            if sys.platform == 'win32':
+                import msvcrt
+                f.seek(0)
+                # LK_LOCK retries for 10 seconds before raising an OSError
+                while True:
+                    try:
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+                try:
+                    yield
+                finally:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class TokenManager:
+    """
+    Keep the tokens of an integration valid
+
+    Pass the token manager to the API (``WebexSimpleApi(token_manager=manager)`` or
+    ``AsWebexSimpleApi(token_manager=manager)``) to have the session use the tokens of the manager.
+    """
+
+    def __init__(self, integration: Integration, tokens: Tokens = None, store: TokenStore = None,
+                 min_lifetime: int = 300, refresh_ahead: int = 900):
+        """
+
+        :param integration: integration used to refresh the access token
+        :param tokens: tokens; if not given then tokens are read from the store
+        :param store: store to share tokens with other processes, optional
+        :param min_lifetime: minimum remaining lifetime of the access token (seconds) before a request is sent. If
+            the remaining lifetime is shorter then the access token is refreshed before the request is sent
+        :param refresh_ahead: the background refresh (:meth:`start`) refreshes the access token this many seconds
+            before it expires
+        """
+        if tokens is None:
+            tokens = store and store.read()
+            if tokens is None:
+                raise ValueError('tokens have to be passed or available in the store')
+        self.integration = integration
+        #: tokens; updated in place when the access token is refreshed
+        self.tokens = tokens
+        self.store = store
+        self.min_lifetime = min_lifetime
+        self.refresh_ahead = max(refresh_ahead, min_lifetime)
+        #: number of times the access token was refreshed (or new tokens were read from the store)
+        self.refreshes = 0
+        self._lock = Lock()
+        self._session = requests.Session()
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def needs_refresh(self, min_lifetime: int = None) -> bool:
+        """
+        check whether the access token expires within the given lifetime (default: :attr:`min_lifetime`)
+        """
+        if not self.tokens.access_token:
+            return True
+        if self.tokens.expires_at is None:
+            # unknown expiration
+            return False
+        return self.tokens.remaining < (self.min_lifetime if min_lifetime is None else min_lifetime)
+
+    def refresh(self, force: bool = False, failed_token: str = None, min_lifetime: int = None) -> bool:
+        """
+        Refresh the access token if needed. Concurrent calls are serialized; callers waiting for a refresh in
+        progress don't refresh again.
+
+        :param force: refresh even if the access token is still valid
+        :param failed_token: access token rejected by Webex (401). Only refreshed if the current access token is
+            still the failed token
+        :param min_lifetime: refresh if the access token expires within this lifetime; default: :attr:`min_lifetime`
+        :return: True if the tokens have been updated
+        :raise:
+            :class:`requests.HTTPError`: if request to obtain new access token fails
+        """
+        with self._lock:
+            if failed_token is not None:
+                if self.tokens.access_token != failed_token:
+                    # somebody else refreshed already
+                    return False
+            elif not force and not self.needs_refresh(min_lifetime):
+                return False
+            with self.store.lock() if self.store else nullcontext():
+                current = self.tokens.access_token
+                stored = self.store and self.store.read()
+                if (stored and stored.access_token and stored.access_token not in (current, failed_token) and
+                        (stored.expires_at is None or stored.remaining >= self.min_lifetime)):
+                    # another process refreshed the tokens
+                    log.debug('using tokens refreshed by another process')
+                    self.tokens.update(stored)
+                else:
+                    log.debug(f'Getting new access token, valid until {self.tokens.expires_at}')
+                    # refresh a copy so that the current tokens stay intact if the refresh fails
+                    new_tokens = self.tokens.copy()
+                    self.integration.refresh(tokens=new_tokens, session=self._session)
+                    self.tokens.update(new_tokens)
+                    if self.store:
+                        self.store.write(self.tokens)
+            self.refreshes += 1
+            return True
+
+    def ensure_valid(self):
+        """
+        refresh the access token if it expires within :attr:`min_lifetime`
+        """
+        if self.needs_refresh():
+            self.refresh()
+
+    async def as_refresh(self, force: bool = False, failed_token: str = None) -> bool:
+        """
+        async version of :meth:`refresh`. The refresh is executed in a thread
+        """
+        return await asyncio.to_thread(self.refresh, force=force, failed_token=failed_token)
+
+    async def as_ensure_valid(self):
+        """
+        async version of :meth:`ensure_valid`
+        """
+        if self.needs_refresh():
+            await self.as_refresh()
+
+    def _next_refresh(self) -> float:
+        """
+        seconds until the next background refresh
+        """
+        if self.tokens.expires_at is None or not self.tokens.access_token:
+            return 60.0
+        return max(0.0, self.tokens.remaining - self.refresh_ahead)
+
+    def _background(self):
+        while not self._stop.wait(self._next_refresh()):
+            try:
+                self.refresh(min_lifetime=self.refresh_ahead)
+            except Exception as e:
+                log.warning(f'background token refresh failed: {e}')
+                if self._stop.wait(30):
+                    break
+
+    def start(self):
+        """
+        start refreshing the access token in the background ahead of its expiration
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = Thread(target=self._background, name='wxc_sdk_token_refresh', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        stop background refresh
+        """
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def close(self):
+        """
+        stop background refresh and release resources
+        """
+        self.stop()
+        self._session.close()
+
@@ -0,0 +1,250 @@
+"""
+Bulk export of meeting transcripts for compliance archiving
+
+:class:`TranscriptExporter` (and :class:`AsTranscriptExporter` for the async API) walk the transcripts of a site
+visible to a compliance officer (:meth:`wxc_sdk.meetings.transcripts.MeetingTranscriptsApi.list_compliance_officer`)
+for a date range and download all of them concurrently:
+
+* transcripts are streamed to disk; memory consumption doesn't depend on the size or number of transcripts
+* at most `concurrent_requests` (setting of the API) downloads are in flight; the rate limiter of the session applies
+  and 429 responses are retried
+* transcripts which are not available (deleted) are not downloaded and reported as
+  :attr:`ExportStatus.unavailable`
+* files are written to `<directory>/<date>/<transcript id>.<format>`. A file only exists once the download is
+  complete; an export can be resumed by running it again: transcripts already exported are skipped
+* each exported file is recorded in an index (`index.jsonl` in the export directory) with the transcript metadata
+
+Example:
+
+    .. code-block:: python
+
+        exporter = TranscriptExporter(api, directory='archive', formats=['vtt', 'txt'])
+        for result in exporter.run(site_url='example.webex.com', from_='2023-05-01', to_='2023-06-01'):
+            if result.status == ExportStatus.failed:
+                print(f'{result.transcript.id}: {result.error}')
+"""
+import asyncio
+import os
+import re
+from collections.abc import Generator, AsyncGenerator, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from threading import Lock
+from typing import Optional, Union, TYPE_CHECKING
+
+from .base import dt_iso_str
+from .json_codec import json_dumps
+from .meetings.transcripts import Transcript, TranscriptStatus
+
+if TYPE_CHECKING:
+    from . import WebexSimpleApi
+    from .as_api import AsWebexSimpleApi
+
+__all__ = ['ExportStatus', 'ExportResult', 'TranscriptExporter', 'AsTranscriptExporter']
+
+#: name of the index file in the export directory
+INDEX_FILE = 'index.jsonl'
+
+
+class ExportStatus(str, Enum):
+    downloaded = 'downloaded'
+    #: already exported by a previous run
+    skipped = 'skipped'
+    #: transcript is not available for download (deleted); nothing is exported
+    unavailable = 'unavailable'
+    failed = 'failed'
+
+
+@dataclass
+class ExportResult:
+    """
+    Result of the export of a transcript in one format
+    """
+    transcript: Transcript
+    format: str
+    #: path of the exported file
+    path: str
+    status: ExportStatus
+    #: number of bytes downloaded
+    size: int = 0
+    error: Optional[Exception] = None
+
+
+def _iso(value: Union[str, datetime, None]) -> Optional[str]:
+    if isinstance(value, datetime):
+        return dt_iso_str(value)
+    return value
+
+
+class _ExporterBase:
+    """
+    Common code for sync and async exporter
+    """
+
+    def __init__(self, directory: str, formats: Iterable[str]):
+        self.directory = directory
+        self.formats = list(formats)
+        self._index_lock = Lock()
+
+    def path(self, transcript: Transcript, fmt: str) -> str:
+        """
+        path of the file for a transcript in the given format
+        """
+        day = (transcript.start_time or '')[:10] or 'unknown'
+        name = re.sub(r'[^\w.-]', '_', transcript.id)
+        return os.path.join(self.directory, day, f'{name}.{fmt}')
+
+    @staticmethod
+    def download_url(transcript: Transcript, fmt: str) -> Optional[str]:
+        return {'vtt': transcript.vtt_download_link, 'txt': transcript.txt_download_link}.get(fmt)
+
+    def _index(self, result: ExportResult):
+        """
+        record an exported file in the index
+        """
+        transcript = result.transcript
+        record = {'id': transcript.id, 'meetingId': transcript.meeting_id, 'meetingTopic': transcript.meeting_topic,
+                  'hostUserId': transcript.host_user_id, 'startTime': transcript.start_time,
+                  'status': transcript.status, 'format': result.format,
+                  'path': os.path.relpath(result.path, self.directory), 'size': result.size}
+        line = json_dumps(record)
+        with self._index_lock:
+            with open(os.path.join(self.directory, INDEX_FILE), mode='a') as f:
+                f.write(f'{line}\n')
+
+    def _pending(self, transcript: Transcript) -> tuple[list[ExportResult], list[tuple[str, str]]]:
+        """
+        results for formats already exported and (format, path) tuples for the formats to download
+        """
+        skipped, pending = [], []
+        for fmt in self.formats:
+            path = self.path(transcript, fmt)
+            if transcript.status not in (None, TranscriptStatus.available):
+                # list_compliance_officer also returns deleted transcripts
+                skipped.append(ExportResult(transcript=transcript, format=fmt, path=path,
+                                            status=ExportStatus.unavailable))
+            elif os.path.exists(path):
+                skipped.append(ExportResult(transcript=transcript, format=fmt, path=path,
+                                            status=ExportStatus.skipped, size=os.path.getsize(path)))
+            else:
+                pending.append((fmt, path))
+        return skipped, pending
+
+
+class TranscriptExporter(_ExporterBase):
+    """
+    Export all transcripts of a site for a date range
+    """
+
+    def __init__(self, api: 'WebexSimpleApi', directory: str, formats: Iterable[str] = ('vtt',)):
+        """
+
+        :param api: API; needs a compliance officer token
+        :param directory: export directory
+        :param formats: formats to export: vtt, txt
+        """
+        super().__init__(directory=directory, formats=formats)
+        self.api = api
+
+    def _export(self, transcript: Transcript) -> list[ExportResult]:
+        results, pending = self._pending(transcript)
+        for fmt, path in pending:
+            result = ExportResult(transcript=transcript, format=fmt, path=path, status=ExportStatus.downloaded)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                url = self.download_url(transcript, fmt)
+                if url:
+                    result.size = self.api.session.rest_download(url=url, file=path)
+                else:
+                    result.size = self.api.meetings.transcripts.download_to_file(transcript_id=transcript.id,
+                                                                                 file=path, format=fmt)
+            except Exception as e:
+                result.status = ExportStatus.failed
+                result.error = e
+            else:
+                self._index(result)
+            results.append(result)
+        return results
+
+    def run(self, site_url: str, from_: Union[str, datetime] = None,
+            to_: Union[str, datetime] = None) -> Generator[ExportResult, None, None]:
+        """
+        Export all transcripts of a site created in the given date range
+
+        :param site_url: URL of the Webex site
+        :param from_: start (inclusive) of the date range; ISO 8601 string or datetime
+        :param to_: end (exclusive) of the date range; ISO 8601 string or datetime
+        :return: yields one result per transcript and format as downloads complete
+        """
+        transcripts = self.api.meetings.transcripts.list_compliance_officer(site_url=site_url, from_=_iso(from_),
+                                                                            to_=_iso(to_))
+        for results in self.api.map(self._export, transcripts, ordered=False):
+            yield from results
+
+
+class AsTranscriptExporter(_ExporterBase):
+    """
+    Export all transcripts of a site for a date range using the async API
+    """
+
+    def __init__(self, api: 'AsWebexSimpleApi', directory: str, formats: Iterable[str] = ('vtt',)):
+        """
+
+        :param api: API; needs a compliance officer token
+        :param directory: export directory
+        :param formats: formats to export: vtt, txt
+        """
+        super().__init__(directory=directory, formats=formats)
+        self.api = api
+
+    async def _export(self, transcript: Transcript) -> list[ExportResult]:
+        results, pending = self._pending(transcript)
+        for fmt, path in pending:
+            result = ExportResult(transcript=transcript, format=fmt, path=path, status=ExportStatus.downloaded)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                url = self.download_url(transcript, fmt)
+                if url:
+                    result.size = await self.api.session.rest_download(url=url, file=path)
+                else:
+                    result.size = await self.api.meetings.transcripts.download_to_file(transcript_id=transcript.id,
+                                                                                       file=path, format=fmt)
+            except Exception as e:
+                result.status = ExportStatus.failed
+                result.error = e
+            else:
+                self._index(result)
+            results.append(result)
+        return results
+
+    async def run(self, site_url: str, from_: Union[str, datetime] = None,
+                  to_: Union[str, datetime] = None) -> AsyncGenerator[ExportResult, None]:
+        """
+        Export all transcripts of a site created in the given date range
+
+        :param site_url: URL of the Webex site
+        :param from_: start (inclusive) of the date range; ISO 8601 string or datetime
+        :param to_: end (exclusive) of the date range; ISO 8601 string or datetime
+        :return: yields one result per transcript and format as downloads complete
+        """
+        transcripts = self.api.meetings.transcripts.list_compliance_officer_gen(site_url=site_url,
+                                                                                from_=_iso(from_), to_=_iso(to_))
+        window = self.api.session.concurrent_requests
+        pending = set()
+        try:
+            async for transcript in transcripts:
+                pending.add(asyncio.create_task(self._export(transcript)))
+                if len(pending) >= window:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        for result in task.result():
+                            yield result
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    for result in task.result():
+                        yield result
+        finally:
+            for task in pending:
+                task.cancel()
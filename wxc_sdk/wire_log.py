@@ -0,0 +1,276 @@
+"""
+Structured wire logging for REST sessions
+
+A :class:`WireLog` can be set for :class:`wxc_sdk.rest.RestSession` and :class:`wxc_sdk.as_rest.AsRestSession` to log
+requests and responses as JSON lines. Compared to the legacy debug dumps (:func:`wxc_sdk.rest.dump_response`) wire
+logging is cheap:
+
+* bodies are not parsed or pretty-printed; only the first `max_body` bytes are logged
+* logging can be limited to selected endpoints and methods and to a sample of the requests
+* when logging to a :class:`logging.Logger` the JSON line is only created if a handler emits the record
+* secrets (authorization header, tokens, client secret) are masked
+
+If a wire log is set then the legacy debug dumps are not created. The legacy debug dumps are only created if a handler
+would actually emit the DEBUG level records of the `wxc_sdk.rest` or `wxc_sdk.as_rest` logger.
+
+Example:
+
+    .. code-block:: python
+
+        # log 10% of all requests to /people endpoints to a JSON lines file
+        wire_log = WireLog(sink='wire.jsonl', endpoints=[r'/people'], sample_rate=0.1)
+        api = WebexSimpleApi(tokens=tokens, wire_log=wire_log)
+"""
+import logging
+import random
+import re
+import time
+from collections.abc import Iterable
+from io import TextIOBase
+from threading import Lock
+from typing import Any, Optional, Union
+from urllib.parse import urlparse, urlencode
+
+from .json_codec import json_dumps
+
+__all__ = ['WireLog', 'debug_enabled', 'mask_headers', 'mask_json', 'mask_form', 'MASKED_HEADERS', 'SECRET_KEYS',
+           'FORM_SECRET_KEYS']
+
+#: headers with values to be masked
+MASKED_HEADERS = frozenset({'authorization', 'cookie', 'set-cookie'})
+
+#: keys of secrets in JSON bodies
+SECRET_KEYS = frozenset({'access_token', 'refresh_token', 'id_token', 'client_secret', 'password'})
+
+#: names of secrets in form encoded bodies; code: OAuth authorization code
+FORM_SECRET_KEYS = SECRET_KEYS | {'code'}
+
+# secrets in (truncated) JSON or form encoded bodies
+_SECRETS_RE = re.compile(f'("(?:{"|".join(SECRET_KEYS)})"\\s*:\\s*")[^"]*(")'
+                         f'|((?:^|&)(?:{"|".join(FORM_SECRET_KEYS)})=)[^&]*')
+
+
+def _mask_secret(match: re.Match) -> str:
+    if match.group(1):
+        return f'{match.group(1)}***{match.group(2)}'
+    return f'{match.group(3)}***'
+
+
+def mask_headers(headers) -> dict[str, str]:
+    """
+    Copy of headers with secrets masked
+
+    :param headers: headers; dict or any other mapping
+    """
+    return {k: '***' if k.lower() in MASKED_HEADERS else v for k, v in headers.items()}
+
+
+def mask_json(data: Any) -> Any:
+    """
+    Copy of a JSON body (parsed) with secrets masked
+
+    :param data: parsed JSON body
+    """
+    if isinstance(data, dict):
+        return {k: '***' if k in SECRET_KEYS else mask_json(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [mask_json(v) for v in data]
+    return data
+
+
+def mask_form(pairs: Iterable[tuple[str, str]]) -> list[tuple[str, str]]:
+    """
+    Form fields with secrets masked
+
+    :param pairs: form fields as (name, value) tuples; for example from :func:`urllib.parse.parse_qsl`
+    """
+    return [(k, '***' if k in FORM_SECRET_KEYS else v) for k, v in pairs]
+
+
+def debug_enabled(logger: logging.Logger) -> bool:
+    """
+    Check if a DEBUG level record logged to the given logger would be emitted by any handler.
+
+    This is more selective than :meth:`logging.Logger.isEnabledFor`: if the root logger is set to DEBUG but all
+    handlers only emit INFO records, then the result is False.
+
+    :param logger: logger to check
+    :return: True if a handler would emit a DEBUG record
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return False
+    current = logger
+    while current:
+        for handler in current.handlers:
+            if handler.level <= logging.DEBUG:
+                return True
+        if not current.propagate:
+            break
+        current = current.parent
+    return False
+
+
+class _LazyLine:
+    """
+    JSON line created when a log record is formatted
+
+    :meta private:
+    """
+    __slots__ = ('record',)
+
+    def __init__(self, record: dict):
+        self.record = record
+
+    def __str__(self):
+        return json_dumps(self.record)
+
+
+class WireLog:
+    """
+    Structured wire logging: one JSON object per request/response exchange.
+
+    Each record has these keys: ts (epoch time), method, url, status, elapsed_ms, tracking_id, request_headers,
+    request_body, request_size, response_headers, response_body, response_size. Bodies are truncated to `max_body`
+    bytes. Header keys are only present if headers are logged.
+    """
+
+    def __init__(self, *, sink: Union[str, TextIOBase, logging.Logger] = None, enabled: bool = True,
+                 sample_rate: float = 1.0, endpoints: Iterable[str] = None, methods: Iterable[str] = None,
+                 max_body: int = 4096, headers: bool = True):
+        """
+
+        :param sink: where to write the JSON lines to: path of a file (opened in append mode), a text stream, or a
+            logger (records are logged at DEBUG level). Default: logger `wxc_sdk.wire`
+        :type sink: Union[str, TextIOBase, logging.Logger]
+        :param enabled: switch to turn wire logging on and off; can be changed at runtime. A disabled wire log also
+            suppresses the legacy debug dumps
+        :type enabled: bool
+        :param sample_rate: fraction of the requests to log; 0..1
+        :type sample_rate: float
+        :param endpoints: only log requests with a URL path matching any of these regular expressions
+        :type endpoints: Iterable[str]
+        :param methods: only log requests with these HTTP methods
+        :type methods: Iterable[str]
+        :param max_body: maximum number of bytes to log for request and response bodies; 0: don't log bodies
+        :type max_body: int
+        :param headers: log request and response headers
+        :type headers: bool
+        """
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.endpoints = [re.compile(pattern) for pattern in endpoints] if endpoints else None
+        self.methods = {method.upper() for method in methods} if methods else None
+        self.max_body = max_body
+        self.headers = headers
+        self._lock = Lock()
+        self._file: Optional[TextIOBase] = None
+        self._logger: Optional[logging.Logger] = None
+        self._stream: Optional[TextIOBase] = None
+        if sink is None:
+            self._logger = logging.getLogger('wxc_sdk.wire')
+        elif isinstance(sink, logging.Logger):
+            self._logger = sink
+        elif isinstance(sink, str):
+            self._file = self._stream = open(sink, mode='a', encoding='utf-8')
+        else:
+            self._stream = sink
+        #: number of logged exchanges
+        self.logged = 0
+
+    def close(self):
+        """
+        Close the file opened for a file sink
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = self._stream = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def wants(self, method: str, url: str) -> bool:
+        """
+        Check whether an exchange should be logged. Cheap check to avoid any work for exchanges that are not logged.
+
+        :param method: HTTP method
+        :param url: request URL
+        :return: True if the exchange should be logged
+        """
+        if not self.enabled:
+            return False
+        if self.methods is not None and method.upper() not in self.methods:
+            return False
+        if self.endpoints is not None:
+            path = urlparse(url).path
+            if not any(pattern.search(path) for pattern in self.endpoints):
+                return False
+        if self._logger is not None and not debug_enabled(self._logger):
+            return False
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def _body(self, body: Any) -> tuple[Optional[str], Optional[int]]:
+        """
+        truncated body and size of the body
+
+        :meta private:
+        """
+        if body is None:
+            return None, None
+        if isinstance(body, dict):
+            # form data
+            body = urlencode(body)
+        if isinstance(body, str):
+            size = len(body)
+            text = body[:self.max_body]
+        elif isinstance(body, (bytes, bytearray)):
+            size = len(body)
+            text = bytes(body[:self.max_body]).decode(errors='replace')
+        else:
+            # multipart or streamed data
+            return f'<{body.__class__.__name__}>', None
+        if not self.max_body:
+            return None, size
+        return _SECRETS_RE.sub(_mask_secret, text), size
+
+    def log(self, *, method: str, url: str, status: int, elapsed_ns: int = None, request_headers=None,
+            request_body: Any = None, response_headers=None, response_body: Any = None):
+        """
+        Log an exchange. Callers should check :meth:`wants` first.
+
+        :param method: HTTP method
+        :param url: request URL
+        :param status: HTTP status of the response
+        :param elapsed_ns: time the request took in ns
+        :param request_headers: request headers
+        :param request_body: request body: str, bytes, or dict (form data)
+        :param response_headers: response headers
+        :param response_body: response body: str or bytes
+        """
+        request_text, request_size = self._body(request_body)
+        response_text, response_size = self._body(response_body)
+        record = {'ts': time.time(),
+                  'method': method,
+                  'url': url,
+                  'status': status,
+                  'elapsed_ms': None if elapsed_ns is None else round(elapsed_ns / 1000000, 3),
+                  'tracking_id': request_headers and request_headers.get('TrackingID')}
+        if self.headers:
+            record['request_headers'] = request_headers and mask_headers(request_headers)
+            record['response_headers'] = response_headers and mask_headers(response_headers)
+        record.update(request_body=request_text, request_size=request_size,
+                      response_body=response_text, response_size=response_size)
+        if self._logger is not None:
+            with self._lock:
+                self.logged += 1
+            self._logger.debug('%s', _LazyLine(record))
+            return
+        line = json_dumps(record)
+        with self._lock:
+            self.logged += 1
+            if self._stream is not None:
+                self._stream.write(f'{line}\n')
+                self._stream.flush()
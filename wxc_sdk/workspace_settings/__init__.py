@@ -6,10 +6,10 @@ from dataclasses import dataclass
 
 from .devices import WorkspaceDevicesApi
 from .numbers import WorkspaceNumbersApi
-from ..api_child import ApiChild
 from ..person_settings.call_intercept import CallInterceptApi
 from ..person_settings.call_waiting import CallWaitingApi
 from ..person_settings.caller_id import CallerIdApi
+from ..person_settings.common import BulkSettingsApiChild
 from ..person_settings.forwarding import PersonForwardingApi
 from ..person_settings.monitoring import MonitoringApi
 from ..person_settings.permissions_in import IncomingPermissionsApi
@@ -20,13 +20,15 @@ __all__ = ['WorkspaceSettingsApi']
 
 
 @dataclass(init=False)
-class WorkspaceSettingsApi(ApiChild, base='workspaces'):
+class WorkspaceSettingsApi(BulkSettingsApiChild, base='workspaces'):
     """
     API for all workspace settings.
 
     Most of the workspace settings are equivalent to corresponding user settings. For these settings the attributes of
     this class are instances of the respective user settings APIs. When calling endpoints of these APIs workspace IDs
     need to be passed to the ``person_id`` parameter of the called function.
+
+    Settings of many workspaces can be read concurrently using :meth:`read_bulk`.
     """
     forwarding: PersonForwardingApi
     call_waiting: CallWaitingApi